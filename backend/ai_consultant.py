@@ -6,7 +6,6 @@ AI Consultant - Модуль AI-консультанта для promarkirui.ru
 import os
 import json
 import uuid
-import sqlite3
 import httpx
 import subprocess
 from datetime import datetime, timedelta
@@ -17,6 +16,10 @@ from fastapi import APIRouter, HTTPException, Request, Depends, BackgroundTasks
 from fastapi.responses import FileResponse
 from pydantic import BaseModel
 
+from db_pool import get_pool
+from migrations import AI_MIGRATIONS_DIR, run_migrations
+from catalog import get_catalog
+
 # LangGraph imports
 from langchain_anthropic import ChatAnthropic
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
@@ -232,14 +235,24 @@ DETAIL_KEYWORDS = [
 
 DB_PATH = '/var/www/promarkirui/backend/promarkirui.db'
 
+_migrated = False
+
+
 @contextmanager
 def get_db():
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
+    global _migrated
+    conn = get_pool(DB_PATH).acquire()
     try:
+        if not _migrated:
+            # Схема БД консультанта ведётся отдельно: migrations/ai/
+            _migrated = True
+            try:
+                run_migrations(conn, AI_MIGRATIONS_DIR)
+            except Exception as e:
+                print(f'[DB] Migrations failed: {e}')
         yield conn
     finally:
-        conn.close()
+        get_pool(DB_PATH).release(conn)
 
 # ==================== МОДЕЛИ API ====================
 
@@ -544,29 +557,12 @@ class AgentState(TypedDict):
 
 # ==================== ИНСТРУМЕНТЫ АГЕНТА ====================
 
-# Ленивая загрузка данных о товарах
-_categories_data = None
-_products_lookup = None
-
+# Данные о товарах - из общего каталога процесса (без импорта server)
 def get_categories_data():
-    global _categories_data
-    if _categories_data is None:
-        try:
-            from server import CATEGORIES_DATA
-            _categories_data = CATEGORIES_DATA
-        except ImportError:
-            _categories_data = []
-    return _categories_data
+    return get_catalog().categories
 
 def get_products_lookup():
-    global _products_lookup
-    if _products_lookup is None:
-        try:
-            from server import PRODUCTS_LOOKUP
-            _products_lookup = PRODUCTS_LOOKUP
-        except ImportError:
-            _products_lookup = {}
-    return _products_lookup
+    return get_catalog().products_lookup
 
 @tool
 def search_product(query: str) -> str:
@@ -14,6 +14,7 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel, EmailStr
 
 from database import UserDB, EmailVerificationDB, ClientDB, verify_password
+from db_async import run_db
 from email_service import generate_verification_token, send_verification_email
 
 # Секретный ключ для JWT - ОБЯЗАТЕЛЬНО установить в .env!
@@ -103,7 +104,7 @@ async def get_current_user(
     if not payload:
         return None
 
-    user = UserDB.get_by_id(int(payload["sub"]))
+    user = await run_db(UserDB.get_by_id, int(payload["sub"]))
     if not user or not user.get('is_active'):
         return None
 
@@ -137,7 +138,7 @@ async def require_auth(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user = UserDB.get_by_id(int(payload["sub"]))
+    user = await run_db(UserDB.get_by_id, int(payload["sub"]))
     if not user or not user.get('is_active'):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
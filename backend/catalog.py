@@ -0,0 +1,539 @@
+# -*- coding: utf-8 -*-
+"""
+Каталог справочных данных маркировки
+Единая точка загрузки tnved.json, tnved_marking.json, marking_timeline.json,
+category_requirements.json и CATEGORIES_DATA, а также построенных по ним индексов.
+API, Telegram-бот и AI-консультант берут данные отсюда через get_catalog().
+
+Файлы данных можно обновлять без рестарта: фоновый поток (start_catalog_reloader)
+следит за mtime, собирает новый снимок и атомарно подменяет текущий.
+Запросы, уже получившие снимок, дорабатывают со старыми данными.
+
+Для быстрого холодного старта каталог можно заранее скомпилировать
+в бинарный снимок: python catalog.py build-snapshot. Снимок используется,
+только если его контрольная сумма совпадает с исходниками, иначе - JSON.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import threading
+from bisect import bisect_right
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from tnved_index import CategoryIndex, CodeTrie, NameIndex, normalize_tnved_code
+
+logger = logging.getLogger(__name__)
+
+# ======================== ПУТИ К ДАННЫМ ========================
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+TNVED_PATH = os.path.join(DATA_DIR, 'tnved.json')
+TNVED_MARKING_PATH = os.path.join(DATA_DIR, 'tnved_marking.json')
+TIMELINE_PATH = os.path.join(DATA_DIR, 'marking_timeline.json')
+CATEGORY_REQUIREMENTS_PATH = os.path.join(DATA_DIR, 'category_requirements.json')
+
+# Окно ближайших дедлайнов (дней)
+UPCOMING_WINDOW_DAYS = 180
+# Сколько ближайших событий отдавать
+UPCOMING_EVENTS_LIMIT = 10
+
+# Файлы, изменение которых приводит к перезагрузке каталога
+SOURCE_PATHS = (TNVED_PATH, TNVED_MARKING_PATH, TIMELINE_PATH, CATEGORY_REQUIREMENTS_PATH)
+
+# Скомпилированный снимок каталога с готовыми индексами
+SNAPSHOT_PATH = os.path.join(DATA_DIR, 'catalog.snapshot.pickle')
+# Увеличивать при несовместимых изменениях Catalog / индексов
+SNAPSHOT_FORMAT = 1
+_BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+# Исходники, от которых зависит содержимое снимка (кроме файлов данных)
+SNAPSHOT_CODE_PATHS = (
+    os.path.join(_BACKEND_DIR, 'catalog_data.py'),
+    os.path.join(_BACKEND_DIR, 'tnved_index.py'),
+    os.path.abspath(__file__),
+)
+
+# Период проверки mtime файлов данных (секунды, 0 - не следить)
+CATALOG_RELOAD_INTERVAL = int(os.getenv('CATALOG_RELOAD_INTERVAL', '30'))
+
+
+# ======================== ПОСТРОЕНИЕ ИНДЕКСОВ ========================
+
+def _load_json(path: str, default: Any, strict: bool = False) -> Any:
+    """
+    Прочитать JSON файл, при ошибке вернуть default.
+    strict=True - битый файл (например, недописанный) пробрасывает исключение.
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        logger.info(f"Loaded {os.path.basename(path)}")
+        return data
+    except FileNotFoundError:
+        logger.warning(f"{os.path.basename(path)} not found, using empty data")
+    except Exception as e:
+        if strict:
+            raise
+        logger.error(f"Failed to load {os.path.basename(path)}: {e}")
+    return default
+
+
+def _source_signature() -> Tuple:
+    """Отпечаток файлов данных (mtime и размер) для обнаружения изменений"""
+    signature = []
+    for path in SOURCE_PATHS:
+        try:
+            stat = os.stat(path)
+            signature.append((path, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append((path, None, None))
+    return tuple(signature)
+
+
+def build_products_lookup(categories: List[Dict]) -> Dict[str, Dict]:
+    """Словарь товаров по id (3-уровневая структура CATEGORIES_DATA)"""
+    lookup = {}
+    for category in categories:
+        for sub in category.get("subcategories", []):
+            for product in sub.get("products", []):
+                lookup[product["id"]] = {
+                    "category_id": category["id"],
+                    "category_name": category["name"],
+                    "subcategory_id": sub["id"],
+                    "subcategory_name": sub["name"],
+                    "name": product["name"],
+                    "tnved": product.get("tnved", ""),
+                    "marking_status": product.get("marking_status", "not_required"),
+                    "mandatory_since": product.get("mandatory_since"),
+                    "timeline": product.get("timeline")
+                }
+    return lookup
+
+
+def build_tnved_lookup(tnved_data: List[Dict], categories: List[Dict]) -> Dict[str, Dict]:
+    """Словарь кодов ТН ВЭД: tnved.json (единая база) + CATEGORIES_DATA (детали)"""
+    lookup = {}
+
+    # 1. Сначала коды с маркировкой из tnved.json
+    for item in tnved_data:
+        if item.get('requires_marking') or item.get('is_experimental'):
+            code = item.get('code', '')
+            if code:
+                entry = {
+                    "category_id": "tnved",
+                    "category_name": item.get('marking_group', 'ТН ВЭД'),
+                    "subcategory_id": "tnved",
+                    "subcategory_name": item.get('marking_subcategory', ''),
+                    "name": item.get('name', ''),
+                    "tnved": item.get('code_formatted', code),
+                    "marking_status": item.get('marking_status', 'not_required'),
+                    "mandatory_since": None,
+                    "timeline": None
+                }
+                lookup[code] = entry
+                # Также по нормализованному коду
+                normalized = code.replace(' ', '')
+                if normalized != code:
+                    lookup[normalized] = entry
+
+    # 2. Дополняем/перезаписываем из CATEGORIES_DATA (более детальная инфо)
+    for category in categories:
+        for sub in category.get("subcategories", []):
+            for product in sub.get("products", []):
+                tnved = product.get("tnved", "")
+                if tnved and tnved != '-' and ';' not in tnved:
+                    entry = {
+                        "category_id": category["id"],
+                        "category_name": category["name"],
+                        "subcategory_id": sub["id"],
+                        "subcategory_name": sub["name"],
+                        "name": product["name"],
+                        "tnved": tnved,
+                        "marking_status": product.get("marking_status", "not_required"),
+                        "mandatory_since": product.get("mandatory_since"),
+                        "timeline": product.get("timeline")
+                    }
+                    lookup[tnved] = entry
+                    # Также по нормализованному коду
+                    normalized = tnved.replace(" ", "")
+                    if normalized != tnved:
+                        lookup[normalized] = entry
+
+    return lookup
+
+
+def build_tnved_stats(tnved_data: List[Dict], categories: List[Dict]) -> Dict:
+    """Статистика: всего кодов из tnved.json, обязательных/эксперимент из CATEGORIES_DATA"""
+    total = len(tnved_data)
+    mandatory = 0
+    experimental = 0
+    for category in categories:
+        for subcategory in category.get("subcategories", []):
+            for product in subcategory.get("products", []):
+                status = product.get("marking_status", "not_required")
+                if status == "mandatory":
+                    mandatory += 1
+                elif status == "experiment":
+                    experimental += 1
+    return {
+        "loaded": True,
+        "total": total,
+        "mandatory": mandatory,
+        "experimental": experimental,
+        "not_required": total - mandatory - experimental
+    }
+
+
+def build_timeline_index(timeline_categories: Dict[str, Dict]) -> Tuple[Dict[str, int], List[date], List[Dict]]:
+    """
+    Индекс сроков маркировки: счётчики статусов и незавершённые события,
+    отсортированные по дате (даты парсятся один раз при загрузке).
+    Возвращает (счётчики, даты событий, события в формате ответа API).
+    """
+    status_counts = {"active": 0, "partial": 0}
+    dated_events = []
+
+    for cat_name, cat_data in timeline_categories.items():
+        status = cat_data.get("status", "")
+        if status in status_counts:
+            status_counts[status] += 1
+
+        for event in cat_data.get("events", []):
+            if event.get("is_completed", False):
+                continue
+            date_str = event.get("date", "")
+            if not date_str:
+                continue
+            try:
+                event_date = datetime.strptime(date_str, "%Y-%m-%d").date()
+            except (TypeError, ValueError):
+                continue
+            dated_events.append((event_date, {
+                "date": date_str,
+                "date_display": event.get("date_display", ""),
+                "category": cat_name,
+                "title": event.get("title", ""),
+                "type_label": event.get("type_label", ""),
+                "description": event.get("description", "")[:200] if event.get("description") else ""
+            }))
+
+    # Сортировка устойчивая: события одной даты остаются в порядке файла
+    dated_events.sort(key=lambda pair: pair[0])
+    return status_counts, [pair[0] for pair in dated_events], [pair[1] for pair in dated_events]
+
+
+def build_category_index(categories: Dict[str, Any]) -> CategoryIndex:
+    """Индекс категорий {название: данные} по названию, id и синонимам (поле aliases)"""
+    def aliases(data: Any) -> List[str]:
+        if not isinstance(data, dict):
+            return []
+        result = [str(data["id"])] if data.get("id") else []
+        result.extend(data.get("aliases") or [])
+        return result
+
+    return CategoryIndex((name, data, aliases(data)) for name, data in categories.items())
+
+
+# ======================== КАТАЛОГ ========================
+
+class Catalog:
+    """Снимок справочных данных и индексов. После построения только читается."""
+
+    def __init__(self, categories: List[Dict], tnved_data: List[Dict], tnved_marking: Dict,
+                 timeline: Dict, category_requirements: Dict, version: int = 1,
+                 signature: Tuple = ()):
+        self.version = version
+        self.signature = signature
+        self.loaded_at = datetime.now()
+
+        self.categories = categories
+        self.tnved_data = tnved_data
+        self.tnved_marking = tnved_marking
+        self.timeline = timeline
+        self.category_requirements = category_requirements
+
+        self.products_lookup = build_products_lookup(categories)
+        self.tnved_lookup = build_tnved_lookup(tnved_data, categories)
+        self.tnved_stats = build_tnved_stats(tnved_data, categories)
+
+        # Коды с маркировкой (нормализованные ключи TNVED_LOOKUP)
+        self.tnved_index = CodeTrie(
+            (code, entry) for code, entry in self.tnved_lookup.items() if code.isdigit()
+        )
+        # Полный справочник tnved.json: поиск по коду и по названию
+        self.tnved_code_index = CodeTrie((item.get('code', ''), item) for item in tnved_data)
+        self.tnved_name_index = NameIndex((item.get('name', ''), item) for item in tnved_data)
+        # tnved_marking.json (бот): longest-prefix поиск по коду
+        self.marking_index = CodeTrie(tnved_marking.items())
+        # marking_timeline.json: события по дате для окна ближайших дедлайнов
+        self.timeline_status_counts, self.timeline_event_dates, self.timeline_events = \
+            build_timeline_index(self.timeline_categories)
+        # Поиск категории сроков и требований по названию, id, синонимам
+        self.timeline_category_index = build_category_index(self.timeline_categories)
+        self.requirements_index = build_category_index(category_requirements or {})
+        # Статистика на текущий день: (дата, результат), пересчитывается при смене дня
+        self._timeline_stats: Optional[Tuple[date, Dict]] = None
+
+    @property
+    def timeline_categories(self) -> Dict[str, Dict]:
+        return self.timeline.get("categories", {}) if self.timeline else {}
+
+    def timeline_stats(self, today: Optional[date] = None) -> Dict:
+        """
+        Статистика по срокам с ближайшими дедлайнами в окне (today, today + UPCOMING_WINDOW_DAYS].
+        Окно находится двоичным поиском по отсортированным датам,
+        результат запоминается до смены дня.
+        """
+        today = today or date.today()
+        cached = self._timeline_stats
+        if cached is not None and cached[0] == today:
+            return cached[1]
+
+        lo = bisect_right(self.timeline_event_dates, today)
+        hi = bisect_right(self.timeline_event_dates, today + timedelta(days=UPCOMING_WINDOW_DAYS))
+        stats = {
+            "active": self.timeline_status_counts["active"],
+            "partial": self.timeline_status_counts["partial"],
+            "upcoming_count": hi - lo,
+            "upcoming_events": self.timeline_events[lo:min(hi, lo + UPCOMING_EVENTS_LIMIT)]
+        }
+        self._timeline_stats = (today, stats)
+        return stats
+
+    def find_timeline_category(self, query: str) -> Optional[Tuple[str, Dict]]:
+        """Категория marking_timeline.json: (название, данные) или None"""
+        return self.timeline_category_index.find(query)
+
+    def find_category_requirements(self, query: str) -> Optional[Tuple[str, Dict]]:
+        """Требования category_requirements.json: (название, данные) или None"""
+        return self.requirements_index.find(query)
+
+    def find_marking_info(self, code: str) -> Optional[Dict]:
+        """
+        Поиск кода в tnved_marking.json: точное совпадение или самый длинный
+        известный префикс (не короче 4 знаков) за один проход по дереву.
+        """
+        code = normalize_tnved_code(code)
+        match = self.marking_index.longest_prefix(code, min_length=4)
+        if not match:
+            return None
+
+        matched_code, entries = match
+        if matched_code == code:
+            return {'code': code, 'entries': entries, 'match_type': 'exact'}
+        return {'code': code, 'matched_prefix': matched_code, 'entries': entries, 'match_type': 'prefix'}
+
+    def resolve_product(self, query: str) -> Tuple[Optional[Dict], Optional[str], Optional[str]]:
+        """
+        Найти товар по id из CATEGORIES_DATA, "tnved_<код>" или коду ТН ВЭД.
+        Для кода берётся самый длинный известный префикс (не короче 4 знаков).
+        Возвращает (запись, тип совпадения 'id'/'exact'/'prefix', найденный код).
+        """
+        query = (query or '').strip()
+        if not query:
+            return None, None, None
+
+        product = self.products_lookup.get(query)
+        if product:
+            return product, 'id', normalize_tnved_code(product.get('tnved', ''))
+
+        code = normalize_tnved_code(query[len('tnved_'):] if query.startswith('tnved_') else query)
+        match = self.tnved_index.longest_prefix(code, min_length=4)
+        if not match:
+            return None, None, None
+        matched_code, product = match
+        return product, 'exact' if matched_code == code else 'prefix', matched_code
+
+
+def _snapshot_checksum() -> str:
+    """Контрольная сумма исходников снимка: файлы данных + код каталога"""
+    digest = hashlib.sha256(f"format:{SNAPSHOT_FORMAT}".encode())
+    for path in SOURCE_PATHS + SNAPSHOT_CODE_PATHS:
+        digest.update(path.encode())
+        try:
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+        except FileNotFoundError:
+            digest.update(b'<missing>')
+    return digest.hexdigest()
+
+
+def _load_snapshot(signature: Tuple, version: int) -> Optional[Catalog]:
+    """Загрузить снимок, если он есть и соответствует исходникам"""
+    try:
+        with open(SNAPSHOT_PATH, 'rb') as f:
+            payload = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Catalog snapshot unreadable, falling back to JSON: {e}")
+        return None
+
+    if payload.get('format') != SNAPSHOT_FORMAT or payload.get('checksum') != _snapshot_checksum():
+        logger.info("Catalog snapshot is stale, falling back to JSON")
+        return None
+
+    catalog = payload['catalog']
+    catalog.version = version
+    catalog.signature = signature
+    catalog.loaded_at = datetime.now()
+    logger.info(f"Catalog v{version} loaded from snapshot ({payload.get('built_at')})")
+    return catalog
+
+
+def build_snapshot(path: str = SNAPSHOT_PATH) -> Catalog:
+    """Скомпилировать каталог из JSON в бинарный снимок (атомарная запись)"""
+    checksum = _snapshot_checksum()
+    catalog = _load_catalog_from_json(_source_signature(), version=1, strict=True)
+    payload = {
+        'format': SNAPSHOT_FORMAT,
+        'checksum': checksum,
+        'built_at': datetime.now().isoformat(),
+        'catalog': catalog,
+    }
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+    logger.info(f"Catalog snapshot written to {path}")
+    return catalog
+
+
+def load_catalog(version: int = 1, strict: bool = False) -> Catalog:
+    """Загрузить каталог: из актуального снимка, иначе из JSON с построением индексов"""
+    # Отпечаток снимаем до чтения: если файл поменяется во время загрузки,
+    # следующая проверка увидит расхождение и перезагрузит ещё раз
+    signature = _source_signature()
+    catalog = _load_snapshot(signature, version)
+    if catalog is None:
+        catalog = _load_catalog_from_json(signature, version, strict)
+    return catalog
+
+
+def _load_catalog_from_json(signature: Tuple, version: int, strict: bool) -> Catalog:
+    """Прочитать все справочники с диска и построить индексы"""
+    from catalog_data import CATEGORIES_DATA
+
+    catalog = Catalog(
+        categories=CATEGORIES_DATA,
+        tnved_data=_load_json(TNVED_PATH, [], strict),
+        tnved_marking=_load_json(TNVED_MARKING_PATH, {}, strict),
+        timeline=_load_json(TIMELINE_PATH, {}, strict),
+        category_requirements=_load_json(CATEGORY_REQUIREMENTS_PATH, {}, strict),
+        version=version,
+        signature=signature,
+    )
+    logger.info(
+        f"Catalog v{version} loaded: {len(catalog.products_lookup)} products, "
+        f"{len(catalog.tnved_data)} TNVED codes, {len(catalog.tnved_marking)} marking codes"
+    )
+    return catalog
+
+
+_catalog: Optional[Catalog] = None
+_catalog_lock = threading.Lock()
+
+
+def get_catalog() -> Catalog:
+    """
+    Текущий снимок каталога (загружается при первом обращении).
+    Запрос должен брать снимок один раз и работать с ним до конца.
+    """
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = load_catalog()
+    return _catalog
+
+
+def reload_catalog(force: bool = False) -> bool:
+    """
+    Пересобрать каталог, если файлы данных изменились.
+    Новый снимок строится целиком и подменяет старый одним присваиванием.
+    Возвращает True, если данные были обновлены.
+    """
+    global _catalog
+    current = get_catalog()
+    if not force and _source_signature() == current.signature:
+        return False
+
+    try:
+        fresh = load_catalog(version=current.version + 1, strict=True)
+    except Exception as e:
+        logger.error(f"Catalog reload failed, keeping v{current.version}: {e}")
+        return False
+
+    with _catalog_lock:
+        # Параллельная перезагрузка могла уже поставить более свежий снимок
+        if _catalog is not None and _catalog.version >= fresh.version:
+            return False
+        _catalog = fresh
+    logger.info(f"Catalog swapped to v{fresh.version}")
+    return True
+
+
+class CatalogReloader(threading.Thread):
+    """Фоновый поток, периодически проверяющий mtime файлов данных"""
+
+    def __init__(self, interval: int):
+        super().__init__(name="catalog-reloader", daemon=True)
+        self.interval = interval
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                reload_catalog()
+            except Exception as e:
+                logger.error(f"Catalog reloader error: {e}")
+
+    def stop(self):
+        self._stop_event.set()
+
+
+_reloader: Optional[CatalogReloader] = None
+
+
+def start_catalog_reloader(interval: int = CATALOG_RELOAD_INTERVAL) -> Optional[CatalogReloader]:
+    """Запустить слежение за файлами данных (один поток на процесс)"""
+    global _reloader
+    if interval <= 0:
+        return None
+    with _catalog_lock:
+        if _reloader is None or not _reloader.is_alive():
+            _reloader = CatalogReloader(interval)
+            _reloader.start()
+            logger.info(f"Catalog reloader started (every {interval}s)")
+    return _reloader
+
+
+def stop_catalog_reloader():
+    """Остановить слежение за файлами данных"""
+    global _reloader
+    if _reloader is not None:
+        _reloader.stop()
+        _reloader = None
+
+
+# ======================== TIMELINE ========================
+
+def get_timeline_stats_with_upcoming(catalog: Optional[Catalog] = None) -> Dict:
+    """Расчёт статистики с ближайшими дедлайнами"""
+    return (catalog or get_catalog()).timeline_stats()
+
+
+if __name__ == '__main__':
+    import sys
+
+    logging.basicConfig(level=logging.INFO)
+
+    if len(sys.argv) > 1 and sys.argv[1] == 'build-snapshot':
+        # Импорт по имени модуля, чтобы классы в снимке ссылались на catalog, а не на __main__
+        from catalog import build_snapshot as _build_snapshot
+        _build_snapshot(sys.argv[2] if len(sys.argv) > 2 else SNAPSHOT_PATH)
+    else:
+        print("Usage: python catalog.py build-snapshot [path]")
+        sys.exit(1)
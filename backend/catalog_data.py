@@ -0,0 +1,1439 @@
+# -*- coding: utf-8 -*-
+"""
+Справочник категорий маркировки
+Загружается и индексируется модулем catalog.py
+"""
+
+# 3 уровня: Категория → Подкатегория → Товары (products)
+# Товары будут добавляться постепенно через админку
+
+CATEGORIES_DATA = [
+    {
+        "id": "food_drinks",
+        "name": "Продукты питания и напитки",
+        "icon": "utensils",
+        "subcategories": [
+            {"id": "beer_alcohol", "name": "Пиво и слабоалкогольные напитки", "icon": "beer", "products": [
+                {"id": "beer_alcohol_2203", "name": "пиво крепостью от 0,5 % до 8,6 % включительно,; пиво крепостью свыше 8", "tnved": "2203", "marking_status": "mandatory"},
+                {"id": "beer_alcohol_220300", "name": "Пиво солодовое:", "tnved": "2203 00", "marking_status": "mandatory"},
+                {"id": "beer_alcohol_2206", "name": "пиво крепостью от 0,5 % до 8,6 % включительно,; пиво крепостью свыше 8", "tnved": "2206", "marking_status": "mandatory"},
+                {"id": "beer_alcohol_220600", "name": "Напитки прочие сброженные (например, сидр, сидр грушевый, напиток медо", "tnved": "2206 00", "marking_status": "mandatory"},
+                {"id": "beer_alcohol_22060031", "name": "сидр, пуаре", "tnved": "2206 00 31", "marking_status": "mandatory"},
+                {"id": "beer_alcohol_2206003100", "name": "сидр и грушевый сидр", "tnved": "2206 00 310 0", "marking_status": "mandatory"},
+                {"id": "beer_alcohol_22060051", "name": "сидр, пуаре", "tnved": "2206 00 51", "marking_status": "mandatory"},
+                {"id": "beer_alcohol_2206005100", "name": "сидр и грушевый сидр", "tnved": "2206 00 510 0", "marking_status": "mandatory"},
+                {"id": "beer_alcohol_22060081", "name": "сидр, пуаре", "tnved": "2206 00 81", "marking_status": "mandatory"},
+                {"id": "beer_alcohol_2206008100", "name": "сидр и грушевый сидр", "tnved": "2206 00 810 0", "marking_status": "mandatory"},
+                {"id": "beer_alcohol_22060039", "name": "напитки слабоалкогольные брожения", "tnved": "2206 00 39", "marking_status": "mandatory"},
+                {"id": "beer_alcohol_2206003901", "name": "с фактической концентрацией спирта не более 7 об.%", "tnved": "2206 00 390 1", "marking_status": "mandatory"},
+                {"id": "beer_alcohol_22060059", "name": "напитки слабоалкогольные брожения", "tnved": "2206 00 59", "marking_status": "mandatory"},
+                {"id": "beer_alcohol_2206005901", "name": "с фактической концентрацией спирта не более 7 об.%", "tnved": "2206 00 590 1", "marking_status": "mandatory"},
+                {"id": "beer_alcohol_22060089", "name": "напитки слабоалкогольные брожения", "tnved": "2206 00 89", "marking_status": "mandatory"},
+                {"id": "beer_alcohol_2206008901", "name": "с фактической концентрацией спирта не более 7 об.%", "tnved": "2206 00 890 1", "marking_status": "mandatory"}
+            ]},
+            {"id": "dairy", "name": "Молочная продукция", "icon": "milk", "products": [
+                {
+                    "id": "dairy_0401", "name": "Молоко и сливки несгущенные", "tnved": "0401",
+                    "marking_status": "mandatory", "mandatory_since": "2021-12-01",
+                    "timeline": {
+                        "title": "Срок годности до 40 дней",
+                        "start_date": "1 декабря 2021",
+                        "who": ["Производители", "Импортёры", "Оптовики", "Розница"],
+                        "current_requirements": [
+                            "Регистрация в Честном ЗНАКе",
+                            "Нанесение кодов маркировки",
+                            "Передача данных при продаже на кассе",
+                            "Электронный документооборот (ЭДО)"
+                        ]
+                    }
+                },
+                {
+                    "id": "dairy_0402", "name": "Молоко и сливки сгущенные", "tnved": "0402",
+                    "marking_status": "mandatory", "mandatory_since": "2021-09-01",
+                    "timeline": {
+                        "title": "Срок годности более 40 дней",
+                        "start_date": "1 сентября 2021",
+                        "who": ["Производители", "Импортёры", "Оптовики", "Розница"],
+                        "current_requirements": [
+                            "Регистрация в Честном ЗНАКе",
+                            "Нанесение кодов маркировки",
+                            "Передача данных при продаже на кассе",
+                            "Электронный документооборот (ЭДО)"
+                        ]
+                    }
+                },
+                {
+                    "id": "dairy_0403", "name": "Пахта, йогурт, кефир", "tnved": "0403",
+                    "marking_status": "mandatory", "mandatory_since": "2021-12-01",
+                    "timeline": {
+                        "title": "Срок годности до 40 дней",
+                        "start_date": "1 декабря 2021",
+                        "who": ["Производители", "Импортёры", "Оптовики", "Розница"],
+                        "current_requirements": [
+                            "Регистрация в Честном ЗНАКе",
+                            "Нанесение кодов маркировки",
+                            "Передача данных при продаже на кассе",
+                            "Электронный документооборот (ЭДО)"
+                        ]
+                    }
+                },
+                {
+                    "id": "dairy_0404", "name": "Молочная сыворотка", "tnved": "0404",
+                    "marking_status": "mandatory", "mandatory_since": "2021-09-01",
+                    "timeline": {
+                        "title": "Срок годности более 40 дней",
+                        "start_date": "1 сентября 2021",
+                        "who": ["Производители", "Импортёры", "Оптовики", "Розница"],
+                        "current_requirements": [
+                            "Регистрация в Честном ЗНАКе",
+                            "Нанесение кодов маркировки",
+                            "Передача данных при продаже на кассе",
+                            "Электронный документооборот (ЭДО)"
+                        ]
+                    }
+                },
+                {
+                    "id": "dairy_0405", "name": "Сливочное масло", "tnved": "0405",
+                    "marking_status": "mandatory", "mandatory_since": "2021-09-01",
+                    "timeline": {
+                        "title": "Срок годности более 40 дней",
+                        "start_date": "1 сентября 2021",
+                        "who": ["Производители", "Импортёры", "Оптовики", "Розница"],
+                        "current_requirements": [
+                            "Регистрация в Честном ЗНАКе",
+                            "Нанесение кодов маркировки",
+                            "Передача данных при продаже на кассе",
+                            "Электронный документооборот (ЭДО)"
+                        ]
+                    }
+                },
+                {
+                    "id": "dairy_0406", "name": "Сыры и творог", "tnved": "0406",
+                    "marking_status": "mandatory", "mandatory_since": "2021-06-01",
+                    "timeline": {
+                        "title": "Сыры — первая категория",
+                        "start_date": "1 июня 2021",
+                        "who": ["Производители", "Импортёры", "Оптовики", "Розница", "Фермеры (с 1.09.2024)"],
+                        "current_requirements": [
+                            "Регистрация в Честном ЗНАКе",
+                            "Нанесение кодов маркировки",
+                            "Передача данных при продаже на кассе",
+                            "Разрешительный режим на кассах",
+                            "Электронный документооборот (ЭДО)"
+                        ]
+                    }
+                },
+                {
+                    "id": "dairy_210500", "name": "Мороженое", "tnved": "2105 00",
+                    "marking_status": "mandatory", "mandatory_since": "2021-06-01",
+                    "timeline": {
+                        "title": "Мороженое — первая категория",
+                        "start_date": "1 июня 2021",
+                        "who": ["Производители", "Импортёры", "Оптовики", "Розница", "Фермеры (с 1.09.2024)"],
+                        "current_requirements": [
+                            "Регистрация в Честном ЗНАКе",
+                            "Нанесение кодов маркировки",
+                            "Передача данных при продаже на кассе",
+                            "Разрешительный режим на кассах",
+                            "Электронный документооборот (ЭДО)"
+                        ]
+                    }
+                },
+                {
+                    "id": "dairy_2202999100", "name": "Молочные напитки (до 0,2% жира)", "tnved": "2202 99 910 0",
+                    "marking_status": "mandatory", "mandatory_since": "2021-12-01",
+                    "timeline": {
+                        "title": "Молочные напитки",
+                        "start_date": "1 декабря 2021",
+                        "who": ["Производители", "Импортёры", "Оптовики", "Розница"],
+                        "current_requirements": [
+                            "Регистрация в Честном ЗНАКе",
+                            "Нанесение кодов маркировки",
+                            "Передача данных при продаже на кассе",
+                            "Электронный документооборот (ЭДО)"
+                        ]
+                    }
+                },
+                {
+                    "id": "dairy_2202999500", "name": "Молочные напитки (0,2-2% жира)", "tnved": "2202 99 950 0",
+                    "marking_status": "mandatory", "mandatory_since": "2021-12-01",
+                    "timeline": {
+                        "title": "Молочные напитки",
+                        "start_date": "1 декабря 2021",
+                        "who": ["Производители", "Импортёры", "Оптовики", "Розница"],
+                        "current_requirements": [
+                            "Регистрация в Честном ЗНАКе",
+                            "Нанесение кодов маркировки",
+                            "Передача данных при продаже на кассе",
+                            "Электронный документооборот (ЭДО)"
+                        ]
+                    }
+                },
+                {
+                    "id": "dairy_2202999900", "name": "Молочные напитки (от 2% жира)", "tnved": "2202 99 990 0",
+                    "marking_status": "mandatory", "mandatory_since": "2021-12-01",
+                    "timeline": {
+                        "title": "Молочные напитки",
+                        "start_date": "1 декабря 2021",
+                        "who": ["Производители", "Импортёры", "Оптовики", "Розница"],
+                        "current_requirements": [
+                            "Регистрация в Честном ЗНАКе",
+                            "Нанесение кодов маркировки",
+                            "Передача данных при продаже на кассе",
+                            "Электронный документооборот (ЭДО)"
+                        ]
+                    }
+                }
+            ]},
+            {"id": "water", "name": "Упакованная вода", "icon": "droplet", "products": [
+                {"id": "water_220110_1", "name": "Природные минеральные воды газированные", "tnved": "2201 10", "marking_status": "mandatory"},
+                {"id": "water_220110_2", "name": "Природные минеральные воды негазированные", "tnved": "2201 10", "marking_status": "mandatory"},
+                {"id": "water_220110_3", "name": "Природные минеральные воды слабогазированные", "tnved": "2201 10", "marking_status": "mandatory"},
+                {"id": "water_22019000_1", "name": "Вода питьевая газированная", "tnved": "2201 90 000 0", "marking_status": "mandatory"},
+                {"id": "water_22019000_2", "name": "Вода питьевая негазированная", "tnved": "2201 90 000 0", "marking_status": "mandatory"},
+                {"id": "water_22019000_3", "name": "Вода питьевая слабогазированная", "tnved": "2201 90 000 0", "marking_status": "mandatory"},
+                {"id": "water_22019000_4", "name": "Вода питьевая прочая", "tnved": "2201 90 000 0", "marking_status": "mandatory"},
+                {"id": "water_22019000_5", "name": "Вода для детского питания", "tnved": "2201 90 000 0", "marking_status": "mandatory"}
+            ]},
+            {"id": "tobacco", "name": "Табак", "icon": "cigarette", "products": [
+                {"id": "tobacco_2402", "name": "Сигары, сигары с обрезанными концами, сигариллы и сигареты из табака и", "tnved": "2402", "marking_status": "mandatory"},
+                {"id": "tobacco_240220", "name": "сигареты, содержащие табак:", "tnved": "2402 20", "marking_status": "mandatory"},
+                {"id": "tobacco_24022090", "name": "сигареты", "tnved": "2402 20 90", "marking_status": "mandatory"},
+                {"id": "tobacco_2402209000", "name": "прочие", "tnved": "2402 20 900 0", "marking_status": "mandatory"},
+                {"id": "tobacco_2403", "name": "Прочий промышленно изготовленный табак и промышленные заменители табак", "tnved": "2403", "marking_status": "mandatory"},
+                {"id": "tobacco_240311", "name": "табак для кальяна, сигары, сигары с обрезанными концами (черуты), сига", "tnved": "2403 11", "marking_status": "mandatory"},
+                {"id": "tobacco_24031100", "name": "табак для кальяна, сигары, сигары с обрезанными концами (черуты), сига", "tnved": "2403 11 00", "marking_status": "mandatory"},
+                {"id": "tobacco_2403110000", "name": "табак для кальяна, сигары, сигары с обрезанными концами (черуты), сига", "tnved": "2403 11 000 0", "marking_status": "mandatory"},
+                {"id": "tobacco_240210", "name": "табак для кальяна, сигары, сигары с обрезанными концами (черуты), сига", "tnved": "2402 10", "marking_status": "mandatory"},
+                {"id": "tobacco_24021000", "name": "табак для кальяна, сигары, сигары с обрезанными концами (черуты), сига", "tnved": "2402 10 00", "marking_status": "mandatory"},
+                {"id": "tobacco_2402100000", "name": "сигары, сигары с обрезанными концами и сигариллы, содержащие табак", "tnved": "2402 10 000 0", "marking_status": "mandatory"},
+                {"id": "tobacco_24022010", "name": "табак для кальяна, сигары, сигары с обрезанными концами (черуты), сига", "tnved": "2402 20 10", "marking_status": "mandatory"},
+                {"id": "tobacco_2402201000", "name": "содержащие гвоздику", "tnved": "2402 20 100 0", "marking_status": "mandatory"},
+                {"id": "tobacco_240319", "name": "прочий:", "tnved": "2403 19", "marking_status": "mandatory"},
+                {"id": "tobacco_24031910", "name": "табак для кальяна, сигары, сигары с обрезанными концами (черуты), сига", "tnved": "2403 19 10", "marking_status": "mandatory"},
+                {"id": "tobacco_2403191000", "name": "в первичных упаковках нетто-массой не более 500 г", "tnved": "2403 19 100 0", "marking_status": "mandatory"},
+                {"id": "tobacco_240399", "name": "прочий:", "tnved": "2403 99", "marking_status": "mandatory"},
+                {"id": "tobacco_24039910", "name": "табак для кальяна, сигары, сигары с обрезанными концами (черуты), сига", "tnved": "2403 99 10", "marking_status": "mandatory"},
+                {"id": "tobacco_2403991000", "name": "жевательный и нюхательный табак", "tnved": "2403 99 100 0", "marking_status": "mandatory"},
+                {"id": "tobacco_24039990", "name": "табачные изделия, предназначенные для потребления путем нагревания;; к", "tnved": "2403 99 90", "marking_status": "mandatory"},
+                {"id": "tobacco_2403999008", "name": "прочий", "tnved": "2403 99 900 8", "marking_status": "mandatory"},
+                {"id": "tobacco_2404", "name": "Продукция, содержащая табак, восстановленный табак, никотин, или замен", "tnved": "2404", "marking_status": "mandatory"},
+                {"id": "tobacco_240411", "name": "табачные изделия, предназначенные для потребления путем нагревания;; к", "tnved": "2404 11", "marking_status": "mandatory"},
+                {"id": "tobacco_24041100", "name": "табачные изделия, предназначенные для потребления путем нагревания;; к", "tnved": "2404 11 00", "marking_status": "mandatory"},
+                {"id": "tobacco_2404110009", "name": "прочая", "tnved": "2404 11 000 9", "marking_status": "mandatory"},
+                {"id": "tobacco_240419", "name": "табачные изделия, предназначенные для потребления путем нагревания;; к", "tnved": "2404 19", "marking_status": "mandatory"},
+                {"id": "tobacco_24041900", "name": "табачные изделия, предназначенные для потребления путем нагревания;; к", "tnved": "2404 19 00", "marking_status": "mandatory"},
+                {"id": "tobacco_2404190001", "name": "содержащая заменители табака", "tnved": "2404 19 000 1", "marking_status": "mandatory"},
+                {"id": "tobacco_2404110001", "name": "содержащая \"гомогенизированный\" или \"восстановленный\" табак или табачн", "tnved": "2404 11 000 1", "marking_status": "mandatory"},
+                {"id": "tobacco_240412", "name": "Жидкости для электронных систем доставки никотина, в том числе безнико", "tnved": "2404 12", "marking_status": "mandatory"},
+                {"id": "tobacco_24041200", "name": "Жидкости для электронных систем доставки никотина, в том числе безнико", "tnved": "2404 12 00", "marking_status": "mandatory"},
+                {"id": "tobacco_2404120000", "name": "прочая, содержащая никотин", "tnved": "2404 12 000 0", "marking_status": "mandatory"},
+                {"id": "tobacco_2404190009", "name": "прочая", "tnved": "2404 19 000 9", "marking_status": "mandatory"}
+            ]},
+            {"id": "seafood", "name": "Морепродукты (икра)", "icon": "fish", "products": [
+                {"id": "seafood_1604", "name": "Готовая или консервированная рыба; икра осетровых и ее заменители, изг", "tnved": "1604", "marking_status": "mandatory"},
+                {"id": "seafood_160431", "name": "Икра осетровых", "tnved": "1604 31", "marking_status": "mandatory"},
+                {"id": "seafood_16043100", "name": "Икра осетровых", "tnved": "1604 31 00", "marking_status": "mandatory"},
+                {"id": "seafood_1604310000", "name": "икра осетровых", "tnved": "1604 31 000 0", "marking_status": "mandatory"},
+                {"id": "seafood_160432", "name": "Заменители икры осетровых: икра лососевых (красная икра)", "tnved": "1604 32", "marking_status": "mandatory"},
+                {"id": "seafood_16043200", "name": "Заменители икры осетровых: икра лососевых (красная икра)", "tnved": "1604 32 00", "marking_status": "mandatory"},
+                {"id": "seafood_1604320010", "name": "икра лососевых (красная икра)", "tnved": "1604 32 001 0", "marking_status": "mandatory"},
+                {"id": "seafood_0305", "name": "Рыба сушеная, соленая или в рассоле; рыба копченая, не подвергнутая ил", "tnved": "0305", "marking_status": "mandatory"},
+                {"id": "seafood_030520", "name": "Печень, икра и молоки рыб, сушеные, копченые, соленые или в рассоле", "tnved": "0305 20", "marking_status": "mandatory"},
+                {"id": "seafood_03052000", "name": "Печень, икра и молоки рыб, сушеные, копченые, соленые или в рассоле", "tnved": "0305 20 00", "marking_status": "mandatory"},
+                {"id": "seafood_0305200000", "name": "печень, икра и молоки рыбы, сушеные, копченые, соленые или в рассоле", "tnved": "0305 20 000 0", "marking_status": "mandatory"},
+                {"id": "seafood_0302", "name": "Печень, икра и молоки, свежие или охлажденные", "tnved": "0302", "marking_status": "mandatory"},
+                {"id": "seafood_030291", "name": "Печень, икра и молоки, свежие или охлажденные", "tnved": "0302 91", "marking_status": "mandatory"},
+                {"id": "seafood_03029100", "name": "Печень, икра и молоки, свежие или охлажденные", "tnved": "0302 91 00", "marking_status": "mandatory"},
+                {"id": "seafood_0302910000", "name": "печень, икра и молоки", "tnved": "0302 91 000 0", "marking_status": "mandatory"},
+                {"id": "seafood_0303", "name": "Икра и молоки для производства дезоксирибонуклеиновой кислоты или суль", "tnved": "0303", "marking_status": "mandatory"},
+                {"id": "seafood_030391", "name": "печень, икра и молоки:", "tnved": "0303 91", "marking_status": "mandatory"},
+                {"id": "seafood_03039110", "name": "Икра и молоки для производства дезоксирибонуклеиновой кислоты или суль", "tnved": "0303 91 10", "marking_status": "mandatory"},
+                {"id": "seafood_0303911000", "name": "икра и молоки для производства дезоксирибонуклеиновой кислоты или суль", "tnved": "0303 91 100 0", "marking_status": "mandatory"},
+                {"id": "seafood_03039190", "name": "Прочие печень, икра и молоки, мороженые", "tnved": "0303 91 90", "marking_status": "mandatory"},
+                {"id": "seafood_0303919000", "name": "прочие", "tnved": "0303 91 900 0", "marking_status": "mandatory"}
+            ]},
+            {"id": "oils", "name": "Растительные масла", "icon": "flask", "products": [
+                {"id": "oils_1507", "name": "Масло соевое и его фракции, нерафинированные или рафинированные, но бе", "tnved": "1507", "marking_status": "mandatory"},
+                {"id": "oils_150710", "name": "масло сырое, нерафинированное или рафинированное гидратацией:", "tnved": "1507 10", "marking_status": "mandatory"},
+                {"id": "oils_15071090", "name": "Отдельные виды пищевых растительных масел и масложировой продукции, уп", "tnved": "1507 10 90", "marking_status": "mandatory"},
+                {"id": "oils_1507109001", "name": "в первичных упаковках нетто-объемом 10 л или менее", "tnved": "1507 10 900 1", "marking_status": "mandatory"}
+            ]},
+            {"id": "pet_food", "name": "Корма для животных", "icon": "paw", "products": [
+                {"id": "pet_food_dry", "name": "Сухой корм", "tnved": "2309", "marking_status": "mandatory"},
+                {"id": "pet_food_dry_animal", "name": "Сухой корм животного происхождения", "tnved": "2309", "marking_status": "mandatory"},
+                {"id": "pet_food_dry_animal_dog", "name": "Сухой корм животного происхождения для собак", "tnved": "2309", "marking_status": "mandatory"},
+                {"id": "pet_food_dry_animal_cat", "name": "Сухой корм животного происхождения для кошек", "tnved": "2309", "marking_status": "mandatory"},
+                {"id": "pet_food_dry_animal_other", "name": "Сухой корм животного происхождения для прочих животных", "tnved": "2309", "marking_status": "mandatory"},
+                {"id": "pet_food_dry_plant", "name": "Сухой корм растительного происхождения", "tnved": "2309", "marking_status": "mandatory"},
+                {"id": "pet_food_dry_other", "name": "Сухой корм прочий", "tnved": "2309", "marking_status": "mandatory"},
+                {"id": "pet_food_dry_other_dog", "name": "Сухой корм прочий для собак", "tnved": "2309", "marking_status": "mandatory"},
+                {"id": "pet_food_dry_other_cat", "name": "Сухой корм прочий для кошек", "tnved": "2309", "marking_status": "mandatory"},
+                {"id": "pet_food_dry_other_other", "name": "Сухой корм прочий для прочих животных", "tnved": "2309", "marking_status": "mandatory"},
+                {"id": "pet_food_wet", "name": "Влажный корм", "tnved": "2309", "marking_status": "mandatory"},
+                {"id": "pet_food_wet_animal", "name": "Влажный корм животного происхождения", "tnved": "2309", "marking_status": "mandatory"},
+                {"id": "pet_food_wet_animal_dog", "name": "Влажный корм животного происхождения для собак", "tnved": "2309", "marking_status": "mandatory"},
+                {"id": "pet_food_wet_animal_cat", "name": "Влажный корм животного происхождения для кошек", "tnved": "2309", "marking_status": "mandatory"},
+                {"id": "pet_food_wet_animal_other", "name": "Влажный корм животного происхождения для прочих животных", "tnved": "2309", "marking_status": "mandatory"},
+                {"id": "pet_food_wet_plant", "name": "Влажный корм растительного происхождения", "tnved": "2309", "marking_status": "mandatory"},
+                {"id": "pet_food_wet_other", "name": "Влажный корм прочий", "tnved": "2309", "marking_status": "mandatory"},
+                {"id": "pet_food_wet_other_dog", "name": "Влажный корм прочий для собак", "tnved": "2309", "marking_status": "mandatory"},
+                {"id": "pet_food_wet_other_cat", "name": "Влажный корм прочий для кошек", "tnved": "2309", "marking_status": "mandatory"},
+                {"id": "pet_food_wet_other_other", "name": "Влажный корм прочий для прочих животных", "tnved": "2309", "marking_status": "mandatory"}
+            ]},
+            {"id": "canned", "name": "Консервированные продукты", "icon": "archive", "products": [
+                {"id": "canned_1604", "name": "Готовая или консервированная рыба; икра осетровых и ее заменители, изг", "tnved": "1604", "marking_status": "mandatory"},
+                {"id": "canned_160416", "name": "Рыбная консервная продукция и консервированная продукция из морепродук", "tnved": "1604 16", "marking_status": "mandatory"},
+                {"id": "canned_16041604", "name": "Рыбная консервная продукция и консервированная продукция из морепродук", "tnved": "1604 16 04", "marking_status": "mandatory"},
+                {"id": "canned_1604160431", "name": "Рыбная консервная продукция и консервированная продукция из морепродук", "tnved": "1604 16 043 1", "marking_status": "mandatory"},
+                {"id": "canned_1602", "name": "Готовые или консервированные продукты из мяса, мясных субпродуктов, кр", "tnved": "1602", "marking_status": "mandatory"},
+                {"id": "canned_160220", "name": "из печени любых животных:", "tnved": "1602 20", "marking_status": "mandatory"},
+                {"id": "canned_16022001", "name": "Мясная и плодоовощная консервация", "tnved": "1602 20 01", "marking_status": "mandatory"},
+                {"id": "canned_1602200121", "name": "Мясная и плодоовощная консервация", "tnved": "1602 20 012 1", "marking_status": "mandatory"}
+            ]},
+            {"id": "grocery", "name": "Бакалея", "icon": "shopping-basket", "products": [
+                {"id": "snacks_chips_potato", "name": "Чипсы картофельные", "tnved": "1904 10 100 0", "marking_status": "mandatory"},
+                {"id": "snacks_chips_veg", "name": "Чипсы овощные", "tnved": "1904 10 300 0", "marking_status": "mandatory"},
+                {"id": "snacks_chips_other", "name": "Чипсы прочие", "tnved": "1904 10 900 0", "marking_status": "mandatory"},
+                {"id": "snacks_crispbread", "name": "Хлебцы хрустящие", "tnved": "1905 10 000 0", "marking_status": "mandatory"},
+                {"id": "snacks_crackers", "name": "Сухарики", "tnved": "1905 40 100 0", "marking_status": "mandatory"},
+                {"id": "snacks_croutons", "name": "Гренки", "tnved": "1905 40 900 0", "marking_status": "mandatory"},
+                {"id": "snacks_corn_sticks", "name": "Кукурузные палочки", "tnved": "1905 90 550 0", "marking_status": "mandatory"},
+                {"id": "snacks_nachos", "name": "Начос", "tnved": "1905 90 900 0", "marking_status": "mandatory"},
+                {"id": "snacks_popcorn", "name": "Попкорн готовый", "tnved": "2005 20 200 0", "marking_status": "mandatory"},
+                {"id": "snacks_other", "name": "Снековая продукция прочая", "tnved": "2005 20 800 0", "marking_status": "mandatory"},
+                {"id": "spices_onion", "name": "Лук сушеный", "tnved": "0712 20 000 0", "marking_status": "mandatory"},
+                {"id": "spices_veg_dried", "name": "Овощи сушеные прочие", "tnved": "0712 90 900 0", "marking_status": "mandatory"},
+                {"id": "spices_pepper", "name": "Перец (род Piper)", "tnved": "0904", "marking_status": "mandatory"},
+                {"id": "spices_vanilla", "name": "Ваниль", "tnved": "0905", "marking_status": "mandatory"},
+                {"id": "spices_cinnamon", "name": "Корица и цветы коричного дерева", "tnved": "0906", "marking_status": "mandatory"},
+                {"id": "spices_cloves", "name": "Гвоздика", "tnved": "0907", "marking_status": "mandatory"},
+                {"id": "spices_nutmeg", "name": "Мускатный орех, мацис и кардамон", "tnved": "0908", "marking_status": "mandatory"},
+                {"id": "spices_seeds", "name": "Семена аниса, бадьяна, кориандра, тмина", "tnved": "0909", "marking_status": "mandatory"},
+                {"id": "spices_ginger", "name": "Имбирь, шафран, куркума, тимьян, лавровый лист", "tnved": "0910", "marking_status": "mandatory"},
+                {"id": "spices_other", "name": "Пряности пищевые прочие", "tnved": "1211 90 860 8", "marking_status": "mandatory"},
+                {"id": "sauces_main", "name": "Соусы и их компоненты, приправы", "tnved": "2103", "marking_status": "mandatory"},
+                {"id": "sauces_mustard", "name": "Горчица готовая", "tnved": "2103", "marking_status": "mandatory"},
+                {"id": "sauces_soups_dry", "name": "Сухие супы", "tnved": "2104 10 000 0", "marking_status": "mandatory"},
+                {"id": "sauces_broth_dry", "name": "Сухие бульоны", "tnved": "2104 10 000 0", "marking_status": "mandatory"},
+                {"id": "sauces_vinegar", "name": "Уксусы", "tnved": "2209 000", "marking_status": "mandatory"}
+            ]},
+            {"id": "soft_drinks", "name": "Безалкогольные напитки", "icon": "glass-water", "products": [
+                {"id": "soft_drinks_2202100000", "name": "воды, включая минеральные и газированные, содержащие добавки сахара ил", "tnved": "2202 10 000 0", "marking_status": "mandatory"}
+            ]},
+            {"id": "non_alc_beer", "name": "Безалкогольное пиво", "icon": "beer", "products": [
+                {"id": "non_alc_beer_220291", "name": "Безалкогольное пиво", "tnved": "2202 91", "marking_status": "mandatory"},
+                {"id": "non_alc_beer_22029100", "name": "Безалкогольное пиво", "tnved": "2202 91 00", "marking_status": "mandatory"},
+                {"id": "non_alc_beer_2202910000", "name": "безалкогольное пиво", "tnved": "2202 91 000 0", "marking_status": "mandatory"}
+            ]},
+            {"id": "sweets", "name": "Сладости", "icon": "candy", "products": [
+                {"id": "sweets_1704", "name": "Кондитерские изделия из сахара (включая белый шоколад), не содержащие ", "tnved": "1704", "marking_status": "mandatory"},
+                {"id": "sweets_1806", "name": "Шоколад и прочие готовые пищевые продукты, содержащие какао:", "tnved": "1806", "marking_status": "mandatory"},
+                {"id": "sweets_180618", "name": "Шоколадные, ореховые и иные пасты", "tnved": "1806 18", "marking_status": "mandatory"},
+                {"id": "sweets_18061806", "name": "Шоколадные, ореховые и иные пасты", "tnved": "1806 18 06", "marking_status": "mandatory"},
+                {"id": "sweets_1806180610", "name": "Шоколадные, ореховые и иные пасты", "tnved": "1806 18 061 0", "marking_status": "mandatory"},
+                {"id": "sweets_1905", "name": "Хлеб, мучные кондитерские изделия, пирожные, печенье и прочие хлебобул", "tnved": "1905", "marking_status": "mandatory"},
+                {"id": "sweets_190519", "name": "Мучные кондитерские изделия, пирожные, печенье и прочие хлебобулочные ", "tnved": "1905 19", "marking_status": "mandatory"},
+                {"id": "sweets_19051905", "name": "Мучные кондитерские изделия, пирожные, печенье и прочие хлебобулочные ", "tnved": "1905 19 05", "marking_status": "mandatory"},
+                {"id": "sweets_1905190510", "name": "Мучные кондитерские изделия, пирожные, печенье и прочие хлебобулочные ", "tnved": "1905 19 051 0", "marking_status": "mandatory"},
+                {"id": "sweets_2006", "name": "Овощи, фрукты, орехи, кожура плодов и другие части растений, консервир", "tnved": "2006", "marking_status": "mandatory"},
+                {"id": "sweets_200600", "name": "Овощи, фрукты, орехи, кожура плодов и другие части растений, консервир", "tnved": "2006 00", "marking_status": "mandatory"},
+                {"id": "sweets_2007", "name": "Джемы, желе фруктовое, мармелады, пюре фруктовое или ореховое, паста ф", "tnved": "2007", "marking_status": "mandatory"},
+                {"id": "sweets_2008", "name": "Фрукты, орехи и прочие съедобные части растений, приготовленные или ко", "tnved": "2008", "marking_status": "mandatory"},
+                {"id": "sweets_2106", "name": "Пищевые продукты, в другом месте не поименованные или не включенные:", "tnved": "2106", "marking_status": "mandatory"},
+                {"id": "sweets_210621", "name": "Сахаристые кондитерские изделия", "tnved": "2106 21", "marking_status": "mandatory"},
+                {"id": "sweets_21062106", "name": "Сахаристые кондитерские изделия", "tnved": "2106 21 06", "marking_status": "mandatory"},
+                {"id": "sweets_2106210690", "name": "Сахаристые кондитерские изделия", "tnved": "2106 21 069 0", "marking_status": "mandatory"}
+            ]},
+            {"id": "instant_drinks", "name": "Растворимые напитки", "icon": "coffee", "products": [
+                {"id": "instant_drinks_1806", "name": "Шоколад и прочие готовые пищевые продукты, содержащие какао:", "tnved": "1806", "marking_status": "mandatory"},
+                {"id": "instant_drinks_2106", "name": "Пищевые продукты, в другом месте не поименованные или не включенные:", "tnved": "2106", "marking_status": "mandatory"},
+                {"id": "instant_drinks_1805", "name": "Какао-порошок без добавок сахара или других подслащивающих веществ; ка", "tnved": "1805", "marking_status": "mandatory"},
+                {"id": "instant_drinks_180500", "name": "Какао-порошок без добавок сахара или других подслащивающих веществ; ка", "tnved": "1805 00", "marking_status": "mandatory"},
+                {"id": "instant_drinks_18050000", "name": "Какао-порошок без добавок сахара или других подслащивающих веществ; ка", "tnved": "1805 00 00", "marking_status": "mandatory"},
+                {"id": "instant_drinks_1805000000", "name": "Какао-порошок без добавок сахара или других подслащивающих веществ", "tnved": "1805 00 000 0", "marking_status": "mandatory"},
+                {"id": "instant_drinks_180610", "name": "какао-порошок с добавлением сахара или других подслащивающих веществ:", "tnved": "1806 10", "marking_status": "mandatory"},
+                {"id": "instant_drinks_18061090", "name": "Какао-порошок без добавок сахара или других подслащивающих веществ; ка", "tnved": "1806 10 90", "marking_status": "mandatory"},
+                {"id": "instant_drinks_1806109000", "name": "содержащий 80 мас.% или более сахарозы (включая инвертный сахар, выраж", "tnved": "1806 10 900 0", "marking_status": "mandatory"},
+                {"id": "instant_drinks_180690", "name": "прочие:", "tnved": "1806 90", "marking_status": "mandatory"},
+                {"id": "instant_drinks_18069070", "name": "Какао-порошок без добавок сахара или других подслащивающих веществ; ка", "tnved": "1806 90 70", "marking_status": "mandatory"},
+                {"id": "instant_drinks_1806907000", "name": "готовые изделия, содержащие какао и предназначенные для производства и", "tnved": "1806 90 700 0", "marking_status": "mandatory"},
+                {"id": "instant_drinks_210690", "name": "прочие:", "tnved": "2106 90", "marking_status": "mandatory"},
+                {"id": "instant_drinks_21069098", "name": "Какао-порошок без добавок сахара или других подслащивающих веществ; ка", "tnved": "2106 90 98", "marking_status": "mandatory"},
+                {"id": "instant_drinks_2106909808", "name": "прочие", "tnved": "2106 90 980 8", "marking_status": "mandatory"},
+                {"id": "instant_drinks_0902", "name": "Чай со вкусо-ароматическими добавками или без них:", "tnved": "0902", "marking_status": "mandatory"},
+                {"id": "instant_drinks_0903", "name": "Чай со вкусо-ароматическими добавками или без них;; Мате, или парагвай", "tnved": "0903", "marking_status": "mandatory"},
+                {"id": "instant_drinks_090300", "name": "Чай со вкусо-ароматическими добавками или без них;; Мате, или парагвай", "tnved": "0903 00", "marking_status": "mandatory"},
+                {"id": "instant_drinks_09030000", "name": "Чай со вкусо-ароматическими добавками или без них;; Мате, или парагвай", "tnved": "0903 00 00", "marking_status": "mandatory"},
+                {"id": "instant_drinks_0903000000", "name": "Мате, или парагвайский чай", "tnved": "0903 00 000 0", "marking_status": "mandatory"},
+                {"id": "instant_drinks_1211", "name": "Растения и их части (включая семена и плоды), используемые главным обр", "tnved": "1211", "marking_status": "mandatory"},
+                {"id": "instant_drinks_121120", "name": "Чай со вкусо-ароматическими добавками или без них;; Мате, или парагвай", "tnved": "1211 20", "marking_status": "mandatory"},
+                {"id": "instant_drinks_12112000", "name": "Чай со вкусо-ароматическими добавками или без них;; Мате, или парагвай", "tnved": "1211 20 00", "marking_status": "mandatory"},
+                {"id": "instant_drinks_1211200000", "name": "корни женьшеня", "tnved": "1211 20 000 0", "marking_status": "mandatory"},
+                {"id": "instant_drinks_121190", "name": "прочие:", "tnved": "1211 90", "marking_status": "mandatory"},
+                {"id": "instant_drinks_12119086", "name": "Чай со вкусо-ароматическими добавками или без них;; Мате, или парагвай", "tnved": "1211 90 86", "marking_status": "mandatory"},
+                {"id": "instant_drinks_1211908608", "name": "прочие", "tnved": "1211 90 860 8", "marking_status": "mandatory"},
+                {"id": "instant_drinks_2101", "name": "Экстракты, эссенции и концентраты кофе, чая или мате, или парагвайског", "tnved": "2101", "marking_status": "mandatory"},
+                {"id": "instant_drinks_0901", "name": "Кофе, жареный или нежареный, с кофеином или без кофеина; кофейная шелу", "tnved": "0901", "marking_status": "mandatory"}
+            ]}
+        ]
+    },
+    {
+        "id": "pharma",
+        "name": "Фармацевтика и здоровье",
+        "icon": "pill",
+        "subcategories": [
+            {"id": "medicines", "name": "Лекарства", "icon": "pill", "products": [
+                {"id": "medicines_3002", "name": "Кровь человеческая; кровь животных, приготовленная для использования в", "tnved": "3002", "marking_status": "mandatory"},
+                {"id": "medicines_3002150000", "name": "иммунологические продукты, расфасованные в виде дозированных лекарстве", "tnved": "3002 15 000 0", "marking_status": "mandatory"}
+            ]},
+            {"id": "tsr", "name": "Технические средства реабилитации (ТСР)", "icon": "accessibility", "products": [
+                {"id": "tsr_6602", "name": "трости опорные и тактильные, костыли, опоры, поручни;", "tnved": "6602", "marking_status": "mandatory"},
+                {"id": "tsr_660200", "name": "трости опорные и тактильные, костыли, опоры, поручни;", "tnved": "6602 00", "marking_status": "mandatory"},
+                {"id": "tsr_66020000", "name": "трости опорные и тактильные, костыли, опоры, поручни;", "tnved": "6602 00 00", "marking_status": "mandatory"},
+                {"id": "tsr_6602000000", "name": "Трости, трости-сиденья, хлысты, кнуты для верховой езды и аналогичные ", "tnved": "6602 00 000 0", "marking_status": "mandatory"},
+                {"id": "tsr_7326", "name": "Изделия из черных металлов прочие:", "tnved": "7326", "marking_status": "mandatory"},
+                {"id": "tsr_9021", "name": "Приспособления ортопедические, включая костыли, хирургические ремни и ", "tnved": "9021", "marking_status": "mandatory"},
+                {"id": "tsr_902110", "name": "приспособления ортопедические или для лечения переломов:", "tnved": "9021 10", "marking_status": "mandatory"},
+                {"id": "tsr_90211010", "name": "трости опорные и тактильные, костыли, опоры, поручни;", "tnved": "9021 10 10", "marking_status": "mandatory"},
+                {"id": "tsr_9021101000", "name": "приспособления ортопедические", "tnved": "9021 10 100 0", "marking_status": "mandatory"},
+                {"id": "tsr_902190", "name": "прочие:", "tnved": "9021 90", "marking_status": "mandatory"},
+                {"id": "tsr_90219090", "name": "трости опорные и тактильные, костыли, опоры, поручни;", "tnved": "9021 90 90", "marking_status": "mandatory"},
+                {"id": "tsr_9021909009", "name": "прочие", "tnved": "9021 90 900 9", "marking_status": "mandatory"},
+                {"id": "tsr_9403", "name": "Мебель прочая и ее части:", "tnved": "9403", "marking_status": "mandatory"},
+                {"id": "tsr_9620", "name": "трости опорные и тактильные, костыли, опоры, поручни;", "tnved": "9620", "marking_status": "mandatory"},
+                {"id": "tsr_962000", "name": "трости опорные и тактильные, костыли, опоры, поручни;", "tnved": "9620 00", "marking_status": "mandatory"},
+                {"id": "tsr_96200000", "name": "трости опорные и тактильные, костыли, опоры, поручни;", "tnved": "9620 00 00", "marking_status": "mandatory"},
+                {"id": "tsr_9620000009", "name": "прочие", "tnved": "9620 00 000 9", "marking_status": "mandatory"},
+                {"id": "tsr_6212", "name": "Бюстгальтеры, пояса, корсеты, подтяжки, подвязки и аналогичные изделия", "tnved": "6212", "marking_status": "mandatory"},
+                {"id": "tsr_621290", "name": "ортезы, функциональные узлы протезов (из категории товаров \"части и пр", "tnved": "6212 90", "marking_status": "mandatory"},
+                {"id": "tsr_62129000", "name": "ортезы, функциональные узлы протезов (из категории товаров \"части и пр", "tnved": "6212 90 00", "marking_status": "mandatory"},
+                {"id": "tsr_6212900000", "name": "прочие", "tnved": "6212 90 000 0", "marking_status": "mandatory"},
+                {"id": "tsr_902139", "name": "прочие:", "tnved": "9021 39", "marking_status": "mandatory"},
+                {"id": "tsr_90213990", "name": "ортезы, функциональные узлы протезов (из категории товаров \"части и пр", "tnved": "9021 39 90", "marking_status": "mandatory"},
+                {"id": "tsr_9021399000", "name": "прочие", "tnved": "9021 39 900 0", "marking_status": "mandatory"},
+                {"id": "tsr_9019", "name": "Устройства для механотерапии; аппараты массажные; аппаратура для психо", "tnved": "9019", "marking_status": "mandatory"},
+                {"id": "tsr_901910", "name": "устройства для механотерапии; аппараты массажные; аппаратура для психо", "tnved": "9019 10", "marking_status": "mandatory"},
+                {"id": "tsr_90191090", "name": "противопролежневые матрацы и подушки;", "tnved": "9019 10 90", "marking_status": "mandatory"},
+                {"id": "tsr_9019109009", "name": "прочие", "tnved": "9019 10 900 9", "marking_status": "mandatory"},
+                {"id": "tsr_9404", "name": "Основы матрацные; принадлежности постельные и аналогичные изделия мебл", "tnved": "9404", "marking_status": "mandatory"},
+                {"id": "tsr_940421", "name": "из пористой резины или пластмассы, с покрытием или без покрытия:", "tnved": "9404 21", "marking_status": "mandatory"},
+                {"id": "tsr_940429", "name": "из прочих материалов:", "tnved": "9404 29", "marking_status": "mandatory"},
+                {"id": "tsr_94042990", "name": "противопролежневые матрацы и подушки;", "tnved": "9404 29 90", "marking_status": "mandatory"},
+                {"id": "tsr_9404299000", "name": "прочие", "tnved": "9404 29 900 0", "marking_status": "mandatory"},
+                {"id": "tsr_3006", "name": "специальные средства при нарушениях функций выделения (моче- и калопри", "tnved": "3006", "marking_status": "mandatory"},
+                {"id": "tsr_300691", "name": "специальные средства при нарушениях функций выделения (моче- и калопри", "tnved": "3006 91", "marking_status": "mandatory"},
+                {"id": "tsr_30069100", "name": "специальные средства при нарушениях функций выделения (моче- и калопри", "tnved": "3006 91 00", "marking_status": "mandatory"},
+                {"id": "tsr_3006910000", "name": "приспособления, идентифицируемые как приспособления для стомического и", "tnved": "3006 91 000 0", "marking_status": "mandatory"},
+                {"id": "tsr_9018", "name": "Приборы и устройства, применяемые в медицине, хирургии, стоматологии и", "tnved": "9018", "marking_status": "mandatory"},
+                {"id": "tsr_901839", "name": "специальные средства при нарушениях функций выделения (моче- и калопри", "tnved": "9018 39", "marking_status": "mandatory"},
+                {"id": "tsr_90183900", "name": "специальные средства при нарушениях функций выделения (моче- и калопри", "tnved": "9018 39 00", "marking_status": "mandatory"},
+                {"id": "tsr_9018390000", "name": "прочие", "tnved": "9018 39 000 0", "marking_status": "mandatory"},
+                {"id": "tsr_9401", "name": "кресла-стулья с санитарным оснащением;", "tnved": "9401", "marking_status": "mandatory"},
+                {"id": "tsr_940179", "name": "кресла-стулья с санитарным оснащением;", "tnved": "9401 79", "marking_status": "mandatory"},
+                {"id": "tsr_94017900", "name": "кресла-стулья с санитарным оснащением;", "tnved": "9401 79 00", "marking_status": "mandatory"},
+                {"id": "tsr_9401790009", "name": "прочая", "tnved": "9401 79 000 9", "marking_status": "mandatory"},
+                {"id": "tsr_9402", "name": "Мебель медицинская, хирургическая, стоматологическая или ветеринарная ", "tnved": "9402", "marking_status": "mandatory"},
+                {"id": "tsr_940290", "name": "кресла-стулья с санитарным оснащением;", "tnved": "9402 90", "marking_status": "mandatory"},
+                {"id": "tsr_94029000", "name": "кресла-стулья с санитарным оснащением;", "tnved": "9402 90 00", "marking_status": "mandatory"},
+                {"id": "tsr_9402900000", "name": "прочая", "tnved": "9402 90 000 0", "marking_status": "mandatory"},
+                {"id": "tsr_8713", "name": "Коляски для людей, не способных передвигаться, оснащенные или не оснащ", "tnved": "8713", "marking_status": "mandatory"},
+                {"id": "tsr_871310", "name": "кресла-стулья с санитарным оснащением;", "tnved": "8713 10", "marking_status": "mandatory"},
+                {"id": "tsr_87131000", "name": "кресла-стулья с санитарным оснащением;", "tnved": "8713 10 00", "marking_status": "mandatory"},
+                {"id": "tsr_8713100000", "name": "без механических устройств для передвижения", "tnved": "8713 10 000 0", "marking_status": "mandatory"},
+                {"id": "tsr_3926", "name": "специальные средства при нарушениях функций выделения (моче- и калопри", "tnved": "3926", "marking_status": "mandatory"},
+                {"id": "tsr_392690", "name": "прочие:", "tnved": "3926 90", "marking_status": "mandatory"},
+                {"id": "tsr_39269092", "name": "специальные средства при нарушениях функций выделения (моче- и калопри", "tnved": "3926 90 92", "marking_status": "mandatory"},
+                {"id": "tsr_3926909200", "name": "изготовленные из листового материала", "tnved": "3926 90 920 0", "marking_status": "mandatory"},
+                {"id": "tsr_39269097", "name": "специальные средства при нарушениях функций выделения (моче- и калопри", "tnved": "3926 90 97", "marking_status": "mandatory"},
+                {"id": "tsr_3926909709", "name": "прочие", "tnved": "3926 90 970 9", "marking_status": "mandatory"}
+            ]},
+            {"id": "vet", "name": "Ветеринарные препараты", "icon": "stethoscope", "products": [
+                {"id": "vet_3002", "name": "Кровь человеческая; кровь животных, приготовленная для использования в", "tnved": "3002", "marking_status": "mandatory"},
+                {"id": "vet_3002150000", "name": "иммунологические продукты, расфасованные в виде дозированных лекарстве", "tnved": "3002 15 000 0", "marking_status": "mandatory"},
+                {"id": "vet_2936", "name": "Провитамины и витамины, природные или синтезированные (включая природн", "tnved": "2936", "marking_status": "mandatory"},
+                {"id": "vet_2936900009", "name": "прочие", "tnved": "2936 90 000 9", "marking_status": "mandatory"},
+                {"id": "vet_2941", "name": "Антибиотики:", "tnved": "2941", "marking_status": "mandatory"},
+                {"id": "vet_2941900009", "name": "прочие", "tnved": "2941 90 000 9", "marking_status": "mandatory"},
+                {"id": "vet_3001", "name": "Железы и прочие органы, предназначенные для органотерапии, высушенные,", "tnved": "3001", "marking_status": "mandatory"},
+                {"id": "vet_300120", "name": "экстракты желез или прочих органов или их секретов:", "tnved": "3001 20", "marking_status": "mandatory"},
+                {"id": "vet_3001209000", "name": "прочие", "tnved": "3001 20 900 0", "marking_status": "mandatory"},
+                {"id": "vet_3002120002", "name": "прочие", "tnved": "3002 12 000 2", "marking_status": "mandatory"},
+                {"id": "vet_3002120003", "name": "гемоглобин, глобулины крови и сывороточные глобулины", "tnved": "3002 12 000 3", "marking_status": "mandatory"},
+                {"id": "vet_3002120009", "name": "прочие", "tnved": "3002 12 000 9", "marking_status": "mandatory"},
+                {"id": "vet_3002420000", "name": "вакцины ветеринарные", "tnved": "3002 42 000 0", "marking_status": "mandatory"},
+                {"id": "vet_300290", "name": "прочие:", "tnved": "3002 90", "marking_status": "mandatory"},
+                {"id": "vet_3002903000", "name": "кровь животных, приготовленная для использования в терапевтических, пр", "tnved": "3002 90 300 0", "marking_status": "mandatory"}
+            ]},
+            {"id": "pharma_raw", "name": "Фармацевтическое сырьё, лекарственные средства", "icon": "flask", "products": [
+                {"id": "pharma_raw_2932", "name": "Фармсубстанции (с кислородом)", "tnved": "2932", "marking_status": "experiment"},
+                {"id": "pharma_raw_2933", "name": "Фармсубстанции (с азотом)", "tnved": "2933", "marking_status": "experiment"},
+                {"id": "pharma_raw_2934", "name": "Нуклеиновые кислоты", "tnved": "2934", "marking_status": "experiment"},
+                {"id": "pharma_raw_2935", "name": "Сульфонамиды", "tnved": "2935", "marking_status": "experiment"},
+                {"id": "pharma_raw_2936", "name": "Витамины", "tnved": "2936", "marking_status": "experiment"},
+                {"id": "pharma_raw_2937", "name": "Гормоны", "tnved": "2937", "marking_status": "experiment"},
+                {"id": "pharma_raw_2939", "name": "Гликозиды, алкалоиды", "tnved": "2939", "marking_status": "experiment"},
+                {"id": "pharma_raw_2941", "name": "Антибиотики", "tnved": "2941", "marking_status": "experiment"},
+                {"id": "pharma_raw_in_process", "name": "In-process продукты", "tnved": "-", "marking_status": "experiment"},
+                {"id": "pharma_raw_in_bulk", "name": "In-bulk продукты", "tnved": "-", "marking_status": "experiment"},
+                {"id": "pharma_raw_afs", "name": "АФС (активные фармацевтические субстанции)", "tnved": "-", "marking_status": "experiment"}
+            ]},
+            {"id": "medical_devices", "name": "Медицинские изделия", "icon": "heart-pulse", "products": [
+                {"id": "medical_devices_9021", "name": "Приспособления ортопедические, включая костыли, хирургические ремни и ", "tnved": "9021", "marking_status": "mandatory"},
+                {"id": "medical_devices_902110", "name": "приспособления ортопедические или для лечения переломов:", "tnved": "9021 10", "marking_status": "mandatory"},
+                {"id": "medical_devices_90211010", "name": "трости опорные и тактильные, костыли, опоры, поручни;", "tnved": "9021 10 10", "marking_status": "mandatory"},
+                {"id": "medical_devices_9021101000", "name": "приспособления ортопедические", "tnved": "9021 10 100 0", "marking_status": "mandatory"},
+                {"id": "medical_devices_902190", "name": "прочие:", "tnved": "9021 90", "marking_status": "mandatory"},
+                {"id": "medical_devices_90219090", "name": "трости опорные и тактильные, костыли, опоры, поручни;", "tnved": "9021 90 90", "marking_status": "mandatory"},
+                {"id": "medical_devices_3926", "name": "специальные средства при нарушениях функций выделения (моче- и калопри", "tnved": "3926", "marking_status": "mandatory"},
+                {"id": "medical_devices_8421", "name": "Центрифуги, включая центробежные сушилки; оборудование и устройства дл", "tnved": "8421", "marking_status": "mandatory"},
+                {"id": "medical_devices_842139", "name": "прочее:", "tnved": "8421 39", "marking_status": "mandatory"},
+                {"id": "medical_devices_84213920", "name": "131980152690152700182750209360292620336330375930", "tnved": "8421 39 20", "marking_status": "mandatory"},
+                {"id": "medical_devices_8421392008", "name": "прочее", "tnved": "8421 39 200 8", "marking_status": "mandatory"},
+                {"id": "medical_devices_902140", "name": "113850173110202800202810204370210000228560302870", "tnved": "9021 40", "marking_status": "mandatory"},
+                {"id": "medical_devices_90214000", "name": "113850173110202800202810204370210000228560302870", "tnved": "9021 40 00", "marking_status": "mandatory"},
+                {"id": "medical_devices_9021400000", "name": "аппараты слуховые, кроме частей и принадлежностей", "tnved": "9021 40 000 0", "marking_status": "mandatory"},
+                {"id": "medical_devices_9021909001", "name": "стенты коронарные", "tnved": "9021 90 900 1", "marking_status": "mandatory"},
+                {"id": "medical_devices_9022", "name": "Аппаратура, основанная на использовании рентгеновского, альфа-, бета- ", "tnved": "9022", "marking_status": "mandatory"},
+                {"id": "medical_devices_902212", "name": "135190142570280730282030", "tnved": "9022 12", "marking_status": "mandatory"},
+                {"id": "medical_devices_90221200", "name": "135190142570280730282030", "tnved": "9022 12 00", "marking_status": "mandatory"},
+                {"id": "medical_devices_9022120000", "name": "компьютерные томографы", "tnved": "9022 12 000 0", "marking_status": "mandatory"},
+                {"id": "medical_devices_9619", "name": "233730233900280360320550331320331330331830356150126750233860343580", "tnved": "9619", "marking_status": "mandatory"},
+                {"id": "medical_devices_961900", "name": "Женские гигиенические прокладки и тампоны, пеленки, подгузники и анало", "tnved": "9619 00", "marking_status": "mandatory"},
+                {"id": "medical_devices_96190089", "name": "233730233900280360320550331320331330331830356150126750233860343580", "tnved": "9619 00 89", "marking_status": "mandatory"},
+                {"id": "medical_devices_392620", "name": "1225401225601226101226301226401298001299001302201393101393501393601565", "tnved": "3926 20", "marking_status": "mandatory"},
+                {"id": "medical_devices_39262000", "name": "1225401225601226101226301226401298001299001302201393101393501393601565", "tnved": "3926 20 00", "marking_status": "mandatory"},
+                {"id": "medical_devices_3926200000", "name": "одежда и принадлежности к одежде (включая перчатки, рукавицы и митенки", "tnved": "3926 20 000 0", "marking_status": "mandatory"}
+            ]},
+            {"id": "supplements", "name": "БАД", "icon": "apple", "products": [
+                {"id": "supplements_220299", "name": "прочие:", "tnved": "2202 99", "marking_status": "mandatory"},
+                {"id": "supplements_2202999100", "name": "менее 0,2 мас.%", "tnved": "2202 99 910 0", "marking_status": "mandatory"},
+                {"id": "supplements_1602", "name": "Готовые или консервированные продукты из мяса, мясных субпродуктов, кр", "tnved": "1602", "marking_status": "mandatory"},
+                {"id": "supplements_1904", "name": "Готовые пищевые продукты, полученные путем вздувания или обжаривания з", "tnved": "1904", "marking_status": "mandatory"},
+                {"id": "supplements_190410", "name": "готовые пищевые продукты, полученные путем вздувания или обжаривания з", "tnved": "1904 10", "marking_status": "mandatory"},
+                {"id": "supplements_2202100000", "name": "воды, включая минеральные и газированные, содержащие добавки сахара ил", "tnved": "2202 10 000 0", "marking_status": "mandatory"},
+                {"id": "supplements_1704", "name": "Кондитерские изделия из сахара (включая белый шоколад), не содержащие ", "tnved": "1704", "marking_status": "mandatory"},
+                {"id": "supplements_1806", "name": "Шоколад и прочие готовые пищевые продукты, содержащие какао:", "tnved": "1806", "marking_status": "mandatory"},
+                {"id": "supplements_2106", "name": "Пищевые продукты, в другом месте не поименованные или не включенные:", "tnved": "2106", "marking_status": "mandatory"},
+                {"id": "supplements_180690", "name": "прочие:", "tnved": "1806 90", "marking_status": "mandatory"},
+                {"id": "supplements_18069070", "name": "Какао-порошок без добавок сахара или других подслащивающих веществ; ка", "tnved": "1806 90 70", "marking_status": "mandatory"},
+                {"id": "supplements_1806907000", "name": "готовые изделия, содержащие какао и предназначенные для производства и", "tnved": "1806 90 700 0", "marking_status": "mandatory"},
+                {"id": "supplements_210690", "name": "прочие:", "tnved": "2106 90", "marking_status": "mandatory"},
+                {"id": "supplements_21069098", "name": "Какао-порошок без добавок сахара или других подслащивающих веществ; ка", "tnved": "2106 90 98", "marking_status": "mandatory"},
+                {"id": "supplements_2106909808", "name": "прочие", "tnved": "2106 90 980 8", "marking_status": "mandatory"},
+                {"id": "supplements_1211", "name": "Растения и их части (включая семена и плоды), используемые главным обр", "tnved": "1211", "marking_status": "mandatory"},
+                {"id": "supplements_121190", "name": "прочие:", "tnved": "1211 90", "marking_status": "mandatory"},
+                {"id": "supplements_12119086", "name": "Чай со вкусо-ароматическими добавками или без них;; Мате, или парагвай", "tnved": "1211 90 86", "marking_status": "mandatory"},
+                {"id": "supplements_1211908608", "name": "прочие", "tnved": "1211 90 860 8", "marking_status": "mandatory"},
+                {"id": "supplements_2101", "name": "Экстракты, эссенции и концентраты кофе, чая или мате, или парагвайског", "tnved": "2101", "marking_status": "mandatory"},
+                {"id": "supplements_3002", "name": "Кровь человеческая; кровь животных, приготовленная для использования в", "tnved": "3002", "marking_status": "mandatory"},
+                {"id": "supplements_2936", "name": "Провитамины и витамины, природные или синтезированные (включая природн", "tnved": "2936", "marking_status": "mandatory"},
+                {"id": "supplements_3001", "name": "Железы и прочие органы, предназначенные для органотерапии, высушенные,", "tnved": "3001", "marking_status": "mandatory"},
+                {"id": "supplements_300120", "name": "экстракты желез или прочих органов или их секретов:", "tnved": "3001 20", "marking_status": "mandatory"},
+                {"id": "supplements_300290", "name": "прочие:", "tnved": "3002 90", "marking_status": "mandatory"},
+                {"id": "supplements_3002903000", "name": "кровь животных, приготовленная для использования в терапевтических, пр", "tnved": "3002 90 300 0", "marking_status": "mandatory"},
+                {"id": "supplements_120400", "name": "Семена льна, дробленые или недробленые:", "tnved": "1204 00", "marking_status": "mandatory"},
+                {"id": "supplements_1204009000", "name": "прочие", "tnved": "1204 00 900 0", "marking_status": "mandatory"},
+                {"id": "supplements_1208", "name": "Мука тонкого и грубого помола из семян или плодов масличных культур, к", "tnved": "1208", "marking_status": "mandatory"},
+                {"id": "supplements_1208900000", "name": "прочая", "tnved": "1208 90 000 0", "marking_status": "mandatory"},
+                {"id": "supplements_1210", "name": "Шишки хмеля, свежие или сушеные, дробленые или недробленые, в порошкоо", "tnved": "1210", "marking_status": "mandatory"},
+                {"id": "supplements_121020", "name": "шишки хмеля дробленые, в порошкообразном виде или в виде гранул; лупул", "tnved": "1210 20", "marking_status": "mandatory"},
+                {"id": "supplements_1210209000", "name": "прочие", "tnved": "1210 20 900 0", "marking_status": "mandatory"},
+                {"id": "supplements_1212", "name": "Плоды рожкового дерева, морские и прочие водоросли, свекла сахарная и ", "tnved": "1212", "marking_status": "mandatory"},
+                {"id": "supplements_1212210000", "name": "пригодные для употребления в пищу", "tnved": "1212 21 000 0", "marking_status": "mandatory"},
+                {"id": "supplements_1302", "name": "Соки и экстракты растительные; пектиновые вещества, пектинаты и пектат", "tnved": "1302", "marking_status": "mandatory"},
+                {"id": "supplements_130219", "name": "прочие:", "tnved": "1302 19", "marking_status": "mandatory"},
+                {"id": "supplements_1302199000", "name": "прочие", "tnved": "1302 19 900 0", "marking_status": "mandatory"},
+                {"id": "supplements_1504", "name": "Жиры, масла и их фракции, из рыбы или морских млекопитающих, нерафинир", "tnved": "1504", "marking_status": "mandatory"},
+                {"id": "supplements_150410", "name": "жиры из печени рыбы и их фракции:", "tnved": "1504 10", "marking_status": "mandatory"},
+                {"id": "supplements_1504101000", "name": "с содержанием витамина А не более 2500 МЕ/г", "tnved": "1504 10 100 0", "marking_status": "mandatory"},
+                {"id": "supplements_150420", "name": "жиры и масла из рыбы и их фракции, кроме жира из печени:", "tnved": "1504 20", "marking_status": "mandatory"},
+                {"id": "supplements_1504209000", "name": "прочие", "tnved": "1504 20 900 0", "marking_status": "mandatory"},
+                {"id": "supplements_1515", "name": "Прочие нелетучие жиры и масла (включая масло жожоба) растительного или", "tnved": "1515", "marking_status": "mandatory"},
+                {"id": "supplements_1515110000", "name": "масло сырое", "tnved": "1515 11 000 0", "marking_status": "mandatory"},
+                {"id": "supplements_151519", "name": "прочие:", "tnved": "1515 19", "marking_status": "mandatory"},
+                {"id": "supplements_1515199000", "name": "прочие", "tnved": "1515 19 900 0", "marking_status": "mandatory"},
+                {"id": "supplements_151590", "name": "прочие:", "tnved": "1515 90", "marking_status": "mandatory"},
+                {"id": "supplements_1515906900", "name": "в твердом виде, прочие; в жидком виде", "tnved": "1515 90 690 0", "marking_status": "mandatory"},
+                {"id": "supplements_1515908900", "name": "в твердом виде, прочие; в жидком виде", "tnved": "1515 90 890 0", "marking_status": "mandatory"},
+                {"id": "supplements_1516", "name": "Жиры и масла животного, растительного или микробиологического происхож", "tnved": "1516", "marking_status": "mandatory"},
+                {"id": "supplements_151610", "name": "жиры и масла животного происхождения и их фракции:", "tnved": "1516 10", "marking_status": "mandatory"},
+                {"id": "supplements_1516109000", "name": "прочие", "tnved": "1516 10 900 0", "marking_status": "mandatory"},
+                {"id": "supplements_151790", "name": "прочие:", "tnved": "1517 90", "marking_status": "mandatory"},
+                {"id": "supplements_1517909900", "name": "прочие", "tnved": "1517 90 990 0", "marking_status": "mandatory"},
+                {"id": "supplements_160290", "name": "прочие, включая готовые продукты из крови любых животных:", "tnved": "1602 90", "marking_status": "mandatory"},
+                {"id": "supplements_1602909909", "name": "прочие", "tnved": "1602 90 990 9", "marking_status": "mandatory"},
+                {"id": "supplements_1702", "name": "Прочие сахара, включая химически чистые лактозу, мальтозу, глюкозу и ф", "tnved": "1702", "marking_status": "mandatory"},
+                {"id": "supplements_170230", "name": "глюкоза и сироп глюкозы, не содержащие фруктозу или содержащие менее 2", "tnved": "1702 30", "marking_status": "mandatory"},
+                {"id": "supplements_1702305000", "name": "в виде белого кристаллического порошка, агломерированного или неагломе", "tnved": "1702 30 500 0", "marking_status": "mandatory"},
+                {"id": "supplements_170240", "name": "глюкоза и сироп глюкозы, содержащие в сухом состоянии не менее 20 мас.", "tnved": "1702 40", "marking_status": "mandatory"},
+                {"id": "supplements_1702409000", "name": "прочие", "tnved": "1702 40 900 0", "marking_status": "mandatory"},
+                {"id": "supplements_170260", "name": "фруктоза прочая и сироп фруктозы, содержащие в сухом состоянии более 5", "tnved": "1702 60", "marking_status": "mandatory"},
+                {"id": "supplements_1702609500", "name": "прочие", "tnved": "1702 60 950 0", "marking_status": "mandatory"},
+                {"id": "supplements_170290", "name": "прочие, включая инвертный сахар и прочие сахара и сахарные сиропы, сод", "tnved": "1702 90", "marking_status": "mandatory"},
+                {"id": "supplements_1702909500", "name": "прочие", "tnved": "1702 90 950 0", "marking_status": "mandatory"},
+                {"id": "supplements_170490", "name": "прочие:", "tnved": "1704 90", "marking_status": "mandatory"},
+                {"id": "supplements_1704905500", "name": "пастилки от боли в горле и таблетки от кашля", "tnved": "1704 90 550 0", "marking_status": "mandatory"},
+                {"id": "supplements_1704907100", "name": "леденцовая карамель, с начинкой или без начинки", "tnved": "1704 90 710 0", "marking_status": "mandatory"},
+                {"id": "supplements_1704908200", "name": "отпрессованные таблетки", "tnved": "1704 90 820 0", "marking_status": "mandatory"},
+                {"id": "supplements_1806310000", "name": "с начинкой", "tnved": "1806 31 000 0", "marking_status": "mandatory"},
+                {"id": "supplements_180632", "name": "без начинки:", "tnved": "1806 32", "marking_status": "mandatory"},
+                {"id": "supplements_1904109000", "name": "прочие", "tnved": "1904 10 900 0", "marking_status": "mandatory"},
+                {"id": "supplements_210112", "name": "готовые продукты на основе этих экстрактов, эссенций или концентратов ", "tnved": "2101 12", "marking_status": "mandatory"},
+                {"id": "supplements_2101129201", "name": "в первичных упаковках нетто-массой не более 3 кг", "tnved": "2101 12 920 1", "marking_status": "mandatory"},
+                {"id": "supplements_210610", "name": "белковые концентраты и текстурированные белковые вещества:", "tnved": "2106 10", "marking_status": "mandatory"},
+                {"id": "supplements_2106108000", "name": "прочие", "tnved": "2106 10 800 0", "marking_status": "mandatory"},
+                {"id": "supplements_2106905800", "name": "прочие", "tnved": "2106 90 580 0", "marking_status": "mandatory"},
+                {"id": "supplements_2106909300", "name": "не содержащие молочных жиров, сахарозы, изоглюкозы, глюкозы или крахма", "tnved": "2106 90 930 0", "marking_status": "mandatory"},
+                {"id": "supplements_2106909801", "name": "жевательная резинка без сахара (сахарозы) и/или с использованием замен", "tnved": "2106 90 980 1", "marking_status": "mandatory"},
+                {"id": "supplements_2106909803", "name": "смеси витаминов и минеральных веществ, предназначенные для сбалансиров", "tnved": "2106 90 980 3", "marking_status": "mandatory"},
+                {"id": "supplements_2202991800", "name": "прочие", "tnved": "2202 99 180 0", "marking_status": "mandatory"},
+                {"id": "supplements_2922", "name": "Аминосоединения, включающие кислородсодержащую функциональную группу:", "tnved": "2922", "marking_status": "mandatory"},
+                {"id": "supplements_2922410000", "name": "лизин и его сложные эфиры; соли этих соединений", "tnved": "2922 41 000 0", "marking_status": "mandatory"},
+                {"id": "supplements_2922420000", "name": "глутаминовая кислота и ее соли", "tnved": "2922 42 000 0", "marking_status": "mandatory"},
+                {"id": "supplements_2923", "name": "Соли и гидроксиды четвертичного аммониевого основания; лецитины и фосф", "tnved": "2923", "marking_status": "mandatory"},
+                {"id": "supplements_2923200000", "name": "лецитины и фосфоаминолипиды прочие", "tnved": "2923 20 000 0", "marking_status": "mandatory"},
+                {"id": "supplements_2923900009", "name": "прочие", "tnved": "2923 90 000 9", "marking_status": "mandatory"},
+                {"id": "supplements_3002490001", "name": "культуры микроорганизмов", "tnved": "3002 49 000 1", "marking_status": "mandatory"},
+                {"id": "supplements_121299", "name": "прочие:", "tnved": "1212 99", "marking_status": "mandatory"},
+                {"id": "supplements_1212999509", "name": "прочие", "tnved": "1212 99 950 9", "marking_status": "mandatory"},
+                {"id": "supplements_130220", "name": "пектиновые вещества, пектинаты и пектаты:", "tnved": "1302 20", "marking_status": "mandatory"},
+                {"id": "supplements_1302201000", "name": "сухие", "tnved": "1302 20 100 0", "marking_status": "mandatory"},
+                {"id": "supplements_1302209000", "name": "прочие", "tnved": "1302 20 900 0", "marking_status": "mandatory"},
+                {"id": "supplements_1504201000", "name": "твердые фракции", "tnved": "1504 20 100 0", "marking_status": "mandatory"},
+                {"id": "supplements_1516101000", "name": "в первичных упаковках нетто-массой не более 1 кг", "tnved": "1516 10 100 0", "marking_status": "mandatory"},
+                {"id": "supplements_160300", "name": "Экстракты и соки из мяса, рыбы или ракообразных, моллюсков или прочих ", "tnved": "1603 00", "marking_status": "mandatory"},
+                {"id": "supplements_1603001000", "name": "в первичных упаковках нетто-массой 1 кг или менее", "tnved": "1603 00 100 0", "marking_status": "mandatory"},
+                {"id": "supplements_1806903100", "name": "с начинкой", "tnved": "1806 90 310 0", "marking_status": "mandatory"},
+                {"id": "supplements_190190", "name": "прочие:", "tnved": "1901 90", "marking_status": "mandatory"},
+                {"id": "supplements_1901909800", "name": "прочие", "tnved": "1901 90 980 0", "marking_status": "mandatory"},
+                {"id": "supplements_210220", "name": "дрожжи неактивные; прочие мертвые одноклеточные микроорганизмы:", "tnved": "2102 20", "marking_status": "mandatory"},
+                {"id": "supplements_2102201100", "name": "в виде таблеток, кубиков или в аналогичной форме, или в первичных упак", "tnved": "2102 20 110 0", "marking_status": "mandatory"},
+                {"id": "supplements_292249", "name": "прочие:", "tnved": "2922 49", "marking_status": "mandatory"},
+                {"id": "supplements_2922498500", "name": "прочие", "tnved": "2922 49 850 0", "marking_status": "mandatory"},
+                {"id": "supplements_2925", "name": "Соединения, содержащие карбоксимидную функциональную группу (включая с", "tnved": "2925", "marking_status": "mandatory"},
+                {"id": "supplements_2925290000", "name": "прочие", "tnved": "2925 29 000 0", "marking_status": "mandatory"},
+                {"id": "supplements_3502", "name": "Альбумины (включая концентраты двух или более сывороточных белков, сод", "tnved": "3502", "marking_status": "mandatory"},
+                {"id": "supplements_350290", "name": "прочие:", "tnved": "3502 90", "marking_status": "mandatory"},
+                {"id": "supplements_3502907000", "name": "прочие", "tnved": "3502 90 700 0", "marking_status": "mandatory"},
+                {"id": "supplements_3802", "name": "Уголь активированный; продукты минеральные природные активированные; у", "tnved": "3802", "marking_status": "mandatory"},
+                {"id": "supplements_3802100000", "name": "уголь активированный", "tnved": "3802 10 000 0", "marking_status": "mandatory"},
+                {"id": "supplements_3913", "name": "Полимеры природные (например, альгиновая кислота) и полимеры природные", "tnved": "3913", "marking_status": "mandatory"},
+                {"id": "supplements_3913100000", "name": "кислота альгиновая, ее соли и сложные эфиры", "tnved": "3913 10 000 0", "marking_status": "mandatory"},
+                {"id": "supplements_1504109900", "name": "прочие", "tnved": "1504 10 990 0", "marking_status": "mandatory"},
+                {"id": "supplements_3507", "name": "Ферменты; ферментные препараты, в другом месте не поименованные или не", "tnved": "3507", "marking_status": "mandatory"},
+                {"id": "supplements_350790", "name": "прочие:", "tnved": "3507 90", "marking_status": "mandatory"}
+            ]},
+            {"id": "antiseptics", "name": "Антисептики и дезинфицирующие средства", "icon": "spray-can", "products": []},
+            {"id": "wheelchairs", "name": "Кресла-коляски", "icon": "wheelchair", "products": [
+                {"id": "wheelchairs_8713", "name": "Коляски для людей, не способных передвигаться, оснащенные или не оснащ", "tnved": "8713", "marking_status": "mandatory"},
+                {"id": "wheelchairs_871310", "name": "кресла-стулья с санитарным оснащением;", "tnved": "8713 10", "marking_status": "mandatory"},
+                {"id": "wheelchairs_87131000", "name": "кресла-стулья с санитарным оснащением;", "tnved": "8713 10 00", "marking_status": "mandatory"},
+                {"id": "wheelchairs_8713100000", "name": "без механических устройств для передвижения", "tnved": "8713 10 000 0", "marking_status": "mandatory"},
+                {"id": "wheelchairs_871390", "name": "Кресла-коляски электрические (прочие, оснащенные двигателем или другим", "tnved": "8713 90", "marking_status": "mandatory"},
+                {"id": "wheelchairs_87139000", "name": "Кресла-коляски электрические (прочие, оснащенные двигателем или другим", "tnved": "8713 90 00", "marking_status": "mandatory"},
+                {"id": "wheelchairs_8713900000", "name": "прочие", "tnved": "8713 90 000 0", "marking_status": "mandatory"},
+                {"id": "wheelchairs_3092", "name": "Коляски инвалидные, кроме частей и принадлежностей", "tnved": "3092", "marking_status": "mandatory"},
+                {"id": "wheelchairs_309220", "name": "Коляски инвалидные, кроме частей и принадлежностей", "tnved": "3092 20", "marking_status": "mandatory"},
+                {"id": "wheelchairs_30922000", "name": "Коляски инвалидные, кроме частей и принадлежностей", "tnved": "3092 20 00", "marking_status": "mandatory"},
+                {"id": "wheelchairs_3250", "name": "Изделия медицинские, в том числе хирургические, прочие, не включенные ", "tnved": "3250", "marking_status": "mandatory"},
+                {"id": "wheelchairs_325050", "name": "Изделия медицинские, в том числе хирургические, прочие, не включенные ", "tnved": "3250 50", "marking_status": "mandatory"},
+                {"id": "wheelchairs_32505019", "name": "Изделия медицинские, в том числе хирургические, прочие, не включенные ", "tnved": "3250 50 19", "marking_status": "mandatory"},
+                {"id": "wheelchairs_3099", "name": "Средства транспортные и оборудование прочие, не включенные в другие гр", "tnved": "3099", "marking_status": "mandatory"},
+                {"id": "wheelchairs_309910", "name": "Средства транспортные и оборудование прочие, не включенные в другие гр", "tnved": "3099 10", "marking_status": "mandatory"},
+                {"id": "wheelchairs_30991019", "name": "Средства транспортные и оборудование прочие, не включенные в другие гр", "tnved": "3099 10 19", "marking_status": "mandatory"}
+            ]},
+            {"id": "sports_nutrition", "name": "Спортивное питание", "icon": "dumbbell", "products": [
+                {"id": "sports_nutrition_0210", "name": "Мясо и пищевые мясные субпродукты, соленые, в рассоле, сушеные или коп", "tnved": "0210", "marking_status": "mandatory"}
+            ]}
+        ]
+    },
+    {
+        "id": "cosmetics",
+        "name": "Косметика, гигиена и бытовая химия",
+        "icon": "sparkles",
+        "subcategories": [
+            {"id": "perfume", "name": "Духи и туалетная вода", "icon": "spray-can", "products": [
+                {"id": "perfume_330300", "name": "Духи и туалетная вода:", "tnved": "3303 00", "marking_status": "mandatory"},
+                {"id": "perfume_dukhi", "name": "Духи", "tnved": "3303 00", "marking_status": "mandatory"},
+                {"id": "perfume_tualetnaya_voda", "name": "Туалетная вода", "tnved": "3303 00", "marking_status": "mandatory"},
+                {"id": "perfume_odekolon", "name": "Одеколон", "tnved": "3303 00", "marking_status": "mandatory"},
+                {"id": "perfume_parfyumernaya_voda", "name": "Парфюмерная вода", "tnved": "3303 00", "marking_status": "mandatory"},
+                {"id": "perfume_nabory", "name": "Наборы парфюмерной продукции (импорт)", "tnved": "3303 00", "marking_status": "mandatory"}
+            ]},
+            {"id": "cosmetics_hygiene", "name": "Косметика, бытовая химия и товары личной гигиены", "icon": "sparkles", "products": [
+                {"id": "cosmetics_hygiene_3304", "name": "Косметические средства или средства для макияжа и средства для ухода з", "tnved": "3304", "marking_status": "mandatory"},
+                {"id": "cosmetics_hygiene_3401", "name": "Мыло; поверхностно-активные органические вещества и средства, применяе", "tnved": "3401", "marking_status": "mandatory"},
+                {"id": "cosmetics_hygiene_340134", "name": "Мыло, моющие средства, бытовая химия и т.д.", "tnved": "3401 34", "marking_status": "mandatory"},
+                {"id": "cosmetics_hygiene_34013402", "name": "Мыло, моющие средства, бытовая химия и т.д.", "tnved": "3401 34 02", "marking_status": "mandatory"},
+                {"id": "cosmetics_hygiene_3401340250", "name": "Мыло, моющие средства, бытовая химия и т.д.", "tnved": "3401 34 025 0", "marking_status": "mandatory"},
+                {"id": "cosmetics_hygiene_3305", "name": "Средства для волос:", "tnved": "3305", "marking_status": "mandatory"},
+                {"id": "cosmetics_hygiene_330533", "name": "Средства для волос, средства для бритья, дезодоранты, ароматизаторы и ", "tnved": "3305 33", "marking_status": "mandatory"},
+                {"id": "cosmetics_hygiene_33053307", "name": "Средства для волос, средства для бритья, дезодоранты, ароматизаторы и ", "tnved": "3305 33 07", "marking_status": "mandatory"},
+                {"id": "cosmetics_hygiene_3305330733", "name": "Средства для волос, средства для бритья, дезодоранты, ароматизаторы и ", "tnved": "3305 33 073 3", "marking_status": "mandatory"},
+                {"id": "cosmetics_hygiene_330433", "name": "Косметические средства, декоративная косметика, средства для ухода за ", "tnved": "3304 33", "marking_status": "mandatory"},
+                {"id": "cosmetics_hygiene_33043304", "name": "Косметические средства, декоративная косметика, средства для ухода за ", "tnved": "3304 33 04", "marking_status": "mandatory"},
+                {"id": "cosmetics_hygiene_3304330499", "name": "Косметические средства, декоративная косметика, средства для ухода за ", "tnved": "3304 33 049 9", "marking_status": "mandatory"},
+                {"id": "cosmetics_hygiene_8212", "name": "Бритвы и лезвия для них (включая полосовые заготовки для лезвий):", "tnved": "8212", "marking_status": "mandatory"},
+                {"id": "cosmetics_hygiene_821210", "name": "бритвы:", "tnved": "8212 10", "marking_status": "mandatory"},
+                {"id": "cosmetics_hygiene_82121010", "name": "Бритвы и лезвия для них, включая полосовые заготовки для лезвий", "tnved": "8212 10 10", "marking_status": "mandatory"},
+                {"id": "cosmetics_hygiene_8212101000", "name": "безопасные бритвы с несменяемыми лезвиями", "tnved": "8212 10 100 0", "marking_status": "mandatory"},
+                {"id": "cosmetics_mylo_tualetnoe", "name": "Мыло туалетное", "tnved": "3401", "marking_status": "mandatory"},
+                {"id": "cosmetics_mylo_hozyaystvennoe", "name": "Мыло хозяйственное", "tnved": "3401", "marking_status": "mandatory"},
+                {"id": "cosmetics_moyushchie_pav", "name": "Моющие средства ПАВ", "tnved": "3402 50 000 0", "marking_status": "mandatory"},
+                {"id": "cosmetics_chistka_obuvi", "name": "Средства для чистки обуви", "tnved": "3405 40 00 0", "marking_status": "mandatory"},
+                {"id": "cosmetics_shampuni", "name": "Шампуни", "tnved": "3305", "marking_status": "mandatory"},
+                {"id": "cosmetics_kondicionery_volos", "name": "Кондиционеры для волос", "tnved": "3305", "marking_status": "mandatory"},
+                {"id": "cosmetics_laki_volos", "name": "Лаки для волос", "tnved": "3305", "marking_status": "mandatory"},
+                {"id": "cosmetics_kraski_volos", "name": "Краски для волос", "tnved": "3305", "marking_status": "mandatory"},
+                {"id": "cosmetics_sredstva_britya", "name": "Средства для бритья", "tnved": "3307", "marking_status": "mandatory"},
+                {"id": "cosmetics_dezodoranty", "name": "Дезодоранты", "tnved": "3307", "marking_status": "mandatory"},
+                {"id": "cosmetics_aromatizatory", "name": "Ароматизаторы помещений", "tnved": "3307", "marking_status": "mandatory"},
+                {"id": "cosmetics_kremy_lico", "name": "Кремы для лица", "tnved": "3304", "marking_status": "mandatory"},
+                {"id": "cosmetics_kremy_ruki_telo", "name": "Кремы для рук и тела", "tnved": "3304", "marking_status": "mandatory"},
+                {"id": "cosmetics_dekorativnaya", "name": "Декоративная косметика", "tnved": "3304", "marking_status": "mandatory"},
+                {"id": "cosmetics_laki_nogtey", "name": "Лаки для ногтей", "tnved": "3304", "marking_status": "mandatory"},
+                {"id": "cosmetics_sredstva_zagara", "name": "Средства для загара", "tnved": "3304", "marking_status": "mandatory"},
+                {"id": "cosmetics_zubnaya_pasta", "name": "Зубная паста", "tnved": "3306", "marking_status": "mandatory"},
+                {"id": "cosmetics_opolaskivateli_rta", "name": "Ополаскиватели для рта", "tnved": "3306", "marking_status": "mandatory"},
+                {"id": "cosmetics_britvy_bezopasnye", "name": "Бритвы безопасные", "tnved": "8212 10 100 0", "marking_status": "mandatory"},
+                {"id": "cosmetics_britvy_prochie", "name": "Бритвы прочие", "tnved": "8212 10 900 0", "marking_status": "mandatory"},
+                {"id": "cosmetics_lezviya_britv", "name": "Лезвия для бритв", "tnved": "8212 20 000 0", "marking_status": "mandatory"},
+                {"id": "cosmetics_zagotovki_lezviy", "name": "Заготовки для лезвий", "tnved": "8212 90 000 0", "marking_status": "mandatory"}
+            ]}
+        ]
+    },
+    {
+        "id": "non_food",
+        "name": "Непродовольственные товары",
+        "icon": "box",
+        "subcategories": [
+            {"id": "light_industry", "name": "Товары лёгкой промышленности", "icon": "shirt", "products": [
+                {"id": "light_industry_6212", "name": "Бюстгальтеры, пояса, корсеты, подтяжки, подвязки и аналогичные изделия", "tnved": "6212", "marking_status": "mandatory"},
+                {"id": "light_industry_4203", "name": "Предметы одежды и принадлежности к одежде, из натуральной кожи или ком", "tnved": "4203", "marking_status": "mandatory"},
+                {"id": "light_industry_420310", "name": "Предметы одежды, включая рабочую одежду, изготовленные из натуральной ", "tnved": "4203 10", "marking_status": "mandatory"},
+                {"id": "light_industry_42031000", "name": "Предметы одежды, включая рабочую одежду, изготовленные из натуральной ", "tnved": "4203 10 00", "marking_status": "mandatory"},
+                {"id": "light_industry_6106", "name": "Блузки, блузы и блузоны трикотажные машинного или ручного вязания, жен", "tnved": "6106", "marking_status": "mandatory"},
+                {"id": "light_industry_6201", "name": "Пальто, полупальто, накидки, плащи, куртки (включая лыжные), ветровки,", "tnved": "6201", "marking_status": "mandatory"},
+                {"id": "light_industry_6202", "name": "Пальто, полупальто, накидки, плащи, куртки (включая лыжные), ветровки,", "tnved": "6202", "marking_status": "mandatory"},
+                {"id": "light_industry_6302", "name": "Белье постельное, столовое, туалетное и кухонное:", "tnved": "6302", "marking_status": "mandatory"},
+                {"id": "light_industry_6105", "name": "Рубашки трикотажные машинного или ручного вязания, мужские или для мал", "tnved": "6105", "marking_status": "mandatory"},
+                {"id": "light_industry_4304", "name": "Предметы одежды из искусственного меха", "tnved": "4304", "marking_status": "mandatory"},
+                {"id": "light_industry_430400", "name": "Предметы одежды из искусственного меха", "tnved": "4304 00", "marking_status": "mandatory"},
+                {"id": "light_industry_43040000", "name": "Предметы одежды из искусственного меха", "tnved": "4304 00 00", "marking_status": "mandatory"},
+                {"id": "light_industry_4304000000", "name": "Мех искусственный и изделия из него", "tnved": "4304 00 000 0", "marking_status": "mandatory"},
+                {"id": "light_industry_6210", "name": "Одежда из фетра или нетканых материалов, текстильных материалов с проп", "tnved": "6210", "marking_status": "mandatory"},
+                {"id": "light_industry_6113", "name": "Одежда из фетра или нетканых материалов, текстильных материалов с проп", "tnved": "6113", "marking_status": "mandatory"},
+                {"id": "light_industry_611300", "name": "Одежда из фетра или нетканых материалов, текстильных материалов с проп", "tnved": "6113 00", "marking_status": "mandatory"},
+                {"id": "light_industry_6101", "name": "Пальто, куртки, плащи, плащи с капюшонами, анораки, ветровки, штормовк", "tnved": "6101", "marking_status": "mandatory"},
+                {"id": "light_industry_6102", "name": "Пальто, куртки, плащи, плащи с капюшонами, анораки, ветровки, штормовк", "tnved": "6102", "marking_status": "mandatory"},
+                {"id": "light_industry_6205", "name": "Рубашки мужские или для мальчиков:", "tnved": "6205", "marking_status": "mandatory"},
+                {"id": "light_industry_6206", "name": "Блузки, блузы и блузоны женские или для девочек:", "tnved": "6206", "marking_status": "mandatory"},
+                {"id": "light_industry_6211", "name": "Костюмы спортивные, лыжные и купальные; предметы одежды прочие:", "tnved": "6211", "marking_status": "mandatory"},
+                {"id": "light_industry_6103", "name": "Костюмы, комплекты, пиджаки, блайзеры, брюки, комбинезоны с нагрудника", "tnved": "6103", "marking_status": "mandatory"},
+                {"id": "light_industry_6104", "name": "Костюмы, комплекты, жакеты, блайзеры, платья, юбки, юбки-брюки, брюки,", "tnved": "6104", "marking_status": "mandatory"},
+                {"id": "light_industry_6203", "name": "Костюмы, комплекты, пиджаки, блайзеры, брюки, комбинезоны с нагрудника", "tnved": "6203", "marking_status": "mandatory"},
+                {"id": "light_industry_6204", "name": "Костюмы, комплекты, жакеты, блайзеры, платья, юбки, юбки-брюки, брюки,", "tnved": "6204", "marking_status": "mandatory"},
+                {"id": "light_industry_6110", "name": "Свитеры, пуловеры, кардиганы, жилеты и аналогичные изделия трикотажные", "tnved": "6110", "marking_status": "mandatory"},
+                {"id": "light_industry_6112", "name": "Костюмы спортивные, лыжные и купальные трикотажные машинного или ручно", "tnved": "6112", "marking_status": "mandatory"},
+                {"id": "light_industry_611211", "name": "Костюмы спортивные, лыжные, трикотажные машинного или ручного вязания ", "tnved": "6112 11", "marking_status": "mandatory"},
+                {"id": "light_industry_61121100", "name": "Костюмы спортивные, лыжные, трикотажные машинного или ручного вязания ", "tnved": "6112 11 00", "marking_status": "mandatory"},
+                {"id": "light_industry_6112110000", "name": "из хлопчатобумажной пряжи", "tnved": "6112 11 000 0", "marking_status": "mandatory"},
+                {"id": "light_industry_611212", "name": "Костюмы спортивные, лыжные, трикотажные машинного или ручного вязания ", "tnved": "6112 12", "marking_status": "mandatory"},
+                {"id": "light_industry_61121200", "name": "Костюмы спортивные, лыжные, трикотажные машинного или ручного вязания ", "tnved": "6112 12 00", "marking_status": "mandatory"},
+                {"id": "light_industry_6112120000", "name": "из синтетических нитей", "tnved": "6112 12 000 0", "marking_status": "mandatory"},
+                {"id": "light_industry_611219", "name": "Костюмы спортивные, лыжные, трикотажные машинного или ручного вязания ", "tnved": "6112 19", "marking_status": "mandatory"},
+                {"id": "light_industry_61121900", "name": "Костюмы спортивные, лыжные, трикотажные машинного или ручного вязания ", "tnved": "6112 19 00", "marking_status": "mandatory"},
+                {"id": "light_industry_6112190000", "name": "из прочих текстильных материалов", "tnved": "6112 19 000 0", "marking_status": "mandatory"},
+                {"id": "light_industry_611220", "name": "Костюмы спортивные, лыжные, трикотажные машинного или ручного вязания ", "tnved": "6112 20", "marking_status": "mandatory"},
+                {"id": "light_industry_61122000", "name": "Костюмы спортивные, лыжные, трикотажные машинного или ручного вязания ", "tnved": "6112 20 00", "marking_status": "mandatory"},
+                {"id": "light_industry_6112200000", "name": "лыжные костюмы", "tnved": "6112 20 000 0", "marking_status": "mandatory"},
+                {"id": "light_industry_6214", "name": "Шали, шарфы, кашне, мантильи, вуали и аналогичные изделия:", "tnved": "6214", "marking_status": "mandatory"},
+                {"id": "light_industry_6215", "name": "Галстуки, галстуки-бабочки и шейные платки:", "tnved": "6215", "marking_status": "mandatory"},
+                {"id": "light_industry_6107", "name": "Кальсоны, трусы, ночные сорочки, пижамы, купальные халаты, домашние ха", "tnved": "6107", "marking_status": "mandatory"},
+                {"id": "light_industry_6207", "name": "Майки и нательные фуфайки прочие, кальсоны, трусы, ночные сорочки, пиж", "tnved": "6207", "marking_status": "mandatory"},
+                {"id": "light_industry_6108", "name": "Комбинации, нижние юбки, трусы, панталоны, ночные сорочки, пижамы, пен", "tnved": "6108", "marking_status": "mandatory"},
+                {"id": "light_industry_6208", "name": "Майки и нательные фуфайки прочие, комбинации, нижние юбки, трусы, пант", "tnved": "6208", "marking_status": "mandatory"},
+                {"id": "light_industry_6109", "name": "Майки, фуфайки с рукавами и прочие нательные фуфайки трикотажные машин", "tnved": "6109", "marking_status": "mandatory"},
+                {"id": "light_industry_6111", "name": "Детская одежда и принадлежности к детской одежде трикотажные машинного", "tnved": "6111", "marking_status": "mandatory"},
+                {"id": "light_industry_6209", "name": "Детская одежда и принадлежности к детской одежде:", "tnved": "6209", "marking_status": "mandatory"},
+                {"id": "light_industry_611231", "name": "из синтетических нитей:", "tnved": "6112 31", "marking_status": "mandatory"},
+                {"id": "light_industry_611239", "name": "из прочих текстильных материалов:", "tnved": "6112 39", "marking_status": "mandatory"},
+                {"id": "light_industry_611241", "name": "из синтетических нитей:", "tnved": "6112 41", "marking_status": "mandatory"},
+                {"id": "light_industry_611249", "name": "из прочих текстильных материалов:", "tnved": "6112 49", "marking_status": "mandatory"},
+                {"id": "light_industry_621111", "name": "Купальные костюмы", "tnved": "6211 11", "marking_status": "mandatory"},
+                {"id": "light_industry_62111100", "name": "Купальные костюмы", "tnved": "6211 11 00", "marking_status": "mandatory"},
+                {"id": "light_industry_6211110000", "name": "мужские или для мальчиков", "tnved": "6211 11 000 0", "marking_status": "mandatory"},
+                {"id": "light_industry_621112", "name": "Купальные костюмы", "tnved": "6211 12", "marking_status": "mandatory"},
+                {"id": "light_industry_62111200", "name": "Купальные костюмы", "tnved": "6211 12 00", "marking_status": "mandatory"},
+                {"id": "light_industry_6211120000", "name": "женские или для девочек", "tnved": "6211 12 000 0", "marking_status": "mandatory"},
+                {"id": "light_industry_6115", "name": "Колготы, чулки, гольфы, носки и подследники и прочие чулочно-носочные ", "tnved": "6115", "marking_status": "mandatory"},
+                {"id": "light_industry_420321", "name": "Перчатки, рукавицы и митенки", "tnved": "4203 21", "marking_status": "mandatory"},
+                {"id": "light_industry_42032100", "name": "Перчатки, рукавицы и митенки", "tnved": "4203 21 00", "marking_status": "mandatory"},
+                {"id": "light_industry_4203210000", "name": "специально предназначенные для спортивных целей", "tnved": "4203 21 000 0", "marking_status": "mandatory"},
+                {"id": "light_industry_420329", "name": "прочие:", "tnved": "4203 29", "marking_status": "mandatory"},
+                {"id": "light_industry_6116", "name": "Перчатки, рукавицы и митенки трикотажные машинного или ручного вязания", "tnved": "6116", "marking_status": "mandatory"},
+                {"id": "light_industry_6216", "name": "Перчатки, рукавицы и митенки", "tnved": "6216", "marking_status": "mandatory"},
+                {"id": "light_industry_621600", "name": "Перчатки, рукавицы и митенки", "tnved": "6216 00", "marking_status": "mandatory"},
+                {"id": "light_industry_62160000", "name": "Перчатки, рукавицы и митенки", "tnved": "6216 00 00", "marking_status": "mandatory"},
+                {"id": "light_industry_6216000000", "name": "Перчатки, рукавицы и митенки", "tnved": "6216 00 000 0", "marking_status": "mandatory"},
+                {"id": "light_industry_6114", "name": "Предметы одежды прочие трикотажные машинного или ручного вязания:", "tnved": "6114", "marking_status": "mandatory"},
+                {"id": "light_industry_6117", "name": "Принадлежности к одежде трикотажные машинного или ручного вязания гото", "tnved": "6117", "marking_status": "mandatory"},
+                {"id": "light_industry_611710", "name": "Предметы одежды и принадлежности к одежде готовые прочие, в том числе ", "tnved": "6117 10", "marking_status": "mandatory"},
+                {"id": "light_industry_61171000", "name": "Предметы одежды и принадлежности к одежде готовые прочие, в том числе ", "tnved": "6117 10 00", "marking_status": "mandatory"},
+                {"id": "light_industry_6117100000", "name": "шали, шарфы, кашне, мантильи, вуали и аналогичные изделия", "tnved": "6117 10 000 0", "marking_status": "mandatory"},
+                {"id": "light_industry_611780", "name": "принадлежности прочие:", "tnved": "6117 80", "marking_status": "mandatory"},
+                {"id": "light_industry_61178010", "name": "Предметы одежды и принадлежности к одежде готовые прочие, в том числе ", "tnved": "6117 80 10", "marking_status": "mandatory"},
+                {"id": "light_industry_6117801009", "name": "прочие", "tnved": "6117 80 100 9", "marking_status": "mandatory"},
+                {"id": "light_industry_61178080", "name": "Предметы одежды и принадлежности к одежде готовые прочие, в том числе ", "tnved": "6117 80 80", "marking_status": "mandatory"},
+                {"id": "light_industry_6117808009", "name": "прочие", "tnved": "6117 80 800 9", "marking_status": "mandatory"},
+                {"id": "light_industry_6217", "name": "Предметы одежды и принадлежности к одежде готовые прочие, в том числе ", "tnved": "6217", "marking_status": "mandatory"},
+                {"id": "light_industry_621710", "name": "Предметы одежды и принадлежности к одежде готовые прочие, в том числе ", "tnved": "6217 10", "marking_status": "mandatory"},
+                {"id": "light_industry_62171000", "name": "Предметы одежды и принадлежности к одежде готовые прочие, в том числе ", "tnved": "6217 10 00", "marking_status": "mandatory"},
+                {"id": "light_industry_6217100000", "name": "принадлежности", "tnved": "6217 10 000 0", "marking_status": "mandatory"},
+                {"id": "light_industry_6213", "name": "Платки:", "tnved": "6213", "marking_status": "mandatory"},
+                {"id": "light_industry_6117808001", "name": "галстуки, галстуки-бабочки и шейные платки", "tnved": "6117 80 800 1", "marking_status": "mandatory"},
+                {"id": "light_industry_6406", "name": "Детали обуви (включая заготовки верха обуви с прикрепленной или неприк", "tnved": "6406", "marking_status": "mandatory"},
+                {"id": "light_industry_640690", "name": "прочие:", "tnved": "6406 90", "marking_status": "mandatory"},
+                {"id": "light_industry_64069090", "name": "Гетры, гамаши и аналогичные изделия", "tnved": "6406 90 90", "marking_status": "mandatory"},
+                {"id": "light_industry_6406909000", "name": "прочие", "tnved": "6406 90 900 0", "marking_status": "mandatory"},
+                {"id": "light_industry_6504", "name": "Шляпы и прочие головные уборы", "tnved": "6504", "marking_status": "mandatory"},
+                {"id": "light_industry_650400", "name": "Шляпы и прочие головные уборы", "tnved": "6504 00", "marking_status": "mandatory"},
+                {"id": "light_industry_65040000", "name": "Шляпы и прочие головные уборы", "tnved": "6504 00 00", "marking_status": "mandatory"},
+                {"id": "light_industry_6504000000", "name": "Шляпы и прочие головные уборы, плетеные или изготовленные путем соедин", "tnved": "6504 00 000 0", "marking_status": "mandatory"},
+                {"id": "light_industry_6505", "name": "Шляпы и прочие головные уборы", "tnved": "6505", "marking_status": "mandatory"},
+                {"id": "light_industry_650500", "name": "Шляпы и прочие головные уборы трикотажные машинного или ручного вязани", "tnved": "6505 00", "marking_status": "mandatory"},
+                {"id": "light_industry_6506", "name": "Головные уборы прочие, с подкладкой или без подкладки или с отделкой и", "tnved": "6506", "marking_status": "mandatory"},
+                {"id": "light_industry_650699", "name": "из прочих материалов:", "tnved": "6506 99", "marking_status": "mandatory"}
+            ]},
+            {"id": "shoes", "name": "Обувь", "icon": "footprints", "products": [
+                {"id": "shoes_6401", "name": "Водонепроницаемая обувь с подошвой и с верхом из резины или пластмассы", "tnved": "6401", "marking_status": "mandatory"},
+                {"id": "shoes_6402", "name": "Прочая обувь с подошвой и с верхом из резины или пластмассы:", "tnved": "6402", "marking_status": "mandatory"},
+                {"id": "shoes_6403", "name": "Обувь с подошвой из резины, пластмассы, натуральной или композиционной", "tnved": "6403", "marking_status": "mandatory"},
+                {"id": "shoes_6404", "name": "Обувь с подошвой из резины, пластмассы, натуральной или композиционной", "tnved": "6404", "marking_status": "mandatory"},
+                {"id": "shoes_6405", "name": "Обувь прочая:", "tnved": "6405", "marking_status": "mandatory"},
+                {"id": "shoes_sportivnaya", "name": "Обувь спортивная", "tnved": "6402; 6403; 6404", "marking_status": "mandatory"}
+            ]},
+            {"id": "furs", "name": "Шубы", "icon": "shirt", "products": [
+                {"id": "furs_4303", "name": "Предметы одежды, принадлежности к одежде и прочие изделия, из натураль", "tnved": "4303", "marking_status": "mandatory"},
+                {"id": "furs_430310", "name": "предметы одежды и принадлежности к одежде:", "tnved": "4303 10", "marking_status": "mandatory"},
+                {"id": "furs_43031090", "name": "Предметы одежды из норки.", "tnved": "4303 10 90", "marking_status": "mandatory"},
+                {"id": "furs_4303109010", "name": "предметы одежды из норки", "tnved": "4303 10 901 0", "marking_status": "mandatory"},
+                {"id": "furs_4303109020", "name": "предметы одежды из нутрии", "tnved": "4303 10 902 0", "marking_status": "mandatory"},
+                {"id": "furs_4303109030", "name": "предметы одежды из песца или лисицы", "tnved": "4303 10 903 0", "marking_status": "mandatory"},
+                {"id": "furs_4303109040", "name": "предметы одежды из кролика или зайца", "tnved": "4303 10 904 0", "marking_status": "mandatory"},
+                {"id": "furs_4303109050", "name": "предметы одежды из енота", "tnved": "4303 10 905 0", "marking_status": "mandatory"},
+                {"id": "furs_4303109060", "name": "предметы одежды из овчины", "tnved": "4303 10 906 0", "marking_status": "mandatory"},
+                {"id": "furs_4303109080", "name": "предметы одежды прочие", "tnved": "4303 10 908 0", "marking_status": "mandatory"}
+            ]},
+            {"id": "toys", "name": "Детские игрушки", "icon": "puzzle", "products": [
+                {"id": "toys_9503", "name": "Игрушки, предназначенные для детей в возрасте до 14 лет — самокаты, пе", "tnved": "9503", "marking_status": "mandatory"},
+                {"id": "toys_950300", "name": "Трехколесные велосипеды, самокаты, педальные автомобили и аналогичные ", "tnved": "9503 00", "marking_status": "mandatory"},
+                {"id": "toys_9504", "name": "Консоли и оборудование для видеоигр, настольные или комнатные игры, вк", "tnved": "9504", "marking_status": "mandatory"},
+                {"id": "toys_9504400000", "name": "карты игральные", "tnved": "9504 40 000 0", "marking_status": "mandatory"},
+                {"id": "toys_950490", "name": "прочие:", "tnved": "9504 90", "marking_status": "mandatory"},
+                {"id": "toys_9504901000", "name": "наборы электрических гоночных автомобилей для соревновательных игр", "tnved": "9504 90 100 0", "marking_status": "mandatory"},
+                {"id": "toys_9504908009", "name": "прочие", "tnved": "9504 90 800 9", "marking_status": "mandatory"},
+                {"id": "toys_kolyaski_kukol", "name": "Коляски для кукол", "tnved": "9503 00", "marking_status": "mandatory"},
+                {"id": "toys_kukly", "name": "Куклы", "tnved": "9503 00", "marking_status": "mandatory"},
+                {"id": "toys_igrushki_prochie", "name": "Игрушки прочие", "tnved": "9503 00", "marking_status": "mandatory"},
+                {"id": "toys_modeli", "name": "Модели в масштабе", "tnved": "9503 00", "marking_status": "mandatory"},
+                {"id": "toys_golovolomki", "name": "Головоломки всех видов", "tnved": "9503 00", "marking_status": "mandatory"}
+            ]},
+            {"id": "bicycles", "name": "Велосипеды", "icon": "bike", "products": [
+                {"id": "bicycles_8711", "name": "Мотоциклы (включая мопеды) и велосипеды с установленным вспомогательны", "tnved": "8711", "marking_status": "mandatory"},
+                {"id": "bicycles_871187", "name": "Велосипеды (в том числе с установленным вспомогательным двигателем и т", "tnved": "8711 87", "marking_status": "mandatory"},
+                {"id": "bicycles_87118712", "name": "Велосипеды (в том числе с установленным вспомогательным двигателем и т", "tnved": "8711 87 12", "marking_status": "mandatory"},
+                {"id": "bicycles_8711871200", "name": "Велосипеды (в том числе с установленным вспомогательным двигателем и т", "tnved": "8711 87 120 0", "marking_status": "mandatory"},
+                {"id": "bicycles_871200", "name": "Велосипеды двухколёсные", "tnved": "8712 00", "marking_status": "mandatory"},
+                {"id": "bicycles_871491100", "name": "Рамы велосипедные", "tnved": "8714 91 100", "marking_status": "mandatory"},
+                {"id": "bicycles_950300100", "name": "Велосипеды трёхколёсные, самокаты детские", "tnved": "9503 00 100", "marking_status": "mandatory"}
+            ]}
+        ]
+    },
+    {
+        "id": "auto",
+        "name": "Автомобильная отрасль",
+        "icon": "car",
+        "subcategories": [
+            {"id": "tires", "name": "Шины и покрышки", "icon": "circle", "products": [
+                {"id": "tires_4011", "name": "Шины и покрышки пневматические резиновые новые:", "tnved": "4011", "marking_status": "mandatory"},
+                {"id": "tires_401110", "name": "Шины и покрышки пневматические резиновые новые", "tnved": "4011 10", "marking_status": "mandatory"},
+                {"id": "tires_40111000", "name": "Шины и покрышки пневматические резиновые новые", "tnved": "4011 10 00", "marking_status": "mandatory"},
+                {"id": "tires_4011100003", "name": "с посадочным диаметром не более 16 дюймов", "tnved": "4011 10 000 3", "marking_status": "mandatory"},
+                {"id": "tires_4011100009", "name": "прочие", "tnved": "4011 10 000 9", "marking_status": "mandatory"},
+                {"id": "tires_401120", "name": "для автобусов или моторных транспортных средств для перевозки грузов:", "tnved": "4011 20", "marking_status": "mandatory"},
+                {"id": "tires_40112010", "name": "Шины и покрышки пневматические резиновые новые", "tnved": "4011 20 10", "marking_status": "mandatory"},
+                {"id": "tires_4011201000", "name": "с индексом нагрузки не более 121", "tnved": "4011 20 100 0", "marking_status": "mandatory"},
+                {"id": "tires_40112090", "name": "Шины и покрышки пневматические резиновые новые", "tnved": "4011 20 90", "marking_status": "mandatory"},
+                {"id": "tires_4011209000", "name": "с индексом нагрузки более 121", "tnved": "4011 20 900 0", "marking_status": "mandatory"},
+                {"id": "tires_401140", "name": "Шины и покрышки пневматические резиновые новые", "tnved": "4011 40", "marking_status": "mandatory"},
+                {"id": "tires_40114000", "name": "Шины и покрышки пневматические резиновые новые", "tnved": "4011 40 00", "marking_status": "mandatory"},
+                {"id": "tires_4011400000", "name": "для мотоциклов", "tnved": "4011 40 000 0", "marking_status": "mandatory"},
+                {"id": "tires_401170", "name": "Шины и покрышки пневматические резиновые новые", "tnved": "4011 70", "marking_status": "mandatory"},
+                {"id": "tires_40117000", "name": "Шины и покрышки пневматические резиновые новые", "tnved": "4011 70 00", "marking_status": "mandatory"},
+                {"id": "tires_4011700000", "name": "для сельскохозяйственных или лесохозяйственных транспортных средств и ", "tnved": "4011 70 000 0", "marking_status": "mandatory"},
+                {"id": "tires_401180", "name": "Шины и покрышки пневматические резиновые новые", "tnved": "4011 80", "marking_status": "mandatory"},
+                {"id": "tires_40118000", "name": "Шины и покрышки пневматические резиновые новые", "tnved": "4011 80 00", "marking_status": "mandatory"},
+                {"id": "tires_4011800000", "name": "для транспортных средств и машин, используемых в строительстве, горном", "tnved": "4011 80 000 0", "marking_status": "mandatory"},
+                {"id": "tires_401190", "name": "Шины и покрышки пневматические резиновые новые", "tnved": "4011 90", "marking_status": "mandatory"},
+                {"id": "tires_40119000", "name": "Шины и покрышки пневматические резиновые новые", "tnved": "4011 90 00", "marking_status": "mandatory"},
+                {"id": "tires_4011900000", "name": "прочие", "tnved": "4011 90 000 0", "marking_status": "mandatory"}
+            ]},
+            {"id": "motor_oils", "name": "Моторные масла", "icon": "droplet", "products": [
+                {"id": "motor_oils_2710", "name": "Нефть и нефтепродукты, полученные из битуминозных пород, кроме сырых; ", "tnved": "2710", "marking_status": "mandatory"},
+                {"id": "motor_oils_271019", "name": "прочие:", "tnved": "2710 19", "marking_status": "mandatory"},
+                {"id": "motor_oils_27101982", "name": "Моторные масла, компрессорное смазочное масло, турбинное смазочное мас", "tnved": "2710 19 82", "marking_status": "mandatory"},
+                {"id": "motor_oils_2710198200", "name": "моторные масла, компрессорное смазочное масло, турбинное смазочное мас", "tnved": "2710 19 820 0", "marking_status": "mandatory"},
+                {"id": "motor_oils_27101988", "name": "Масло для шестерен и масло для редукторов (например, масло трансмиссио", "tnved": "2710 19 88", "marking_status": "mandatory"},
+                {"id": "motor_oils_2710198800", "name": "масло для шестерен и масло для редукторов", "tnved": "2710 19 880 0", "marking_status": "mandatory"},
+                {"id": "motor_oils_3403", "name": "Материалы смазочные (включая смазочно-охлаждающие эмульсии для режущих", "tnved": "3403", "marking_status": "mandatory"},
+                {"id": "motor_oils_340319", "name": "прочие:", "tnved": "3403 19", "marking_status": "mandatory"},
+                {"id": "motor_oils_34031910", "name": "Прочие материалы смазочные, содержащие не в качестве основного компоне", "tnved": "3403 19 10", "marking_status": "mandatory"},
+                {"id": "motor_oils_3403191000", "name": "содержащие не в качестве основного компонента 70 мас.% или более нефти", "tnved": "3403 19 100 0", "marking_status": "mandatory"},
+                {"id": "motor_oils_34031990", "name": "Средства для смазки машин, механизмов и транспортных средств. В данную", "tnved": "3403 19 90", "marking_status": "mandatory"},
+                {"id": "motor_oils_3403199000", "name": "прочие", "tnved": "3403 19 900 0", "marking_status": "mandatory"},
+                {"id": "motor_oils_340399", "name": "Материалы смазочные (включая смазочно-охлаждающие эмульсии для режущих", "tnved": "3403 99", "marking_status": "mandatory"},
+                {"id": "motor_oils_34039900", "name": "Материалы смазочные (включая смазочно-охлаждающие эмульсии для режущих", "tnved": "3403 99 00", "marking_status": "mandatory"},
+                {"id": "motor_oils_3403990000", "name": "прочие", "tnved": "3403 99 000 0", "marking_status": "mandatory"},
+                {"id": "motor_oils_3819", "name": "Жидкости тормозные гидравлические и жидкости готовые прочие для гидрав", "tnved": "3819", "marking_status": "mandatory"},
+                {"id": "motor_oils_381900", "name": "Жидкости тормозные гидравлические и жидкости готовые прочие для гидрав", "tnved": "3819 00", "marking_status": "mandatory"},
+                {"id": "motor_oils_38190000", "name": "Жидкости тормозные гидравлические и жидкости готовые прочие для гидрав", "tnved": "3819 00 00", "marking_status": "mandatory"},
+                {"id": "motor_oils_3819000000", "name": "Жидкости тормозные гидравлические и жидкости готовые прочие для гидрав", "tnved": "3819 00 000 0", "marking_status": "mandatory"},
+                {"id": "motor_oils_3820", "name": "Антифризы и жидкости антиобледенительные готовые (например, омыватель ", "tnved": "3820", "marking_status": "mandatory"},
+                {"id": "motor_oils_382000", "name": "Антифризы и жидкости антиобледенительные готовые (например, омыватель ", "tnved": "3820 00", "marking_status": "mandatory"},
+                {"id": "motor_oils_38200000", "name": "Антифризы и жидкости антиобледенительные готовые (например, омыватель ", "tnved": "3820 00 00", "marking_status": "mandatory"},
+                {"id": "motor_oils_3820000000", "name": "Антифризы и жидкости антиобледенительные готовые", "tnved": "3820 00 000 0", "marking_status": "mandatory"},
+                {"id": "motor_oils_kompressornye", "name": "Компрессорные масла", "tnved": "2710 19 820 0", "marking_status": "mandatory"},
+                {"id": "motor_oils_turbinnye", "name": "Турбинные масла", "tnved": "2710 19 820 0", "marking_status": "mandatory"},
+                {"id": "motor_oils_reduktory", "name": "Масла для редукторов", "tnved": "2710 19 880 0", "marking_status": "mandatory"},
+                {"id": "motor_oils_smazki_prochie", "name": "Смазки прочие (эмульсии, антикоррозионные)", "tnved": "3403 99 000 0", "marking_status": "mandatory"},
+                {"id": "motor_oils_omyvateli", "name": "Омыватели стёкол", "tnved": "3820 00 000 0", "marking_status": "mandatory"}
+            ]}
+        ]
+    },
+    {
+        "id": "construction",
+        "name": "Строительство и инфраструктура",
+        "icon": "hard-hat",
+        "subcategories": [
+            {"id": "building_materials", "name": "Строительные материалы", "icon": "hammer", "products": [
+                {"id": "building_materials_2520", "name": "Гипс; ангидрит; гипсовые вяжущие (представляющие собой кальцинированны", "tnved": "2520", "marking_status": "mandatory"},
+                {"id": "building_materials_2523", "name": "Портландцемент, цемент глиноземистый, цемент шлаковый, цемент суперсул", "tnved": "2523", "marking_status": "mandatory"},
+                {"id": "building_materials_3816", "name": "Цементы огнеупорные, растворы строительные огнеупорные, бетоны огнеупо", "tnved": "3816", "marking_status": "mandatory"},
+                {"id": "building_materials_381600", "name": "Цементы огнеупорные, растворы строительные огнеупорные, бетоны огнеупо", "tnved": "3816 00", "marking_status": "mandatory"},
+                {"id": "building_materials_38160000", "name": "Цементы огнеупорные, растворы строительные огнеупорные, бетоны огнеупо", "tnved": "3816 00 00", "marking_status": "mandatory"},
+                {"id": "building_materials_3816000000", "name": "Цементы огнеупорные, растворы строительные огнеупорные, бетоны огнеупо", "tnved": "3816 00 000 0", "marking_status": "mandatory"},
+                {"id": "building_materials_3824", "name": "Готовые связующие вещества для производства литейных форм или литейных", "tnved": "3824", "marking_status": "mandatory"},
+                {"id": "building_materials_382450", "name": "неогнеупорные строительные растворы и бетоны:", "tnved": "3824 50", "marking_status": "mandatory"},
+                {"id": "building_materials_38245090", "name": "Смеси строительные, растворы строительные", "tnved": "3824 50 90", "marking_status": "mandatory"},
+                {"id": "building_materials_3824509000", "name": "прочие", "tnved": "3824 50 900 0", "marking_status": "mandatory"},
+                {"id": "building_materials_3214", "name": "Замазки стекольная и садовая, цементы смоляные, составы для уплотнения", "tnved": "3214", "marking_status": "mandatory"},
+                {"id": "building_materials_gips_stroit", "name": "Гипс строительный", "tnved": "2520", "marking_status": "mandatory"},
+                {"id": "building_materials_gips_tech", "name": "Гипс технический", "tnved": "2520", "marking_status": "mandatory"},
+                {"id": "building_materials_gips_med", "name": "Гипс медицинский", "tnved": "2520", "marking_status": "mandatory"},
+                {"id": "building_materials_gips_form", "name": "Гипс формовочный", "tnved": "2520", "marking_status": "mandatory"},
+                {"id": "building_materials_portland_bez", "name": "Портландцемент без добавок", "tnved": "2523", "marking_status": "mandatory"},
+                {"id": "building_materials_portland_s", "name": "Портландцемент с добавками", "tnved": "2523", "marking_status": "mandatory"},
+                {"id": "building_materials_shlako", "name": "Шлакопортландцемент", "tnved": "2523", "marking_status": "mandatory"},
+                {"id": "building_materials_kompozit", "name": "Цемент композиционный", "tnved": "2523", "marking_status": "mandatory"},
+                {"id": "building_materials_belye", "name": "Портландцементы белые/цветные", "tnved": "2523", "marking_status": "mandatory"},
+                {"id": "building_materials_tampon", "name": "Цемент тампонажный", "tnved": "2523", "marking_status": "mandatory"},
+                {"id": "building_materials_glinozem", "name": "Цементы глинозёмистые", "tnved": "2523", "marking_status": "mandatory"},
+                {"id": "building_materials_cement_proch", "name": "Цементы прочие", "tnved": "2523", "marking_status": "mandatory"},
+                {"id": "building_materials_rastvory_ogn", "name": "Растворы огнеупорные", "tnved": "3816 00 000 0", "marking_status": "mandatory"},
+                {"id": "building_materials_betony_ogn", "name": "Бетоны огнеупорные", "tnved": "3816 00 000 0", "marking_status": "mandatory"},
+                {"id": "building_materials_rastvory_str", "name": "Растворы строительные", "tnved": "3824 50 900 0", "marking_status": "mandatory"},
+                {"id": "building_materials_shpatlyovki", "name": "Шпатлёвки", "tnved": "3214", "marking_status": "mandatory"},
+                {"id": "building_materials_zamazki", "name": "Замазки", "tnved": "3214", "marking_status": "mandatory"},
+                {"id": "building_materials_germetiki", "name": "Герметики", "tnved": "3214", "marking_status": "mandatory"},
+                {"id": "building_materials_mastiki", "name": "Мастики", "tnved": "3214", "marking_status": "mandatory"},
+                {"id": "building_materials_pasty", "name": "Пасты строительные", "tnved": "3214", "marking_status": "mandatory"}
+            ]}
+        ]
+    },
+    {
+        "id": "electronics",
+        "name": "Электроника и техника",
+        "icon": "cpu",
+        "subcategories": [
+            {"id": "cameras", "name": "Фотоаппараты и лампы-вспышки", "icon": "camera", "products": [
+                {"id": "cameras_9006", "name": "Фотокамеры (кроме кинематографических)", "tnved": "9006", "marking_status": "mandatory", "mandatory_since": "2020-10-01",
+                    "timeline": {
+                        "title": "Фотоаппараты и лампы-вспышки",
+                        "start_date": "1 октября 2020",
+                        "who": ["Производители", "Импортёры", "Оптовики", "Розница"],
+                        "current_requirements": [
+                            "Регистрация в Честном ЗНАКе",
+                            "Нанесение кодов маркировки",
+                            "Передача данных при продаже на кассе",
+                            "Электронный документооборот (ЭДО)",
+                            "Разрешительный режим на кассах (с 01.11.2024)"
+                        ]
+                    }
+                },
+                {"id": "cameras_900610", "name": "Фотоаппараты для изготовления печатных пластин/цилиндров", "tnved": "9006 10", "marking_status": "mandatory"},
+                {"id": "cameras_900630", "name": "Фотоаппараты специальные для подводной/аэросъёмки", "tnved": "9006 30", "marking_status": "mandatory"},
+                {"id": "cameras_900640", "name": "Фотоаппараты для моментальной печати", "tnved": "9006 40", "marking_status": "mandatory"},
+                {"id": "cameras_900651", "name": "Фотоаппараты прочие с видоискателем (зеркальные)", "tnved": "9006 51", "marking_status": "mandatory"},
+                {"id": "cameras_900652", "name": "Фотоаппараты прочие для плёнки шириной менее 35мм", "tnved": "9006 52", "marking_status": "mandatory"},
+                {"id": "cameras_900653", "name": "Фотоаппараты прочие для плёнки шириной 35мм", "tnved": "9006 53", "marking_status": "mandatory"},
+                {"id": "cameras_900659", "name": "Фотоаппараты прочие", "tnved": "9006 59", "marking_status": "mandatory"},
+                {"id": "cameras_900661", "name": "Лампы-вспышки с газоразрядной трубкой", "tnved": "9006 61", "marking_status": "mandatory"},
+                {"id": "cameras_900669", "name": "Лампы-вспышки прочие", "tnved": "9006 69", "marking_status": "mandatory"}
+            ]}
+        ]
+    },
+    {
+        "id": "pilot",
+        "name": "Пилотные проекты",
+        "icon": "rocket",
+        "subcategories": [
+            {
+                "id": "pilot_титановая_металлопродукция",
+                "name": "Титановая металлопродукция (завершен)",
+                "products": [
+                    {"id": "pilot_титановая_металлопродукция_8108_20_000_6", "name": "Слитки из титановых сплавов", "tnved": "8108 20 000 6", "marking_status": "not_required"},
+                    {"id": "pilot_титановая_металлопродукция_8108_20_000_7", "name": "Слябы из титановых сплавов", "tnved": "8108 20 000 7", "marking_status": "not_required"},
+                    {"id": "pilot_титановая_металлопродукция_8108_90_300_8", "name": "Прутки и биллеты из титановых сплавов", "tnved": "8108 90 300 8", "marking_status": "not_required"},
+                    {"id": "pilot_титановая_металлопродукция_8108_90_300_8_1", "name": "Плиты и листы из титановых сплавов", "tnved": "8108 90 300 8", "marking_status": "not_required"},
+                    {"id": "pilot_титановая_металлопродукция_8108_90_300_8_2", "name": "Поковки прямоугольной формы из титановых сплавов", "tnved": "8108 90 300 8", "marking_status": "not_required"},
+                    {"id": "pilot_титановая_металлопродукция_8108_90_500_8", "name": "Плиты и листы из титановых сплавов", "tnved": "8108 90 500 8", "marking_status": "not_required"}
+                ]
+            },
+            {
+                "id": "pilot_оптоволоконная_продукция",
+                "name": "Оптоволоконная продукция",
+                "products": [
+                    {"id": "pilot_оптоволоконная_продукция_9001_10_900_1", "name": "Волокна оптические", "tnved": "9001 10 900 1", "marking_status": "experiment"},
+                    {"id": "pilot_оптоволоконная_продукция_8544_70_000_0", "name": "Кабели волоконно-оптические", "tnved": "8544 70 000 0", "marking_status": "experiment"}
+                ]
+            },
+            {
+                "id": "pilot_отопительные_приборы",
+                "name": "Отопительные приборы",
+                "products": [
+                    {"id": "pilot_отопительные_приборы_7322_11_000_0", "name": "Радиаторы центрального отопления чугунные", "tnved": "7322 11 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_отопительные_приборы_7322_19_000_0", "name": "Радиаторы центрального отопления прочие", "tnved": "7322 19 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_отопительные_приборы_7616_99_100_2", "name": "Радиаторы алюминиевые", "tnved": "7616 99 100 2", "marking_status": "experiment"},
+                    {"id": "pilot_отопительные_приборы_7616_99_100_3", "name": "Радиаторы алюминиевые", "tnved": "7616 99 100 3", "marking_status": "experiment"},
+                    {"id": "pilot_отопительные_приборы_7616_99_900_8", "name": "Радиаторы алюминиевые прочие", "tnved": "7616 99 900 8", "marking_status": "experiment"},
+                    {"id": "pilot_отопительные_приборы_7322_90_000_9", "name": "Конвекторы отопительные", "tnved": "7322 90 000 9", "marking_status": "experiment"},
+                    {"id": "pilot_отопительные_приборы_7419_80_000_0", "name": "Конвекторы отопительные медные", "tnved": "7419 80 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_отопительные_приборы_8403_10_900_0", "name": "Котлы центрального отопления", "tnved": "8403 10 900 0", "marking_status": "experiment"}
+                ]
+            },
+            {
+                "id": "pilot_слабоалкогольная_продукция_до_9",
+                "name": "Слабоалкогольная продукция (до 9%)",
+                "products": [
+                    {"id": "pilot_слабоалкогольная_продукция_до_9_2206_00_590_1", "name": "Алкогольная продукция до 9%", "tnved": "2206 00 590 1", "marking_status": "experiment"},
+                    {"id": "pilot_слабоалкогольная_продукция_до_9_2206_00_390_1", "name": "Алкогольная продукция до 9%", "tnved": "2206 00 390 1", "marking_status": "experiment"},
+                    {"id": "pilot_слабоалкогольная_продукция_до_9_2206_00_890_1", "name": "Алкогольная продукция до 9%", "tnved": "2206 00 890 1", "marking_status": "experiment"},
+                    {"id": "pilot_слабоалкогольная_продукция_до_9_2208_90_690_1", "name": "Алкогольная продукция до 9%", "tnved": "2208 90 690 1", "marking_status": "experiment"},
+                    {"id": "pilot_слабоалкогольная_продукция_до_9_2208_90_780_1", "name": "Алкогольная продукция до 9%", "tnved": "2208 90 780 1", "marking_status": "experiment"},
+                    {"id": "pilot_слабоалкогольная_продукция_до_9_2206_00_390_9", "name": "Алкогольная продукция до 9%", "tnved": "2206 00 390 9", "marking_status": "experiment"},
+                    {"id": "pilot_слабоалкогольная_продукция_до_9_2206_00_590_9", "name": "Алкогольная продукция до 9%", "tnved": "2206 00 590 9", "marking_status": "experiment"},
+                    {"id": "pilot_слабоалкогольная_продукция_до_9_2206_00_890_9", "name": "Алкогольная продукция до 9%", "tnved": "2206 00 890 9", "marking_status": "experiment"},
+                    {"id": "pilot_слабоалкогольная_продукция_до_9_2208_90_690_9", "name": "Алкогольная продукция до 9%", "tnved": "2208 90 690 9", "marking_status": "experiment"},
+                    {"id": "pilot_слабоалкогольная_продукция_до_9_2208_90_780_9", "name": "Алкогольная продукция до 9%", "tnved": "2208 90 780 9", "marking_status": "experiment"}
+                ]
+            },
+            {
+                "id": "pilot_пиротехника_и_пожарная_безопасность",
+                "name": "Пиротехника и пожарная безопасность",
+                "products": [
+                    {"id": "pilot_пиротехника_и_пожарная_безопасность_3604", "name": "Изделия пиротехнические I, II, III классов", "tnved": "3604", "marking_status": "experiment"},
+                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8424_10_000_0", "name": "Огнетушители", "tnved": "8424 10 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_пиротехника_и_пожарная_безопасность_3813_00_000_0", "name": "Составы и заряды для огнетушителей", "tnved": "3813 00 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8526_92_000_8", "name": "Извещатели пожарные", "tnved": "8526 92 000 8", "marking_status": "experiment"},
+                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8531_10", "name": "Извещатели пожарные", "tnved": "8531 10", "marking_status": "experiment"},
+                    {"id": "pilot_пиротехника_и_пожарная_безопасность_9022_29_000_0", "name": "Извещатели пожарные", "tnved": "9022 29 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_пиротехника_и_пожарная_безопасность_9027_10", "name": "Извещатели пожарные", "tnved": "9027 10", "marking_status": "experiment"},
+                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8504_40_300_4", "name": "Источники бесперебойного питания пожарной автоматики", "tnved": "8504 40 300 4", "marking_status": "experiment"},
+                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8504_40_300_8", "name": "Источники бесперебойного питания пожарной автоматики", "tnved": "8504 40 300 8", "marking_status": "experiment"},
+                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8504_40_550_0", "name": "Источники бесперебойного питания пожарной автоматики", "tnved": "8504 40 550 0", "marking_status": "experiment"},
+                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8504_40_830_0", "name": "Источники бесперебойного питания пожарной автоматики", "tnved": "8504 40 830 0", "marking_status": "experiment"},
+                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8504_40_850_0", "name": "Источники бесперебойного питания пожарной автоматики", "tnved": "8504 40 850 0", "marking_status": "experiment"},
+                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8504_40_870_0", "name": "Источники бесперебойного питания пожарной автоматики", "tnved": "8504 40 870 0", "marking_status": "experiment"},
+                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8504_40_910_0", "name": "Источники бесперебойного питания пожарной автоматики", "tnved": "8504 40 910 0", "marking_status": "experiment"},
+                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8517_62_000_9", "name": "Оповещатели пожарные", "tnved": "8517 62 000 9", "marking_status": "experiment"},
+                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8518_21_000_0", "name": "Оповещатели пожарные", "tnved": "8518 21 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8518_22_000_9", "name": "Оповещатели пожарные", "tnved": "8518 22 000 9", "marking_status": "experiment"},
+                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8518_29_300_8", "name": "Оповещатели пожарные", "tnved": "8518 29 300 8", "marking_status": "experiment"},
+                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8518_29_960_0", "name": "Оповещатели пожарные", "tnved": "8518 29 960 0", "marking_status": "experiment"},
+                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8531_20_200_0", "name": "Выносные устройства индикации", "tnved": "8531 20 200 0", "marking_status": "experiment"},
+                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8531_80_950_0", "name": "Выносные устройства индикации", "tnved": "8531 80 950 0", "marking_status": "experiment"},
+                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8537_10", "name": "Приборы приемно-контрольные пожарные", "tnved": "8537 10", "marking_status": "experiment"},
+                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8517_61_000", "name": "Системы передачи извещений о пожаре", "tnved": "8517 61 000", "marking_status": "experiment"},
+                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8517_62_000", "name": "Системы передачи извещений о пожаре", "tnved": "8517 62 000", "marking_status": "experiment"},
+                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8517_69_390_0", "name": "Системы передачи извещений о пожаре", "tnved": "8517 69 390 0", "marking_status": "experiment"},
+                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8517_69_900_0", "name": "Системы передачи извещений о пожаре", "tnved": "8517 69 900 0", "marking_status": "experiment"}
+                ]
+            },
+            {
+                "id": "pilot_компоненты_транспортных_средств",
+                "name": "Компоненты транспортных средств",
+                "products": [
+                    {"id": "pilot_компоненты_транспортных_средств_4823_90_859_7", "name": "Фильтры", "tnved": "4823 90 859 7", "marking_status": "experiment"},
+                    {"id": "pilot_компоненты_транспортных_средств_5911_90_900_0", "name": "Фильтры", "tnved": "5911 90 900 0", "marking_status": "experiment"},
+                    {"id": "pilot_компоненты_транспортных_средств_8421_23_000_0", "name": "Фильтры масляные", "tnved": "8421 23 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_компоненты_транспортных_средств_8421_29_000_9", "name": "Фильтры прочие", "tnved": "8421 29 000 9", "marking_status": "experiment"},
+                    {"id": "pilot_компоненты_транспортных_средств_8421_31_000_0", "name": "Фильтры воздушные", "tnved": "8421 31 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_компоненты_транспортных_средств_8421_32_000_0", "name": "Фильтры воздушные", "tnved": "8421 32 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_компоненты_транспортных_средств_8421_39_200_8", "name": "Фильтры прочие", "tnved": "8421 39 200 8", "marking_status": "experiment"},
+                    {"id": "pilot_компоненты_транспортных_средств_8421_99_000_6", "name": "Фильтры части", "tnved": "8421 99 000 6", "marking_status": "experiment"},
+                    {"id": "pilot_компоненты_транспортных_средств_7007_11_100_1", "name": "Стекло закаленное безопасное", "tnved": "7007 11 100 1", "marking_status": "experiment"},
+                    {"id": "pilot_компоненты_транспортных_средств_7007_11_100_9", "name": "Стекло закаленное безопасное", "tnved": "7007 11 100 9", "marking_status": "experiment"},
+                    {"id": "pilot_компоненты_транспортных_средств_7007_11_900_0", "name": "Стекло закаленное безопасное", "tnved": "7007 11 900 0", "marking_status": "experiment"},
+                    {"id": "pilot_компоненты_транспортных_средств_7007_21_200_1", "name": "Стекло многослойное безопасное", "tnved": "7007 21 200 1", "marking_status": "experiment"},
+                    {"id": "pilot_компоненты_транспортных_средств_7007_21_200_9", "name": "Стекло многослойное безопасное", "tnved": "7007 21 200 9", "marking_status": "experiment"},
+                    {"id": "pilot_компоненты_транспортных_средств_7007_21_800_9", "name": "Стекло многослойное безопасное", "tnved": "7007 21 800 9", "marking_status": "experiment"},
+                    {"id": "pilot_компоненты_транспортных_средств_7007_29_000_0", "name": "Стекло многослойное безопасное", "tnved": "7007 29 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_компоненты_транспортных_средств_8511_10_000_1", "name": "Свечи зажигания", "tnved": "8511 10 000 1", "marking_status": "experiment"},
+                    {"id": "pilot_компоненты_транспортных_средств_8511_10_000_9", "name": "Свечи зажигания", "tnved": "8511 10 000 9", "marking_status": "experiment"},
+                    {"id": "pilot_компоненты_транспортных_средств_8708_22_000_1", "name": "Лобовые стекла", "tnved": "8708 22 000 1", "marking_status": "experiment"},
+                    {"id": "pilot_компоненты_транспортных_средств_8708_22_000_9", "name": "Лобовые стекла", "tnved": "8708 22 000 9", "marking_status": "experiment"},
+                    {"id": "pilot_компоненты_транспортных_средств_8708_30_910_1", "name": "Тормозные диски, колодки", "tnved": "8708 30 910 1", "marking_status": "experiment"},
+                    {"id": "pilot_компоненты_транспортных_средств_8708_30_910_9", "name": "Тормозные диски, колодки", "tnved": "8708 30 910 9", "marking_status": "experiment"},
+                    {"id": "pilot_компоненты_транспортных_средств_8708_30_990_9", "name": "Тормозные диски, колодки", "tnved": "8708 30 990 9", "marking_status": "experiment"},
+                    {"id": "pilot_компоненты_транспортных_средств_8714_10_100_0", "name": "Тормозные диски, колодки мото", "tnved": "8714 10 100 0", "marking_status": "experiment"},
+                    {"id": "pilot_компоненты_транспортных_средств_8708_70_500_1", "name": "Колеса ходовые, диски", "tnved": "8708 70 500 1", "marking_status": "experiment"},
+                    {"id": "pilot_компоненты_транспортных_средств_8708_70_500_9", "name": "Колеса ходовые, диски", "tnved": "8708 70 500 9", "marking_status": "experiment"},
+                    {"id": "pilot_компоненты_транспортных_средств_8708_70_990_1", "name": "Колеса ходовые, диски", "tnved": "8708 70 990 1", "marking_status": "experiment"},
+                    {"id": "pilot_компоненты_транспортных_средств_8708_70_990_9", "name": "Колеса ходовые, диски", "tnved": "8708 70 990 9", "marking_status": "experiment"},
+                    {"id": "pilot_компоненты_транспортных_средств_8714_10_300_0", "name": "Колеса ходовые мото", "tnved": "8714 10 300 0", "marking_status": "experiment"}
+                ]
+            },
+            {
+                "id": "pilot_товары_для_дома_и_интерьера",
+                "name": "Товары для дома и интерьера",
+                "products": [
+                    {"id": "pilot_товары_для_дома_и_интерьера_3924_10_000_0", "name": "Посуда пластиковая столовая", "tnved": "3924 10 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_3924_90_000_9", "name": "Посуда пластиковая прочая", "tnved": "3924 90 000 9", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_4419", "name": "Посуда деревянная", "tnved": "4419", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_4806_10_000_0", "name": "Бумага пергаментная", "tnved": "4806 10 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_4806_20_000_0", "name": "Бумага жиронепроницаемая", "tnved": "4806 20 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_4806_40_100_0", "name": "Бумага пергаментная прочая", "tnved": "4806 40 100 0", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_4818_30_000_0", "name": "Скатерти бумажные", "tnved": "4818 30 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_4823_61_000_0", "name": "Подносы бумажные", "tnved": "4823 61 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_4823_69", "name": "Посуда бумажная прочая", "tnved": "4823 69", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_6911", "name": "Посуда фарфоровая", "tnved": "6911", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_6912_00", "name": "Посуда керамическая", "tnved": "6912 00", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_7013", "name": "Посуда стеклянная", "tnved": "7013", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_7323_91_000_0", "name": "Посуда чугунная эмалированная", "tnved": "7323 91 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_7323_92_000_0", "name": "Посуда чугунная прочая", "tnved": "7323 92 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_7323_93_000_0", "name": "Посуда из нержавеющей стали", "tnved": "7323 93 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_7323_94_000_0", "name": "Посуда стальная эмалированная", "tnved": "7323 94 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_7323_99_000_0", "name": "Посуда стальная прочая", "tnved": "7323 99 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_7326_20_000_2", "name": "Изделия из проволоки", "tnved": "7326 20 000 2", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_7418_10_100_0", "name": "Посуда медная", "tnved": "7418 10 100 0", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_7615_10_100_0", "name": "Посуда алюминиевая", "tnved": "7615 10 100 0", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_7615_10_300_0", "name": "Посуда алюминиевая", "tnved": "7615 10 300 0", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_7615_10_800_9", "name": "Посуда алюминиевая прочая", "tnved": "7615 10 800 9", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_8205_51_009_0", "name": "Инструменты кухонные", "tnved": "8205 51 009 0", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_8211_10_000_0", "name": "Наборы ножей", "tnved": "8211 10 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_8211_91_000", "name": "Ножи столовые", "tnved": "8211 91 000", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_8211_92_000_0", "name": "Ножи кухонные", "tnved": "8211 92 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_8213_00_000_0", "name": "Ножницы", "tnved": "8213 00 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_8215", "name": "Столовые приборы", "tnved": "8215", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_9616_10", "name": "Пульверизаторы", "tnved": "9616 10", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_9617_00_000", "name": "Термосы", "tnved": "9617 00 000", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_6307_10", "name": "Тряпки для уборки", "tnved": "6307 10", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_9603_10_000_0", "name": "Метлы", "tnved": "9603 10 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_9603_90", "name": "Щетки и швабры", "tnved": "9603 90", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_9604_00_000_0", "name": "Сита", "tnved": "9604 00 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_3406_00_000_0", "name": "Свечи", "tnved": "3406 00 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_3926_40_000_0", "name": "Статуэтки пластиковые", "tnved": "3926 40 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_4414", "name": "Рамки деревянные", "tnved": "4414", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_4420_11_000_0", "name": "Статуэтки деревянные", "tnved": "4420 11 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_4420_19_000_0", "name": "Статуэтки деревянные прочие", "tnved": "4420 19 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_4421_10_000_0", "name": "Вешалки деревянные", "tnved": "4421 10 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_4602", "name": "Изделия плетеные", "tnved": "4602", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_6702", "name": "Искусственные цветы", "tnved": "6702", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_6810_99_000_0", "name": "Изделия из цемента", "tnved": "6810 99 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_6913", "name": "Статуэтки керамические", "tnved": "6913", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_7009_91_000_0", "name": "Зеркала без рамы", "tnved": "7009 91 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_7009_92_000_0", "name": "Зеркала в раме", "tnved": "7009 92 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_8306_21_000_0", "name": "Статуэтки металлические", "tnved": "8306 21 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_8306_29_000", "name": "Статуэтки металлические прочие", "tnved": "8306 29 000", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_8306_30_000_0", "name": "Рамки для фото металлические", "tnved": "8306 30 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_9105_19_000_0", "name": "Часы настенные", "tnved": "9105 19 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_9105_29_000_0", "name": "Часы настенные прочие", "tnved": "9105 29 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_9105_96_000_0", "name": "Часы настенные прочие", "tnved": "9105 96 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_товары_для_дома_и_интерьера_9405_50_000_0", "name": "Подсвечники", "tnved": "9405 50 000 0", "marking_status": "experiment"}
+                ]
+            },
+            {
+                "id": "pilot_бакалейная_продукция",
+                "name": "Бакалейная продукция",
+                "products": [
+                    {"id": "pilot_бакалейная_продукция_0713_10_900_9", "name": "Горох прочий", "tnved": "0713 10 900 9", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_0713_20_000_0", "name": "Нут сушеный", "tnved": "0713 20 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_0713_31_000_0", "name": "Фасоль VINGA MUNGO", "tnved": "0713 31 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_0713_32_000_0", "name": "Фасоль мелкая красная (адзуки)", "tnved": "0713 32 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_0713_33_900_0", "name": "Фасоль обыкновенная", "tnved": "0713 33 900 0", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_0713_34_000_9", "name": "Земляной орех бамбарский", "tnved": "0713 34 000 9", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_0713_35_000_9", "name": "Коровий горох", "tnved": "0713 35 000 9", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_0713_39_000_9", "name": "Фасоль прочая", "tnved": "0713 39 000 9", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_0713_40_000_0", "name": "Чечевица", "tnved": "0713 40 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_0713_60_000_9", "name": "Голубиный горох", "tnved": "0713 60 000 9", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_0713_90_000_9", "name": "Прочие бобовые", "tnved": "0713 90 000 9", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_1006", "name": "Рис (кроме 1006 10)", "tnved": "1006", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_1007_90_000_0", "name": "Сорго зерновое", "tnved": "1007 90 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_1008_10_000_0", "name": "Гречиха", "tnved": "1008 10 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_1008_29_000_0", "name": "Просо и прочие злаки", "tnved": "1008 29 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_1008_50_000_0", "name": "Киноа", "tnved": "1008 50 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_1008_90_000_0", "name": "Прочие злаки", "tnved": "1008 90 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_1101_00", "name": "Мука пшеничная", "tnved": "1101 00", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_1102", "name": "Мука из зерна злаков", "tnved": "1102", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_1103", "name": "Крупа из зерна злаков", "tnved": "1103", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_1104", "name": "Зерно злаков обработанное", "tnved": "1104", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_1105", "name": "Мука картофельная, хлопья", "tnved": "1105", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_1106", "name": "Мука из бобовых", "tnved": "1106", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_1208", "name": "Мука из масличных культур", "tnved": "1208", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_1212", "name": "Продукты растительного происхождения", "tnved": "1212", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_1901_10_000_0", "name": "Готовые продукты для детей", "tnved": "1901 10 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_1901_20_000_0", "name": "Смеси для теста", "tnved": "1901 20 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_1902", "name": "Макаронные изделия", "tnved": "1902", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_1904_10", "name": "Готовые продукты из злаков вздутые", "tnved": "1904 10", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_1904_20", "name": "Мюсли, хлопья", "tnved": "1904 20", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_1904_30_000_0", "name": "Булгур", "tnved": "1904 30 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_1904_90", "name": "Злаки готовые прочие", "tnved": "1904 90", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_1905_90", "name": "Смеси для хлебобулочных изделий", "tnved": "1905 90", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_2004_90_500_0", "name": "Горох и фасоль в стручках", "tnved": "2004 90 500 0", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_2005_20_100_0", "name": "Картофель быстрого приготовления", "tnved": "2005 20 100 0", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_2005_40_000_0", "name": "Горох консервированный", "tnved": "2005 40 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_2005_51_000_0", "name": "Фасоль лущеная консервированная", "tnved": "2005 51 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_2005_59_000_0", "name": "Фасоль прочая консервированная", "tnved": "2005 59 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_0409_00_000_0", "name": "Мёд натуральный", "tnved": "0409 00 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_1212_99_950_9", "name": "Продукты растительные пищевые", "tnved": "1212 99 950 9", "marking_status": "experiment"},
+                    {"id": "pilot_бакалейная_продукция_1702", "name": "Искусственный мёд, сахара прочие", "tnved": "1702", "marking_status": "experiment"}
+                ]
+            },
+            {
+                "id": "pilot_полуфабрикаты_и_замороженная_продукция",
+                "name": "Полуфабрикаты и замороженная продукция",
+                "products": [
+                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_0201", "name": "Мясо крупного рогатого скота, свежее или охлажденное", "tnved": "0201", "marking_status": "experiment"},
+                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_0202", "name": "Мясо крупного рогатого скота, замороженное", "tnved": "0202", "marking_status": "experiment"},
+                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_0203", "name": "Свинина свежая, охлажденная или замороженная", "tnved": "0203", "marking_status": "experiment"},
+                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_0204", "name": "Баранина или козлятина", "tnved": "0204", "marking_status": "experiment"},
+                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_0205_00", "name": "Мясо лошадей, ослов, мулов", "tnved": "0205 00", "marking_status": "experiment"},
+                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_0206", "name": "Пищевые субпродукты", "tnved": "0206", "marking_status": "experiment"},
+                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_0207", "name": "Мясо и субпродукты домашней птицы", "tnved": "0207", "marking_status": "experiment"},
+                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_0208", "name": "Прочее мясо и субпродукты", "tnved": "0208", "marking_status": "experiment"},
+                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_0209", "name": "Свиной жир и жир птицы", "tnved": "0209", "marking_status": "experiment"},
+                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_0304", "name": "Филе рыбное и прочее мясо рыбы", "tnved": "0304", "marking_status": "experiment"},
+                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_0306", "name": "Ракообразные", "tnved": "0306", "marking_status": "experiment"},
+                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_0307", "name": "Моллюски", "tnved": "0307", "marking_status": "experiment"},
+                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_0710", "name": "Овощи замороженные", "tnved": "0710", "marking_status": "experiment"},
+                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_0811", "name": "Фрукты и орехи замороженные", "tnved": "0811", "marking_status": "experiment"},
+                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_1501_10_900_0", "name": "Жир свиной топленый", "tnved": "1501 10 900 0", "marking_status": "experiment"},
+                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_1501_20_900_0", "name": "Жир свиной прочий", "tnved": "1501 20 900 0", "marking_status": "experiment"},
+                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_1501_90_000_0", "name": "Жир домашней птицы", "tnved": "1501 90 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_1601_00", "name": "Колбасы и аналогичные продукты из мяса", "tnved": "1601 00", "marking_status": "experiment"},
+                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_1602", "name": "Готовые или консервированные продукты из мяса", "tnved": "1602", "marking_status": "experiment"},
+                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_1604", "name": "Готовая или консервированная рыба", "tnved": "1604", "marking_status": "experiment"},
+                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_1901_20_000_0", "name": "Смеси для приготовления", "tnved": "1901 20 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_1902", "name": "Макаронные изделия замороженные", "tnved": "1902", "marking_status": "experiment"},
+                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_1904_90_100_0", "name": "Злаки готовые", "tnved": "1904 90 100 0", "marking_status": "experiment"},
+                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_1905_90", "name": "Хлебобулочные изделия замороженные", "tnved": "1905 90", "marking_status": "experiment"},
+                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_2003", "name": "Грибы готовые или консервированные", "tnved": "2003", "marking_status": "experiment"},
+                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_2004", "name": "Овощи готовые замороженные", "tnved": "2004", "marking_status": "experiment"},
+                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_2005", "name": "Овощи готовые незамороженные", "tnved": "2005", "marking_status": "experiment"},
+                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_2104", "name": "Супы, бульоны готовые", "tnved": "2104", "marking_status": "experiment"},
+                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_2106", "name": "Пищевые продукты прочие (кроме исключений)", "tnved": "2106", "marking_status": "experiment"}
+                ]
+            },
+            {
+                "id": "pilot_радиоэлектроника_i_этап",
+                "name": "Радиоэлектроника (I этап) (завершен)",
+                "products": [
+                    {"id": "pilot_радиоэлектроника_i_этап_8504_40_830_0", "name": "Выпрямители прочие", "tnved": "8504 40 830 0", "marking_status": "not_required"},
+                    {"id": "pilot_радиоэлектроника_i_этап_8504_40_910_0", "name": "Преобразователи статические прочие", "tnved": "8504 40 910 0", "marking_status": "not_required"},
+                    {"id": "pilot_радиоэлектроника_i_этап_8536_49_000_0", "name": "Реле на напряжение не более 1000 В", "tnved": "8536 49 000 0", "marking_status": "not_required"},
+                    {"id": "pilot_радиоэлектроника_i_этап_8536_69_900_8", "name": "Штепсели и розетки", "tnved": "8536 69 900 8", "marking_status": "not_required"},
+                    {"id": "pilot_радиоэлектроника_i_этап_8536_90_100_0", "name": "Соединители для проводов и кабелей", "tnved": "8536 90 100 0", "marking_status": "not_required"},
+                    {"id": "pilot_радиоэлектроника_i_этап_8536_90_850_0", "name": "Аппаратура электрическая прочая", "tnved": "8536 90 850 0", "marking_status": "not_required"},
+                    {"id": "pilot_радиоэлектроника_i_этап_8537_10_980_0", "name": "Пульты, панели, распределительные щиты", "tnved": "8537 10 980 0", "marking_status": "not_required"},
+                    {"id": "pilot_радиоэлектроника_i_этап_8539", "name": "Лампы накаливания и газоразрядные", "tnved": "8539", "marking_status": "not_required"},
+                    {"id": "pilot_радиоэлектроника_i_этап_8541_41_000", "name": "Светодиоды (LED)", "tnved": "8541 41 000", "marking_status": "not_required"},
+                    {"id": "pilot_радиоэлектроника_i_этап_8541_42_000_0", "name": "Фотогальванические элементы", "tnved": "8541 42 000 0", "marking_status": "not_required"},
+                    {"id": "pilot_радиоэлектроника_i_этап_8541_43_000_0", "name": "Фоточувствительные приборы", "tnved": "8541 43 000 0", "marking_status": "not_required"},
+                    {"id": "pilot_радиоэлектроника_i_этап_8541_49_000_0", "name": "Приборы полупроводниковые прочие", "tnved": "8541 49 000 0", "marking_status": "not_required"},
+                    {"id": "pilot_радиоэлектроника_i_этап_8512_20_000", "name": "Приборы освещения для транспорта", "tnved": "8512 20 000", "marking_status": "not_required"},
+                    {"id": "pilot_радиоэлектроника_i_этап_8513_10_000_0", "name": "Фонари портативные", "tnved": "8513 10 000 0", "marking_status": "not_required"},
+                    {"id": "pilot_радиоэлектроника_i_этап_9405_11_00", "name": "Люстры и светильники потолочные", "tnved": "9405 11 00", "marking_status": "not_required"},
+                    {"id": "pilot_радиоэлектроника_i_этап_9405_19_00", "name": "Светильники прочие", "tnved": "9405 19 00", "marking_status": "not_required"},
+                    {"id": "pilot_радиоэлектроника_i_этап_9405_21_00", "name": "Лампы настольные LED", "tnved": "9405 21 00", "marking_status": "not_required"},
+                    {"id": "pilot_радиоэлектроника_i_этап_9405_29_00", "name": "Лампы настольные прочие", "tnved": "9405 29 00", "marking_status": "not_required"},
+                    {"id": "pilot_радиоэлектроника_i_этап_9405_31_000_0", "name": "Гирлянды световые LED", "tnved": "9405 31 000 0", "marking_status": "not_required"},
+                    {"id": "pilot_радиоэлектроника_i_этап_9405_39_000_0", "name": "Гирлянды световые прочие", "tnved": "9405 39 000 0", "marking_status": "not_required"},
+                    {"id": "pilot_радиоэлектроника_i_этап_9405_41_00", "name": "Фотогальванические светильники", "tnved": "9405 41 00", "marking_status": "not_required"},
+                    {"id": "pilot_радиоэлектроника_i_этап_9405_42_00", "name": "Светильники LED прочие", "tnved": "9405 42 00", "marking_status": "not_required"},
+                    {"id": "pilot_радиоэлектроника_i_этап_9405_49_00", "name": "Светильники прочие", "tnved": "9405 49 00", "marking_status": "not_required"},
+                    {"id": "pilot_радиоэлектроника_i_этап_9405_92_000_8", "name": "Части светильников пластиковые", "tnved": "9405 92 000 8", "marking_status": "not_required"},
+                    {"id": "pilot_радиоэлектроника_i_этап_9405_99_000_8", "name": "Части светильников прочие", "tnved": "9405 99 000 8", "marking_status": "not_required"}
+                ]
+            },
+            {
+                "id": "pilot_радиоэлектроника_ii_этап",
+                "name": "Радиоэлектроника (II этап) (завершен)",
+                "products": [
+                    {"id": "pilot_радиоэлектроника_ii_этап_8471_30_000_0", "name": "Ноутбуки портативные до 10 кг", "tnved": "8471 30 000 0", "marking_status": "not_required"},
+                    {"id": "pilot_радиоэлектроника_ii_этап_8517_11_000_0", "name": "Телефоны проводные с беспроводной трубкой", "tnved": "8517 11 000 0", "marking_status": "not_required"},
+                    {"id": "pilot_радиоэлектроника_ii_этап_8517_13_000_0", "name": "Смартфоны", "tnved": "8517 13 000 0", "marking_status": "not_required"},
+                    {"id": "pilot_радиоэлектроника_ii_этап_8517_14_000_0", "name": "Телефоны для сотовых сетей прочие", "tnved": "8517 14 000 0", "marking_status": "not_required"},
+                    {"id": "pilot_радиоэлектроника_ii_этап_8517_18_000_0", "name": "Телефонные аппараты прочие", "tnved": "8517 18 000 0", "marking_status": "not_required"}
+                ]
+            },
+            {
+                "id": "pilot_радиоэлектроника_iii_этап",
+                "name": "Радиоэлектроника (III этап) (завершен)",
+                "products": [
+                    {"id": "pilot_радиоэлектроника_iii_этап_8534_00_110_0", "name": "Печатные схемы многослойные", "tnved": "8534 00 110 0", "marking_status": "not_required"},
+                    {"id": "pilot_радиоэлектроника_iii_этап_8534_00_190_0", "name": "Печатные схемы прочие", "tnved": "8534 00 190 0", "marking_status": "not_required"},
+                    {"id": "pilot_радиоэлектроника_iii_этап_8534_00_900_0", "name": "Печатные схемы с пассивными элементами", "tnved": "8534 00 900 0", "marking_status": "not_required"}
+                ]
+            },
+            {
+                "id": "pilot_радиоэлектроника_iv_этап",
+                "name": "Радиоэлектроника (IV этап)",
+                "products": [
+                    {"id": "pilot_радиоэлектроника_iv_этап_8543_40_000_0", "name": "Электронные сигареты многоразовые", "tnved": "8543 40 000 0", "marking_status": "experiment"}
+                ]
+            },
+            {
+                "id": "pilot_печатная_продукция",
+                "name": "Печатная продукция (завершен)",
+                "products": [
+                    {"id": "pilot_печатная_продукция_4901_99_000_0", "name": "Учебники печатные общеобразовательные", "tnved": "4901 99 000 0", "marking_status": "not_required"}
+                ]
+            },
+            {
+                "id": "pilot_кабельная_продукция",
+                "name": "Кабельная продукция",
+                "products": [
+                    {"id": "pilot_кабельная_продукция_8544_49_990_0", "name": "Кабели и провода на напряжение 1000 В", "tnved": "8544 49 990 0", "marking_status": "experiment"},
+                    {"id": "pilot_кабельная_продукция_8544_49_910_8", "name": "Кабели с изолированными проводниками >0,51 мм", "tnved": "8544 49 910 8", "marking_status": "experiment"}
+                ]
+            },
+            {
+                "id": "pilot_медицинские_изделия_2.0",
+                "name": "Медицинские изделия 2.0",
+                "products": [
+                    {"id": "pilot_медицинские_изделия_2.0_4014_10_000_0", "name": "Презервативы", "tnved": "4014 10 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_медицинские_изделия_2.0_9018_31", "name": "Шприцы", "tnved": "9018 31", "marking_status": "experiment"},
+                    {"id": "pilot_медицинские_изделия_2.0_9018_90_500", "name": "Инфузионные системы", "tnved": "9018 90 500", "marking_status": "experiment"},
+                    {"id": "pilot_медицинские_изделия_2.0_3005_10_000_0", "name": "Салфетки медицинские", "tnved": "3005 10 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_медицинские_изделия_2.0_3005_90_310_0", "name": "Салфетки медицинские", "tnved": "3005 90 310 0", "marking_status": "experiment"},
+                    {"id": "pilot_медицинские_изделия_2.0_3005_90_500_0", "name": "Салфетки медицинские", "tnved": "3005 90 500 0", "marking_status": "experiment"},
+                    {"id": "pilot_медицинские_изделия_2.0_3005_90_990_0", "name": "Салфетки медицинские прочие", "tnved": "3005 90 990 0", "marking_status": "experiment"},
+                    {"id": "pilot_медицинские_изделия_2.0_4803_00_900_0", "name": "Салфетки бумажные медицинские", "tnved": "4803 00 900 0", "marking_status": "experiment"},
+                    {"id": "pilot_медицинские_изделия_2.0_4818_20", "name": "Салфетки носовые медицинские", "tnved": "4818 20", "marking_status": "experiment"},
+                    {"id": "pilot_медицинские_изделия_2.0_4818_30_000_0", "name": "Скатерти медицинские", "tnved": "4818 30 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_медицинские_изделия_2.0_4818_90", "name": "Изделия бумажные медицинские", "tnved": "4818 90", "marking_status": "experiment"},
+                    {"id": "pilot_медицинские_изделия_2.0_5603", "name": "Нетканые материалы медицинские", "tnved": "5603", "marking_status": "experiment"},
+                    {"id": "pilot_медицинские_изделия_2.0_6307_90_920_0", "name": "Изделия текстильные медицинские", "tnved": "6307 90 920 0", "marking_status": "experiment"},
+                    {"id": "pilot_медицинские_изделия_2.0_6307_90_980_0", "name": "Изделия текстильные медицинские прочие", "tnved": "6307 90 980 0", "marking_status": "experiment"},
+                    {"id": "pilot_медицинские_изделия_2.0_3307_90_000_8", "name": "Салфетки косметические медицинские", "tnved": "3307 90 000 8", "marking_status": "experiment"},
+                    {"id": "pilot_медицинские_изделия_2.0_3926_90_970_9", "name": "Пробирки пластиковые", "tnved": "3926 90 970 9", "marking_status": "experiment"},
+                    {"id": "pilot_медицинские_изделия_2.0_7010_10_000_0", "name": "Пробирки стеклянные (ампулы)", "tnved": "7010 10 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_медицинские_изделия_2.0_7017", "name": "Пробирки лабораторные стеклянные", "tnved": "7017", "marking_status": "experiment"},
+                    {"id": "pilot_медицинские_изделия_2.0_9019_10", "name": "Аппаратура для озоновой/кислородной терапии", "tnved": "9019 10", "marking_status": "experiment"},
+                    {"id": "pilot_медицинские_изделия_2.0_9019_20_000_0", "name": "Аппаратура терапевтическая дыхательная", "tnved": "9019 20 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_медицинские_изделия_2.0_9018_90_840_9", "name": "Инкубаторы для новорожденных", "tnved": "9018 90 840 9", "marking_status": "experiment"},
+                    {"id": "pilot_медицинские_изделия_2.0_3006_10_900_0", "name": "Филлеры для пластической хирургии", "tnved": "3006 10 900 0", "marking_status": "experiment"},
+                    {"id": "pilot_медицинские_изделия_2.0_9021_90_900_9", "name": "Имплантаты косметические (нити)", "tnved": "9021 90 900 9", "marking_status": "experiment"},
+                    {"id": "pilot_медицинские_изделия_2.0_3926_20_000_0", "name": "Маски медицинские пластиковые", "tnved": "3926 20 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_медицинские_изделия_2.0_4818_90_100_0", "name": "Маски медицинские бумажные", "tnved": "4818 90 100 0", "marking_status": "experiment"},
+                    {"id": "pilot_медицинские_изделия_2.0_9020_00_000_0", "name": "Маски медицинские дыхательные", "tnved": "9020 00 000 0", "marking_status": "experiment"}
+                ]
+            },
+            {
+                "id": "pilot_полимерные_трубы",
+                "name": "Полимерные трубы",
+                "products": [
+                    {"id": "pilot_полимерные_трубы_3917_21_100_0", "name": "Трубы бесшовные из полимеров этилена", "tnved": "3917 21 100 0", "marking_status": "experiment"},
+                    {"id": "pilot_полимерные_трубы_3917_22", "name": "Трубы из полимеров пропилена (кроме 3917 22 900 1)", "tnved": "3917 22", "marking_status": "experiment"},
+                    {"id": "pilot_полимерные_трубы_3917_23", "name": "Трубы из полимеров винилхлорида", "tnved": "3917 23", "marking_status": "experiment"},
+                    {"id": "pilot_полимерные_трубы_3917_29_000_9", "name": "Трубы из прочих пластмасс", "tnved": "3917 29 000 9", "marking_status": "experiment"},
+                    {"id": "pilot_полимерные_трубы_3917_31_000_8", "name": "Трубы гибкие, давление ≥27,6 МПа", "tnved": "3917 31 000 8", "marking_status": "experiment"},
+                    {"id": "pilot_полимерные_трубы_3917_32_000", "name": "Трубы не армированные без фитингов", "tnved": "3917 32 000", "marking_status": "experiment"},
+                    {"id": "pilot_полимерные_трубы_3917_33_000_9", "name": "Трубы не армированные с фитингами", "tnved": "3917 33 000 9", "marking_status": "experiment"},
+                    {"id": "pilot_полимерные_трубы_3917_40_000_9", "name": "Фитинги из пластмасс", "tnved": "3917 40 000 9", "marking_status": "experiment"},
+                    {"id": "pilot_полимерные_трубы_3901_20_900_9", "name": "Композиции полиэтилена для труб", "tnved": "3901 20 900 9", "marking_status": "experiment"},
+                    {"id": "pilot_полимерные_трубы_3902_10_000_0", "name": "Композиции полипропилена для труб", "tnved": "3902 10 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_полимерные_трубы_3904_10_000_9", "name": "Композиции поливинилхлорида для труб", "tnved": "3904 10 000 9", "marking_status": "experiment"}
+                ]
+            },
+            {
+                "id": "pilot_средства_гигиены",
+                "name": "Средства гигиены",
+                "products": [
+                    {"id": "pilot_средства_гигиены_9603_21_000_0", "name": "Щетки зубные", "tnved": "9603 21 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_средства_гигиены_9603_29_300_0", "name": "Щетки для волос", "tnved": "9603 29 300 0", "marking_status": "experiment"},
+                    {"id": "pilot_средства_гигиены_9603_29_800_0", "name": "Помазки, щеточки для ногтей/ресниц", "tnved": "9603 29 800 0", "marking_status": "experiment"},
+                    {"id": "pilot_средства_гигиены_5601_21_100_0", "name": "Вата из хлопковых волокон", "tnved": "5601 21 100 0", "marking_status": "experiment"},
+                    {"id": "pilot_средства_гигиены_5601_21_900_0", "name": "Вата из хлопковых волокон прочая", "tnved": "5601 21 900 0", "marking_status": "experiment"},
+                    {"id": "pilot_средства_гигиены_8214_20_000_0", "name": "Наборы маникюрные/педикюрные", "tnved": "8214 20 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_средства_гигиены_4818_10_100_0", "name": "Бумага туалетная", "tnved": "4818 10 100 0", "marking_status": "experiment"},
+                    {"id": "pilot_средства_гигиены_4818_10_900_0", "name": "Бумага туалетная прочая", "tnved": "4818 10 900 0", "marking_status": "experiment"},
+                    {"id": "pilot_средства_гигиены_4818_20_100_0", "name": "Платки носовые, косметические салфетки", "tnved": "4818 20 100 0", "marking_status": "experiment"},
+                    {"id": "pilot_средства_гигиены_4818_20_910_0", "name": "Полотенца для рук", "tnved": "4818 20 910 0", "marking_status": "experiment"},
+                    {"id": "pilot_средства_гигиены_4818_20_990_0", "name": "Полотенца для рук прочие", "tnved": "4818 20 990 0", "marking_status": "experiment"},
+                    {"id": "pilot_средства_гигиены_9615_11_000_0", "name": "Расчески из резины/пластмасс", "tnved": "9615 11 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_средства_гигиены_9615_19_000_0", "name": "Расчески прочие", "tnved": "9615 19 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_средства_гигиены_9619_00", "name": "Прокладки, тампоны, подгузники", "tnved": "9619 00", "marking_status": "experiment"},
+                    {"id": "pilot_средства_гигиены_9019_10_900_9", "name": "Аппараты массажные", "tnved": "9019 10 900 9", "marking_status": "experiment"},
+                    {"id": "pilot_средства_гигиены_2513_10_000_0", "name": "Пемза", "tnved": "2513 10 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_средства_гигиены_8203_20_000_1", "name": "Пинцеты", "tnved": "8203 20 000 1", "marking_status": "experiment"},
+                    {"id": "pilot_средства_гигиены_3306_20_000_0", "name": "Нити зубные (зубной шелк)", "tnved": "3306 20 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_средства_гигиены_3924_90_000_1", "name": "Губки и мочалки пластиковые", "tnved": "3924 90 000 1", "marking_status": "experiment"},
+                    {"id": "pilot_средства_гигиены_7323_10_000_0", "name": "Губки и мочалки металлические", "tnved": "7323 10 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_средства_гигиены_7418_10_900_0", "name": "Губки медные", "tnved": "7418 10 900 0", "marking_status": "experiment"},
+                    {"id": "pilot_средства_гигиены_7615_10_800_1", "name": "Губки алюминиевые", "tnved": "7615 10 800 1", "marking_status": "experiment"}
+                ]
+            },
+            {
+                "id": "pilot_удобрения",
+                "name": "Удобрения",
+                "products": [
+                    {"id": "pilot_удобрения_3105", "name": "Удобрения минеральные (N, P, K)", "tnved": "3105", "marking_status": "experiment"},
+                    {"id": "pilot_удобрения_2834_21_000_0", "name": "Нитраты калия", "tnved": "2834 21 000 0", "marking_status": "experiment"},
+                    {"id": "pilot_удобрения_2834_29_800_0", "name": "Нитраты прочие", "tnved": "2834 29 800 0", "marking_status": "experiment"},
+                    {"id": "pilot_удобрения_2835_24_000_0", "name": "Фосфаты калия", "tnved": "2835 24 000 0", "marking_status": "experiment"}
+                ]
+            },
+            {
+                "id": "pilot_мясные_изделия",
+                "name": "Мясные изделия",
+                "products": [
+                    {"id": "pilot_мясные_изделия_1601_00", "name": "Колбасы и аналогичные продукты", "tnved": "1601 00", "marking_status": "experiment"},
+                    {"id": "pilot_мясные_изделия_1602", "name": "Готовые/консервированные продукты из мяса", "tnved": "1602", "marking_status": "experiment"},
+                    {"id": "pilot_мясные_изделия_0209_00", "name": "Свиной жир и жир птицы", "tnved": "0209 00", "marking_status": "experiment"},
+                    {"id": "pilot_мясные_изделия_0210_11", "name": "Свиные окорока, лопатки необваленные", "tnved": "0210 11", "marking_status": "experiment"},
+                    {"id": "pilot_мясные_изделия_0210_12", "name": "Свиные грудинки", "tnved": "0210 12", "marking_status": "experiment"},
+                    {"id": "pilot_мясные_изделия_0210_19", "name": "Прочие части туш свиней", "tnved": "0210 19", "marking_status": "experiment"},
+                    {"id": "pilot_мясные_изделия_0210_20", "name": "Мясо КРС соленое/сушеное/копченое", "tnved": "0210 20", "marking_status": "experiment"},
+                    {"id": "pilot_мясные_изделия_0210_99_100_0", "name": "Мясо лошадей соленое/сушеное", "tnved": "0210 99 100 0", "marking_status": "experiment"},
+                    {"id": "pilot_мясные_изделия_0210_99_210_0", "name": "Баранина/козлятина необваленная", "tnved": "0210 99 210 0", "marking_status": "experiment"},
+                    {"id": "pilot_мясные_изделия_0210_99_290_0", "name": "Баранина/козлятина обваленная", "tnved": "0210 99 290 0", "marking_status": "experiment"},
+                    {"id": "pilot_мясные_изделия_0210_99_310_0", "name": "Мясо северных оленей", "tnved": "0210 99 310 0", "marking_status": "experiment"},
+                    {"id": "pilot_мясные_изделия_0210_99_390_0", "name": "Прочее мясо", "tnved": "0210 99 390 0", "marking_status": "experiment"},
+                    {"id": "pilot_мясные_изделия_0210_99_410_0", "name": "Печень", "tnved": "0210 99 410 0", "marking_status": "experiment"},
+                    {"id": "pilot_мясные_изделия_0210_99_490_0", "name": "Субпродукты свиные прочие", "tnved": "0210 99 490 0", "marking_status": "experiment"},
+                    {"id": "pilot_мясные_изделия_0210_99_510_0", "name": "Диафрагма КРС", "tnved": "0210 99 510 0", "marking_status": "experiment"},
+                    {"id": "pilot_мясные_изделия_0210_99_590_0", "name": "Субпродукты КРС прочие", "tnved": "0210 99 590 0", "marking_status": "experiment"},
+                    {"id": "pilot_мясные_изделия_0210_99_710_0", "name": "Жирная печень гусей/уток соленая", "tnved": "0210 99 710 0", "marking_status": "experiment"},
+                    {"id": "pilot_мясные_изделия_0210_99_790_0", "name": "Жирная печень гусей/уток прочая", "tnved": "0210 99 790 0", "marking_status": "experiment"},
+                    {"id": "pilot_мясные_изделия_0210_99_850_0", "name": "Жирная печень прочая", "tnved": "0210 99 850 0", "marking_status": "experiment"},
+                    {"id": "pilot_мясные_изделия_1501_10_900_0", "name": "Лярд прочий", "tnved": "1501 10 900 0", "marking_status": "experiment"},
+                    {"id": "pilot_мясные_изделия_1501_20_900_0", "name": "Жир свиной прочий", "tnved": "1501 20 900 0", "marking_status": "experiment"},
+                    {"id": "pilot_мясные_изделия_1501_90_000_0", "name": "Жир свиной и жир птицы прочий", "tnved": "1501 90 000 0", "marking_status": "experiment"}
+                ]
+            }
+        ]
+    }
+]
@@ -4,16 +4,24 @@
 Хранение пользователей, компаний, КП, договоров
 """
 
-import sqlite3
 import logging
 logger = logging.getLogger(__name__)
 import os
+import re
 from datetime import datetime, date
 from typing import Optional, List, Dict, Any
 from contextlib import contextmanager
 import hashlib
 import secrets
 
+from db_pool import get_pool
+from db_async import async_db
+from migrations import run_migrations
+from pagination import InvalidCursor, fetch_page, page_limit
+from normalize import normalize_email, normalize_inn, normalize_phone
+import partner_ledger
+from stats_cache import invalidates_stats
+
 # Путь к базе данных
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = os.path.join(BASE_DIR, "data")
@@ -25,435 +33,21 @@ os.makedirs(DATA_DIR, exist_ok=True)
 
 @contextmanager
 def get_db():
-    """Контекстный менеджер для работы с БД"""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row  # Возвращать dict-like объекты
-    try:
+    """Контекстный менеджер для работы с БД (соединение из общего пула, строки - sqlite3.Row)"""
+    with get_pool(DB_PATH).connection() as conn:
         yield conn
-        conn.commit()
-    except Exception:
-        conn.rollback()
-        raise
-    finally:
-        conn.close()
 
 
 def init_database():
-    """Инициализация базы данных - создание таблиц"""
-    with get_db() as conn:
-        cursor = conn.cursor()
-
-        # Таблица пользователей
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS users (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                email TEXT UNIQUE NOT NULL,
-                password_hash TEXT NOT NULL,
-                role TEXT DEFAULT 'client',  -- client, employee, superadmin
-                is_active BOOLEAN DEFAULT 1,
-                email_verified BOOLEAN DEFAULT 0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-
-        # Таблица токенов верификации email
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS email_verifications (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id INTEGER NOT NULL,
-                token TEXT UNIQUE NOT NULL,
-                expires_at TIMESTAMP NOT NULL,
-                used BOOLEAN DEFAULT 0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (user_id) REFERENCES users(id)
-            )
-        ''')
-
-        # Таблица токенов сброса пароля
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS password_resets (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id INTEGER NOT NULL,
-                token TEXT UNIQUE NOT NULL,
-                expires_at TIMESTAMP NOT NULL,
-                used BOOLEAN DEFAULT 0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (user_id) REFERENCES users(id)
-            )
-        ''')
-
-        # Добавляем колонку email_verified если её нет (для существующих БД)
-        try:
-            cursor.execute('ALTER TABLE users ADD COLUMN email_verified BOOLEAN DEFAULT 0')
-        except sqlite3.OperationalError:
-            pass  # Колонка уже существует
-
-        # Миграция: добавляем поля профиля пользователя
-        try:
-            cursor.execute('ALTER TABLE users ADD COLUMN name TEXT')
-        except sqlite3.OperationalError:
-            pass
-        try:
-            cursor.execute('ALTER TABLE users ADD COLUMN phone TEXT')
-        except sqlite3.OperationalError:
-            pass
-        try:
-            cursor.execute('ALTER TABLE users ADD COLUMN inn TEXT')
-        except sqlite3.OperationalError:
-            pass
-        try:
-            cursor.execute('ALTER TABLE users ADD COLUMN company_name TEXT')
-        except sqlite3.OperationalError:
-            pass
-        try:
-            cursor.execute('ALTER TABLE users ADD COLUMN city TEXT')
-        except sqlite3.OperationalError:
-            pass
-        try:
-            cursor.execute('ALTER TABLE users ADD COLUMN region TEXT')
-        except sqlite3.OperationalError:
-            pass
-
-        # Миграция: поля для отслеживания приглашений и активности
-        try:
-            cursor.execute('ALTER TABLE users ADD COLUMN invitation_sent_at TIMESTAMP')
-        except sqlite3.OperationalError:
-            pass
-        try:
-            cursor.execute('ALTER TABLE users ADD COLUMN last_login TIMESTAMP')
-        except sqlite3.OperationalError:
-            pass
-
-        # Миграция: откуда узнали о нас
-        try:
-            cursor.execute('ALTER TABLE users ADD COLUMN source TEXT')
-        except sqlite3.OperationalError:
-            pass
-
-        # Миграция: добавляем manager_id и client_id в quotes
-        try:
-            cursor.execute('ALTER TABLE quotes ADD COLUMN manager_id INTEGER')
-        except sqlite3.OperationalError:
-            pass
-        try:
-            cursor.execute('ALTER TABLE quotes ADD COLUMN client_id INTEGER')
-        except sqlite3.OperationalError:
-            pass
-
-        # Миграция: добавляем manager_id и client_id в contracts
-        try:
-            cursor.execute('ALTER TABLE contracts ADD COLUMN manager_id INTEGER')
-        except sqlite3.OperationalError:
-            pass
-        try:
-            cursor.execute('ALTER TABLE contracts ADD COLUMN client_id INTEGER')
-        except sqlite3.OperationalError:
-            pass
-
-        # Миграция: добавляем director_name в clients (ФИО генерального директора)
-        try:
-            cursor.execute('ALTER TABLE clients ADD COLUMN director_name TEXT')
-        except sqlite3.OperationalError:
-            pass
-
-        # Таблица компаний (клиентов)
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS companies (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id INTEGER,  -- NULL если гостевой заказ
-                inn TEXT NOT NULL,
-                kpp TEXT,
-                ogrn TEXT,
-                name TEXT NOT NULL,
-                name_short TEXT,
-                name_full TEXT,
-                opf TEXT,
-                type TEXT,  -- LEGAL или INDIVIDUAL
-                address TEXT,
-                management_name TEXT,
-                management_post TEXT,
-                status TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (user_id) REFERENCES users(id)
-            )
-        ''')
-
-        # Таблица КП (коммерческих предложений)
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS quotes (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                quote_number TEXT UNIQUE NOT NULL,  -- КП-0001
-                user_id INTEGER,  -- NULL если гостевой (клиент)
-                manager_id INTEGER,  -- Менеджер, создавший КП
-                client_id INTEGER,  -- Клиент из CRM
-                company_id INTEGER,
-                services_json TEXT NOT NULL,  -- JSON с услугами
-                total_amount REAL NOT NULL,
-                contact_name TEXT,
-                contact_phone TEXT,
-                contact_email TEXT,
-                status TEXT DEFAULT 'draft',  -- draft, sent, approved, rejected
-                valid_until DATE,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (user_id) REFERENCES users(id),
-                FOREIGN KEY (manager_id) REFERENCES users(id),
-                FOREIGN KEY (client_id) REFERENCES clients(id),
-                FOREIGN KEY (company_id) REFERENCES companies(id)
-            )
-        ''')
-
-        # Таблица договоров
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS contracts (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                contract_number TEXT UNIQUE NOT NULL,  -- ДОГ-0001
-                quote_id INTEGER,  -- Связь с КП если есть
-                user_id INTEGER,  -- Клиент (пользователь)
-                manager_id INTEGER,  -- Менеджер, создавший договор
-                client_id INTEGER,  -- Клиент из CRM
-                company_id INTEGER NOT NULL,
-                services_json TEXT NOT NULL,
-                total_amount REAL NOT NULL,
-                status TEXT DEFAULT 'draft',  -- draft, signed, active, completed, cancelled
-                signed_at TIMESTAMP,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (quote_id) REFERENCES quotes(id),
-                FOREIGN KEY (user_id) REFERENCES users(id),
-                FOREIGN KEY (manager_id) REFERENCES users(id),
-                FOREIGN KEY (client_id) REFERENCES clients(id),
-                FOREIGN KEY (company_id) REFERENCES companies(id)
-            )
-        ''')
-
-        # Единый счётчик нумерации (КП и Договоры)
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS document_sequence (
-                doc_type TEXT NOT NULL,  -- 'quote' или 'contract'
-                year INTEGER NOT NULL,
-                last_number INTEGER DEFAULT 0,
-                PRIMARY KEY (doc_type, year)
-            )
-        ''')
-
-        # Старая таблица для обратной совместимости (можно удалить после миграции)
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS contract_sequence (
-                date_key TEXT PRIMARY KEY,  -- ДДММГГ
-                last_number INTEGER DEFAULT 0
-            )
-        ''')
-
-        # Таблица заявок на звонок
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS callbacks (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id INTEGER,
-                company_inn TEXT,
-                company_name TEXT,
-                contact_name TEXT NOT NULL,
-                contact_phone TEXT NOT NULL,
-                contact_email TEXT,
-                products_json TEXT,  -- JSON с проверенными товарами
-                comment TEXT,
-                source TEXT,  -- откуда пришла заявка: check_page, quote_page, contact_form
-                status TEXT DEFAULT 'new',  -- new, processing, completed, cancelled
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                processed_at TIMESTAMP,
-                FOREIGN KEY (user_id) REFERENCES users(id)
-            )
-        ''')
-
-        # Добавляем колонку source если её нет (миграция)
-        try:
-            cursor.execute('ALTER TABLE callbacks ADD COLUMN source TEXT')
-        except:
-            pass  # Колонка уже существует
-
-        # Таблица счетов
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS invoices (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                invoice_number TEXT UNIQUE NOT NULL,  -- СЧЁТ-081225-001
-                contract_id INTEGER,
-                company_id INTEGER NOT NULL,
-                amount REAL NOT NULL,
-                status TEXT DEFAULT 'created',  -- created, sent, paid, cancelled
-                paid_at TIMESTAMP,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (contract_id) REFERENCES contracts(id),
-                FOREIGN KEY (company_id) REFERENCES companies(id)
-            )
-        ''')
-
-        # Таблица клиентов CRM (для менеджеров)
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS clients (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                inn TEXT,
-                kpp TEXT,
-                ogrn TEXT,
-                company_name TEXT,
-                company_type TEXT,  -- LEGAL или INDIVIDUAL
-                contact_name TEXT NOT NULL,
-                contact_phone TEXT NOT NULL,
-                contact_email TEXT,
-                contact_position TEXT,
-                address TEXT,
-                comment TEXT,
-                source TEXT DEFAULT 'manual',  -- website, manual, callback
-                status TEXT DEFAULT 'lead',  -- lead, active, regular, inactive
-                assigned_manager_id INTEGER,  -- менеджер
-                user_id INTEGER,  -- связь с зарегистрированным пользователем
-                products_json TEXT,  -- JSON с товарами клиента
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (assigned_manager_id) REFERENCES users(id),
-                FOREIGN KEY (user_id) REFERENCES users(id)
-            )
-        ''')
-
-        # Таблица истории взаимодействий с клиентами
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS client_interactions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                client_id INTEGER NOT NULL,
-                manager_id INTEGER NOT NULL,
-                type TEXT NOT NULL,  -- call, email, meeting, document_sent, quote_created, contract_created, note
-                subject TEXT,
-                description TEXT,
-                callback_id INTEGER,
-                quote_id INTEGER,
-                contract_id INTEGER,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (client_id) REFERENCES clients(id),
-                FOREIGN KEY (manager_id) REFERENCES users(id),
-                FOREIGN KEY (callback_id) REFERENCES callbacks(id),
-                FOREIGN KEY (quote_id) REFERENCES quotes(id),
-                FOREIGN KEY (contract_id) REFERENCES contracts(id)
-            )
-        ''')
-
-        # Миграция: добавляем колонки в callbacks если их нет
-        try:
-            cursor.execute('ALTER TABLE callbacks ADD COLUMN assigned_to INTEGER REFERENCES users(id)')
-        except:
-            pass
-        try:
-            cursor.execute('ALTER TABLE callbacks ADD COLUMN client_id INTEGER REFERENCES clients(id)')
-        except:
-            pass
-        try:
-            cursor.execute('ALTER TABLE callbacks ADD COLUMN priority TEXT DEFAULT "normal"')
-        except:
-            pass
-
-        # Миграция: добавляем client_id в quotes и contracts
-        try:
-            cursor.execute('ALTER TABLE quotes ADD COLUMN client_id INTEGER REFERENCES clients(id)')
-        except:
-            pass
-        try:
-            cursor.execute('ALTER TABLE contracts ADD COLUMN client_id INTEGER REFERENCES clients(id)')
-        except:
-            pass
-
-        # Таблица настроек уведомлений
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS notification_settings (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                email TEXT NOT NULL,
-                is_active BOOLEAN DEFAULT 1,
-                notify_new_callback BOOLEAN DEFAULT 1,
-                notify_overdue BOOLEAN DEFAULT 1,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-
-        # Таблица системных настроек CRM
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS crm_settings (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                key TEXT UNIQUE NOT NULL,
-                value TEXT NOT NULL,
-                description TEXT,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-
-        # Инициализируем настройки SLA по умолчанию
-        cursor.execute('''
-            INSERT OR IGNORE INTO crm_settings (key, value, description)
-            VALUES ('sla_hours', '24', 'Время на обработку заявки в часах')
-        ''')
-
-        # Миграция: добавляем sla_deadline в callbacks если нет
-        try:
-            cursor.execute('ALTER TABLE callbacks ADD COLUMN sla_deadline TIMESTAMP')
-        except:
-            pass
-
-        # Таблица партнёров
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS partners (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id INTEGER NOT NULL,
-                ref_code TEXT UNIQUE NOT NULL,
-                commission_rate REAL DEFAULT 10.0,
-                partner_type TEXT NOT NULL,  -- 'legal' или 'individual'
-                inn TEXT,
-                company_name TEXT,
-                contact_name TEXT NOT NULL,
-                contact_phone TEXT NOT NULL,
-                contact_email TEXT NOT NULL,
-                status TEXT DEFAULT 'pending',  -- pending, active, inactive
-                created_by INTEGER,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (user_id) REFERENCES users(id),
-                FOREIGN KEY (created_by) REFERENCES users(id)
-            )
-        ''')
-
-        # Миграция: добавляем partner_id и ref_code в quotes
-        try:
-            cursor.execute('ALTER TABLE quotes ADD COLUMN partner_id INTEGER REFERENCES partners(id)')
-        except sqlite3.OperationalError:
-            pass
-        try:
-            cursor.execute('ALTER TABLE quotes ADD COLUMN ref_code TEXT')
-        except sqlite3.OperationalError:
-            pass
-
-        # Миграция: добавляем partner_id в contracts
-        try:
-            cursor.execute('ALTER TABLE contracts ADD COLUMN partner_id INTEGER REFERENCES partners(id)')
-        except sqlite3.OperationalError:
-            pass
-
-        # Индексы для быстрого поиска
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_companies_inn ON companies(inn)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_companies_user ON companies(user_id)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_quotes_user ON quotes(user_id)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_contracts_user ON contracts(user_id)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_contracts_company ON contracts(company_id)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_clients_inn ON clients(inn)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_clients_manager ON clients(assigned_manager_id)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_clients_status ON clients(status)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_interactions_client ON client_interactions(client_id)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_callbacks_assigned ON callbacks(assigned_to)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_callbacks_sla ON callbacks(sla_deadline)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_partners_user ON partners(user_id)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_partners_ref_code ON partners(ref_code)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_partners_status ON partners(status)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_quotes_partner ON quotes(partner_id)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_contracts_partner ON contracts(partner_id)')
-
-        # Таблицы обучения
-        from education_db import EducationDB
-        EducationDB.init_tables(conn)
-
-        print("Database initialized successfully!")
+    """Инициализация базы данных - применение недостающих миграций (см. migrations/)"""
+    pool = get_pool(DB_PATH)
+    conn = pool.acquire()
+    try:
+        applied = run_migrations(conn)
+    finally:
+        pool.release(conn)
+    if applied:
+        logger.info(f"Database migrated to version {applied[-1]}")
 
 
 # ======================== ФУНКЦИИ ДЛЯ РАБОТЫ С ДАННЫМИ ========================
@@ -475,6 +69,36 @@ def verify_password(password: str, password_hash: str) -> bool:
         return False
 
 
+def next_sequence_value(doc_type: str, year: int, seed_sql: str = None, seed_params: tuple = ()) -> int:
+    """
+    Атомарно выделить следующий номер счётчика (doc_type, year) в document_sequence.
+
+    BEGIN IMMEDIATE берёт блокировку записи до чтения счётчика, а
+    UPDATE ... RETURNING увеличивает и возвращает его одним выражением, поэтому
+    параллельные запросы (воркеры API, бот) всегда получают разные номера.
+    Для нового счётчика начальное значение - результат seed_sql (последний номер,
+    выданный до появления счётчика), иначе 0.
+    """
+    with get_db() as conn:
+        conn.execute('BEGIN IMMEDIATE')
+        row = conn.execute(
+            'UPDATE document_sequence SET last_number = last_number + 1 '
+            'WHERE doc_type = ? AND year = ? RETURNING last_number',
+            (doc_type, year)
+        ).fetchone()
+        if row:
+            return row['last_number']
+
+        last_number = 0
+        if seed_sql:
+            last_number = conn.execute(seed_sql, seed_params).fetchone()[0] or 0
+        conn.execute(
+            'INSERT INTO document_sequence (doc_type, year, last_number) VALUES (?, ?, ?)',
+            (doc_type, year, last_number + 1)
+        )
+        return last_number + 1
+
+
 def get_next_document_number(doc_type: str) -> str:
     """
     Получить следующий номер документа с единой нумерацией по году.
@@ -486,35 +110,12 @@ def get_next_document_number(doc_type: str) -> str:
         Номер в формате KP-ДДММГГ-0001 или DOG-ДДММГГ-0001
     """
     now = datetime.now()
-    year = now.year
     date_str = now.strftime("%d%m%y")
     # Используем латиницу для совместимости с HTTP заголовками
     prefix = "KP" if doc_type == "quote" else "DOG"
 
-    with get_db() as conn:
-        cursor = conn.cursor()
-
-        # Получаем текущий счётчик для этого типа и года
-        cursor.execute(
-            'SELECT last_number FROM document_sequence WHERE doc_type = ? AND year = ?',
-            (doc_type, year)
-        )
-        row = cursor.fetchone()
-
-        if row:
-            next_num = row['last_number'] + 1
-            cursor.execute(
-                'UPDATE document_sequence SET last_number = ? WHERE doc_type = ? AND year = ?',
-                (next_num, doc_type, year)
-            )
-        else:
-            next_num = 1
-            cursor.execute(
-                'INSERT INTO document_sequence (doc_type, year, last_number) VALUES (?, ?, ?)',
-                (doc_type, year, next_num)
-            )
-
-        return f"{prefix}-{date_str}-{next_num:04d}"
+    next_num = next_sequence_value(doc_type, now.year)
+    return f"{prefix}-{date_str}-{next_num:04d}"
 
 
 def get_next_quote_number() -> str:
@@ -527,19 +128,44 @@ def get_next_contract_number() -> str:
     return get_next_document_number("contract")
 
 
-def get_next_invoice_number() -> str:
-    """Получить следующий номер счёта"""
-    today = datetime.now()
-    date_key = today.strftime("%d%m%y")
+def get_next_invoice_number(contract_number: str = None, contract_id: int = None) -> str:
+    """
+    Генерирует следующий номер счёта в формате СЧ-{номер_договора}/{порядковый}
+    (договор без номера - СЧ-ГГММДД-0001, вызов без договора - СЧЁТ-ДДММГГ-001).
+    Счётчики счетов - в document_sequence с year = 0 для счетов по договору;
+    при первом обращении они продолжают уже выданные номера.
+    """
+    if contract_number:
+        # Убираем префикс DOG- если есть
+        base_number = contract_number.replace('DOG-', '').replace('dog-', '')
+        prefix = f"СЧ-{base_number}/"
+        next_num = next_sequence_value(
+            f"invoice:{base_number}", 0,
+            "SELECT MAX(CAST(SUBSTR(invoice_number, ?) AS INTEGER)) FROM invoices WHERE invoice_number LIKE ?",
+            (len(prefix) + 1, f"{prefix}%")
+        )
+        return f"{prefix}{next_num}"
 
-    with get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            'SELECT COUNT(*) as cnt FROM invoices WHERE invoice_number LIKE ?',
-            (f"СЧЁТ-{date_key}-%",)
+    today = datetime.now()
+    if contract_id is None:
+        # Счёт без договора - прежний формат get_next_invoice_number() из database.py
+        date_key = today.strftime("%d%m%y")
+        prefix = f"СЧЁТ-{date_key}-"
+        next_num = next_sequence_value(
+            f"invoice_daily:{date_key}", today.year,
+            "SELECT MAX(CAST(SUBSTR(invoice_number, ?) AS INTEGER)) FROM invoices WHERE invoice_number LIKE ?",
+            (len(prefix) + 1, f"{prefix}%")
         )
-        count = cursor.fetchone()['cnt']
-        return f"СЧЁТ-{date_key}-{count + 1:03d}"
+        return f"{prefix}{next_num:03d}"
+
+    # Fallback - старый формат если нет contract_number
+    date_prefix = today.strftime("%y%m%d")
+    next_num = next_sequence_value(
+        f"invoice:{date_prefix}", today.year,
+        "SELECT MAX(CAST(SUBSTR(invoice_number, -4) AS INTEGER)) FROM invoices WHERE invoice_number LIKE ?",
+        (f"СЧ-{date_prefix}-%",)
+    )
+    return f"СЧ-{date_prefix}-{next_num:04d}"
 
 
 # ======================== CRUD ОПЕРАЦИИ ========================
@@ -601,6 +227,23 @@ class UserDB:
             logger.error(f"Error updating password: {e}")
             return False
 
+    @staticmethod
+    def get_all(role: str = None, cursor: str = None, limit: int = None) -> Dict:
+        """Список пользователей для админки (без хэшей паролей), постранично"""
+        with get_db() as conn:
+            query = '''
+                SELECT id, email, role, is_active, email_verified, created_at,
+                       name, phone, last_login, invitation_sent_at
+                FROM users WHERE 1=1
+            '''
+            params = []
+            if role:
+                query += ' AND role = ?'
+                params.append(role)
+
+            rows, next_cursor = fetch_page(conn.cursor(), query, params, cursor, limit)
+            return {'users': [dict(row) for row in rows], 'next_cursor': next_cursor}
+
 
 class CompanyDB:
     """Операции с компаниями"""
@@ -670,6 +313,7 @@ class QuoteDB:
     """Операции с КП"""
 
     @staticmethod
+    @invalidates_stats
     def create(data: Dict) -> Dict:
         """Создать КП"""
         import json
@@ -789,6 +433,7 @@ class ContractDB:
     """Операции с договорами"""
 
     @staticmethod
+    @invalidates_stats
     def create(data: Dict) -> Dict:
         """Создать договор"""
         import json
@@ -1081,6 +726,7 @@ class CallbackDB:
     """Операции с заявками на звонок"""
 
     @staticmethod
+    @invalidates_stats
     def create(data: Dict) -> int:
         """Создать заявку на звонок с автоматическим SLA"""
         import json
@@ -1137,6 +783,7 @@ class CallbackDB:
             return results
 
     @staticmethod
+    @invalidates_stats
     def update_status(callback_id: int, status: str):
         """Обновить статус заявки"""
         with get_db() as conn:
@@ -1206,11 +853,10 @@ class ClientDB:
             return None
 
     @staticmethod
-    def get_all(status: str = None, manager_id: int = None) -> List[Dict]:
-        """Получить всех клиентов с фильтрами"""
+    def get_all(status: str = None, manager_id: int = None, cursor: str = None, limit: int = None) -> Dict:
+        """Получить клиентов с фильтрами постранично: {"clients": [...], "next_cursor": ...}"""
         import json
         with get_db() as conn:
-            cursor = conn.cursor()
             query = 'SELECT * FROM clients WHERE 1=1'
             params = []
 
@@ -1221,16 +867,15 @@ class ClientDB:
                 query += ' AND assigned_manager_id = ?'
                 params.append(manager_id)
 
-            query += ' ORDER BY created_at DESC'
-            cursor.execute(query, params)
+            rows, next_cursor = fetch_page(conn.cursor(), query, params, cursor, limit)
 
             results = []
-            for row in cursor.fetchall():
+            for row in rows:
                 item = dict(row)
                 item['products'] = json.loads(item['products_json']) if item['products_json'] else []
                 del item['products_json']
                 results.append(item)
-            return results
+            return {'clients': results, 'next_cursor': next_cursor}
 
     @staticmethod
     def update(client_id: int, data: Dict) -> bool:
@@ -1301,6 +946,173 @@ class ClientDB:
                 results.append(item)
             return results
 
+    @staticmethod
+    def find_duplicates(phone: str = None, email: str = None, inn: str = None) -> List[Dict]:
+        """
+        Клиенты с таким же телефоном, email или ИНН (до 5 на каждое поле).
+        Сравниваются нормализованные значения (phone_e164, email_lower) по индексам.
+        """
+        checks = []
+        phone_e164 = normalize_phone(phone)
+        # Неполный номер (меньше 10 цифр) ещё нельзя сравнить
+        if phone_e164 and len(phone_e164) >= 11:
+            checks.append(('phone', 'phone_e164', phone_e164))
+        email_lower = normalize_email(email)
+        if email_lower and len(email_lower) >= 3 and '@' in email_lower:
+            checks.append(('email', 'email_lower', email_lower))
+        inn_digits = normalize_inn(inn)
+        if inn_digits and len(inn_digits) >= 10:
+            checks.append(('inn', 'inn', inn_digits))
+
+        duplicates = []
+        seen = set()
+        with get_db() as conn:
+            cursor = conn.cursor()
+            for match_type, column, value in checks:
+                cursor.execute(f'''
+                    SELECT id, contact_name, company_name, contact_phone, contact_email
+                    FROM clients
+                    WHERE {column} = ?
+                    LIMIT 5
+                ''', (value,))
+                for row in cursor.fetchall():
+                    if row["id"] in seen:
+                        continue
+                    seen.add(row["id"])
+                    duplicates.append({
+                        "id": row["id"],
+                        "name": row["contact_name"],
+                        "company": row["company_name"],
+                        "phone": row["contact_phone"],
+                        "email": row["contact_email"],
+                        "match_type": match_type
+                    })
+        return duplicates
+
+    # Сортировки списка клиентов: по полям клиента и по агрегатам
+    LIST_SORT_FIELDS = {
+        'created_at': 'created_at',
+        'updated_at': 'updated_at',
+        'company_name': 'company_name',
+        'contact_name': 'contact_name',
+        'status': 'status',
+    }
+    LIST_SORT_AGGREGATES = {
+        'quotes_count': 'quotes_count',
+        'quotes_total': 'quotes_total',
+        'contracts_count': 'contracts_count',
+        'contracts_total': 'contracts_total',
+        'tasks_count': 'tasks_count',
+    }
+    # Максимальный размер страницы
+    LIST_MAX_LIMIT = 500
+
+    @staticmethod
+    def get_list_with_stats(status: str = None, search: str = None, sort: str = 'created_at',
+                            order: str = 'desc', limit: int = None, offset: int = 0,
+                            cursor: str = None) -> Dict:
+        """
+        Клиенты со статистикой по КП, договорам, открытым задачам и менеджером - одним запросом.
+        При сортировке по полям клиента сначала выбирается страница клиентов,
+        и агрегаты считаются только для неё (по индексам client_id), поэтому время
+        ответа не зависит от общего числа клиентов.
+        В порядке по умолчанию (created_at desc) вместо offset можно листать курсором
+        (см. pagination.py).
+        Возвращает {"clients": [...], "total": количество клиентов под фильтром, "next_cursor": ...}.
+        """
+        import json
+
+        direction = 'ASC' if str(order).lower() == 'asc' else 'DESC'
+        if sort not in ClientDB.LIST_SORT_FIELDS and sort not in ClientDB.LIST_SORT_AGGREGATES:
+            sort = 'created_at'
+        if search and limit is None and not cursor:
+            limit = 50  # как в ClientDB.search
+        limit = page_limit(cursor, limit)
+        offset = max(int(offset or 0), 0)
+        keyset = sort == 'created_at' and direction == 'DESC' and not offset
+        if cursor and not keyset:
+            raise InvalidCursor("cursor is supported only for sort=created_at, order=desc without offset")
+
+        where = ['1=1']
+        params: List[Any] = []
+        if status:
+            where.append('status = ?')
+            params.append(status)
+        if search:
+            where.append('(contact_name LIKE ? OR company_name LIKE ? OR contact_phone LIKE ? OR inn LIKE ? OR contact_email LIKE ?)')
+            params.extend([f'%{search}%'] * 5)
+        where_sql = ' AND '.join(where)
+
+        page_params = list(params)
+        limit_sql = ''
+        if limit is not None:
+            limit_sql = ' LIMIT ? OFFSET ?'
+        if sort in ClientDB.LIST_SORT_FIELDS:
+            column = ClientDB.LIST_SORT_FIELDS[sort]
+            page_sql = f'SELECT * FROM clients WHERE {where_sql} ORDER BY {column} {direction}, id {direction}{limit_sql}'
+            if limit is not None:
+                page_params.extend([limit, offset])
+            outer_order = f'p.{column} {direction}, p.id {direction}'
+            outer_limit = ''
+            outer_params = []
+        else:
+            page_sql = f'SELECT * FROM clients WHERE {where_sql}'
+            outer_order = f'{ClientDB.LIST_SORT_AGGREGATES[sort]} {direction}, p.id {direction}'
+            outer_limit = limit_sql
+            outer_params = [limit, offset] if limit is not None else []
+
+        next_cursor = None
+        with get_db() as conn:
+            if keyset and limit is not None:
+                # Страница по курсору: сначала id клиентов страницы (поиском по индексу created_at)
+                rows, next_cursor = fetch_page(
+                    conn.cursor(), f'SELECT id, created_at FROM clients WHERE {where_sql}', params, cursor, limit
+                )
+                page_sql = f'SELECT * FROM clients WHERE id IN ({", ".join("?" * len(rows))})'
+                page_params = [row['id'] for row in rows]
+
+            cur = conn.cursor()
+            cur.execute(f'SELECT COUNT(*) FROM clients WHERE {where_sql}', params)
+            total = cur.fetchone()[0]
+
+            cur.execute(f'''
+                WITH page AS ({page_sql})
+                SELECT p.*,
+                    COALESCE(q.cnt, 0) AS quotes_count, COALESCE(q.total, 0) AS quotes_total,
+                    COALESCE(ct.cnt, 0) AS contracts_count, COALESCE(ct.total, 0) AS contracts_total,
+                    COALESCE(t.cnt, 0) AS tasks_count,
+                    u.name AS manager_user_name, u.email AS manager_email
+                FROM page p
+                LEFT JOIN users u ON u.id = p.assigned_manager_id
+                LEFT JOIN (
+                    SELECT client_id, COUNT(*) AS cnt, COALESCE(SUM(total_amount), 0) AS total
+                    FROM quotes WHERE client_id IN (SELECT id FROM page) GROUP BY client_id
+                ) q ON q.client_id = p.id
+                LEFT JOIN (
+                    SELECT client_id, COUNT(*) AS cnt, COALESCE(SUM(total_amount), 0) AS total
+                    FROM contracts WHERE client_id IN (SELECT id FROM page) GROUP BY client_id
+                ) ct ON ct.client_id = p.id
+                LEFT JOIN (
+                    SELECT client_id, COUNT(*) AS cnt
+                    FROM tasks WHERE client_id IN (SELECT id FROM page) AND status != 'completed' GROUP BY client_id
+                ) t ON t.client_id = p.id
+                ORDER BY {outer_order}{outer_limit}
+            ''', page_params + outer_params)
+
+            clients = []
+            for row in cur.fetchall():
+                item = dict(row)
+                item['products'] = json.loads(item['products_json']) if item['products_json'] else []
+                del item['products_json']
+                manager_name = item.pop('manager_user_name')
+                if item['manager_email']:
+                    item['manager_name'] = manager_name or item['manager_email'].split('@')[0]
+                else:
+                    del item['manager_email']
+                clients.append(item)
+
+        return {"clients": clients, "total": total, "next_cursor": next_cursor}
+
     @staticmethod
     def get_stats() -> Dict:
         """Статистика по клиентам"""
@@ -1389,6 +1201,7 @@ class CallbackDBExtended(CallbackDB):
     """Расширенные операции с заявками"""
 
     @staticmethod
+    @invalidates_stats
     def assign_to(callback_id: int, manager_id: int) -> bool:
         """Назначить заявку менеджеру"""
         with get_db() as conn:
@@ -1400,6 +1213,7 @@ class CallbackDBExtended(CallbackDB):
             return cursor.rowcount > 0
 
     @staticmethod
+    @invalidates_stats
     def link_to_client(callback_id: int, client_id: int) -> bool:
         """Связать заявку с клиентом"""
         with get_db() as conn:
@@ -1411,11 +1225,11 @@ class CallbackDBExtended(CallbackDB):
             return cursor.rowcount > 0
 
     @staticmethod
-    def get_all_extended(status: str = None, assigned_to: int = None) -> List[Dict]:
-        """Получить все заявки с расширенной информацией"""
+    def get_all_extended(status: str = None, assigned_to: int = None, period: str = None,
+                         cursor: str = None, limit: int = None) -> Dict:
+        """Заявки с расширенной информацией постранично: {"callbacks": [...], "next_cursor": ...}"""
         import json
         with get_db() as conn:
-            cursor = conn.cursor()
             query = '''
                 SELECT cb.*, u.email as assigned_email, c.contact_name as client_name
                 FROM callbacks cb
@@ -1432,17 +1246,24 @@ class CallbackDBExtended(CallbackDB):
                 query += ' AND cb.assigned_to = ?'
                 params.append(assigned_to)
 
-            query += ' ORDER BY cb.created_at DESC'
-            cursor.execute(query, params)
+            # Фильтр по периоду
+            if period == 'today':
+                query += " AND date(cb.created_at, 'localtime') = date('now', 'localtime')"
+            elif period == 'week':
+                query += " AND cb.created_at >= datetime('now', '-7 days', 'localtime')"
+            elif period == 'month':
+                query += " AND cb.created_at >= datetime('now', '-30 days', 'localtime')"
+
+            rows, next_cursor = fetch_page(conn.cursor(), query, params, cursor, limit, alias='cb.')
 
             results = []
-            for row in cursor.fetchall():
+            for row in rows:
                 item = dict(row)
                 item['products'] = json.loads(item['products_json']) if item.get('products_json') else []
                 if 'products_json' in item:
                     del item['products_json']
                 results.append(item)
-            return results
+            return {'callbacks': results, 'next_cursor': next_cursor}
 
     @staticmethod
     def get_by_id(callback_id: int) -> Optional[Dict]:
@@ -1466,6 +1287,7 @@ class CallbackDBExtended(CallbackDB):
             return None
 
     @staticmethod
+    @invalidates_stats
     def convert_to_client(callback_id: int, manager_id: int) -> Optional[int]:
         """Конвертировать заявку в клиента"""
         callback = CallbackDBExtended.get_by_id(callback_id)
@@ -1656,6 +1478,7 @@ class CallbackSLADB:
             return cursor.fetchone()['cnt']
 
     @staticmethod
+    @invalidates_stats
     def set_sla_deadline(callback_id: int, hours: int = None):
         """Установить SLA deadline для заявки"""
         if hours is None:
@@ -1669,6 +1492,7 @@ class CallbackSLADB:
             ''', (hours, callback_id))
 
     @staticmethod
+    @invalidates_stats
     def update_all_missing_sla():
         """Обновить SLA для всех заявок где он не установлен"""
         hours = CRMSettingsDB.get_sla_hours()
@@ -1874,125 +1698,15 @@ class PartnerDB:
 
     @staticmethod
     def get_stats(partner_id: int) -> Dict:
-        """Получить статистику партнёра"""
+        """Получить статистику партнёра (итоги журнала partner_ledger)"""
         with get_db() as conn:
-            cursor = conn.cursor()
-
-            # Получаем данные партнёра
-            cursor.execute('SELECT commission_rate FROM partners WHERE id = ?', (partner_id,))
-            partner = cursor.fetchone()
-            if not partner:
-                return {}
-
-            commission_rate = partner['commission_rate']
-
-            # Статистика по КП
-            cursor.execute('''
-                SELECT
-                    COUNT(*) as total_leads,
-                    COALESCE(SUM(total_amount), 0) as quotes_amount,
-                    SUM(CASE WHEN status = 'approved' THEN 1 ELSE 0 END) as approved_quotes
-                FROM quotes
-                WHERE partner_id = ?
-            ''', (partner_id,))
-            quotes_stats = dict(cursor.fetchone())
-
-            # Статистика по договорам (оплаченные)
-            cursor.execute('''
-                SELECT
-                    COUNT(*) as total_contracts,
-                    COALESCE(SUM(total_amount), 0) as paid_amount
-                FROM contracts
-                WHERE partner_id = ? AND status IN ('signed', 'active', 'completed')
-            ''', (partner_id,))
-            contracts_stats = dict(cursor.fetchone())
-
-            paid_amount = contracts_stats['paid_amount']
-            commission_earned = paid_amount * commission_rate / 100
-
-            # Ожидает выплаты (КП approved но ещё не оплачены)
-            cursor.execute('''
-                SELECT COALESCE(SUM(q.total_amount), 0) as pending_amount
-                FROM quotes q
-                LEFT JOIN contracts c ON c.quote_id = q.id
-                WHERE q.partner_id = ? AND q.status = 'approved'
-                AND (c.id IS NULL OR c.status NOT IN ('signed', 'active', 'completed'))
-            ''', (partner_id,))
-            pending = cursor.fetchone()
-            pending_amount = pending['pending_amount'] if pending else 0
-            commission_pending = pending_amount * commission_rate / 100
-
-            return {
-                'total_leads': quotes_stats['total_leads'],
-                'quotes_amount': quotes_stats['quotes_amount'],
-                'approved_quotes': quotes_stats['approved_quotes'],
-                'total_contracts': contracts_stats['total_contracts'],
-                'paid_amount': paid_amount,
-                'commission_rate': commission_rate,
-                'commission_earned': commission_earned,
-                'commission_pending': commission_pending
-            }
+            return partner_ledger.get_totals(conn, partner_id) or {}
 
     @staticmethod
     def get_leads(partner_id: int) -> List[Dict]:
         """Получить список клиентов партнёра (минимальная информация)"""
-        import json
         with get_db() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT
-                    q.id,
-                    q.quote_number,
-                    q.total_amount,
-                    q.status as quote_status,
-                    q.created_at,
-                    q.contact_name,
-                    comp.name as company_name,
-                    comp.inn as company_inn,
-                    c.status as contract_status,
-                    c.total_amount as contract_amount,
-                    m.name as manager_name,
-                    m.email as manager_email,
-                    p.commission_rate
-                FROM quotes q
-                LEFT JOIN contracts c ON c.quote_id = q.id
-                LEFT JOIN companies comp ON q.company_id = comp.id
-                LEFT JOIN users m ON q.manager_id = m.id
-                LEFT JOIN partners p ON q.partner_id = p.id
-                WHERE q.partner_id = ?
-                ORDER BY q.created_at DESC
-            ''', (partner_id,))
-
-            results = []
-            for row in cursor.fetchall():
-                item = dict(row)
-                # Определяем статус оплаты
-                if item['contract_status'] in ('signed', 'active', 'completed'):
-                    item['payment_status'] = 'paid'
-                elif item['quote_status'] == 'approved':
-                    item['payment_status'] = 'pending'
-                else:
-                    item['payment_status'] = 'not_paid'
-
-                # Рассчитываем комиссию
-                amount = item['contract_amount'] or item['total_amount'] or 0
-                item['commission'] = amount * (item['commission_rate'] or 10) / 100
-                
-                # Добавляем is_paid и status_label для фронтенда
-                item['is_paid'] = item['payment_status'] == 'paid'
-                status_labels = {
-                    'draft': 'Черновик',
-                    'sent': 'Отправлено',
-                    'viewed': 'Просмотрено', 
-                    'approved': 'Одобрено',
-                    'rejected': 'Отклонено',
-                    'expired': 'Истекло'
-                }
-                item['status_label'] = status_labels.get(item['quote_status'], item['quote_status'])
-
-                results.append(item)
-
-            return results
+            return partner_ledger.get_leads(conn, partner_id)
 
     @staticmethod
     def generate_invite_token() -> str:
@@ -2058,13 +1772,14 @@ class PartnerDB:
             ''', (partner['user_id'],))
 
             # Авто-привязка telegram_id по номеру телефона
-            if partner.get('contact_phone'):
+            partner_phone = normalize_phone(partner.get('contact_phone'))
+            if partner_phone:
                 cursor.execute('''SELECT tl.telegram_id 
                     FROM telegram_leads tl
-                    WHERE tl.phone = ? 
+                    WHERE tl.phone_e164 = ? 
                     ORDER BY tl.created_at DESC 
                     LIMIT 1
-                ''', (partner['contact_phone'],))
+                ''', (partner_phone,))
                 tg_row = cursor.fetchone()
                 if tg_row:
                     cursor.execute('UPDATE partners SET telegram_id = ? WHERE id = ?', (tg_row['telegram_id'], partner['id']))
@@ -2072,5 +1787,260 @@ class PartnerDB:
         return PartnerDB.get_by_id(partner['id'])
 
 
+class MetricsDB:
+    """Дневные агрегаты дашборда (daily_metrics) - см. migrations/0009_daily_metrics.py"""
+
+    # Начало интервала графика для даты {column}: час, день, неделя (с понедельника)
+    SERIES_BUCKETS = {
+        'hour': "strftime('%Y-%m-%d %H:00', {column})",
+        'day': "date({column})",
+        'week': "date({column}, 'weekday 0', '-6 days')",
+    }
+    # Почасовые графики: сущность -> (таблица, сумма)
+    SERIES_TABLES = {
+        'callback': ('callbacks', '0'),
+        'client': ('clients', '0'),
+        'quote': ('quotes', 'total_amount'),
+        'contract': ('contracts', 'total_amount'),
+    }
+
+    @staticmethod
+    def get_totals(start_day: str, end_day: str, prev_start_day: str) -> List[Dict]:
+        """
+        Итоги по (entity, status, source): всего, за период [start_day, end_day)
+        и за предыдущий период [prev_start_day, start_day). Дни - 'YYYY-MM-DD'.
+        """
+        with get_db() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT entity, status, source,
+                       SUM(count) as total,
+                       SUM(amount) as amount,
+                       SUM(CASE WHEN day >= :start AND day < :end THEN count ELSE 0 END) as period,
+                       SUM(CASE WHEN day >= :start AND day < :end THEN amount ELSE 0 END) as period_amount,
+                       SUM(CASE WHEN day >= :prev AND day < :start THEN count ELSE 0 END) as prev_period,
+                       SUM(CASE WHEN day >= :prev AND day < :start THEN amount ELSE 0 END) as prev_period_amount
+                FROM daily_metrics
+                GROUP BY entity, status, source
+                HAVING SUM(count) != 0
+            ''', {'start': start_day, 'end': end_day, 'prev': prev_start_day})
+            return [dict(row) for row in cursor.fetchall()]
+
+    @staticmethod
+    def get_managers() -> List[Dict]:
+        """Клиенты, КП и договоры по менеджерам (сотрудники и суперадмины)"""
+        with get_db() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT u.id, u.email,
+                       COALESCE(SUM(CASE WHEN m.entity = 'client' THEN m.count END), 0) as clients_count,
+                       COALESCE(SUM(CASE WHEN m.entity = 'quote' THEN m.count END), 0) as quotes_count,
+                       COALESCE(SUM(CASE WHEN m.entity = 'contract' THEN m.count END), 0) as contracts_count,
+                       COALESCE(SUM(CASE WHEN m.entity = 'contract' THEN m.amount END), 0) as contracts_amount
+                FROM users u
+                LEFT JOIN daily_metrics m ON m.manager_id = u.id
+                WHERE u.role IN ('employee', 'superadmin')
+                GROUP BY u.id, u.email
+                ORDER BY contracts_count DESC
+            ''')
+            return [dict(row) for row in cursor.fetchall()]
+
+    @staticmethod
+    def get_series(bucket: str, start: str, end: str) -> List[Dict]:
+        """
+        Количество и сумма записей по интервалам [start, end) для графиков:
+        строки {bucket, entity, count, amount} только для непустых интервалов.
+        Дни и недели считаются по daily_metrics, часы - по created_at таблиц.
+        """
+        bucket_sql = MetricsDB.SERIES_BUCKETS[bucket]
+        with get_db() as conn:
+            cursor = conn.cursor()
+            if bucket != 'hour':
+                cursor.execute(f'''
+                    SELECT {bucket_sql.format(column='day')} as bucket, entity,
+                           SUM(count) as count, SUM(amount) as amount
+                    FROM daily_metrics
+                    WHERE day >= ? AND day < ? AND entity IN ('callback', 'client', 'quote', 'contract')
+                    GROUP BY 1, 2
+                ''', (start, end))
+                return [dict(row) for row in cursor.fetchall()]
+
+            rows = []
+            for entity, (table, amount) in MetricsDB.SERIES_TABLES.items():
+                cursor.execute(f'''
+                    SELECT {bucket_sql.format(column='created_at')} as bucket, '{entity}' as entity,
+                           COUNT(*) as count, COALESCE(SUM({amount}), 0) as amount
+                    FROM {table}
+                    WHERE created_at >= ? AND created_at < ?
+                    GROUP BY 1
+                ''', (start, end))
+                rows.extend(dict(row) for row in cursor.fetchall())
+            return rows
+
+
+class DocumentLinesDB:
+    """Строки документов (услуги КП, договоров и счетов) - см. migrations/0008_document_lines.py"""
+
+    DOC_TABLES = {'quote': 'quotes', 'contract': 'contracts', 'invoice': 'invoices'}
+
+    @staticmethod
+    def get_service_revenue(doc_type: str = 'contract', date_from: str = None, date_to: str = None,
+                            status: str = None) -> List[Dict]:
+        """Выручка по услугам: количество документов, единиц и сумма по каждой услуге"""
+        table = DocumentLinesDB.DOC_TABLES.get(doc_type)
+        if not table:
+            raise ValueError(f"Unknown doc_type: {doc_type}")
+
+        query = f'''
+            SELECT dl.service_id, MAX(dl.name) as name,
+                   COUNT(DISTINCT dl.doc_id) as documents,
+                   SUM(dl.quantity) as quantity,
+                   SUM(dl.subtotal) as revenue
+            FROM document_lines dl
+            JOIN {table} d ON d.id = dl.doc_id
+            WHERE dl.doc_type = ?
+        '''
+        params: List[Any] = [doc_type]
+        if date_from:
+            query += ' AND d.created_at >= ?'
+            params.append(date_from)
+        if date_to:
+            query += ' AND d.created_at < ?'
+            params.append(date_to)
+        if status:
+            query += ' AND d.status = ?'
+            params.append(status)
+        query += ' GROUP BY COALESCE(dl.service_id, dl.name) ORDER BY revenue DESC'
+
+        with get_db() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            return [dict(row) for row in cursor.fetchall()]
+
+
+class SearchDB:
+    """Глобальный поиск по FTS5-индексу search_index (см. migrations/0006_search_index.py)"""
+
+    # rowid в search_index = id записи * ROWID_STRIDE + тип
+    ROWID_STRIDE = 8
+    KINDS = {1: 'client', 2: 'callback', 3: 'partner', 4: 'contract', 5: 'quote'}
+    # Совпадение в названии/номере весит больше, чем в телефоне и ИНН
+    TITLE_WEIGHT = 10.0
+    BODY_WEIGHT = 1.0
+
+    _TOKEN_RE = re.compile(r'[^\W_]+')
+
+    @staticmethod
+    def build_match_query(q: str) -> str:
+        """Запрос MATCH: каждое слово - префикс, все слова обязательны ('"ромаш"* "ооо"*')"""
+        return ' '.join(f'"{token}"*' for token in SearchDB._TOKEN_RE.findall(q.lower()))
+
+    @staticmethod
+    def search(q: str, limit: int = 15) -> List[Dict]:
+        """Найти записи по строке q, отсортированные по релевантности (bm25)"""
+        match = SearchDB.build_match_query(q or '')
+        if not match:
+            return []
+
+        with get_db() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f'''
+                SELECT rowid FROM search_index
+                WHERE search_index MATCH ?
+                ORDER BY bm25(search_index, {SearchDB.TITLE_WEIGHT}, {SearchDB.BODY_WEIGHT})
+                LIMIT ?
+            ''', (match, limit))
+            hits = [divmod(row[0], SearchDB.ROWID_STRIDE) for row in cursor.fetchall()]
+
+            ids_by_kind: Dict[str, List[int]] = {}
+            for record_id, kind in hits:
+                if kind in SearchDB.KINDS:
+                    ids_by_kind.setdefault(SearchDB.KINDS[kind], []).append(record_id)
+
+            found = {}
+            for kind, ids in ids_by_kind.items():
+                for record_id, item in SearchDB._load(cursor, kind, ids):
+                    found[(kind, record_id)] = item
+
+        return [found[(SearchDB.KINDS.get(kind), record_id)] for record_id, kind in hits
+                if (SearchDB.KINDS.get(kind), record_id) in found]
+
+    @staticmethod
+    def _load(cursor, kind: str, ids: List[int]):
+        """Результаты поиска одного типа в формате {"type", "id", "title", "subtitle"}"""
+        placeholders = ', '.join('?' * len(ids))
+        if kind in ('client', 'partner'):
+            table = 'clients' if kind == 'client' else 'partners'
+            cursor.execute(f'''
+                SELECT id, company_name, contact_name, contact_phone, inn
+                FROM {table} WHERE id IN ({placeholders})
+            ''', ids)
+            for row in cursor.fetchall():
+                yield row['id'], {
+                    "type": kind,
+                    "id": row["id"],
+                    "title": row["company_name"] or row["contact_name"],
+                    "subtitle": f"{row['contact_phone'] or ''} • ИНН: {row['inn'] or '-'}"
+                }
+        elif kind == 'callback':
+            cursor.execute(f'''
+                SELECT id, contact_name, contact_phone, company_name
+                FROM callbacks WHERE id IN ({placeholders})
+            ''', ids)
+            for row in cursor.fetchall():
+                yield row['id'], {
+                    "type": "callback",
+                    "id": row["id"],
+                    "title": row["contact_name"],
+                    "subtitle": f"{row['contact_phone'] or ''} • {row['company_name'] or ''}"
+                }
+        elif kind == 'contract':
+            cursor.execute(f'''
+                SELECT c.id, c.contract_number, cl.company_name as client_name, cl.contact_name
+                FROM contracts c
+                LEFT JOIN clients cl ON cl.id = c.client_id
+                WHERE c.id IN ({placeholders})
+            ''', ids)
+            for row in cursor.fetchall():
+                yield row['id'], {
+                    "type": "contract",
+                    "id": row["id"],
+                    "title": f"Договор {row['contract_number'] or ''}",
+                    "subtitle": row['client_name'] or row['contact_name'] or ''
+                }
+        elif kind == 'quote':
+            cursor.execute(f'''
+                SELECT q.id, q.quote_number, cl.company_name as client_name,
+                       COALESCE(cl.contact_name, q.contact_name) as contact
+                FROM quotes q
+                LEFT JOIN clients cl ON cl.id = q.client_id
+                WHERE q.id IN ({placeholders})
+            ''', ids)
+            for row in cursor.fetchall():
+                yield row['id'], {
+                    "type": "quote",
+                    "id": row["id"],
+                    "title": f"КП {row['quote_number'] or ''}",
+                    "subtitle": row['client_name'] or row['contact'] or ''
+                }
+
+
+# ==================== ASYNC ВЕРСИИ ====================
+# Для async-эндпоинтов: await AsyncClientDB.get_by_id(...) выполняет запрос
+# в пуле потоков БД и не блокирует event loop
+
+AsyncClientDB = async_db(ClientDB)
+AsyncQuoteDB = async_db(QuoteDB)
+AsyncContractDB = async_db(ContractDB)
+AsyncPartnerDB = async_db(PartnerDB)
+AsyncCallbackDB = async_db(CallbackDB)
+AsyncCallbackDBExtended = async_db(CallbackDBExtended)
+AsyncCallbackSLADB = async_db(CallbackSLADB)
+AsyncInteractionDB = async_db(InteractionDB)
+AsyncSearchDB = async_db(SearchDB)
+AsyncDocumentLinesDB = async_db(DocumentLinesDB)
+AsyncMetricsDB = async_db(MetricsDB)
+
+
 # Инициализация БД при импорте модуля
 init_database()
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+Асинхронный доступ к БД
+Синхронные вызовы SQLite выполняются в отдельном пуле потоков с ограниченным
+числом воркеров, а async-эндпоинты ждут результат через await и не блокируют
+event loop. Число воркеров совпадает с размером пула соединений, поэтому
+каждый воркер работает со своим уже открытым соединением.
+"""
+
+import asyncio
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from db_pool import DB_POOL_SIZE
+
+# Сколько запросов к БД может выполняться одновременно
+DB_EXECUTOR_WORKERS = int(os.getenv('DB_EXECUTOR_WORKERS', str(DB_POOL_SIZE)))
+
+_executor = ThreadPoolExecutor(max_workers=DB_EXECUTOR_WORKERS, thread_name_prefix='db')
+
+
+async def run_db(func: Callable, *args, **kwargs) -> Any:
+    """Выполнить синхронную функцию работы с БД в пуле потоков БД"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(func, *args, **kwargs))
+
+
+def _make_async(method: Callable) -> Callable:
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        return await run_db(method, *args, **kwargs)
+    return wrapper
+
+
+def async_db(cls: type) -> type:
+    """
+    Асинхронная версия класса доступа к данным (ClientDB -> AsyncClientDB):
+    те же публичные методы, но каждый возвращает корутину.
+    """
+    namespace = {'__doc__': f"Асинхронные версии методов {cls.__name__}", 'sync': cls}
+    for name in dir(cls):
+        if name.startswith('_'):
+            continue
+        method = getattr(cls, name)
+        if callable(method):
+            namespace[name] = staticmethod(_make_async(method))
+    return type(f"Async{cls.__name__}", (), namespace)
+
+
+def shutdown_db_executor():
+    """Дождаться текущих запросов и остановить пул потоков (при остановке приложения)"""
+    _executor.shutdown(wait=True)
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+Пул соединений SQLite
+Соединения открываются один раз, настраиваются (WAL, synchronous, кэш, mmap,
+busy_timeout) и переиспользуются между запросами вместе с кэшем
+подготовленных выражений. Общий для API, Telegram-бота и AI-консультанта.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Сколько свободных соединений держать открытыми на один файл БД
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '8'))
+# Сколько мс ждать снятия блокировки записи, прежде чем вернуть "database is locked"
+DB_BUSY_TIMEOUT_MS = int(os.getenv('DB_BUSY_TIMEOUT_MS', '5000'))
+# Кэш подготовленных выражений на соединение
+DB_STATEMENT_CACHE = 256
+
+PRAGMAS = (
+    # Читатели не блокируют писателя и наоборот
+    "PRAGMA journal_mode=WAL",
+    # В режиме WAL NORMAL безопасен и не делает fsync на каждый коммит
+    "PRAGMA synchronous=NORMAL",
+    # Кэш страниц 20 МБ (отрицательное значение - в килобайтах)
+    "PRAGMA cache_size=-20000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA temp_store=MEMORY",
+    f"PRAGMA busy_timeout={DB_BUSY_TIMEOUT_MS}",
+)
+
+
+def _connect(path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(
+        path,
+        timeout=DB_BUSY_TIMEOUT_MS / 1000,
+        check_same_thread=False,  # соединение переходит между потоками пула, но используется одним за раз
+        cached_statements=DB_STATEMENT_CACHE,
+    )
+    conn.row_factory = sqlite3.Row
+    for pragma in PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+class ConnectionPool:
+    """
+    Пул соединений к одному файлу БД.
+
+    Свободные соединения лежат в стеке (последнее возвращённое берётся первым,
+    у него самый тёплый кэш). Если свободных нет, открывается новое соединение,
+    поэтому вложенные get_db() не могут заблокировать друг друга. Лишние
+    соединения сверх size закрываются при возврате.
+    """
+
+    def __init__(self, path: str, size: int = DB_POOL_SIZE):
+        self.path = path
+        self.size = size
+        self._idle: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    def acquire(self) -> sqlite3.Connection:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return _connect(self.path)
+
+    def release(self, conn: sqlite3.Connection):
+        try:
+            # Незавершённая транзакция не должна достаться следующему запросу
+            if conn.in_transaction:
+                conn.rollback()
+            conn.row_factory = sqlite3.Row
+        except sqlite3.Error as e:
+            logger.warning(f"Dropping broken SQLite connection: {e}")
+            conn.close()
+            return
+
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    @contextmanager
+    def connection(self):
+        """Соединение из пула: commit при успехе, rollback при ошибке"""
+        conn = self.acquire()
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self.release(conn)
+
+    def close_all(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+class PooledConnection:
+    """
+    Соединение из пула для кода в стиле conn = get_db() ... conn.close().
+    close() возвращает соединение в пул, остальное делегируется sqlite3.Connection.
+    """
+
+    __slots__ = ('_pool', '_conn')
+
+    def __init__(self, pool: ConnectionPool):
+        self._pool = pool
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn = pool.acquire()
+
+    def __getattr__(self, name):
+        if self._conn is None:
+            raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+        return getattr(self._conn, name)
+
+    def __enter__(self):
+        return self._conn.__enter__()
+
+    def __exit__(self, *exc):
+        return self._conn.__exit__(*exc)
+
+    def close(self):
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            self._pool.release(conn)
+
+    def __del__(self):
+        # Соединение, которое забыли закрыть (например, при исключении), тоже возвращается
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(path: str) -> ConnectionPool:
+    """Пул для файла БД (один на процесс)"""
+    path = os.path.abspath(path)
+    pool = _pools.get(path)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.setdefault(path, ConnectionPool(path))
+    return pool
+
+
+def close_all_pools():
+    """Закрыть свободные соединения всех пулов (при остановке приложения)"""
+    with _pools_lock:
+        pools = list(_pools.values())
+    for pool in pools:
+        pool.close_all()
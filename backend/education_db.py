@@ -131,10 +131,9 @@ class EducationDB:
 
     @staticmethod
     def init_tables(conn):
-        """Создать таблицы обучения"""
-        cursor = conn.cursor()
-        cursor.executescript(EDUCATION_TABLES_SQL)
-        conn.commit()
+        """Создать таблицы обучения (в транзакции вызывающего, см. migrations/0002_education.py)"""
+        from migrations import execute_script
+        execute_script(conn, EDUCATION_TABLES_SQL)
 
     # ========== КУРСЫ ==========
 
@@ -482,6 +481,25 @@ class EducationDB:
         conn.commit()
         return True
 
+    @staticmethod
+    def assign_certificate_number(conn, partner_id, course_id):
+        """
+        Номер сертификата за курс: выдаётся один раз, повторные и параллельные
+        вызовы получают уже записанный номер (COALESCE в одном UPDATE ... RETURNING)
+        """
+        from datetime import datetime
+        cert_num = f"CERT-{datetime.now().strftime('%Y%m%d')}-{partner_id}-{course_id}"
+        cursor = conn.cursor()
+        cursor.execute('''
+            UPDATE partner_course_progress
+            SET certificate_number = COALESCE(certificate_number, ?)
+            WHERE partner_id = ? AND course_id = ?
+            RETURNING certificate_number
+        ''', (cert_num, partner_id, course_id))
+        row = cursor.fetchone()
+        conn.commit()
+        return row['certificate_number'] if row else None
+
     # ========== ТЕСТЫ ПАРТНЁРА ==========
 
     @staticmethod
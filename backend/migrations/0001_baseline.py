@@ -0,0 +1,328 @@
+# -*- coding: utf-8 -*-
+"""
+Базовая схема: таблицы пользователей, CRM, документов, заявок и партнёров.
+Повторяет бывший init_database(), поэтому безопасна и для БД, созданных до
+появления миграций: таблицы создаются только если их нет, колонки добавляются
+только если их нет.
+"""
+
+from migrations import add_column
+
+
+def upgrade(conn):
+    # Таблица пользователей
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            email TEXT UNIQUE NOT NULL,
+            password_hash TEXT NOT NULL,
+            role TEXT DEFAULT 'client',  -- client, employee, superadmin
+            is_active BOOLEAN DEFAULT 1,
+            email_verified BOOLEAN DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # Таблица токенов верификации email
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS email_verifications (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            token TEXT UNIQUE NOT NULL,
+            expires_at TIMESTAMP NOT NULL,
+            used BOOLEAN DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users(id)
+        )
+    ''')
+
+    # Таблица токенов сброса пароля
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS password_resets (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            token TEXT UNIQUE NOT NULL,
+            expires_at TIMESTAMP NOT NULL,
+            used BOOLEAN DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users(id)
+        )
+    ''')
+
+    # Таблица компаний (клиентов)
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS companies (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER,  -- NULL если гостевой заказ
+            inn TEXT NOT NULL,
+            kpp TEXT,
+            ogrn TEXT,
+            name TEXT NOT NULL,
+            name_short TEXT,
+            name_full TEXT,
+            opf TEXT,
+            type TEXT,  -- LEGAL или INDIVIDUAL
+            address TEXT,
+            management_name TEXT,
+            management_post TEXT,
+            status TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users(id)
+        )
+    ''')
+
+    # Таблица КП (коммерческих предложений)
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS quotes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            quote_number TEXT UNIQUE NOT NULL,  -- КП-0001
+            user_id INTEGER,  -- NULL если гостевой (клиент)
+            manager_id INTEGER,  -- Менеджер, создавший КП
+            client_id INTEGER,  -- Клиент из CRM
+            company_id INTEGER,
+            services_json TEXT NOT NULL,  -- JSON с услугами
+            total_amount REAL NOT NULL,
+            contact_name TEXT,
+            contact_phone TEXT,
+            contact_email TEXT,
+            status TEXT DEFAULT 'draft',  -- draft, sent, approved, rejected
+            valid_until DATE,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users(id),
+            FOREIGN KEY (manager_id) REFERENCES users(id),
+            FOREIGN KEY (client_id) REFERENCES clients(id),
+            FOREIGN KEY (company_id) REFERENCES companies(id)
+        )
+    ''')
+
+    # Таблица договоров
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS contracts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            contract_number TEXT UNIQUE NOT NULL,  -- ДОГ-0001
+            quote_id INTEGER,  -- Связь с КП если есть
+            user_id INTEGER,  -- Клиент (пользователь)
+            manager_id INTEGER,  -- Менеджер, создавший договор
+            client_id INTEGER,  -- Клиент из CRM
+            company_id INTEGER NOT NULL,
+            services_json TEXT NOT NULL,
+            total_amount REAL NOT NULL,
+            status TEXT DEFAULT 'draft',  -- draft, signed, active, completed, cancelled
+            signed_at TIMESTAMP,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (quote_id) REFERENCES quotes(id),
+            FOREIGN KEY (user_id) REFERENCES users(id),
+            FOREIGN KEY (manager_id) REFERENCES users(id),
+            FOREIGN KEY (client_id) REFERENCES clients(id),
+            FOREIGN KEY (company_id) REFERENCES companies(id)
+        )
+    ''')
+
+    # Единый счётчик нумерации (КП и Договоры)
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS document_sequence (
+            doc_type TEXT NOT NULL,  -- 'quote' или 'contract'
+            year INTEGER NOT NULL,
+            last_number INTEGER DEFAULT 0,
+            PRIMARY KEY (doc_type, year)
+        )
+    ''')
+
+    # Старая таблица для обратной совместимости (можно удалить после миграции)
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS contract_sequence (
+            date_key TEXT PRIMARY KEY,  -- ДДММГГ
+            last_number INTEGER DEFAULT 0
+        )
+    ''')
+
+    # Таблица заявок на звонок
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS callbacks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER,
+            company_inn TEXT,
+            company_name TEXT,
+            contact_name TEXT NOT NULL,
+            contact_phone TEXT NOT NULL,
+            contact_email TEXT,
+            products_json TEXT,  -- JSON с проверенными товарами
+            comment TEXT,
+            source TEXT,  -- откуда пришла заявка: check_page, quote_page, contact_form
+            status TEXT DEFAULT 'new',  -- new, processing, completed, cancelled
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            processed_at TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users(id)
+        )
+    ''')
+
+    # Таблица счетов
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS invoices (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            invoice_number TEXT UNIQUE NOT NULL,  -- СЧЁТ-081225-001
+            contract_id INTEGER,
+            company_id INTEGER NOT NULL,
+            amount REAL NOT NULL,
+            status TEXT DEFAULT 'created',  -- created, sent, paid, cancelled
+            paid_at TIMESTAMP,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (contract_id) REFERENCES contracts(id),
+            FOREIGN KEY (company_id) REFERENCES companies(id)
+        )
+    ''')
+
+    # Таблица клиентов CRM (для менеджеров)
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS clients (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            inn TEXT,
+            kpp TEXT,
+            ogrn TEXT,
+            company_name TEXT,
+            company_type TEXT,  -- LEGAL или INDIVIDUAL
+            contact_name TEXT NOT NULL,
+            contact_phone TEXT NOT NULL,
+            contact_email TEXT,
+            contact_position TEXT,
+            address TEXT,
+            comment TEXT,
+            source TEXT DEFAULT 'manual',  -- website, manual, callback
+            status TEXT DEFAULT 'lead',  -- lead, active, regular, inactive
+            assigned_manager_id INTEGER,  -- менеджер
+            user_id INTEGER,  -- связь с зарегистрированным пользователем
+            products_json TEXT,  -- JSON с товарами клиента
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (assigned_manager_id) REFERENCES users(id),
+            FOREIGN KEY (user_id) REFERENCES users(id)
+        )
+    ''')
+
+    # Таблица истории взаимодействий с клиентами
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS client_interactions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            client_id INTEGER NOT NULL,
+            manager_id INTEGER NOT NULL,
+            type TEXT NOT NULL,  -- call, email, meeting, document_sent, quote_created, contract_created, note
+            subject TEXT,
+            description TEXT,
+            callback_id INTEGER,
+            quote_id INTEGER,
+            contract_id INTEGER,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (client_id) REFERENCES clients(id),
+            FOREIGN KEY (manager_id) REFERENCES users(id),
+            FOREIGN KEY (callback_id) REFERENCES callbacks(id),
+            FOREIGN KEY (quote_id) REFERENCES quotes(id),
+            FOREIGN KEY (contract_id) REFERENCES contracts(id)
+        )
+    ''')
+
+    # Таблица настроек уведомлений
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS notification_settings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            email TEXT NOT NULL,
+            is_active BOOLEAN DEFAULT 1,
+            notify_new_callback BOOLEAN DEFAULT 1,
+            notify_overdue BOOLEAN DEFAULT 1,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # Таблица системных настроек CRM
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS crm_settings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            key TEXT UNIQUE NOT NULL,
+            value TEXT NOT NULL,
+            description TEXT,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # Таблица партнёров
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS partners (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            ref_code TEXT UNIQUE NOT NULL,
+            commission_rate REAL DEFAULT 10.0,
+            partner_type TEXT NOT NULL,  -- 'legal' или 'individual'
+            inn TEXT,
+            company_name TEXT,
+            contact_name TEXT NOT NULL,
+            contact_phone TEXT NOT NULL,
+            contact_email TEXT NOT NULL,
+            status TEXT DEFAULT 'pending',  -- pending, active, inactive
+            created_by INTEGER,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users(id),
+            FOREIGN KEY (created_by) REFERENCES users(id)
+        )
+    ''')
+
+    # Колонки, добавленные в таблицы после их первого выпуска
+    for column, definition in (
+        ('email_verified', 'BOOLEAN DEFAULT 0'),
+        ('name', 'TEXT'),
+        ('phone', 'TEXT'),
+        ('inn', 'TEXT'),
+        ('company_name', 'TEXT'),
+        ('city', 'TEXT'),
+        ('region', 'TEXT'),
+        ('invitation_sent_at', 'TIMESTAMP'),  # отслеживание приглашений
+        ('last_login', 'TIMESTAMP'),
+        ('source', 'TEXT'),  # откуда узнали о нас
+    ):
+        add_column(conn, 'users', column, definition)
+
+    add_column(conn, 'quotes', 'manager_id', 'INTEGER')
+    add_column(conn, 'quotes', 'client_id', 'INTEGER REFERENCES clients(id)')
+    add_column(conn, 'quotes', 'partner_id', 'INTEGER REFERENCES partners(id)')
+    add_column(conn, 'quotes', 'ref_code', 'TEXT')
+
+    add_column(conn, 'contracts', 'manager_id', 'INTEGER')
+    add_column(conn, 'contracts', 'client_id', 'INTEGER REFERENCES clients(id)')
+    add_column(conn, 'contracts', 'partner_id', 'INTEGER REFERENCES partners(id)')
+
+    # ФИО генерального директора и город (используются ClientDB.create)
+    add_column(conn, 'clients', 'director_name', 'TEXT')
+    add_column(conn, 'clients', 'city', 'TEXT')
+
+    add_column(conn, 'callbacks', 'source', 'TEXT')
+    add_column(conn, 'callbacks', 'assigned_to', 'INTEGER REFERENCES users(id)')
+    add_column(conn, 'callbacks', 'client_id', 'INTEGER REFERENCES clients(id)')
+    add_column(conn, 'callbacks', 'priority', "TEXT DEFAULT 'normal'")
+    add_column(conn, 'callbacks', 'sla_deadline', 'TIMESTAMP')
+
+    # Настройки SLA по умолчанию
+    conn.execute('''
+        INSERT OR IGNORE INTO crm_settings (key, value, description)
+        VALUES ('sla_hours', '24', 'Время на обработку заявки в часах')
+    ''')
+
+    # Индексы для быстрого поиска
+    for index, table, columns in (
+        ('idx_companies_inn', 'companies', 'inn'),
+        ('idx_companies_user', 'companies', 'user_id'),
+        ('idx_quotes_user', 'quotes', 'user_id'),
+        ('idx_contracts_user', 'contracts', 'user_id'),
+        ('idx_contracts_company', 'contracts', 'company_id'),
+        ('idx_clients_inn', 'clients', 'inn'),
+        ('idx_clients_manager', 'clients', 'assigned_manager_id'),
+        ('idx_clients_status', 'clients', 'status'),
+        ('idx_interactions_client', 'client_interactions', 'client_id'),
+        ('idx_callbacks_assigned', 'callbacks', 'assigned_to'),
+        ('idx_callbacks_sla', 'callbacks', 'sla_deadline'),
+        ('idx_partners_user', 'partners', 'user_id'),
+        ('idx_partners_ref_code', 'partners', 'ref_code'),
+        ('idx_partners_status', 'partners', 'status'),
+        ('idx_quotes_partner', 'quotes', 'partner_id'),
+        ('idx_contracts_partner', 'contracts', 'partner_id'),
+    ):
+        conn.execute(f'CREATE INDEX IF NOT EXISTS {index} ON {table}({columns})')
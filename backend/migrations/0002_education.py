@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+"""
+Таблицы модуля обучения: курсы, главы, тесты, прогресс партнёров.
+"""
+
+from education_db import EducationDB
+
+
+def upgrade(conn):
+    EducationDB.init_tables(conn)
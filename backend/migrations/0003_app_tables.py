@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+Таблицы, с которыми работает код, но которые init_database() не создавал:
+задачи менеджеров, уведомления, лиды Telegram-бота и колонки счетов для
+услуг, менеджера и дополнительных счетов. На рабочем сервере они уже есть,
+там миграция ничего не меняет; в новой БД создаёт их до индексов и триггеров
+следующих миграций.
+"""
+
+from migrations import add_column
+
+
+def upgrade(conn):
+    # Задачи менеджеров
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS tasks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            description TEXT,
+            assigned_to INTEGER,
+            created_by INTEGER,
+            client_id INTEGER,
+            priority TEXT DEFAULT 'normal',  -- low, normal, high
+            status TEXT DEFAULT 'pending',  -- pending, in_progress, completed
+            due_date TIMESTAMP,
+            completed_at TIMESTAMP,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (assigned_to) REFERENCES users(id),
+            FOREIGN KEY (created_by) REFERENCES users(id),
+            FOREIGN KEY (client_id) REFERENCES clients(id)
+        )
+    ''')
+
+    # Уведомления: личные (user_id + user_type) и системные от суперадмина (target_role)
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS notifications (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER,
+            user_type TEXT,  -- employee, partner, client
+            type TEXT DEFAULT 'info',
+            title TEXT NOT NULL,
+            message TEXT,
+            link TEXT,
+            icon TEXT DEFAULT 'bell',
+            is_read BOOLEAN DEFAULT 0,
+            read_at TIMESTAMP,
+            target_role TEXT,
+            created_by INTEGER,
+            is_active BOOLEAN DEFAULT 1,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP
+        )
+    ''')
+
+    # Лиды Telegram-бота
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS telegram_leads (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            telegram_id INTEGER UNIQUE NOT NULL,
+            username TEXT,
+            first_name TEXT,
+            last_name TEXT,
+            phone TEXT,
+            client_type TEXT,
+            ref_code TEXT,  -- реферальный код партнёра
+            status TEXT DEFAULT 'new',  -- new, contacted, ...
+            notes TEXT,
+            assigned_to INTEGER,
+            subscribed BOOLEAN DEFAULT 1,
+            interested_categories TEXT,  -- JSON-массив категорий
+            last_query TEXT,
+            queries_count INTEGER DEFAULT 0,
+            last_activity TIMESTAMP,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (assigned_to) REFERENCES users(id)
+        )
+    ''')
+
+    # Счета: услуги, менеджер и дополнительные счета к договору
+    for column, definition in (
+        ('description', 'TEXT'),
+        ('services_json', 'TEXT'),
+        ('manager_id', 'INTEGER'),
+        ('client_name', 'TEXT'),
+        ('due_date', 'TIMESTAMP'),
+        ('is_additional', 'BOOLEAN DEFAULT 0'),
+        ('deleted_at', 'TIMESTAMP'),
+    ):
+        add_column(conn, 'invoices', column, definition)
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""
+Индексы под фильтры и сортировки дашбордов и списков CRM
+(найдены python query_advisor.py по полным сканам таблиц).
+"""
+
+from migrations import create_index
+
+
+def upgrade(conn):
+    for index, table, columns in (
+        # Заявки: фильтр по статусу с сортировкой по дате, счётчики за период
+        ('idx_callbacks_status_created', 'callbacks', 'status, created_at'),
+        ('idx_callbacks_created', 'callbacks', 'created_at'),
+        # КП и договоры в карточке клиента и статистике за период
+        ('idx_quotes_client', 'quotes', 'client_id'),
+        ('idx_quotes_created', 'quotes', 'created_at'),
+        # Статистика партнёра по реферальному коду
+        ('idx_quotes_ref_code', 'quotes', 'ref_code'),
+        ('idx_contracts_client', 'contracts', 'client_id'),
+        ('idx_contracts_quote', 'contracts', 'quote_id'),
+        ('idx_contracts_created', 'contracts', 'created_at'),
+        ('idx_clients_created', 'clients', 'created_at'),
+        ('idx_invoices_contract', 'invoices', 'contract_id'),
+        # Открытые задачи клиента
+        ('idx_tasks_client_status', 'tasks', 'client_id, status'),
+        # Лента уведомлений пользователя и счётчик непрочитанных
+        ('idx_notifications_user', 'notifications', 'user_id, user_type, is_read, created_at'),
+        # Бот: поиск лида по telegram_id, рефералы партнёра
+        ('idx_telegram_leads_telegram_id', 'telegram_leads', 'telegram_id'),
+        ('idx_telegram_leads_ref_code', 'telegram_leads', 'ref_code'),
+    ):
+        create_index(conn, index, table, columns)
@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+"""
+Индексы created_at для курсорной пагинации списков (pagination.py).
+Для callbacks, clients, quotes и contracts они уже созданы в 0004.
+"""
+
+from migrations import create_index
+
+
+def upgrade(conn):
+    for index, table in (
+        ('idx_invoices_created', 'invoices'),
+        ('idx_users_created', 'users'),
+        ('idx_telegram_leads_created', 'telegram_leads'),
+    ):
+        create_index(conn, index, table, 'created_at')
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+Полнотекстовый индекс глобального поиска (/api/search) на FTS5.
+Одна таблица search_index на клиентов, заявки, партнёров, договоры и КП:
+rowid = id записи * 8 + тип (1 - клиент, 2 - заявка, 3 - партнёр, 4 - договор, 5 - КП),
+title - названия/номер (вес выше), body - телефоны, ИНН, имя клиента документа.
+Телефоны и ИНН дополнительно индексируются всеми окончаниями цифр, поэтому
+префиксный запрос находит их по любой части номера, как прежний LIKE '%...%'.
+Токенизатор unicode61 сам приводит кириллицу и латиницу к нижнему регистру.
+Индекс поддерживается триггерами, текст договоров и КП обновляется при изменении клиента.
+"""
+
+from migrations import execute_script
+
+# Самый длинный номер, окончания которого индексируются (E.164 - до 15 цифр, ИНН - 12)
+MAX_DIGITS = 15
+
+
+def _digits(column: str) -> str:
+    """Номер только цифрами, чтобы "+7 (999) 123-45-67" находился и по 79991234567"""
+    expr = f"COALESCE({column}, '')"
+    for char in (' ', '(', ')', '-', '+', '.'):
+        expr = f"REPLACE({expr}, '{char}', '')"
+    return expr
+
+
+def _digit_suffixes(column: str) -> str:
+    """
+    Все окончания номера цифрами ("79991234567 9991234567 ... 67 7"): префикс
+    одного из окончаний - любая подстрока, поэтому "1234"* находит 79991234567
+    """
+    suffixes = " || ' ' || ".join(f"substr(digits, {start})" for start in range(1, MAX_DIGITS + 1))
+    return f"(SELECT {suffixes} FROM (SELECT {_digits(column)} AS digits))"
+
+
+def _text(*columns: str) -> str:
+    return " || ' ' || ".join(f"COALESCE({column}, '')" for column in columns)
+
+
+def _client_names(client_id: str) -> str:
+    return f"(SELECT {_text('company_name', 'contact_name')} FROM clients WHERE id = {client_id})"
+
+
+# таблица -> (тип, отслеживаемые колонки, title, body) в терминах строки {row}
+SOURCES = {
+    'clients': (
+        1, 'company_name, contact_name, contact_phone, inn',
+        _text('{row}.company_name', '{row}.contact_name'),
+        _text('{row}.contact_phone', '{row}.inn') + " || ' ' || " + _digit_suffixes('{row}.contact_phone')
+        + " || ' ' || " + _digit_suffixes('{row}.inn'),
+    ),
+    'callbacks': (
+        2, 'contact_name, company_name, contact_phone',
+        _text('{row}.contact_name', '{row}.company_name'),
+        _text('{row}.contact_phone') + " || ' ' || " + _digit_suffixes('{row}.contact_phone'),
+    ),
+    'partners': (
+        3, 'company_name, contact_name, contact_phone, inn',
+        _text('{row}.company_name', '{row}.contact_name'),
+        _text('{row}.contact_phone', '{row}.inn') + " || ' ' || " + _digit_suffixes('{row}.contact_phone')
+        + " || ' ' || " + _digit_suffixes('{row}.inn'),
+    ),
+    'contracts': (
+        4, 'contract_number, client_id',
+        _text('{row}.contract_number'),
+        f"COALESCE({_client_names('{row}.client_id')}, '')",
+    ),
+    'quotes': (
+        5, 'quote_number, client_id, contact_name',
+        _text('{row}.quote_number'),
+        f"COALESCE({_client_names('{row}.client_id')}, '') || ' ' || " + _text('{row}.contact_name'),
+    ),
+}
+
+
+def _insert(table: str, row: str, where: str = '') -> str:
+    kind, _, title, body = SOURCES[table]
+    return f'''
+        INSERT INTO search_index (rowid, title, body)
+        SELECT {row}.id * 8 + {kind}, {title.format(row=row)}, {body.format(row=row)}
+        FROM {table} {row} {where};'''
+
+
+def _delete(table: str, row: str) -> str:
+    kind = SOURCES[table][0]
+    return f'''
+        DELETE FROM search_index WHERE rowid = {row}.id * 8 + {kind};'''
+
+
+def _refresh_client_documents(client_id: str) -> str:
+    """Пересобрать строки договоров и КП клиента (в них входит имя клиента)"""
+    sql = ''
+    for table in ('contracts', 'quotes'):
+        kind = SOURCES[table][0]
+        sql += f'''
+        DELETE FROM search_index WHERE rowid IN (SELECT id * 8 + {kind} FROM {table} WHERE client_id = {client_id});'''
+        sql += _insert(table, 'd', f'WHERE d.client_id = {client_id}')
+    return sql
+
+
+def upgrade(conn):
+    conn.execute('''
+        CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5(
+            title, body, tokenize = 'unicode61'
+        )
+    ''')
+
+    script = ''
+    for table, (_, columns, _, _) in SOURCES.items():
+        extra_update = extra_delete = ''
+        if table == 'clients':
+            extra_update = _refresh_client_documents('new.id')
+            extra_delete = _refresh_client_documents('old.id')
+        script += f'''
+        CREATE TRIGGER IF NOT EXISTS search_{table}_ai AFTER INSERT ON {table} BEGIN
+            {_insert(table, 'r', 'WHERE r.id = new.id')}
+        END;
+        CREATE TRIGGER IF NOT EXISTS search_{table}_au AFTER UPDATE OF {columns} ON {table} BEGIN
+            {_delete(table, 'old')}{_insert(table, 'r', 'WHERE r.id = new.id')}{extra_update}
+        END;
+        CREATE TRIGGER IF NOT EXISTS search_{table}_ad AFTER DELETE ON {table} BEGIN
+            {_delete(table, 'old')}{extra_delete}
+        END;
+        '''
+    execute_script(conn, script)
+
+    # Заполнить индекс существующими записями
+    conn.execute('DELETE FROM search_index')
+    for table in SOURCES:
+        conn.execute(_insert(table, 'r'))
+    conn.execute("INSERT INTO search_index (search_index) VALUES ('optimize')")
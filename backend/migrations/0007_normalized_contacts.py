@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+Нормализованные контакты для поиска дублей (см. normalize.py):
+phone_e164 и email_lower в clients, partners, callbacks и telegram_leads
+заполняются триггерами при вставке/изменении и индексируются, заполнение
+существующих строк - здесь же. ИНН ищется по индексам inn / company_inn.
+"""
+
+from migrations import add_column, create_index, execute_script
+from normalize import email_lower_sql, phone_e164_sql
+
+# таблица -> (колонка телефона, колонка email или None)
+SOURCES = {
+    'clients': ('contact_phone', 'contact_email'),
+    'partners': ('contact_phone', 'contact_email'),
+    'callbacks': ('contact_phone', 'contact_email'),
+    'telegram_leads': ('phone', None),
+}
+
+
+def upgrade(conn):
+    for table, (phone_column, email_column) in SOURCES.items():
+        add_column(conn, table, 'phone_e164', 'TEXT')
+        assignments = [f'phone_e164 = {phone_e164_sql(phone_column)}']
+        watched = [phone_column]
+        if email_column:
+            add_column(conn, table, 'email_lower', 'TEXT')
+            assignments.append(f'email_lower = {email_lower_sql(email_column)}')
+            watched.append(email_column)
+        # Колонки без префикса в UPDATE ... WHERE id = new.id - это колонки самой новой строки
+        assignments_sql = ', '.join(assignments)
+
+        execute_script(conn, f'''
+            CREATE TRIGGER IF NOT EXISTS normalize_{table}_ai AFTER INSERT ON {table} BEGIN
+                UPDATE {table} SET {assignments_sql} WHERE id = new.id;
+            END;
+            CREATE TRIGGER IF NOT EXISTS normalize_{table}_au AFTER UPDATE OF {', '.join(watched)} ON {table} BEGIN
+                UPDATE {table} SET {assignments_sql} WHERE id = new.id;
+            END;
+        ''')
+
+        # Заполнить существующие строки
+        conn.execute(f'UPDATE {table} SET {assignments_sql}')
+
+        create_index(conn, f'idx_{table}_phone_e164', table, 'phone_e164')
+        if email_column:
+            create_index(conn, f'idx_{table}_email_lower', table, 'email_lower')
+
+    create_index(conn, 'idx_partners_inn', 'partners', 'inn')
+    create_index(conn, 'idx_callbacks_company_inn', 'callbacks', 'company_inn')
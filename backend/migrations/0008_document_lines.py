@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+Строки документов (услуги из services_json КП, договоров и счетов) в таблице
+document_lines. Разбор JSON делает SQLite (JSON1, json_each) в триггерах при
+вставке и изменении документа, поэтому спискам не нужно парсить services_json,
+а отчёты по услугам считаются агрегатами SQL.
+"""
+
+from migrations import add_column, create_index, execute_script
+
+# таблица документа -> doc_type в document_lines
+SOURCES = {
+    'quotes': 'quote',
+    'contracts': 'contract',
+    'invoices': 'invoice',
+}
+
+
+def _insert_lines(table: str, doc_type: str, row: str) -> str:
+    """Строки документа {row} (new или строка таблицы) из его services_json"""
+    json_sql = f"{row}.services_json"
+    return f'''
+        INSERT INTO document_lines (doc_type, doc_id, position, service_id, name, unit, price, quantity, subtotal)
+        SELECT '{doc_type}', {row}.id, CAST(j.key AS INTEGER),
+               json_extract(j.value, '$.id'),
+               json_extract(j.value, '$.name'),
+               json_extract(j.value, '$.unit'),
+               COALESCE(json_extract(j.value, '$.price'), 0),
+               COALESCE(json_extract(j.value, '$.quantity'), 1),
+               COALESCE(json_extract(j.value, '$.subtotal'),
+                        COALESCE(json_extract(j.value, '$.price'), 0) * COALESCE(json_extract(j.value, '$.quantity'), 1))
+        FROM {table} {row}, json_each(
+            CASE WHEN json_valid({json_sql}) AND json_type({json_sql}) = 'array' THEN {json_sql} ELSE '[]' END
+        ) j
+        WHERE j.type = 'object' '''
+
+
+def upgrade(conn):
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS document_lines (
+            doc_type TEXT NOT NULL,  -- quote, contract, invoice
+            doc_id INTEGER NOT NULL,
+            position INTEGER NOT NULL,  -- индекс в services_json
+            service_id TEXT,
+            name TEXT,
+            unit TEXT,
+            price REAL NOT NULL DEFAULT 0,
+            quantity REAL NOT NULL DEFAULT 1,
+            subtotal REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY (doc_type, doc_id, position)
+        ) WITHOUT ROWID
+    ''')
+
+    # services_json у счетов init_database() не создавал (его добавляет 0003)
+    add_column(conn, 'invoices', 'services_json', 'TEXT')
+
+    script = ''
+    for table, doc_type in SOURCES.items():
+        delete_sql = f"DELETE FROM document_lines WHERE doc_type = '{doc_type}' AND doc_id = old.id;"
+        insert_sql = _insert_lines(table, doc_type, 'd') + ' AND d.id = new.id;'
+        script += f'''
+        CREATE TRIGGER IF NOT EXISTS lines_{table}_ai AFTER INSERT ON {table} BEGIN
+            {insert_sql}
+        END;
+        CREATE TRIGGER IF NOT EXISTS lines_{table}_au AFTER UPDATE OF services_json ON {table} BEGIN
+            {delete_sql}
+            {insert_sql}
+        END;
+        CREATE TRIGGER IF NOT EXISTS lines_{table}_ad AFTER DELETE ON {table} BEGIN
+            {delete_sql}
+        END;
+        '''
+    execute_script(conn, script)
+
+    # Разобрать services_json уже созданных документов
+    conn.execute('DELETE FROM document_lines')
+    for table, doc_type in SOURCES.items():
+        conn.execute(_insert_lines(table, doc_type, 'd'))
+
+    create_index(conn, 'idx_document_lines_service', 'document_lines', 'service_id')
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""
+Дневные агрегаты для дашборда суперадмина (/api/superadmin/stats).
+daily_metrics хранит количество и сумму записей по дню создания, сущности,
+статусу, менеджеру и источнику (у заявок). Триггеры на вставку, изменение и
+удаление переносят запись из старой группы в новую, поэтому счётчики всегда
+совпадают с таблицами, а дашборд за любой период - одно чтение агрегатов.
+"""
+
+from migrations import create_index, execute_script
+
+# таблица -> (сущность, статус, менеджер, источник, сумма) в терминах строки {row}
+SOURCES = {
+    'callbacks': ('callback', '{row}.status', '{row}.assigned_to', '{row}.source', '0'),
+    'clients': ('client', '{row}.status', '{row}.assigned_manager_id', "''", '0'),
+    'quotes': ('quote', '{row}.status', '{row}.manager_id', "''", '{row}.total_amount'),
+    'contracts': ('contract', '{row}.status', '{row}.manager_id', "''", '{row}.total_amount'),
+    'partners': ('partner', '{row}.status', '0', "''", '0'),
+    'users': ('user', "CASE WHEN {row}.is_active THEN 'active' ELSE 'inactive' END", '0', "''", '0'),
+}
+
+# Колонки, изменение которых переносит запись в другую группу
+WATCHED = {
+    'callbacks': 'created_at, status, assigned_to, source',
+    'clients': 'created_at, status, assigned_manager_id',
+    'quotes': 'created_at, status, manager_id, total_amount',
+    'contracts': 'created_at, status, manager_id, total_amount',
+    'partners': 'created_at, status',
+    'users': 'created_at, is_active',
+}
+
+UPSERT = '''
+    ON CONFLICT (day, entity, status, manager_id, source) DO UPDATE SET
+        count = count + excluded.count,
+        amount = amount + excluded.amount'''
+
+
+def _group(table: str, row: str) -> str:
+    """day, entity, status, manager_id, source строки {row}"""
+    entity, status, manager, source, _ = SOURCES[table]
+    return (f"COALESCE(date({row}.created_at), ''), '{entity}', "
+            f"COALESCE({status.format(row=row)}, ''), COALESCE({manager.format(row=row)}, 0), "
+            f"COALESCE({source.format(row=row)}, '')")
+
+
+def _apply(table: str, row: str, sign: str) -> str:
+    """Добавить (sign='+') или вычесть (sign='-') строку {row} из её группы"""
+    amount = SOURCES[table][4].format(row=row)
+    return f'''
+        INSERT INTO daily_metrics (day, entity, status, manager_id, source, count, amount)
+        VALUES ({_group(table, row)}, {sign}1, {sign}COALESCE({amount}, 0)){UPSERT};'''
+
+
+def upgrade(conn):
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS daily_metrics (
+            day TEXT NOT NULL,  -- YYYY-MM-DD по created_at (UTC), '' если даты нет
+            entity TEXT NOT NULL,  -- callback, client, quote, contract, partner, user
+            status TEXT NOT NULL DEFAULT '',
+            manager_id INTEGER NOT NULL DEFAULT 0,  -- 0 - без менеджера
+            source TEXT NOT NULL DEFAULT '',  -- источник заявки
+            count INTEGER NOT NULL DEFAULT 0,
+            amount REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY (day, entity, status, manager_id, source)
+        ) WITHOUT ROWID
+    ''')
+
+    script = ''
+    for table in SOURCES:
+        script += f'''
+        CREATE TRIGGER IF NOT EXISTS metrics_{table}_ai AFTER INSERT ON {table} BEGIN
+            {_apply(table, 'new', '+')}
+        END;
+        CREATE TRIGGER IF NOT EXISTS metrics_{table}_au AFTER UPDATE OF {WATCHED[table]} ON {table} BEGIN
+            {_apply(table, 'old', '-')}
+            {_apply(table, 'new', '+')}
+        END;
+        CREATE TRIGGER IF NOT EXISTS metrics_{table}_ad AFTER DELETE ON {table} BEGIN
+            {_apply(table, 'old', '-')}
+        END;
+        '''
+    execute_script(conn, script)
+
+    # Посчитать агрегаты по существующим записям
+    conn.execute('DELETE FROM daily_metrics')
+    for table in SOURCES:
+        amount = SOURCES[table][4].format(row='r')
+        conn.execute(f'''
+            INSERT INTO daily_metrics (day, entity, status, manager_id, source, count, amount)
+            SELECT {_group(table, 'r')}, COUNT(*), COALESCE(SUM({amount}), 0)
+            FROM {table} r
+            GROUP BY 1, 2, 3, 4, 5
+        ''')
+
+    create_index(conn, 'idx_daily_metrics_manager', 'daily_metrics', 'manager_id')
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+Категории интересов лидов Telegram-бота отдельными строками (lead_id, category).
+Их пишет update_lead_query в telegram_bot.py вместе с interested_categories,
+поэтому топ категорий в статистике бота - агрегат по индексу, без разбора
+JSON каждого лида. При удалении лида его категории удаляет триггер.
+"""
+
+from migrations import create_index, execute_script
+
+
+def upgrade(conn):
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS telegram_lead_categories (
+            category TEXT NOT NULL,
+            lead_id INTEGER NOT NULL,  -- telegram_leads.id
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (category, lead_id)
+        ) WITHOUT ROWID
+    ''')
+    create_index(conn, 'idx_telegram_lead_categories_lead', 'telegram_lead_categories', 'lead_id')
+
+    execute_script(conn, '''
+        CREATE TRIGGER IF NOT EXISTS telegram_lead_categories_ad AFTER DELETE ON telegram_leads BEGIN
+            DELETE FROM telegram_lead_categories WHERE lead_id = old.id;
+        END;
+    ''')
+
+    # Разобрать interested_categories существующих лидов
+    conn.execute('''
+        INSERT OR IGNORE INTO telegram_lead_categories (category, lead_id)
+        SELECT j.value, l.id
+        FROM telegram_leads l, json_each(
+            CASE WHEN json_valid(l.interested_categories) AND json_type(l.interested_categories) = 'array'
+                 THEN l.interested_categories ELSE '[]' END
+        ) j
+        WHERE j.type = 'text'
+    ''')
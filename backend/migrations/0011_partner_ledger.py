@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+Журнал партнёра partner_ledger (см. partner_ledger.py): строка на каждое КП
+партнёра с выбранным договором, статусом оплаты и посчитанной комиссией.
+Триггеры на quotes, contracts и partners пересчитывают затронутые КП, поэтому
+кабинет партнёра и бот получают итоги одним агрегатом по индексу partner_id.
+"""
+
+from migrations import create_index, execute_script
+from partner_ledger import ledger_rows_sql
+
+COLUMNS = ('quote_id, partner_id, quote_status, quote_amount, contract_id, contract_status, '
+           'contract_amount, payment_status, commission_rate, commission, created_at')
+
+
+def _refresh(where: str, key: str) -> str:
+    """Пересчитать строки журнала КП, у которых {key} совпадает с where"""
+    return f'''
+            DELETE FROM partner_ledger WHERE {key};
+            INSERT INTO partner_ledger ({COLUMNS}){ledger_rows_sql(where)};'''
+
+
+def _refresh_quote(quote_id: str) -> str:
+    return _refresh(f'q.id = {quote_id}', f'quote_id = {quote_id}')
+
+
+def upgrade(conn):
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS partner_ledger (
+            quote_id INTEGER PRIMARY KEY,  -- quotes.id
+            partner_id INTEGER NOT NULL,
+            quote_status TEXT,
+            quote_amount REAL NOT NULL DEFAULT 0,
+            contract_id INTEGER,  -- оплаченный или последний договор по КП
+            contract_status TEXT,
+            contract_amount REAL,
+            payment_status TEXT NOT NULL,  -- paid, pending, not_paid
+            commission_rate REAL NOT NULL,
+            commission REAL NOT NULL DEFAULT 0,
+            created_at TIMESTAMP
+        )
+    ''')
+    create_index(conn, 'idx_partner_ledger_partner', 'partner_ledger', 'partner_id, created_at')
+
+    execute_script(conn, f'''
+        CREATE TRIGGER IF NOT EXISTS ledger_quotes_ai AFTER INSERT ON quotes
+        WHEN new.partner_id IS NOT NULL BEGIN
+            {_refresh_quote('new.id')}
+        END;
+        CREATE TRIGGER IF NOT EXISTS ledger_quotes_au
+        AFTER UPDATE OF partner_id, status, total_amount, created_at ON quotes BEGIN
+            {_refresh_quote('new.id')}
+        END;
+        CREATE TRIGGER IF NOT EXISTS ledger_quotes_ad AFTER DELETE ON quotes BEGIN
+            DELETE FROM partner_ledger WHERE quote_id = old.id;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS ledger_contracts_ai AFTER INSERT ON contracts
+        WHEN new.quote_id IS NOT NULL BEGIN
+            {_refresh_quote('new.quote_id')}
+        END;
+        CREATE TRIGGER IF NOT EXISTS ledger_contracts_au
+        AFTER UPDATE OF quote_id, status, total_amount ON contracts BEGIN
+            {_refresh_quote('old.quote_id')}
+            {_refresh_quote('new.quote_id')}
+        END;
+        CREATE TRIGGER IF NOT EXISTS ledger_contracts_ad AFTER DELETE ON contracts
+        WHEN old.quote_id IS NOT NULL BEGIN
+            {_refresh_quote('old.quote_id')}
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS ledger_partners_au AFTER UPDATE OF commission_rate ON partners BEGIN
+            {_refresh('q.partner_id = new.id', 'partner_id = new.id')}
+        END;
+        CREATE TRIGGER IF NOT EXISTS ledger_partners_ad AFTER DELETE ON partners BEGIN
+            {_refresh('q.partner_id = old.id', 'partner_id = old.id')}
+        END;
+    ''')
+
+    # Заполнить журнал по существующим КП партнёров
+    conn.execute('DELETE FROM partner_ledger')
+    conn.execute(f'INSERT INTO partner_ledger ({COLUMNS}){ledger_rows_sql("1")}')
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+Версионные миграции схемы БД
+Миграции лежат в этой папке файлами NNNN_название.py и содержат функцию upgrade(conn).
+Миграции отдельной БД AI-консультанта - в подпапке ai/.
+Применённые версии записываются в таблицу schema_version, каждая миграция
+выполняется один раз в своей транзакции (BEGIN IMMEDIATE), поэтому несколько
+воркеров, стартующих одновременно, применят её ровно один раз.
+На старте при актуальной схеме выполняется только один SELECT.
+"""
+
+import importlib.util
+import logging
+import os
+import re
+import sqlite3
+from typing import List, Tuple
+
+from db_pool import DB_BUSY_TIMEOUT_MS
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_DIR = os.path.dirname(os.path.abspath(__file__))
+AI_MIGRATIONS_DIR = os.path.join(MIGRATIONS_DIR, 'ai')
+_MIGRATION_FILE_RE = re.compile(r'^(\d{4})_(\w+)\.py$')
+
+# Сколько мс ждать, пока миграции применяет другой воркер
+MIGRATION_LOCK_TIMEOUT_MS = 60000
+
+
+def discover_migrations(directory: str = MIGRATIONS_DIR) -> List[Tuple[int, str, str]]:
+    """Список (версия, название, путь) в порядке версий"""
+    migrations = []
+    for filename in os.listdir(directory):
+        match = _MIGRATION_FILE_RE.match(filename)
+        if match:
+            migrations.append((int(match.group(1)), match.group(2), os.path.join(directory, filename)))
+    migrations.sort()
+
+    versions = [version for version, _, _ in migrations]
+    if len(versions) != len(set(versions)):
+        raise RuntimeError(f"Duplicate migration versions in {directory}")
+    return migrations
+
+
+def _load_upgrade(version: int, name: str, path: str):
+    package = os.path.basename(os.path.dirname(path))
+    spec = importlib.util.spec_from_file_location(f"{package}.m{version:04d}_{name}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.upgrade
+
+
+def current_version(conn: sqlite3.Connection) -> int:
+    row = conn.execute('SELECT MAX(version) FROM schema_version').fetchone()
+    return row[0] or 0
+
+
+def run_migrations(conn: sqlite3.Connection, directory: str = MIGRATIONS_DIR) -> List[int]:
+    """Применить недостающие миграции. Возвращает список применённых версий."""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    conn.commit()
+
+    migrations = discover_migrations(directory)
+    if not migrations or current_version(conn) >= migrations[-1][0]:
+        return []
+
+    applied = []
+    conn.execute(f'PRAGMA busy_timeout={MIGRATION_LOCK_TIMEOUT_MS}')
+    try:
+        for version, name, path in migrations:
+            upgrade = _load_upgrade(version, name, path)
+            # Блокировка записи берётся до проверки версии: параллельный воркер
+            # дождётся окончания миграции и увидит её уже применённой
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                if conn.execute('SELECT 1 FROM schema_version WHERE version = ?', (version,)).fetchone():
+                    conn.rollback()
+                    continue
+                upgrade(conn)
+                conn.execute('INSERT INTO schema_version (version, name) VALUES (?, ?)', (version, name))
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                logger.exception(f"Migration {version:04d}_{name} failed")
+                raise
+            logger.info(f"Applied migration {version:04d}_{name}")
+            applied.append(version)
+    finally:
+        conn.execute(f'PRAGMA busy_timeout={DB_BUSY_TIMEOUT_MS}')
+    return applied
+
+
+# ======================== ХЕЛПЕРЫ ДЛЯ МИГРАЦИЙ ========================
+
+def column_exists(conn: sqlite3.Connection, table: str, column: str) -> bool:
+    return any(row[1] == column for row in conn.execute(f'PRAGMA table_info({table})'))
+
+
+def table_exists(conn: sqlite3.Connection, table: str) -> bool:
+    row = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)).fetchone()
+    return row is not None
+
+
+def create_index(conn: sqlite3.Connection, name: str, table: str, columns: str):
+    """
+    CREATE INDEX IF NOT EXISTS. Если таблицы или колонок нет, миграция падает
+    и её версия не записывается: схема не должна молча расходиться с ожидаемой.
+    """
+    if not table_exists(conn, table):
+        raise RuntimeError(f"Index {name}: table {table} does not exist")
+    missing = [column.strip() for column in columns.split(',') if not column_exists(conn, table, column.strip())]
+    if missing:
+        raise RuntimeError(f"Index {name}: {table} has no columns {', '.join(missing)}")
+    conn.execute(f'CREATE INDEX IF NOT EXISTS {name} ON {table}({columns})')
+
+
+def add_column(conn: sqlite3.Connection, table: str, column: str, definition: str):
+    """ALTER TABLE ... ADD COLUMN, если такой колонки ещё нет"""
+    if not column_exists(conn, table, column):
+        conn.execute(f'ALTER TABLE {table} ADD COLUMN {column} {definition}')
+
+
+def execute_script(conn: sqlite3.Connection, script: str):
+    """
+    Выполнить несколько SQL-выражений внутри текущей транзакции
+    (в отличие от executescript, который делает COMMIT перед выполнением)
+    """
+    statement = ''
+    for line in script.splitlines(keepends=True):
+        statement += line
+        if sqlite3.complete_statement(statement):
+            conn.execute(statement)
+            statement = ''
+    leftover = [line for line in statement.splitlines() if line.strip() and not line.strip().startswith('--')]
+    if leftover:
+        raise ValueError(f"Incomplete SQL statement: {leftover[0][:100]}")
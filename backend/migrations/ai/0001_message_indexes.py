@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+"""
+Индекс истории диалога AI-консультанта: сообщения беседы в порядке времени.
+"""
+
+from migrations import create_index
+
+
+def upgrade(conn):
+    create_index(conn, 'idx_ai_messages_conversation', 'ai_messages', 'conversation_id, created_at')
@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+"""
+Индекс расходов AI-консультанта по времени: графики стоимости токенов
+(/api/superadmin/stats/series) и расход за день.
+"""
+
+from migrations import create_index
+
+
+def upgrade(conn):
+    create_index(conn, 'idx_ai_token_usage_created', 'ai_token_usage', 'created_at')
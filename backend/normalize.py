@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+Нормализация контактов для поиска дублей
+Телефон приводится к E.164 (+79991234567), email - к нижнему регистру.
+Нормализованные значения хранятся в колонках phone_e164 / email_lower
+(clients, partners, callbacks, telegram_leads), которые заполняют триггеры
+из migrations/0007_normalized_contacts.py по SQL-выражениям ниже.
+Python- и SQL-версии должны давать одинаковый результат.
+"""
+
+import re
+import string
+from typing import Optional
+
+_NON_DIGITS_RE = re.compile(r'\D+')
+# LOWER() в SQLite меняет регистр только у ASCII, здесь так же
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+# Символы форматирования телефона, которые убирает SQL-версия
+_PHONE_FORMAT_CHARS = (' ', '(', ')', '-', '+', '.')
+
+
+def normalize_phone(phone: Optional[str]) -> Optional[str]:
+    """
+    Телефон в формате E.164: "8 (999) 123-45-67" -> "+79991234567".
+    Российские номера из 10 цифр и 11 цифр с 7/8 приводятся к +7.
+    Пустой или нераспознанный телефон -> None.
+    """
+    if not phone:
+        return None
+    digits = str(phone)
+    for char in _PHONE_FORMAT_CHARS:
+        digits = digits.replace(char, '')
+    if not digits or not digits.isdigit() or not digits.isascii():
+        return None
+    if len(digits) == 11 and digits[0] in '78':
+        return '+7' + digits[1:]
+    if len(digits) == 10:
+        return '+7' + digits
+    return '+' + digits
+
+
+def normalize_email(email: Optional[str]) -> Optional[str]:
+    """Email для сравнения: без пробелов по краям, в нижнем регистре"""
+    if not email or not email.strip(' '):
+        return None
+    return email.strip(' ').translate(_ASCII_LOWER)
+
+
+def normalize_inn(inn: Optional[str]) -> Optional[str]:
+    """ИНН только цифрами"""
+    if not inn:
+        return None
+    return _NON_DIGITS_RE.sub('', str(inn)) or None
+
+
+# ======================== SQL-ВЕРСИИ ДЛЯ ТРИГГЕРОВ ========================
+
+def phone_e164_sql(column: str) -> str:
+    """SQL-выражение normalize_phone(column)"""
+    digits = column
+    for char in _PHONE_FORMAT_CHARS:
+        digits = f"REPLACE({digits}, '{char}', '')"
+    return f'''(SELECT CASE
+        WHEN d IS NULL OR d = '' OR d GLOB '*[^0-9]*' THEN NULL
+        WHEN length(d) = 11 AND substr(d, 1, 1) IN ('7', '8') THEN '+7' || substr(d, 2)
+        WHEN length(d) = 10 THEN '+7' || d
+        ELSE '+' || d
+    END FROM (SELECT {digits} AS d))'''
+
+
+def email_lower_sql(column: str) -> str:
+    """SQL-выражение normalize_email(column)"""
+    return f"NULLIF(LOWER(TRIM({column})), '')"
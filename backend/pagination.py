@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+Курсорная (keyset) пагинация списков CRM
+Списки сортируются по (created_at DESC, id DESC). Курсор - непрозрачная строка
+с (created_at, id) последней записи страницы; следующая страница выбирается
+условием "строго после курсора" по индексу created_at, поэтому время запроса
+не зависит от номера страницы, в отличие от OFFSET.
+
+Ответ списка: {"<записи>": [...], "next_cursor": "..." | None}.
+Без cursor и limit эндпоинты отдают весь список, как раньше.
+"""
+
+import base64
+import json
+import sqlite3
+from typing import Any, List, Optional, Sequence, Tuple
+
+# Размер страницы, если передан только cursor
+DEFAULT_PAGE_LIMIT = 50
+MAX_PAGE_LIMIT = 500
+
+
+class InvalidCursor(ValueError):
+    """Курсор повреждён или получен не от этого API"""
+
+
+def encode_cursor(created_at: Any, row_id: int) -> str:
+    raw = json.dumps([created_at, row_id], separators=(',', ':'), default=str)
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        created_at, row_id = json.loads(raw)
+    except (ValueError, TypeError) as e:
+        raise InvalidCursor(f"Invalid cursor: {cursor!r}") from e
+    if not isinstance(row_id, int) or not isinstance(created_at, (str, type(None))):
+        raise InvalidCursor(f"Invalid cursor: {cursor!r}")
+    return created_at, row_id
+
+
+def page_limit(cursor: Optional[str], limit: Optional[int]) -> Optional[int]:
+    """Размер страницы: None - весь список (нет ни cursor, ни limit)"""
+    if limit is None:
+        return DEFAULT_PAGE_LIMIT if cursor else None
+    return max(1, min(int(limit), MAX_PAGE_LIMIT))
+
+
+def keyset_clause(cursor: Optional[str], alias: str = '') -> Tuple[str, List[Any]]:
+    """
+    Условие "после курсора" для WHERE (с ведущим ' AND ') и его параметры.
+    alias - префикс таблицы в запросе ('q.' для FROM quotes q).
+    Сравнение кортежей (created_at, id) < (?, ?) SQLite выполняет поиском
+    по индексу created_at (id - rowid, он уже есть в индексе).
+    """
+    if not cursor:
+        return '', []
+    created_at, row_id = decode_cursor(cursor)
+    if created_at is None:
+        # Записи без даты идут в конце списка, дальше - только по id
+        return f' AND {alias}created_at IS NULL AND {alias}id < ?', [row_id]
+    return f' AND ({alias}created_at, {alias}id) < (?, ?)', [created_at, row_id]
+
+
+def fetch_page(cursor: sqlite3.Cursor, query: str, params: Sequence[Any],
+               page_cursor: Optional[str] = None, limit: Optional[int] = None,
+               alias: str = '') -> Tuple[List[sqlite3.Row], Optional[str]]:
+    """
+    Выполнить запрос списка одной страницей.
+    query - SELECT ... WHERE ... без ORDER BY/LIMIT: условие курсора, сортировка
+    и LIMIT добавляются здесь. В выборке должны быть created_at и id таблицы.
+    Возвращает (строки, next_cursor).
+    """
+    order_sql = f' ORDER BY {alias}created_at DESC, {alias}id DESC'
+    limit = page_limit(page_cursor, limit)
+    if limit is None:
+        return cursor.execute(query + order_sql, params).fetchall(), None
+
+    # Одна лишняя строка показывает, есть ли следующая страница
+    clause, clause_params = keyset_clause(page_cursor, alias)
+    dated = not page_cursor or decode_cursor(page_cursor)[0] is not None
+    if not clause:
+        clause = f' AND {alias}created_at IS NOT NULL'
+    rows = cursor.execute(f'{query}{clause}{order_sql} LIMIT ?',
+                          list(params) + clause_params + [limit + 1]).fetchall()
+    if dated and len(rows) <= limit:
+        # Записи с датой закончились - дочитываем записи без даты
+        rows += cursor.execute(f'{query} AND {alias}created_at IS NULL{order_sql} LIMIT ?',
+                               list(params) + [limit + 1 - len(rows)]).fetchall()
+
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(last['created_at'], last['id'])
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+Журнал партнёра (таблица partner_ledger)
+Одна строка на КП партнёра: договор по нему, статус оплаты и готовая комиссия.
+Строки пересчитывают триггеры из migrations/0011_partner_ledger.py при изменении
+КП, договоров и ставки партнёра по SQL-выражению ledger_rows_sql() ниже.
+Кабинет партнёра (PartnerDB) и Telegram-бот читают журнал одними и теми же
+запросами get_totals() / get_leads() на своём соединении.
+"""
+
+import sqlite3
+from typing import Dict, List, Optional
+
+# Договор по КП в этих статусах считается оплаченным
+PAID_CONTRACT_STATUSES = ('signed', 'active', 'completed')
+# Ставка комиссии, если у партнёра она не задана, %
+DEFAULT_COMMISSION_RATE = 10
+
+STATUS_LABELS = {
+    'draft': 'Черновик',
+    'sent': 'Отправлено',
+    'viewed': 'Просмотрено',
+    'approved': 'Одобрено',
+    'rejected': 'Отклонено',
+    'expired': 'Истекло',
+}
+
+_PAID_SQL = ', '.join(f"'{status}'" for status in PAID_CONTRACT_STATUSES)
+
+
+def ledger_rows_sql(where: str) -> str:
+    """
+    SELECT строк журнала для КП партнёров, подходящих под where (q - quotes).
+    По КП берётся оплаченный договор, а если его нет - последний.
+    Комиссия оплаченного КП считается от суммы договора (без суммы - от суммы КП),
+    ожидаемая и неоплаченная - от суммы КП: черновик договора её не меняет.
+    """
+    rate = f'COALESCE(p.commission_rate, {DEFAULT_COMMISSION_RATE})'
+    return f'''
+        SELECT q.id, q.partner_id, q.status, COALESCE(q.total_amount, 0),
+               c.id, c.status, c.total_amount,
+               CASE
+                   WHEN c.status IN ({_PAID_SQL}) THEN 'paid'
+                   WHEN q.status = 'approved' THEN 'pending'
+                   ELSE 'not_paid'
+               END,
+               {rate},
+               CASE
+                   WHEN c.status IN ({_PAID_SQL})
+                   THEN COALESCE(NULLIF(c.total_amount, 0), NULLIF(q.total_amount, 0), 0)
+                   ELSE COALESCE(q.total_amount, 0)
+               END * {rate} / 100,
+               q.created_at
+        FROM quotes q
+        LEFT JOIN partners p ON p.id = q.partner_id
+        LEFT JOIN contracts c ON c.id = (
+            SELECT id FROM contracts
+            WHERE quote_id = q.id
+            ORDER BY status IN ({_PAID_SQL}) DESC, id DESC
+            LIMIT 1
+        )
+        WHERE q.partner_id IS NOT NULL AND {where}'''
+
+
+def get_totals(conn: sqlite3.Connection, partner_id: int) -> Optional[Dict]:
+    """Итоги партнёра по журналу; None, если партнёра нет"""
+    cursor = conn.cursor()
+    cursor.execute(f'''
+        SELECT
+            COALESCE(p.commission_rate, {DEFAULT_COMMISSION_RATE}) as commission_rate,
+            COUNT(l.quote_id) as total_leads,
+            COALESCE(SUM(l.quote_amount), 0) as quotes_amount,
+            COALESCE(SUM(l.quote_status = 'approved'), 0) as approved_quotes,
+            COALESCE(SUM(l.payment_status = 'paid'), 0) as total_contracts,
+            COALESCE(SUM(CASE WHEN l.payment_status = 'paid' THEN l.contract_amount END), 0) as paid_amount,
+            COALESCE(SUM(CASE WHEN l.payment_status = 'paid' THEN l.commission END), 0) as commission_earned,
+            COALESCE(SUM(CASE WHEN l.payment_status = 'pending' THEN l.commission END), 0) as commission_pending
+        FROM partners p
+        LEFT JOIN partner_ledger l ON l.partner_id = p.id
+        WHERE p.id = ?
+        GROUP BY p.id
+    ''', (partner_id,))
+    row = cursor.fetchone()
+    return dict(row) if row else None
+
+
+def get_leads(conn: sqlite3.Connection, partner_id: int, limit: Optional[int] = None) -> List[Dict]:
+    """КП партнёра с оплатой и комиссией, новые первыми"""
+    labels_sql = ' '.join(f"WHEN '{status}' THEN '{label}'" for status, label in STATUS_LABELS.items())
+    query = f'''
+        SELECT
+            l.quote_id as id,
+            q.quote_number,
+            l.quote_amount as total_amount,
+            l.quote_status,
+            l.quote_status as status,
+            CASE l.quote_status {labels_sql} ELSE l.quote_status END as status_label,
+            l.created_at,
+            q.contact_name,
+            q.contact_phone,
+            comp.name as company_name,
+            comp.inn as company_inn,
+            l.contract_status,
+            l.contract_amount,
+            m.name as manager_name,
+            m.email as manager_email,
+            l.commission_rate,
+            l.payment_status,
+            l.payment_status = 'paid' as is_paid,
+            l.commission
+        FROM partner_ledger l
+        JOIN quotes q ON q.id = l.quote_id
+        LEFT JOIN companies comp ON comp.id = q.company_id
+        LEFT JOIN users m ON m.id = q.manager_id
+        WHERE l.partner_id = ?
+        ORDER BY l.created_at DESC, l.quote_id DESC
+    '''
+    params: List = [partner_id]
+    if limit is not None:
+        query += ' LIMIT ?'
+        params.append(limit)
+
+    cursor = conn.cursor()
+    cursor.execute(query, params)
+    return [{**dict(row), 'is_paid': bool(row['is_paid'])} for row in cursor.fetchall()]
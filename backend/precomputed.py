@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+Заранее сериализованные ответы для статичных эндпоинтов справочника
+JSON кодируется и сжимается один раз на версию данных, дальше отдаются готовые байты
+Поддерживаются ETag / If-None-Match (ответ 304) и Accept-Encoding (br, gzip)
+Сборка тела для новой версии (JSON + сжатие) идёт в пуле потоков, а не в event loop
+"""
+
+import gzip
+import hashlib
+import json
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from fastapi import Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response
+
+try:
+    import brotli
+except ImportError:  # brotli необязателен, без него отдаём gzip
+    brotli = None
+
+# Браузер всегда перепроверяет ответ, но при совпадении ETag получает 304 без тела
+CACHE_CONTROL = "public, no-cache"
+# Ответы меньше этого размера не сжимаем
+MIN_COMPRESS_BYTES = 1024
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+
+class PrecomputedPayload:
+    """Готовое тело ответа в нескольких кодировках с общим ETag"""
+
+    __slots__ = ('key', 'etag', 'bodies')
+
+    def __init__(self, key: Hashable, payload: Any):
+        self.key = key
+        raw = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        self.etag = hashlib.sha256(raw).hexdigest()[:32]
+        self.bodies: Dict[str, bytes] = {'identity': raw}
+        if len(raw) >= MIN_COMPRESS_BYTES:
+            self.bodies['gzip'] = gzip.compress(raw, compresslevel=GZIP_LEVEL, mtime=0)
+            if brotli is not None:
+                self.bodies['br'] = brotli.compress(raw, quality=BROTLI_QUALITY)
+
+    def choose_encoding(self, accept_encoding: str) -> str:
+        """Лучшая кодировка из поддерживаемых клиентом"""
+        accepted = set()
+        for part in accept_encoding.lower().split(','):
+            name, _, params = part.strip().partition(';')
+            if params.replace(' ', '') in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000'):
+                continue
+            accepted.add(name.strip())
+        for encoding in ('br', 'gzip'):
+            if encoding in self.bodies and (encoding in accepted or '*' in accepted):
+                return encoding
+        return 'identity'
+
+    def etag_for(self, encoding: str) -> str:
+        # Сильный ETag обязан различаться для разных кодировок тела
+        if encoding == 'identity':
+            return f'"{self.etag}"'
+        return f'"{self.etag}-{encoding}"'
+
+    def matches(self, if_none_match: str) -> bool:
+        """Совпадает ли If-None-Match с этим телом (в любой кодировке)"""
+        for tag in if_none_match.split(','):
+            tag = tag.strip()
+            if tag == '*':
+                return True
+            if tag.startswith('W/'):
+                tag = tag[2:]
+            tag = tag.strip('"')
+            if tag.split('-', 1)[0] == self.etag:
+                return True
+        return False
+
+    def response(self, request: Request) -> Response:
+        encoding = self.choose_encoding(request.headers.get('accept-encoding', ''))
+        headers = {
+            'ETag': self.etag_for(encoding),
+            'Cache-Control': CACHE_CONTROL,
+            'Vary': 'Accept-Encoding',
+        }
+        if encoding != 'identity':
+            headers['Content-Encoding'] = encoding
+
+        if_none_match = request.headers.get('if-none-match')
+        if if_none_match and self.matches(if_none_match):
+            return Response(status_code=304, headers=headers)
+        return Response(content=self.bodies[encoding], media_type='application/json', headers=headers)
+
+
+_payloads: Dict[str, PrecomputedPayload] = {}
+_payloads_lock = threading.Lock()
+
+
+def get_precomputed(name: str, key: Hashable, build: Callable[[], Any]) -> PrecomputedPayload:
+    """
+    Готовый ответ name для версии данных key.
+    build() вызывается только при смене key (новая версия справочника, новый день и т.п.)
+    """
+    cached: Optional[PrecomputedPayload] = _payloads.get(name)
+    if cached is not None and cached.key == key:
+        return cached
+
+    with _payloads_lock:
+        cached = _payloads.get(name)
+        if cached is None or cached.key != key:
+            cached = PrecomputedPayload(key, build())
+            _payloads[name] = cached
+        return cached
+
+
+async def precomputed_response(request: Request, name: str, key: Hashable, build: Callable[[], Any]) -> Response:
+    """Ответ из кэша готовых тел с учётом If-None-Match и Accept-Encoding"""
+    cached: Optional[PrecomputedPayload] = _payloads.get(name)
+    if cached is None or cached.key != key:
+        cached = await run_in_threadpool(get_precomputed, name, key, build)
+    return cached.response(request)
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+Проверка планов выполнения основных SQL-запросов приложения
+Для каждого запроса из реестра выполняется EXPLAIN QUERY PLAN, полные сканы
+таблиц без индекса выводятся как ошибки, сортировки через временное B-дерево - как предупреждения.
+
+Запуск перед деплоем (код возврата 1, если есть полные сканы):
+    python query_advisor.py [путь к БД] [--ai путь к БД AI-консультанта]
+Новый запрос на горячем пути - добавить в QUERIES / AI_QUERIES,
+а нужный индекс - миграцией в migrations/.
+"""
+
+import os
+import re
+import sqlite3
+import sys
+from typing import List, NamedTuple, Tuple
+
+# Тот же файл, что database.DB_PATH (без импорта database, чтобы не запускать миграции)
+DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'promarkirui.db')
+
+
+class Query(NamedTuple):
+    name: str
+    sql: str
+    # Полный скан ожидаем (маленькая таблица или выгрузка всего списка)
+    allow_scan: bool = False
+
+
+QUERIES = [
+    # Заявки на звонок
+    Query('callbacks_by_status', "SELECT * FROM callbacks WHERE status = ? ORDER BY created_at DESC"),
+    Query('callbacks_new_count', "SELECT COUNT(*) FROM callbacks WHERE status = 'new'"),
+    Query('callbacks_period', "SELECT COUNT(*) FROM callbacks WHERE created_at >= ? AND created_at < ?"),
+    Query('callbacks_assigned', "SELECT * FROM callbacks WHERE assigned_to = ?"),
+    Query('callbacks_overdue', "SELECT * FROM callbacks WHERE sla_deadline < ? AND status IN ('new', 'processing')"),
+    Query('callbacks_all', "SELECT * FROM callbacks ORDER BY created_at DESC", allow_scan=True),
+
+    # Клиенты CRM
+    Query('clients_by_manager', "SELECT * FROM clients WHERE assigned_manager_id = ?"),
+    Query('clients_by_inn', "SELECT id FROM clients WHERE inn = ?"),
+    Query('clients_by_phone', "SELECT id FROM clients WHERE phone_e164 = ?"),
+    Query('clients_by_email', "SELECT id FROM clients WHERE email_lower = ?"),
+    Query('clients_period', "SELECT COUNT(*) FROM clients WHERE created_at >= ? AND created_at < ?"),
+    Query('interactions_by_client', "SELECT * FROM client_interactions WHERE client_id = ? ORDER BY created_at DESC"),
+    Query('tasks_open_by_client', "SELECT COUNT(*) FROM tasks WHERE client_id = ? AND status != 'completed'"),
+
+    # КП, договоры, счета
+    Query('quotes_by_client', "SELECT COUNT(*), COALESCE(SUM(total_amount), 0) FROM quotes WHERE client_id = ?"),
+    Query('quotes_by_user', "SELECT * FROM quotes WHERE user_id = ? ORDER BY created_at DESC"),
+    Query('quotes_by_ref_code', "SELECT COUNT(*) FROM quotes WHERE ref_code = ?"),
+    Query('quotes_period', "SELECT COUNT(*) FROM quotes WHERE created_at >= ? AND created_at < ?"),
+    Query('contracts_by_client', "SELECT COUNT(*), COALESCE(SUM(total_amount), 0) FROM contracts WHERE client_id = ?"),
+    Query('contracts_by_quote', "SELECT q.id FROM quotes q JOIN contracts c ON c.quote_id = q.id WHERE q.id = ?"),
+    Query('contracts_period', "SELECT COUNT(*) FROM contracts WHERE created_at >= ? AND created_at < ?"),
+    Query('invoices_by_contract', "SELECT * FROM invoices WHERE contract_id = ?"),
+    Query('document_lines_by_doc', "SELECT COUNT(*) FROM document_lines WHERE doc_type = ? AND doc_id = ?"),
+    Query('document_lines_by_service', "SELECT * FROM document_lines WHERE service_id = ?"),
+
+    # Страницы списков CRM по курсору (pagination.py)
+    Query('clients_page', "SELECT * FROM clients WHERE (created_at, id) < (?, ?) ORDER BY created_at DESC, id DESC LIMIT ?"),
+    Query('callbacks_page', "SELECT * FROM callbacks WHERE (created_at, id) < (?, ?) ORDER BY created_at DESC, id DESC LIMIT ?"),
+    Query('quotes_page', "SELECT * FROM quotes WHERE (created_at, id) < (?, ?) ORDER BY created_at DESC, id DESC LIMIT ?"),
+    Query('contracts_page', "SELECT * FROM contracts WHERE (created_at, id) < (?, ?) ORDER BY created_at DESC, id DESC LIMIT ?"),
+    Query('invoices_page', "SELECT * FROM invoices WHERE (created_at, id) < (?, ?) ORDER BY created_at DESC, id DESC LIMIT ?"),
+    Query('users_page', "SELECT * FROM users WHERE (created_at, id) < (?, ?) ORDER BY created_at DESC, id DESC LIMIT ?"),
+    Query('telegram_leads_page', "SELECT * FROM telegram_leads WHERE (created_at, id) < (?, ?) ORDER BY created_at DESC, id DESC LIMIT ?"),
+
+    # Дневные агрегаты дашборда (маленькая таблица, читается целиком)
+    Query('daily_metrics_totals', "SELECT entity, status, source, SUM(count) FROM daily_metrics GROUP BY entity, status, source", allow_scan=True),
+    Query('daily_metrics_by_manager', "SELECT entity, SUM(count) FROM daily_metrics WHERE manager_id = ? GROUP BY entity"),
+    Query('daily_metrics_series', "SELECT day, entity, SUM(count) FROM daily_metrics WHERE day >= ? AND day < ? GROUP BY 1, 2"),
+
+    # Партнёры
+    Query('partner_by_user', "SELECT * FROM partners WHERE user_id = ?"),
+    Query('partner_by_ref_code', "SELECT * FROM partners WHERE ref_code = ?"),
+    Query('partner_by_phone', "SELECT * FROM partners WHERE phone_e164 = ? AND status = 'active'"),
+
+    # Уведомления
+    Query('notifications_feed', """
+        SELECT id, type, title, message, link, icon, is_read, created_at
+        FROM notifications WHERE user_id = ? AND user_type = ?
+        ORDER BY created_at DESC LIMIT ?
+    """),
+    Query('notifications_unread', "SELECT COUNT(*) FROM notifications WHERE user_id = ? AND user_type = ? AND is_read = 0"),
+
+    # Telegram-бот
+    Query('telegram_lead_by_telegram_id', "SELECT id FROM telegram_leads WHERE telegram_id = ?"),
+    Query('telegram_leads_by_ref_code', "SELECT COUNT(*) FROM telegram_leads WHERE ref_code = ?"),
+    Query('telegram_lead_by_phone', "SELECT telegram_id FROM telegram_leads WHERE phone_e164 = ? ORDER BY created_at DESC LIMIT 1"),
+    Query('telegram_top_categories', "SELECT category, COUNT(*) FROM telegram_lead_categories GROUP BY category", allow_scan=True),
+    Query('partner_ledger_totals', "SELECT COUNT(l.quote_id), SUM(l.commission) FROM partners p LEFT JOIN partner_ledger l ON l.partner_id = p.id WHERE p.id = ? GROUP BY p.id"),
+    Query('partner_ledger_leads', "SELECT l.quote_id FROM partner_ledger l JOIN quotes q ON q.id = l.quote_id WHERE l.partner_id = ? ORDER BY l.created_at DESC, l.quote_id DESC"),
+    Query('partner_ledger_refresh_by_partner', "SELECT id FROM quotes WHERE partner_id = ?"),
+]
+
+AI_QUERIES = [
+    Query('ai_messages_history', "SELECT role, content FROM ai_messages WHERE conversation_id = ? ORDER BY created_at"),
+    Query('ai_token_usage_period', "SELECT SUM(cost_usd) FROM ai_token_usage WHERE created_at >= ? AND created_at < ?"),
+]
+
+_FULL_SCAN_RE = re.compile(r'^SCAN (\w+)(?! USING)')
+
+
+def explain(conn: sqlite3.Connection, query: Query) -> Tuple[str, List[str]]:
+    """
+    План запроса: ('ok' | 'scan' | 'skip', сообщения).
+    Параметры запроса подставляются как NULL - на выбор индекса это не влияет.
+    """
+    try:
+        rows = conn.execute(f'EXPLAIN QUERY PLAN {query.sql}', [None] * query.sql.count('?')).fetchall()
+    except sqlite3.OperationalError as e:
+        return 'skip', [str(e)]
+
+    status, messages = 'ok', []
+    for row in rows:
+        detail = row[-1]
+        if _FULL_SCAN_RE.match(detail) and not query.allow_scan:
+            status = 'scan'
+            messages.append(f"full scan: {detail}")
+        elif 'USE TEMP B-TREE' in detail:
+            messages.append(f"warning: {detail}")
+    return status, messages
+
+
+def check_database(path: str, queries: List[Query]) -> int:
+    """Проверить запросы на БД path, вернуть количество запросов с полным сканом"""
+    conn = sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+    scans = 0
+    try:
+        for query in queries:
+            status, messages = explain(conn, query)
+            scans += status == 'scan'
+            print(f"{status.upper():5} {query.name}")
+            for message in messages:
+                print(f"      {message}")
+    finally:
+        conn.close()
+    return scans
+
+
+def main(argv: List[str]) -> int:
+    args = list(argv)
+    ai_path = None
+    if '--ai' in args:
+        idx = args.index('--ai')
+        ai_path = args[idx + 1] if idx + 1 < len(args) else None
+        del args[idx:idx + 2]
+    path = args[0] if args else DB_PATH
+
+    print(f"== {path}")
+    scans = check_database(path, QUERIES)
+    if ai_path:
+        print(f"== {ai_path}")
+        scans += check_database(ai_path, AI_QUERIES)
+
+    print(f"\n{scans} queries with full table scans" if scans else "\nNo full table scans")
+    return 1 if scans else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
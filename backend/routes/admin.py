@@ -22,6 +22,9 @@ from auth import (
     
 )
 from database import get_db, UserDB, PartnerDB
+from db_async import run_db
+from pagination import fetch_page
+from stats_cache import cached_stats, invalidate_stats
 from education_db import EducationDB
 from email_service import send_staff_invitation_email, send_password_reset_email
 
@@ -114,24 +117,16 @@ class BroadcastRequest(BaseModel):
 @router.get("/api/admin/users")
 async def get_users(
     role: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
     current_user: Dict = Depends(require_admin)
 ):
-    """Получить список пользователей"""
-    users = UserDB.get_all()
-    
-    if role:
-        users = [u for u in users if u.get('role') == role]
-    
-    # Скрываем пароли
-    for user in users:
-        if 'password' in user:
-            del user['password']
-    
-    return {"users": users}
+    """Получить список пользователей (постранично: cursor/limit)"""
+    return await run_db(UserDB.get_all, role=role, cursor=cursor, limit=limit)
 
 
 @router.post("/api/admin/users")
-async def create_user(
+def create_user(
     data: UserCreateRequest,
     background_tasks: BackgroundTasks,
     current_user: Dict = Depends(require_admin)
@@ -178,7 +173,7 @@ async def create_user(
 
 
 @router.post("/api/admin/users/{user_id}/send-invitation")
-async def resend_user_invitation(
+def resend_user_invitation(
     user_id: int,
     background_tasks: BackgroundTasks,
     current_user: Dict = Depends(require_admin)
@@ -209,7 +204,7 @@ async def resend_user_invitation(
 
 
 @router.put("/api/admin/users/{user_id}")
-async def update_user(
+def update_user(
     user_id: int,
     data: UserUpdateRequest,
     current_user: Dict = Depends(require_admin)
@@ -238,7 +233,7 @@ async def update_user(
 
 
 @router.delete("/api/admin/users/{user_id}")
-async def delete_user(
+def delete_user(
     user_id: int,
     current_user: Dict = Depends(require_admin)
 ):
@@ -264,7 +259,7 @@ async def delete_user(
 # ======================== SUPERADMIN SETTINGS ========================
 
 @router.get("/api/superadmin/settings")
-async def get_settings(current_user: Dict = Depends(require_superadmin)):
+def get_settings(current_user: Dict = Depends(require_superadmin)):
     """Получить системные настройки"""
     with get_db() as conn:
         cursor = conn.cursor()
@@ -275,7 +270,7 @@ async def get_settings(current_user: Dict = Depends(require_superadmin)):
 
 
 @router.put("/api/superadmin/settings/{key}")
-async def update_setting(
+def update_setting(
     key: str,
     data: SettingUpdateRequest,
     current_user: Dict = Depends(require_superadmin)
@@ -297,7 +292,7 @@ async def update_setting(
 # ======================== NOTIFICATIONS ========================
 
 @router.get("/api/superadmin/notifications")
-async def get_notifications(current_user: Dict = Depends(require_superadmin)):
+def get_notifications(current_user: Dict = Depends(require_superadmin)):
     """Получить список системных уведомлений"""
     with get_db() as conn:
         cursor = conn.cursor()
@@ -308,7 +303,7 @@ async def get_notifications(current_user: Dict = Depends(require_superadmin)):
 
 
 @router.post("/api/superadmin/notifications")
-async def create_notification(
+def create_notification(
     data: NotificationCreateRequest,
     current_user: Dict = Depends(require_superadmin)
 ):
@@ -327,7 +322,7 @@ async def create_notification(
 
 
 @router.put("/api/superadmin/notifications/{notification_id}")
-async def update_notification(
+def update_notification(
     notification_id: int,
     data: NotificationUpdateRequest,
     current_user: Dict = Depends(require_superadmin)
@@ -357,7 +352,7 @@ async def update_notification(
 
 
 @router.delete("/api/superadmin/notifications/{notification_id}")
-async def delete_notification(
+def delete_notification(
     notification_id: int,
     current_user: Dict = Depends(require_superadmin)
 ):
@@ -375,7 +370,7 @@ async def delete_notification(
 # ======================== CALLBACK ASSIGNMENT ========================
 
 @router.put("/api/superadmin/callbacks/{callback_id}/assign")
-async def assign_callback(
+def assign_callback(
     callback_id: int,
     data: CallbackAssignRequest,
     current_user: Dict = Depends(require_superadmin)
@@ -402,6 +397,7 @@ async def assign_callback(
             WHERE id = ?
         """, (data.manager_id, datetime.now().isoformat(), callback_id))
     
+    invalidate_stats()
     logger.info(f"Callback {callback_id} assigned to {data.manager_id} by {current_user.get('email')}")
     
     return {"success": True}
@@ -412,13 +408,16 @@ async def assign_callback(
 @router.get("/api/admin/education/stats")
 async def get_education_stats(user: Dict = Depends(require_admin)):
     """Статистика по обучению"""
-    with get_db() as conn:
-        stats = EducationDB.get_education_stats(conn)
-        # Добавляем дополнительные поля для совместимости с фронтендом
-        stats['partners_in_progress'] = stats.get('partners_learning', 0)
-        stats['certificates_issued'] = stats.get('partners_completed', 0)
-        stats['avg_completion_rate'] = stats.get('average_progress', 0)
-        return stats
+    def load_stats():
+        with get_db() as conn:
+            stats = EducationDB.get_education_stats(conn)
+            # Добавляем дополнительные поля для совместимости с фронтендом
+            stats['partners_in_progress'] = stats.get('partners_learning', 0)
+            stats['certificates_issued'] = stats.get('partners_completed', 0)
+            stats['avg_completion_rate'] = stats.get('average_progress', 0)
+            return stats
+
+    return await cached_stats(("education_stats",), load_stats)
 
 
 @router.get("/api/admin/education/progress")
@@ -427,38 +426,41 @@ async def get_partners_progress(
     user: Dict = Depends(require_admin)
 ):
     """Получить прогресс партнёров по курсам"""
-    with get_db() as conn:
-        cursor = conn.cursor()
-        
-        query = """
-            SELECT 
-                p.id, p.contact_name, p.contact_email,
-                c.id as course_id, c.title as course_title,
-                COUNT(ch.id) as total_chapters,
-                SUM(CASE WHEN cp.status = 'completed' THEN 1 ELSE 0 END) as completed_chapters,
-                ROUND(CAST(SUM(CASE WHEN cp.status = 'completed' THEN 1 ELSE 0 END) AS FLOAT) / COUNT(ch.id) * 100, 2) as progress_percent
-            FROM partners p
-            INNER JOIN partner_course_access pca ON p.id = pca.partner_id
-            INNER JOIN courses c ON pca.course_id = c.id
-            LEFT JOIN chapters ch ON c.id = ch.course_id
-            LEFT JOIN chapter_progress cp ON ch.id = cp.chapter_id AND p.id = cp.partner_id
-        """
+    # Агрегация по всем партнёрам и главам тяжёлая - выполняем вне event loop
+    def load_progress():
+        with get_db() as conn:
+            cursor = conn.cursor()
         
-        params = []
-        if course_id:
-            query += " WHERE c.id = ?"
-            params.append(course_id)
+            query = """
+                SELECT 
+                    p.id, p.contact_name, p.contact_email,
+                    c.id as course_id, c.title as course_title,
+                    COUNT(ch.id) as total_chapters,
+                    SUM(CASE WHEN cp.status = 'completed' THEN 1 ELSE 0 END) as completed_chapters,
+                    ROUND(CAST(SUM(CASE WHEN cp.status = 'completed' THEN 1 ELSE 0 END) AS FLOAT) / COUNT(ch.id) * 100, 2) as progress_percent
+                FROM partners p
+                INNER JOIN partner_course_access pca ON p.id = pca.partner_id
+                INNER JOIN courses c ON pca.course_id = c.id
+                LEFT JOIN chapters ch ON c.id = ch.course_id
+                LEFT JOIN chapter_progress cp ON ch.id = cp.chapter_id AND p.id = cp.partner_id
+            """
         
-        query += " GROUP BY p.id, c.id ORDER BY p.contact_name, c.title"
+            params = []
+            if course_id:
+                query += " WHERE c.id = ?"
+                params.append(course_id)
         
-        cursor.execute(query, params)
-        progress = [dict(row) for row in cursor.fetchall()]
+            query += " GROUP BY p.id, c.id ORDER BY p.contact_name, c.title"
         
-        return {"progress": progress}
+            cursor.execute(query, params)
+            return [dict(row) for row in cursor.fetchall()]
+
+    progress = await run_db(load_progress)
+    return {"progress": progress}
 
 
 @router.get("/api/admin/education/courses")
-async def get_courses(user: Dict = Depends(require_admin)):
+def get_courses(user: Dict = Depends(require_admin)):
     """Получить список курсов"""
     with get_db() as conn:
         courses = EducationDB.get_all_courses(conn)
@@ -466,7 +468,7 @@ async def get_courses(user: Dict = Depends(require_admin)):
 
 
 @router.post("/api/admin/education/courses")
-async def create_course(data: CourseCreateRequest, user: Dict = Depends(require_admin)):
+def create_course(data: CourseCreateRequest, user: Dict = Depends(require_admin)):
     """Создать курс"""
     with get_db() as conn:
         course_id = EducationDB.create_course(conn, data.dict())
@@ -475,7 +477,7 @@ async def create_course(data: CourseCreateRequest, user: Dict = Depends(require_
 
 
 @router.put("/api/admin/education/courses/{course_id}")
-async def update_course(
+def update_course(
     course_id: int,
     data: CourseUpdateRequest,
     user: Dict = Depends(require_admin)
@@ -489,7 +491,7 @@ async def update_course(
 
 
 @router.delete("/api/admin/education/courses/{course_id}")
-async def delete_course(course_id: int, user: Dict = Depends(require_admin)):
+def delete_course(course_id: int, user: Dict = Depends(require_admin)):
     """Удалить курс"""
     with get_db() as conn:
         success = EducationDB.delete_course(conn, course_id)
@@ -499,7 +501,7 @@ async def delete_course(course_id: int, user: Dict = Depends(require_admin)):
 
 
 @router.get("/api/admin/education/courses/{course_id}/chapters")
-async def get_course_chapters(course_id: int, user: Dict = Depends(require_admin)):
+def get_course_chapters(course_id: int, user: Dict = Depends(require_admin)):
     """Получить главы курса"""
     with get_db() as conn:
         chapters = EducationDB.get_course_chapters(conn, course_id)
@@ -507,7 +509,7 @@ async def get_course_chapters(course_id: int, user: Dict = Depends(require_admin
 
 
 @router.post("/api/admin/education/courses/{course_id}/chapters")
-async def create_chapter(
+def create_chapter(
     course_id: int,
     data: ChapterCreateRequest,
     user: Dict = Depends(require_admin)
@@ -521,7 +523,7 @@ async def create_chapter(
 
 
 @router.put("/api/admin/education/chapters/{chapter_id}")
-async def update_chapter(
+def update_chapter(
     chapter_id: int,
     data: ChapterUpdateRequest,
     user: Dict = Depends(require_admin)
@@ -535,7 +537,7 @@ async def update_chapter(
 
 
 @router.delete("/api/admin/education/chapters/{chapter_id}")
-async def delete_chapter(chapter_id: int, user: Dict = Depends(require_admin)):
+def delete_chapter(chapter_id: int, user: Dict = Depends(require_admin)):
     """Удалить главу"""
     with get_db() as conn:
         success = EducationDB.delete_chapter(conn, chapter_id)
@@ -545,7 +547,7 @@ async def delete_chapter(chapter_id: int, user: Dict = Depends(require_admin)):
 
 
 @router.post("/api/admin/education/grant-access")
-async def grant_course_access(data: GrantAccessRequest, user: Dict = Depends(require_admin)):
+def grant_course_access(data: GrantAccessRequest, user: Dict = Depends(require_admin)):
     """Предоставить доступ к курсу"""
     with get_db() as conn:
         success = EducationDB.grant_access(conn, data.partner_id, data.course_id)
@@ -555,7 +557,7 @@ async def grant_course_access(data: GrantAccessRequest, user: Dict = Depends(req
 
 
 @router.delete("/api/admin/education/access/{partner_id}/{course_id}")
-async def revoke_course_access(
+def revoke_course_access(
     partner_id: int,
     course_id: int,
     user: Dict = Depends(require_admin)
@@ -569,7 +571,7 @@ async def revoke_course_access(
 
 
 @router.get("/api/admin/education/courses/{course_id}/access")
-async def get_course_access(course_id: int, user: Dict = Depends(require_admin)):
+def get_course_access(course_id: int, user: Dict = Depends(require_admin)):
     """Получить список партнёров с доступом к курсу"""
     with get_db() as conn:
         cursor = conn.cursor()
@@ -585,7 +587,7 @@ async def get_course_access(course_id: int, user: Dict = Depends(require_admin))
 
 
 @router.post("/api/admin/education/courses/{course_id}/grant-all")
-async def grant_course_to_all(course_id: int, user: Dict = Depends(require_admin)):
+def grant_course_to_all(course_id: int, user: Dict = Depends(require_admin)):
     """Предоставить доступ к курсу всем активным партнёрам"""
     with get_db() as conn:
         cursor = conn.cursor()
@@ -606,14 +608,14 @@ async def grant_course_to_all(course_id: int, user: Dict = Depends(require_admin
 # ======================== TELEGRAM LEADS ========================
 
 @router.get("/api/admin/telegram-leads")
-async def get_telegram_leads(
+def get_telegram_leads(
     status: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
     user: Dict = Depends(require_admin)
 ):
-    """Получить лиды из Telegram"""
+    """Получить лиды из Telegram (постранично: cursor/limit)"""
     with get_db() as conn:
-        cursor = conn.cursor()
-        
         query = "SELECT * FROM telegram_leads WHERE 1=1"
         params = []
         
@@ -621,16 +623,14 @@ async def get_telegram_leads(
             query += " AND status = ?"
             params.append(status)
         
-        query += " ORDER BY created_at DESC"
+        rows, next_cursor = fetch_page(conn.cursor(), query, params, cursor, limit)
+        leads = [dict(row) for row in rows]
         
-        cursor.execute(query, params)
-        leads = [dict(row) for row in cursor.fetchall()]
-        
-        return {"leads": leads}
+        return {"leads": leads, "next_cursor": next_cursor}
 
 
 @router.get("/api/admin/telegram-leads/{lead_id}")
-async def get_telegram_lead(lead_id: int, user: Dict = Depends(require_admin)):
+def get_telegram_lead(lead_id: int, user: Dict = Depends(require_admin)):
     """Получить лид из Telegram"""
     with get_db() as conn:
         cursor = conn.cursor()
@@ -644,7 +644,7 @@ async def get_telegram_lead(lead_id: int, user: Dict = Depends(require_admin)):
 
 
 @router.put("/api/admin/telegram-leads/{lead_id}")
-async def update_telegram_lead(
+def update_telegram_lead(
     lead_id: int,
     data: TelegramLeadUpdateRequest,
     user: Dict = Depends(require_admin)
@@ -673,7 +673,7 @@ async def update_telegram_lead(
 
 
 @router.delete("/api/admin/telegram-leads/{lead_id}")
-async def delete_telegram_lead(lead_id: int, user: Dict = Depends(require_admin)):
+def delete_telegram_lead(lead_id: int, user: Dict = Depends(require_admin)):
     """Удалить лид из Telegram"""
     with get_db() as conn:
         cursor = conn.cursor()
@@ -708,30 +708,44 @@ async def send_telegram_broadcast(
 @router.get("/api/admin/telegram-stats")
 async def get_telegram_stats(user: Dict = Depends(require_admin)):
     """Получить статистику Telegram бота"""
-    with get_db() as conn:
-        cursor = conn.cursor()
+    def load_stats():
+        with get_db() as conn:
+            cursor = conn.cursor()
         
-        # Общее количество пользователей
-        cursor.execute("SELECT COUNT(*) FROM telegram_users")
-        total_users = cursor.fetchone()[0]
+            # Общее количество пользователей
+            cursor.execute("SELECT COUNT(*) FROM telegram_users")
+            total_users = cursor.fetchone()[0]
         
-        # Активные пользователи (были активны за последние 30 дней)
-        cursor.execute("""
-            SELECT COUNT(*) FROM telegram_users 
-            WHERE last_activity > datetime('now', '-30 days')
-        """)
-        active_users = cursor.fetchone()[0]
+            # Активные пользователи (были активны за последние 30 дней)
+            cursor.execute("""
+                SELECT COUNT(*) FROM telegram_users 
+                WHERE last_activity > datetime('now', '-30 days')
+            """)
+            active_users = cursor.fetchone()[0]
         
-        # Лиды
-        cursor.execute("SELECT COUNT(*) FROM telegram_leads WHERE status = 'new'")
-        new_leads = cursor.fetchone()[0]
+            # Лиды
+            cursor.execute("SELECT COUNT(*) FROM telegram_leads WHERE status = 'new'")
+            new_leads = cursor.fetchone()[0]
         
-        cursor.execute("SELECT COUNT(*) FROM telegram_leads WHERE status = 'contacted'")
-        contacted_leads = cursor.fetchone()[0]
+            cursor.execute("SELECT COUNT(*) FROM telegram_leads WHERE status = 'contacted'")
+            contacted_leads = cursor.fetchone()[0]
+
+            # Топ категорий интересов (агрегат по telegram_lead_categories)
+            cursor.execute("""
+                SELECT category, COUNT(*) as count
+                FROM telegram_lead_categories
+                GROUP BY category
+                ORDER BY count DESC
+                LIMIT 10
+            """)
+            top_categories = [(row['category'], row['count']) for row in cursor.fetchall()]
         
-        return {
-            "total_users": total_users,
-            "active_users": active_users,
-            "new_leads": new_leads,
-            "contacted_leads": contacted_leads
-        }
+            return {
+                "total_users": total_users,
+                "active_users": active_users,
+                "new_leads": new_leads,
+                "contacted_leads": contacted_leads,
+                "top_categories": top_categories
+            }
+
+    return await cached_stats(("telegram_stats",), load_stats)
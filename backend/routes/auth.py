@@ -74,20 +74,20 @@ class ResetPasswordRequest(BaseModel):
 # ======================== ENDPOINTS ========================
 
 @router.post("/register")
-async def api_register(data: UserRegister):
+def api_register(data: UserRegister):
     """Регистрация нового пользователя"""
     return register_user(data.email, data.password, name=data.name, phone=data.phone, inn=data.inn,
                          company_name=data.company_name, city=data.city, region=data.region, source=data.source)
 
 
 @router.post("/login")
-async def api_login(data: UserLogin):
+def api_login(data: UserLogin):
     """Вход в систему"""
     return login_user(data.email, data.password)
 
 
 @router.get("/me")
-async def api_get_me(user: Dict = Depends(require_auth)):
+def api_get_me(user: Dict = Depends(require_auth)):
     """Получить данные текущего пользователя"""
     # Получаем полные данные пользователя из БД
     full_user = UserDB.get_by_id(user["id"])
@@ -108,19 +108,19 @@ async def api_get_me(user: Dict = Depends(require_auth)):
 
 
 @router.get("/verify-email")
-async def api_verify_email(token: str):
+def api_verify_email(token: str):
     """Подтверждение email по токену из письма"""
     return verify_email(token)
 
 
 @router.post("/resend-verification")
-async def api_resend_verification(user: Dict = Depends(require_auth)):
+def api_resend_verification(user: Dict = Depends(require_auth)):
     """Повторная отправка письма подтверждения"""
     return resend_verification_email(user["id"], user["email"])
 
 
 @router.post("/forgot-password")
-async def api_forgot_password(data: ForgotPasswordRequest):
+def api_forgot_password(data: ForgotPasswordRequest):
     """Запрос на сброс пароля - отправляет письмо с ссылкой"""
     email = data.email.lower().strip()
 
@@ -157,7 +157,7 @@ async def api_forgot_password(data: ForgotPasswordRequest):
 
 
 @router.get("/verify-reset-token")
-async def api_verify_reset_token(token: str):
+def api_verify_reset_token(token: str):
     """Проверка токена сброса пароля (для валидации перед показом формы)"""
     token_data = PasswordResetDB.verify_token(token)
 
@@ -171,7 +171,7 @@ async def api_verify_reset_token(token: str):
 
 
 @router.post("/reset-password")
-async def api_reset_password(data: ResetPasswordRequest):
+def api_reset_password(data: ResetPasswordRequest):
     """Установка нового пароля по токену"""
     # Валидация пароля
     if len(data.password) < 6:
@@ -6,12 +6,12 @@ API эндпоинты для управления заявками (callbacks)
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 from typing import Optional, List, Dict
-import json
 import logging
 
 # Import auth dependencies
 from auth import require_employee, require_admin
-from database import CallbackDB, CallbackDBExtended, CallbackSLADB, get_db
+from database import AsyncCallbackDB, AsyncCallbackDBExtended, AsyncCallbackSLADB, get_db
+from stats_cache import invalidate_stats
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +29,7 @@ class BulkDeleteRequest(BaseModel):
 @router.get("/admin/callbacks")
 async def api_admin_get_callbacks(user: Dict = Depends(require_admin)):
     """Получить все заявки на звонок (админка)"""
-    callbacks = CallbackDB.get_all()
+    callbacks = await AsyncCallbackDB.get_all()
     return callbacks
 
 
@@ -42,12 +42,12 @@ async def api_admin_update_callback(
     """Обновить статус заявки"""
     status = data.get("status")
     if status:
-        CallbackDB.update_status(callback_id, status)
+        await AsyncCallbackDB.update_status(callback_id, status)
     return {"success": True}
 
 
 @router.delete("/admin/callbacks/{callback_id}")
-async def api_admin_delete_callback(
+def api_admin_delete_callback(
     callback_id: int,
     user: Dict = Depends(require_admin)
 ):
@@ -58,6 +58,7 @@ async def api_admin_delete_callback(
         conn.commit()
         if cursor.rowcount == 0:
             raise HTTPException(status_code=404, detail="Заявка не найдена")
+    invalidate_stats()
     return {"success": True, "message": "Заявка удалена"}
 
 
@@ -66,44 +67,14 @@ async def api_admin_delete_callback(
 async def api_employee_get_callbacks(
     status: Optional[str] = None,
     period: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
     user: Dict = Depends(require_employee)
 ):
-    """Получить все заявки с фильтрацией по периоду"""
-    with get_db() as conn:
-        cursor = conn.cursor()
-        query = '''
-            SELECT cb.*, u.email as assigned_email, c.contact_name as client_name
-            FROM callbacks cb
-            LEFT JOIN users u ON cb.assigned_to = u.id
-            LEFT JOIN clients c ON cb.client_id = c.id
-            WHERE 1=1
-        '''
-        params = []
-
-        if status:
-            query += ' AND cb.status = ?'
-            params.append(status)
-
-        # Фильтр по периоду
-        if period == 'today':
-            query += " AND date(cb.created_at, 'localtime') = date('now', 'localtime')"
-        elif period == 'week':
-            query += " AND cb.created_at >= datetime('now', '-7 days', 'localtime')"
-        elif period == 'month':
-            query += " AND cb.created_at >= datetime('now', '-30 days', 'localtime')"
-
-        query += ' ORDER BY cb.created_at DESC'
-        cursor.execute(query, params)
-
-        results = []
-        for row in cursor.fetchall():
-            item = dict(row)
-            item['products'] = json.loads(item['products_json']) if item.get('products_json') else []
-            if 'products_json' in item:
-                del item['products_json']
-            results.append(item)
-
-    return {"callbacks": results}
+    """Получить заявки с фильтрацией по периоду (постранично: cursor/limit)"""
+    return await AsyncCallbackDBExtended.get_all_extended(
+        status=status, period=period, cursor=cursor, limit=limit
+    )
 
 
 @router.get("/employee/callbacks/overdue")
@@ -111,9 +82,9 @@ async def api_get_overdue_callbacks(user: Dict = Depends(require_employee)):
     """Получить просроченные заявки"""
     # Superadmin видит все, employee только свои
     if user['role'] == 'superadmin':
-        callbacks = CallbackSLADB.get_overdue()
+        callbacks = await AsyncCallbackSLADB.get_overdue()
     else:
-        callbacks = CallbackSLADB.get_overdue(assigned_to=user['id'])
+        callbacks = await AsyncCallbackSLADB.get_overdue(assigned_to=user['id'])
     return {"callbacks": callbacks, "count": len(callbacks)}
 
 
@@ -123,7 +94,7 @@ async def api_employee_get_callback(
     user: Dict = Depends(require_employee)
 ):
     """Получить заявку по ID"""
-    callback = CallbackDBExtended.get_by_id(callback_id)
+    callback = await AsyncCallbackDBExtended.get_by_id(callback_id)
     if not callback:
         raise HTTPException(status_code=404, detail="Заявка не найдена")
     return callback
@@ -135,7 +106,7 @@ async def api_employee_assign_callback(
     user: Dict = Depends(require_employee)
 ):
     """Взять заявку в работу"""
-    success = CallbackDBExtended.assign_to(callback_id, user["id"])
+    success = await AsyncCallbackDBExtended.assign_to(callback_id, user["id"])
     if not success:
         raise HTTPException(status_code=404, detail="Заявка не найдена")
     return {"success": True, "message": "Заявка взята в работу"}
@@ -150,12 +121,12 @@ async def api_employee_update_callback_status(
     """Обновить статус заявки"""
     if status not in ['new', 'processing', 'completed', 'cancelled']:
         raise HTTPException(status_code=400, detail="Недопустимый статус")
-    CallbackDB.update_status(callback_id, status)
+    await AsyncCallbackDB.update_status(callback_id, status)
     return {"success": True}
 
 
 @router.put("/employee/callbacks/{callback_id}/comment")
-async def api_employee_update_callback_comment(
+def api_employee_update_callback_comment(
     callback_id: int,
     data: dict,
     user: Dict = Depends(require_employee)
@@ -174,7 +145,7 @@ async def api_employee_update_callback_comment(
 
 
 @router.delete("/employee/callbacks/{callback_id}")
-async def api_employee_delete_callback(
+def api_employee_delete_callback(
     callback_id: int,
     user: Dict = Depends(require_employee)
 ):
@@ -184,11 +155,12 @@ async def api_employee_delete_callback(
         cursor.execute("DELETE FROM callbacks WHERE id = ?", (callback_id,))
         if cursor.rowcount == 0:
             raise HTTPException(status_code=404, detail="Заявка не найдена")
+    invalidate_stats()
     return {"success": True}
 
 
 @router.post("/employee/callbacks/bulk-delete")
-async def api_employee_bulk_delete_callbacks(
+def api_employee_bulk_delete_callbacks(
     request: BulkDeleteRequest,
     user: Dict = Depends(require_employee)
 ):
@@ -200,4 +172,5 @@ async def api_employee_bulk_delete_callbacks(
         placeholders = ",".join(["?"] * len(request.ids))
         cursor.execute(f"DELETE FROM callbacks WHERE id IN ({placeholders})", request.ids)
         deleted_count = cursor.rowcount
+    invalidate_stats()
     return {"success": True, "deleted_count": deleted_count}
@@ -7,7 +7,8 @@ from typing import Dict, Optional, List
 from pydantic import BaseModel
 
 from auth import require_employee
-from database import ClientDB, InteractionDB, get_db
+from database import AsyncClientDB, AsyncInteractionDB, get_db
+from db_async import run_db
 
 router = APIRouter(tags=["clients"])
 
@@ -67,54 +68,23 @@ class BulkDeleteRequest(BaseModel):
 async def get_clients(
     status: Optional[str] = None,
     search: Optional[str] = None,
+    sort: str = "created_at",
+    order: str = "desc",
+    limit: Optional[int] = None,
+    offset: int = 0,
+    cursor: Optional[str] = None,
     user: Dict = Depends(require_employee)
 ):
     """
     Получить клиентов с статистикой по КП и договорам.
+    Сортировка: sort - поле клиента (created_at, company_name, status...) или агрегат
+    (quotes_total, contracts_total, tasks_count...), order - asc/desc.
+    Пагинация: limit/offset, в ответе total - всего клиентов под фильтром.
+    В порядке по умолчанию - курсором: cursor из next_cursor предыдущей страницы.
     """
-    if search:
-        clients = ClientDB.search(search)
-    else:
-        clients = ClientDB.get_all(status=status)
-
-    # Добавляем статистику по КП и договорам для каждого клиента
-    with get_db() as conn:
-        cursor = conn.cursor()
-        for client in clients:
-            client_id = client['id']
-
-            # Количество и сумма КП
-            cursor.execute('''
-                SELECT COUNT(*) as count, COALESCE(SUM(total_amount), 0) as total
-                FROM quotes WHERE client_id = ?
-            ''', (client_id,))
-            quotes_stats = cursor.fetchone()
-            client['quotes_count'] = quotes_stats['count'] if quotes_stats else 0
-            client['quotes_total'] = quotes_stats['total'] if quotes_stats else 0
-
-            # Количество и сумма договоров
-            cursor.execute('''
-                SELECT COUNT(*) as count, COALESCE(SUM(total_amount), 0) as total
-                FROM contracts WHERE client_id = ?
-            ''', (client_id,))
-            contracts_stats = cursor.fetchone()
-            client['contracts_count'] = contracts_stats['count'] if contracts_stats else 0
-            client['contracts_total'] = contracts_stats['total'] if contracts_stats else 0
-
-            # Менеджер
-            if client.get('assigned_manager_id'):
-                cursor.execute('SELECT email, name FROM users WHERE id = ?', (client['assigned_manager_id'],))
-                manager = cursor.fetchone()
-                if manager:
-                    client['manager_name'] = manager['name'] or manager['email'].split('@')[0]
-                    client['manager_email'] = manager['email']
-
-            # Количество задач
-            cursor.execute("SELECT COUNT(*) as cnt FROM tasks WHERE client_id = ? AND status != 'completed'", (client_id,))
-            tasks_row = cursor.fetchone()
-            client["tasks_count"] = tasks_row["cnt"] if tasks_row else 0
-
-    return {"clients": clients}
+    return await AsyncClientDB.get_list_with_stats(
+        status=status, search=search, sort=sort, order=order, limit=limit, offset=offset, cursor=cursor
+    )
 
 
 @router.get("/clients/check-duplicate")
@@ -125,67 +95,7 @@ async def check_duplicate(
     user: Dict = Depends(require_employee)
 ):
     """Проверить есть ли клиент с таким телефоном/email/ИНН"""
-    duplicates = []
-    
-    with get_db() as conn:
-        cursor = conn.cursor()
-        
-        if phone and len(phone) >= 5:
-            # Очищаем телефон от форматирования для поиска
-            clean_phone = ''.join(filter(str.isdigit, phone))
-            if len(clean_phone) >= 5:
-                cursor.execute('''
-                    SELECT id, contact_name, company_name, contact_phone, contact_email
-                    FROM clients 
-                    WHERE REPLACE(REPLACE(REPLACE(REPLACE(contact_phone, ' ', ''), '-', ''), '(', ''), ')', '') LIKE ?
-                    LIMIT 5
-                ''', (f'%{clean_phone[-10:]}%',))
-                for row in cursor.fetchall():
-                    duplicates.append({
-                        "id": row["id"],
-                        "name": row["contact_name"],
-                        "company": row["company_name"],
-                        "phone": row["contact_phone"],
-                        "email": row["contact_email"],
-                        "match_type": "phone"
-                    })
-        
-        if email and len(email) >= 3 and '@' in email:
-            cursor.execute('''
-                SELECT id, contact_name, company_name, contact_phone, contact_email
-                FROM clients 
-                WHERE LOWER(contact_email) = LOWER(?)
-                LIMIT 5
-            ''', (email,))
-            for row in cursor.fetchall():
-                if not any(d["id"] == row["id"] for d in duplicates):
-                    duplicates.append({
-                        "id": row["id"],
-                        "name": row["contact_name"],
-                        "company": row["company_name"],
-                        "phone": row["contact_phone"],
-                        "email": row["contact_email"],
-                        "match_type": "email"
-                    })
-        
-        if inn and len(inn) >= 10:
-            cursor.execute('''
-                SELECT id, contact_name, company_name, contact_phone, contact_email, inn
-                FROM clients 
-                WHERE inn = ?
-                LIMIT 5
-            ''', (inn,))
-            for row in cursor.fetchall():
-                if not any(d["id"] == row["id"] for d in duplicates):
-                    duplicates.append({
-                        "id": row["id"],
-                        "name": row["contact_name"],
-                        "company": row["company_name"],
-                        "phone": row["contact_phone"],
-                        "email": row["contact_email"],
-                        "match_type": "inn"
-                    })
-    
+    duplicates = await AsyncClientDB.find_duplicates(phone=phone, email=email, inn=inn)
     return {
         "has_duplicates": len(duplicates) > 0,
         "duplicates": duplicates
@@ -198,10 +108,10 @@ async def create_client(
     user: Dict = Depends(require_employee)
 ):
     """Создать нового клиента"""
-    client_id = ClientDB.create(data.model_dump(), user["id"])
+    client_id = await AsyncClientDB.create(data.model_dump(), user["id"])
 
     # Добавляем запись в историю
-    InteractionDB.create({
+    await AsyncInteractionDB.create({
         'client_id': client_id,
         'manager_id': user["id"],
         'type': 'note',
@@ -218,32 +128,37 @@ async def get_client(
     user: Dict = Depends(require_employee)
 ):
     """Получить клиента по ID с историей"""
-    client = ClientDB.get_by_id(client_id)
+    client = await AsyncClientDB.get_by_id(client_id)
     if not client:
         raise HTTPException(status_code=404, detail="Клиент не найден")
 
     # Получаем историю взаимодействий
-    history = InteractionDB.get_by_client(client_id)
+    history = await AsyncInteractionDB.get_by_client(client_id)
 
     # Получаем документы клиента (КП, договоры)
-    with get_db() as conn:
-        cursor = conn.cursor()
+    def load_documents():
+        with get_db() as conn:
+            cursor = conn.cursor()
+
+            # КП
+            cursor.execute('''
+                SELECT id, quote_number, total_amount, status, created_at
+                FROM quotes WHERE client_id = ?
+                ORDER BY created_at DESC
+            ''', (client_id,))
+            quotes = [dict(row) for row in cursor.fetchall()]
+
+            # Договоры
+            cursor.execute('''
+                SELECT id, contract_number, total_amount, status, created_at
+                FROM contracts WHERE client_id = ?
+                ORDER BY created_at DESC
+            ''', (client_id,))
+            contracts = [dict(row) for row in cursor.fetchall()]
+
+            return quotes, contracts
 
-        # КП
-        cursor.execute('''
-            SELECT id, quote_number, total_amount, status, created_at
-            FROM quotes WHERE client_id = ?
-            ORDER BY created_at DESC
-        ''', (client_id,))
-        quotes = [dict(row) for row in cursor.fetchall()]
-
-        # Договоры
-        cursor.execute('''
-            SELECT id, contract_number, total_amount, status, created_at
-            FROM contracts WHERE client_id = ?
-            ORDER BY created_at DESC
-        ''', (client_id,))
-        contracts = [dict(row) for row in cursor.fetchall()]
+    quotes, contracts = await run_db(load_documents)
 
     return {
         **client,
@@ -266,13 +181,13 @@ async def update_client(
     if not update_data:
         raise HTTPException(status_code=400, detail="Нет данных для обновления")
 
-    success = ClientDB.update(client_id, update_data)
+    success = await AsyncClientDB.update(client_id, update_data)
     if not success:
         raise HTTPException(status_code=404, detail="Клиент не найден")
 
     # Логируем изменение статуса
     if 'status' in update_data:
-        InteractionDB.create({
+        await AsyncInteractionDB.create({
             'client_id': client_id,
             'manager_id': user["id"],
             'type': 'note',
@@ -284,7 +199,7 @@ async def update_client(
 
 
 @router.delete("/clients/{client_id}")
-async def delete_client(
+def delete_client(
     client_id: int,
     user: Dict = Depends(require_employee)
 ):
@@ -298,7 +213,7 @@ async def delete_client(
 
 
 @router.post("/clients/bulk-delete")
-async def bulk_delete_clients(
+def bulk_delete_clients(
     request: BulkDeleteRequest,
     user: Dict = Depends(require_employee)
 ):
@@ -323,7 +238,7 @@ async def get_client_history(
     user: Dict = Depends(require_employee)
 ):
     """Получить историю взаимодействий с клиентом"""
-    history = InteractionDB.get_by_client(client_id)
+    history = await AsyncInteractionDB.get_by_client(client_id)
     return {"history": history}
 
 
@@ -335,11 +250,11 @@ async def add_interaction(
 ):
     """Добавить запись в историю взаимодействий"""
     # Проверяем существование клиента
-    client = ClientDB.get_by_id(client_id)
+    client = await AsyncClientDB.get_by_id(client_id)
     if not client:
         raise HTTPException(status_code=404, detail="Клиент не найден")
 
-    interaction_id = InteractionDB.create({
+    interaction_id = await AsyncInteractionDB.create({
         'client_id': client_id,
         'manager_id': user["id"],
         'type': data.type,
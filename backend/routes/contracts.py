@@ -11,7 +11,9 @@ from pydantic import BaseModel
 import json
 
 from auth import require_employee, require_auth
-from database import ContractDB, ClientDB, get_db
+from database import ClientDB, AsyncContractDB, get_db
+from pagination import fetch_page
+from stats_cache import invalidate_stats
 
 router = APIRouter(tags=["contracts"])
 
@@ -25,15 +27,15 @@ class BulkDeleteRequest(BaseModel):
 # --- Эндпоинты для сотрудников ---
 
 @router.get("/employee/contracts")
-async def get_contracts(
+def get_contracts(
     status: Optional[str] = None,
     client_id: Optional[int] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
     user: Dict = Depends(require_employee)
 ):
-    """Получить все договоры с информацией о менеджерах и клиентах"""
+    """Получить договоры с информацией о менеджерах и клиентах (постранично: cursor/limit)"""
     with get_db() as conn:
-        cursor = conn.cursor()
-
         query = '''
             SELECT ct.*,
                    c.contact_name as client_name,
@@ -42,6 +44,7 @@ async def get_contracts(
                    comp.name as company_legal_name,
                    comp.inn as company_inn,
                    q.quote_number,
+                   (SELECT COUNT(*) FROM document_lines dl WHERE dl.doc_type = 'contract' AND dl.doc_id = ct.id) as services_count,
                    (SELECT COUNT(*) FROM invoices WHERE contract_id = ct.id AND deleted_at IS NULL) as invoices_count,
                    (SELECT COALESCE(SUM(amount), 0) FROM invoices WHERE contract_id = ct.id AND deleted_at IS NULL) as invoices_total,
                    (SELECT COALESCE(SUM(amount), 0) FROM invoices WHERE contract_id = ct.id AND status = 'paid' AND deleted_at IS NULL) as invoices_paid
@@ -61,22 +64,20 @@ async def get_contracts(
             query += ' AND ct.client_id = ?'
             params.append(client_id)
 
-        query += ' ORDER BY ct.created_at DESC'
-        cursor.execute(query, params)
+        rows, next_cursor = fetch_page(conn.cursor(), query, params, cursor, limit, alias='ct.')
 
         contracts = []
-        for row in cursor.fetchall():
+        for row in rows:
             item = dict(row)
-            item['services'] = json.loads(item['services_json']) if item.get('services_json') else []
-            if 'services_json' in item:
-                del item['services_json']
+            # Услуги списку не нужны (они есть в document_lines и в карточке договора)
+            item.pop('services_json', None)
             contracts.append(item)
 
-    return {"contracts": contracts}
+    return {"contracts": contracts, "next_cursor": next_cursor}
 
 
 @router.put("/employee/contracts/{contract_id}/status")
-async def update_contract_status(
+def update_contract_status(
     contract_id: int,
     status: str,
     user: Dict = Depends(require_employee)
@@ -97,11 +98,12 @@ async def update_contract_status(
             (status, contract_id)
         )
 
+    invalidate_stats()
     return {"success": True, "status": status}
 
 
 @router.get("/employee/contracts/{contract_id}/pdf")
-async def download_contract_pdf(
+def download_contract_pdf(
     contract_id: int,
     user: Dict = Depends(require_employee)
 ):
@@ -165,7 +167,7 @@ async def download_contract_pdf(
 
 
 @router.delete("/employee/contracts/{contract_id}")
-async def delete_contract(
+def delete_contract(
     contract_id: int,
     user: Dict = Depends(require_employee)
 ):
@@ -175,11 +177,12 @@ async def delete_contract(
         cursor.execute("DELETE FROM contracts WHERE id = ?", (contract_id,))
         if cursor.rowcount == 0:
             raise HTTPException(status_code=404, detail="Договор не найден")
+    invalidate_stats()
     return {"success": True}
 
 
 @router.post("/employee/contracts/bulk-delete")
-async def bulk_delete_contracts(
+def bulk_delete_contracts(
     request: BulkDeleteRequest,
     user: Dict = Depends(require_employee)
 ):
@@ -193,6 +196,7 @@ async def bulk_delete_contracts(
         cursor.execute(f"DELETE FROM contracts WHERE id IN ({placeholders})", request.ids)
         deleted_count = cursor.rowcount
     
+    invalidate_stats()
     return {"success": True, "deleted_count": deleted_count}
 
 
@@ -201,5 +205,5 @@ async def bulk_delete_contracts(
 @router.get("/cabinet/contracts")
 async def get_user_contracts(user: Dict = Depends(require_auth)):
     """Получить все договоры пользователя"""
-    contracts = ContractDB.get_by_user(user["id"])
+    contracts = await AsyncContractDB.get_by_user(user["id"])
     return {"contracts": contracts}
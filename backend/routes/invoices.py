@@ -12,7 +12,8 @@ from datetime import datetime, timedelta
 from urllib.parse import quote
 
 from auth import require_employee
-from database import get_db, ClientDB, InteractionDB
+from database import get_db, ClientDB, InteractionDB, get_next_invoice_number
+from pagination import fetch_page
 from document_generator import generate_invoice_pdf
 from email_service import send_email
 
@@ -55,53 +56,10 @@ class BulkDeleteRequest(BaseModel):
     ids: List[int]
 
 
-# ======================== HELPER FUNCTIONS ========================
-
-def get_next_invoice_number(contract_number: str = None, contract_id: int = None) -> str:
-    """Генерирует следующий номер счёта в формате СЧ-{номер_договора}/{порядковый}"""
-    
-    if contract_number:
-        # Убираем префикс DOG- если есть
-        base_number = contract_number.replace('DOG-', '').replace('dog-', '')
-        
-        with get_db() as conn:
-            cursor = conn.cursor()
-            # Считаем сколько счетов уже есть по этому договору
-            if contract_id:
-                cursor.execute(
-                    "SELECT COUNT(*) FROM invoices WHERE contract_id = ?",
-                    (contract_id,)
-                )
-            else:
-                cursor.execute(
-                    "SELECT COUNT(*) FROM invoices WHERE invoice_number LIKE ?",
-                    (f"СЧ-{base_number}/%",)
-                )
-            row = cursor.fetchone()
-            next_num = (row[0] or 0) + 1
-        
-        return f"СЧ-{base_number}/{next_num}"
-    else:
-        # Fallback - старый формат если нет contract_number
-        today = datetime.now()
-        date_prefix = today.strftime("%y%m%d")
-        
-        with get_db() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT MAX(CAST(SUBSTR(invoice_number, -4) AS INTEGER)) FROM invoices WHERE invoice_number LIKE ?",
-                (f"СЧ-{date_prefix}-%",)
-            )
-            row = cursor.fetchone()
-            next_num = (row[0] or 0) + 1
-        
-        return f"СЧ-{date_prefix}-{next_num:04d}"
-
-
 # ======================== INVOICE CRUD ENDPOINTS ========================
 
 @router.post("/api/employee/invoices")
-async def create_invoice(
+def create_invoice(
     request: InvoiceCreateRequest,
     user: Dict = Depends(require_employee)
 ):
@@ -159,22 +117,23 @@ async def create_invoice(
 
 
 @router.get("/api/employee/invoices")
-async def get_invoices(
+def get_invoices(
     contract_id: Optional[int] = None,
     status: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
     user: Dict = Depends(require_employee)
 ):
-    """Получить список счетов"""
+    """Получить список счетов (постранично: cursor/limit)"""
     
     with get_db() as conn:
-        cursor = conn.cursor()
-        
         query = """
             SELECT i.*, i.amount as total_amount,
                    c.contract_number,
                    comp.name as company_name,
                    comp.inn as company_inn,
-                   m.email as manager_email
+                   m.email as manager_email,
+                   (SELECT COUNT(*) FROM document_lines dl WHERE dl.doc_type = 'invoice' AND dl.doc_id = i.id) as services_count
             FROM invoices i
             LEFT JOIN contracts c ON i.contract_id = c.id
             LEFT JOIN companies comp ON i.company_id = comp.id
@@ -191,22 +150,19 @@ async def get_invoices(
             query += " AND i.status = ?"
             params.append(status)
         
-        query += " ORDER BY i.created_at DESC"
-        
-        cursor.execute(query, params)
+        rows, next_cursor = fetch_page(conn.cursor(), query, params, cursor, limit, alias="i.")
         invoices = []
-        for row in cursor.fetchall():
+        for row in rows:
             item = dict(row)
-            item["services"] = json.loads(item["services_json"]) if item.get("services_json") else []
-            if "services_json" in item:
-                del item["services_json"]
+            # Услуги списку не нужны (они есть в document_lines и в карточке счёта)
+            item.pop("services_json", None)
             invoices.append(item)
     
-    return {"invoices": invoices}
+    return {"invoices": invoices, "next_cursor": next_cursor}
 
 
 @router.get("/api/employee/contracts/{contract_id}/invoices")
-async def get_contract_invoices(
+def get_contract_invoices(
     contract_id: int,
     user: Dict = Depends(require_employee)
 ):
@@ -266,7 +222,7 @@ async def get_contract_invoices(
 
 
 @router.put("/api/employee/invoices/{invoice_id}/status")
-async def update_invoice_status(
+def update_invoice_status(
     invoice_id: int,
     request: InvoiceUpdateRequest,
     user: Dict = Depends(require_employee)
@@ -334,7 +290,7 @@ async def update_invoice_status(
 
 
 @router.delete("/api/employee/invoices/{invoice_id}")
-async def delete_invoice(
+def delete_invoice(
     invoice_id: int,
     user: Dict = Depends(require_employee)
 ):
@@ -357,7 +313,7 @@ async def delete_invoice(
 
 
 @router.post("/api/employee/invoices/bulk-delete")
-async def bulk_delete_invoices(
+def bulk_delete_invoices(
     request: BulkDeleteRequest,
     user: Dict = Depends(require_employee)
 ):
@@ -377,7 +333,7 @@ async def bulk_delete_invoices(
 # ======================== INVOICE PDF & EMAIL ========================
 
 @router.get("/api/invoices/{invoice_id}/pdf")
-async def get_invoice_pdf(
+def get_invoice_pdf(
     invoice_id: int,
     user: Dict = Depends(require_employee)
 ):
@@ -444,7 +400,7 @@ async def get_invoice_pdf(
 
 
 @router.post("/api/invoices/{invoice_id}/send-email")
-async def send_invoice_email(
+def send_invoice_email(
     invoice_id: int,
     request: InvoiceEmailRequest,
     background_tasks: BackgroundTasks,
@@ -521,7 +477,7 @@ https://promarkirui.ru
 # ======================== INVOICE FULL CREATION ========================
 
 @router.post("/api/employee/clients/{client_id}/invoice/full")
-async def create_client_invoice_full(
+def create_client_invoice_full(
     client_id: int,
     request: EmployeeInvoiceFullRequest,
     user: Dict = Depends(require_employee)
@@ -11,8 +11,10 @@ import logging
 from datetime import datetime
 
 from auth import require_employee, require_partner, require_admin
-from database import get_db, PartnerDB
+from database import AsyncPartnerDB, PartnerDB, get_db
+from db_async import run_db
 from education_db import EducationDB
+from stats_cache import cached_stats, invalidate_stats
 
 router = APIRouter(tags=["partners"])
 logger = logging.getLogger(__name__)
@@ -55,12 +57,21 @@ class SubmitTestRequest(BaseModel):
     answers: Dict
 
 
+def _stats_response(stats: Dict) -> Dict:
+    """Статистика партнёра с алиасами, которые читает фронтенд"""
+    return {
+        **stats,
+        "total_amount": stats.get("quotes_amount", 0),
+        "total_commission": stats.get("commission_earned", 0),
+    }
+
+
 # ======================== EMPLOYEE PARTNER MANAGEMENT ========================
 
 @router.get("/api/employee/partners")
 async def get_partners(status: Optional[str] = None, current_user: dict = Depends(require_employee)):
     """Получить список партнёров"""
-    partners = PartnerDB.get_all(status)
+    partners = await AsyncPartnerDB.get_all(status)
 
     # Подсчитываем статистику
     total = len(partners)
@@ -81,7 +92,7 @@ async def get_partners(status: Optional[str] = None, current_user: dict = Depend
 async def create_partner(data: PartnerCreateRequest, current_user: dict = Depends(require_employee)):
     """Создать партнёра"""
     try:
-        result = PartnerDB.create(data.dict(), created_by=current_user.get('id'))
+        result = await AsyncPartnerDB.create(data.dict(), created_by=current_user.get('id'))
         return {
             "success": True,
             "partner_id": result['id'],
@@ -96,16 +107,17 @@ async def create_partner(data: PartnerCreateRequest, current_user: dict = Depend
 @router.get("/api/employee/partners/{partner_id}")
 async def get_partner(partner_id: int, current_user: dict = Depends(require_employee)):
     """Получить партнёра по ID"""
-    partner = PartnerDB.get_by_id(partner_id)
+    partner = await AsyncPartnerDB.get_by_id(partner_id)
     if not partner:
         raise HTTPException(status_code=404, detail="Partner not found")
-    return partner
+    stats = await AsyncPartnerDB.get_stats(partner_id)
+    return {"partner": partner, "stats": _stats_response(stats)}
 
 
 @router.put("/api/employee/partners/{partner_id}")
 async def update_partner(partner_id: int, data: PartnerUpdateRequest, current_user: dict = Depends(require_employee)):
     """Обновить партнёра"""
-    success = PartnerDB.update(partner_id, data.dict(exclude_unset=True))
+    success = await AsyncPartnerDB.update(partner_id, data.dict(exclude_unset=True))
     if not success:
         raise HTTPException(status_code=404, detail="Partner not found")
     return {"success": True}
@@ -114,7 +126,7 @@ async def update_partner(partner_id: int, data: PartnerUpdateRequest, current_us
 @router.post("/api/employee/partners/{partner_id}/activate")
 async def activate_partner(partner_id: int, current_user: dict = Depends(require_employee)):
     """Активировать партнёра"""
-    success = PartnerDB.update(partner_id, {"status": "active"})
+    success = await AsyncPartnerDB.update(partner_id, {"status": "active"})
     if not success:
         raise HTTPException(status_code=404, detail="Partner not found")
     return {"success": True}
@@ -123,7 +135,7 @@ async def activate_partner(partner_id: int, current_user: dict = Depends(require
 @router.post("/api/employee/partners/{partner_id}/deactivate")
 async def deactivate_partner(partner_id: int, current_user: dict = Depends(require_employee)):
     """Деактивировать партнёра"""
-    success = PartnerDB.update(partner_id, {"status": "inactive"})
+    success = await AsyncPartnerDB.update(partner_id, {"status": "inactive"})
     if not success:
         raise HTTPException(status_code=404, detail="Partner not found")
     return {"success": True}
@@ -136,7 +148,7 @@ async def send_partner_invite(
     current_user: dict = Depends(require_employee)
 ):
     """Отправить приглашение партнёру"""
-    partner = PartnerDB.get_by_id(partner_id)
+    partner = await AsyncPartnerDB.get_by_id(partner_id)
     if not partner:
         raise HTTPException(status_code=404, detail="Partner not found")
     
@@ -149,12 +161,15 @@ async def send_partner_invite(
     token = generate_invite_token(partner_id)
     
     # Сохраняем токен
-    with get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
-            UPDATE partners SET invite_token = ?, invite_token_created = ? 
-            WHERE id = ?
-        """, (token, datetime.now().isoformat(), partner_id))
+    def save_token():
+        with get_db() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                UPDATE partners SET invite_token = ?, invite_token_created = ? 
+                WHERE id = ?
+            """, (token, datetime.now().isoformat(), partner_id))
+
+    await run_db(save_token)
     
     # Отправляем email в фоне
     background_tasks.add_task(
@@ -171,7 +186,7 @@ async def send_partner_invite(
 @router.delete("/api/employee/partners/{partner_id}")
 async def delete_partner_employee(partner_id: int, current_user: dict = Depends(require_employee)):
     """Удалить партнёра (сотрудник)"""
-    success = PartnerDB.delete(partner_id)
+    success = await AsyncPartnerDB.delete(partner_id)
     if not success:
         raise HTTPException(status_code=404, detail="Partner not found")
     return {"success": True}
@@ -187,7 +202,7 @@ async def update_partner_commission(
     """Обновить комиссию партнёра с опциональным уведомлением"""
     
     # Получаем текущие данные партнёра
-    partner = PartnerDB.get_by_id(partner_id)
+    partner = await AsyncPartnerDB.get_by_id(partner_id)
     if not partner:
         raise HTTPException(status_code=404, detail="Partner not found")
     
@@ -199,9 +214,11 @@ async def update_partner_commission(
         raise HTTPException(status_code=400, detail="Комиссия должна быть от 0 до 100%")
     
     # Обновляем комиссию
-    success = PartnerDB.update(partner_id, {'commission_rate': new_rate})
+    success = await AsyncPartnerDB.update(partner_id, {'commission_rate': new_rate})
     if not success:
         raise HTTPException(status_code=500, detail="Ошибка обновления")
+    # Комиссия в журнале партнёра пересчитана триггером - сбрасываем кэш статистики
+    invalidate_stats()
     
     # Логируем изменение
     logger.info(f"Commission changed for partner {partner_id}: {old_rate}% -> {new_rate}% by {current_user.get('email')}")
@@ -234,7 +251,7 @@ async def update_partner_commission(
 @router.delete("/api/admin/partners/{partner_id}")
 async def delete_partner_admin(partner_id: int, current_user: dict = Depends(require_admin)):
     """Удалить партнёра (администратор)"""
-    success = PartnerDB.delete(partner_id)
+    success = await AsyncPartnerDB.delete(partner_id)
     if not success:
         raise HTTPException(status_code=404, detail="Partner not found")
     return {"success": True}
@@ -243,7 +260,7 @@ async def delete_partner_admin(partner_id: int, current_user: dict = Depends(req
 # ======================== PARTNER PORTAL ========================
 
 @router.get("/api/partner/me")
-async def get_partner_profile(user: Dict = Depends(require_partner)):
+def get_partner_profile(user: Dict = Depends(require_partner)):
     """Получить профиль партнёра"""
     with get_db() as conn:
         cursor = conn.cursor()
@@ -257,90 +274,30 @@ async def get_partner_profile(user: Dict = Depends(require_partner)):
 @router.get("/api/partner/stats")
 async def get_partner_stats(user: Dict = Depends(require_partner)):
     """Получить статистику партнёра"""
-    with get_db() as conn:
-        cursor = conn.cursor()
-        
-        # Получаем partner_id
-        cursor.execute("SELECT id, ref_code FROM partners WHERE user_id = ?", (user['id'],))
-        partner = cursor.fetchone()
+    def load_stats():
+        partner = PartnerDB.get_by_user_id(user['id'])
         if not partner:
             raise HTTPException(status_code=404, detail="Партнёр не найден")
-        
-        partner_id = partner['id']
-        ref_code = partner['ref_code']
-        
-        # Статистика по лидам
-        cursor.execute("SELECT COUNT(*) FROM clients WHERE ref_code = ?", (ref_code,))
-        total_leads = cursor.fetchone()[0]
-        
-        # Статистика по конверсии
-        cursor.execute("""
-            SELECT COUNT(*) FROM clients c
-            INNER JOIN contracts ct ON c.id = ct.client_id
-            WHERE c.ref_code = ?
-        """, (ref_code,))
-        converted = cursor.fetchone()[0]
-        
-        # Статистика по выручке
-        cursor.execute("""
-            SELECT COALESCE(SUM(ct.total_amount), 0) FROM clients c
-            INNER JOIN contracts ct ON c.id = ct.client_id
-            WHERE c.ref_code = ?
-        """, (ref_code,))
-        total_revenue = cursor.fetchone()[0]
-        
-        # Статистика по комиссии
-        cursor.execute("SELECT commission_rate FROM partners WHERE id = ?", (partner_id,))
-        commission_rate = cursor.fetchone()[0] or 0
-        
-        earned_commission = total_revenue * (commission_rate / 100)
-        
-        return {
-            "total_leads": total_leads,
-            "converted": converted,
-            "conversion_rate": round((converted / total_leads * 100) if total_leads > 0 else 0, 2),
-            "total_revenue": total_revenue,
-            "commission_rate": commission_rate,
-            "earned_commission": earned_commission
-        }
+        return {"stats": _stats_response(PartnerDB.get_stats(partner['id']))}
+
+    return await cached_stats(("partner_stats", user['id']), load_stats)
 
 
 @router.get("/api/partner/leads")
 async def get_partner_leads(user: Dict = Depends(require_partner)):
-    """Получить список лидов партнёра"""
-    with get_db() as conn:
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT ref_code FROM partners WHERE user_id = ?", (user['id'],))
-        partner = cursor.fetchone()
-        if not partner:
-            raise HTTPException(status_code=404, detail="Партнёр не найден")
-        
-        ref_code = partner['ref_code']
-        
-        # Получаем лидов
-        cursor.execute("""
-            SELECT 
-                c.id, c.company_name, c.contact_name, c.contact_phone, c.contact_email,
-                c.created_at, c.status,
-                COUNT(DISTINCT ct.id) as contracts_count,
-                COALESCE(SUM(ct.total_amount), 0) as total_revenue
-            FROM clients c
-            LEFT JOIN contracts ct ON c.id = ct.client_id
-            WHERE c.ref_code = ?
-            GROUP BY c.id
-            ORDER BY c.created_at DESC
-        """, (ref_code,))
-        
-        leads = [dict(row) for row in cursor.fetchall()]
-        
-        return {"leads": leads}
+    """Получить список лидов партнёра (КП с оплатой и комиссией)"""
+    partner = await AsyncPartnerDB.get_by_user_id(user['id'])
+    if not partner:
+        raise HTTPException(status_code=404, detail="Партнёр не найден")
+
+    leads = await AsyncPartnerDB.get_leads(partner['id'])
+    return {"leads": leads}
 
 
 # ======================== REFERRAL SYSTEM ========================
 
 @router.get("/api/ref/{ref_code}")
-async def process_referral_link(ref_code: str):
+def process_referral_link(ref_code: str):
     """Обработать переход по реферальной ссылке"""
     with get_db() as conn:
         cursor = conn.cursor()
@@ -374,7 +331,7 @@ async def process_referral_link(ref_code: str):
 # ======================== PARTNER INVITE SYSTEM ========================
 
 @router.get("/api/partner/invite/{token}")
-async def get_invite_info(token: str):
+def get_invite_info(token: str):
     """Получить информацию о приглашении"""
     with get_db() as conn:
         cursor = conn.cursor()
@@ -396,7 +353,7 @@ async def get_invite_info(token: str):
 
 
 @router.post("/api/partner/accept-invite")
-async def accept_partner_invite(request: InviteAcceptRequest):
+def accept_partner_invite(request: InviteAcceptRequest):
     """Принять приглашение партнёра"""
     with get_db() as conn:
         cursor = conn.cursor()
@@ -432,7 +389,7 @@ async def accept_partner_invite(request: InviteAcceptRequest):
 # ======================== PARTNER EDUCATION ========================
 
 @router.get("/api/partner/courses")
-async def get_partner_courses(user: Dict = Depends(require_partner)):
+def get_partner_courses(user: Dict = Depends(require_partner)):
     """Получить курсы для партнёра"""
     with get_db() as conn:
         cursor = conn.cursor()
@@ -448,7 +405,7 @@ async def get_partner_courses(user: Dict = Depends(require_partner)):
 
 
 @router.get("/api/partner/courses/{course_id}")
-async def get_partner_course_details(course_id: int, user: Dict = Depends(require_partner)):
+def get_partner_course_details(course_id: int, user: Dict = Depends(require_partner)):
     """Получить детали курса для партнёра"""
     with get_db() as conn:
         cursor = conn.cursor()
@@ -467,7 +424,7 @@ async def get_partner_course_details(course_id: int, user: Dict = Depends(requir
 
 
 @router.post("/api/partner/chapters/{chapter_id}/start")
-async def start_chapter(chapter_id: int, user: Dict = Depends(require_partner)):
+def start_chapter(chapter_id: int, user: Dict = Depends(require_partner)):
     """Начать главу курса"""
     with get_db() as conn:
         cursor = conn.cursor()
@@ -502,7 +459,7 @@ async def start_chapter(chapter_id: int, user: Dict = Depends(require_partner)):
 
 
 @router.post("/api/partner/chapters/{chapter_id}/video-progress")
-async def update_video_progress(
+def update_video_progress(
     chapter_id: int,
     request: Dict,
     user: Dict = Depends(require_partner)
@@ -537,7 +494,7 @@ async def update_video_progress(
 
 
 @router.get("/api/partner/chapters/{chapter_id}/test")
-async def get_chapter_test(chapter_id: int, user: Dict = Depends(require_partner)):
+def get_chapter_test(chapter_id: int, user: Dict = Depends(require_partner)):
     """Получить тест главы"""
     with get_db() as conn:
         cursor = conn.cursor()
@@ -585,7 +542,7 @@ async def get_chapter_test(chapter_id: int, user: Dict = Depends(require_partner
 
 
 @router.post("/api/partner/tests/{test_id}/submit")
-async def submit_test(
+def submit_test(
     test_id: int,
     request: SubmitTestRequest,
     user: Dict = Depends(require_partner)
@@ -614,7 +571,7 @@ async def submit_test(
 
 
 @router.get("/api/partner/courses/{course_id}/certificate")
-async def get_certificate_status(course_id: int, user: Dict = Depends(require_partner)):
+def get_certificate_status(course_id: int, user: Dict = Depends(require_partner)):
     """Получить статус сертификата"""
     with get_db() as conn:
         cursor = conn.cursor()
@@ -660,7 +617,7 @@ async def get_certificate_status(course_id: int, user: Dict = Depends(require_pa
 
 
 @router.get("/api/partner/courses/{course_id}/certificate/download")
-async def download_certificate(course_id: int, user: Dict = Depends(require_partner)):
+def download_certificate(course_id: int, user: Dict = Depends(require_partner)):
     """Скачать сертификат"""
     from fastapi.responses import FileResponse
     import os
@@ -328,7 +328,7 @@ async def recommend_equipment(request: EquipmentRequest):
     )
 
 @router.post("/contact/send")
-async def send_contact(request: ContactRequest, background_tasks: BackgroundTasks):
+def send_contact(request: ContactRequest, background_tasks: BackgroundTasks):
     """Send contact form to email and save to database"""
     from database import CallbackDB
 
@@ -371,7 +371,7 @@ async def send_contact(request: ContactRequest, background_tasks: BackgroundTask
 
 
 @router.post("/training/enroll")
-async def training_enroll(request: TrainingEnrollRequest, background_tasks: BackgroundTasks):
+def training_enroll(request: TrainingEnrollRequest, background_tasks: BackgroundTasks):
     """Отправка заявки на обучение"""
     from database import CallbackDB
 
@@ -11,7 +11,9 @@ from pydantic import BaseModel
 import json
 
 from auth import require_employee, require_auth
-from database import QuoteDB, ClientDB, get_db
+from database import ClientDB, AsyncQuoteDB, get_db
+from pagination import fetch_page
+from stats_cache import invalidate_stats
 
 router = APIRouter(tags=["quotes"])
 
@@ -25,15 +27,15 @@ class BulkDeleteRequest(BaseModel):
 # --- Эндпоинты для сотрудников ---
 
 @router.get("/employee/quotes")
-async def get_quotes(
+def get_quotes(
     status: Optional[str] = None,
     client_id: Optional[int] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
     user: Dict = Depends(require_employee)
 ):
-    """Получить все КП с информацией о менеджерах и клиентах"""
+    """Получить КП с информацией о менеджерах и клиентах (постранично: cursor/limit)"""
     with get_db() as conn:
-        cursor = conn.cursor()
-
         query = '''
             SELECT q.*,
                    COALESCE(q.contact_name, c.contact_name, comp.name) as client_name,
@@ -41,7 +43,8 @@ async def get_quotes(
                    m.email as manager_email,
                    m.name as manager_name,
                    comp.name as company_legal_name,
-                   comp.inn as company_inn
+                   comp.inn as company_inn,
+                   (SELECT COUNT(*) FROM document_lines dl WHERE dl.doc_type = 'quote' AND dl.doc_id = q.id) as services_count
             FROM quotes q
             LEFT JOIN clients c ON q.client_id = c.id
             LEFT JOIN users m ON q.manager_id = m.id
@@ -57,22 +60,20 @@ async def get_quotes(
             query += ' AND q.client_id = ?'
             params.append(client_id)
 
-        query += ' ORDER BY q.created_at DESC'
-        cursor.execute(query, params)
+        rows, next_cursor = fetch_page(conn.cursor(), query, params, cursor, limit, alias='q.')
 
         quotes = []
-        for row in cursor.fetchall():
+        for row in rows:
             item = dict(row)
-            item['services'] = json.loads(item['services_json']) if item.get('services_json') else []
-            if 'services_json' in item:
-                del item['services_json']
+            # Услуги списку не нужны (они есть в document_lines и в карточке КП)
+            item.pop('services_json', None)
             quotes.append(item)
 
-    return {"quotes": quotes}
+    return {"quotes": quotes, "next_cursor": next_cursor}
 
 
 @router.put("/employee/quotes/{quote_id}/status")
-async def update_quote_status(
+def update_quote_status(
     quote_id: int,
     status: str,
     user: Dict = Depends(require_employee)
@@ -93,11 +94,12 @@ async def update_quote_status(
             (status, quote_id)
         )
 
+    invalidate_stats()
     return {"success": True, "status": status}
 
 
 @router.get("/employee/quotes/{quote_id}/pdf")
-async def download_quote_pdf(
+def download_quote_pdf(
     quote_id: int,
     user: Dict = Depends(require_employee)
 ):
@@ -168,7 +170,7 @@ async def download_quote_pdf(
 
 
 @router.delete("/employee/quotes/{quote_id}")
-async def delete_quote(
+def delete_quote(
     quote_id: int,
     user: Dict = Depends(require_employee)
 ):
@@ -178,11 +180,12 @@ async def delete_quote(
         cursor.execute("DELETE FROM quotes WHERE id = ?", (quote_id,))
         if cursor.rowcount == 0:
             raise HTTPException(status_code=404, detail="КП не найдено")
+    invalidate_stats()
     return {"success": True}
 
 
 @router.post("/employee/quotes/bulk-delete")
-async def bulk_delete_quotes(
+def bulk_delete_quotes(
     request: BulkDeleteRequest,
     user: Dict = Depends(require_employee)
 ):
@@ -196,6 +199,7 @@ async def bulk_delete_quotes(
         cursor.execute(f"DELETE FROM quotes WHERE id IN ({placeholders})", request.ids)
         deleted_count = cursor.rowcount
     
+    invalidate_stats()
     return {"success": True, "deleted_count": deleted_count}
 
 
@@ -204,5 +208,5 @@ async def bulk_delete_quotes(
 @router.get("/cabinet/quotes")
 async def get_user_quotes(user: Dict = Depends(require_auth)):
     """Получить все КП пользователя"""
-    quotes = QuoteDB.get_by_user(user["id"])
+    quotes = await AsyncQuoteDB.get_by_user(user["id"])
     return {"quotes": quotes}
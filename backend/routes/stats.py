@@ -3,14 +3,22 @@ API эндпоинты для статистики и аналитики
 /api/admin/stats - статистика для админов
 /api/employee/stats - статистика для сотрудников
 /api/superadmin/stats - расширенная статистика
+/api/superadmin/stats/series - ряды для графиков
+Ответы кэшируются на короткое время (stats_cache.py)
 """
-from fastapi import APIRouter, Depends
-from typing import Dict
+from fastapi import APIRouter, Depends, HTTPException
+from typing import Dict, List, Optional, Tuple
 import logging
-from datetime import datetime, timedelta
+import sqlite3
+from datetime import date, datetime, timedelta
 
+from ai_consultant import get_db as get_ai_db
 from auth import require_admin, require_employee, require_superadmin
-from database import get_db, ClientDB, QuoteDB, ContractDB
+from database import (
+    get_db, ClientDB, QuoteDB, ContractDB, CallbackSLADB, DocumentLinesDB, MetricsDB,
+    AsyncDocumentLinesDB
+)
+from stats_cache import cached_stats
 
 router = APIRouter(tags=["stats"])
 logger = logging.getLogger(__name__)
@@ -20,6 +28,10 @@ logger = logging.getLogger(__name__)
 @router.get("/api/admin/stats")
 async def get_admin_stats(user: Dict = Depends(require_admin)):
     """Получить статистику (админка)"""
+    return await cached_stats(("admin_stats",), _admin_stats)
+
+
+def _admin_stats() -> Dict:
     with get_db() as conn:
         cursor = conn.cursor()
 
@@ -62,6 +74,10 @@ async def get_admin_stats(user: Dict = Depends(require_admin)):
 @router.get("/api/employee/stats")
 async def get_employee_stats(user: Dict = Depends(require_employee)):
     """Статистика для Employee Dashboard"""
+    return await cached_stats(("employee_stats",), _employee_stats)
+
+
+def _employee_stats() -> Dict:
     with get_db() as conn:
         cursor = conn.cursor()
 
@@ -102,186 +118,327 @@ async def get_employee_stats(user: Dict = Depends(require_employee)):
 
 # ======================== SUPERADMIN STATS ========================
 
-@router.get("/api/superadmin/stats")
-async def get_superadmin_stats(
-    period: str = "week",
-    user: Dict = Depends(require_superadmin)
-):
-    """Расширенная статистика для Superadmin Dashboard"""
-    
-    # Определяем текущий и предыдущий периоды для сравнения
-    now = datetime.now()
-    if period == "day":
-        start_date = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        prev_start = start_date - timedelta(days=1)
-        prev_end = start_date
-    elif period == "week":
-        start_date = now - timedelta(days=7)
-        prev_start = now - timedelta(days=14)
-        prev_end = start_date
-    elif period == "month":
-        start_date = now - timedelta(days=30)
-        prev_start = now - timedelta(days=60)
-        prev_end = start_date
+# Длина периода дашборда в днях
+PERIOD_DAYS = {"day": 1, "week": 7, "month": 30}
+
+
+def _period_days(period: str, date_from: Optional[str], date_to: Optional[str]) -> Tuple[str, str, str]:
+    """
+    Дни периода дашборда: (начало, конец не включая, начало предыдущего периода той же длины).
+    Периоды считаются целыми днями по дате created_at (UTC), сегодняшний день входит в период.
+    """
+    if period == "custom" and date_from and date_to:
+        try:
+            start = date.fromisoformat(date_from)
+            end = date.fromisoformat(date_to) + timedelta(days=1)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Некорректная дата периода")
+        if end <= start:
+            raise HTTPException(status_code=400, detail="Дата начала позже даты окончания")
     else:
-        start_date = now - timedelta(days=7)
-        prev_start = now - timedelta(days=14)
-        prev_end = start_date
+        end = datetime.utcnow().date() + timedelta(days=1)
+        start = end - timedelta(days=PERIOD_DAYS.get(period, 7))
+    prev_start = start - (end - start)
+    return start.isoformat(), end.isoformat(), prev_start.isoformat()
 
-    start_str = start_date.strftime('%Y-%m-%d %H:%M:%S')
-    prev_start_str = prev_start.strftime('%Y-%m-%d %H:%M:%S')
-    prev_end_str = prev_end.strftime('%Y-%m-%d %H:%M:%S')
 
-    with get_db() as conn:
-        cursor = conn.cursor()
+def _entity_stats(totals: List[Dict], entity: str) -> Dict:
+    """Итоги сущности из daily_metrics: всего/за период/за прошлый период и количество по статусам"""
+    stats = {"total": 0, "total_amount": 0, "period": 0, "period_amount": 0,
+             "prev_period": 0, "prev_period_amount": 0, "by_status": {}}
+    for row in totals:
+        if row["entity"] != entity:
+            continue
+        stats["total"] += row["total"]
+        stats["total_amount"] += row["amount"]
+        stats["period"] += row["period"]
+        stats["period_amount"] += row["period_amount"]
+        stats["prev_period"] += row["prev_period"]
+        stats["prev_period_amount"] += row["prev_period_amount"]
+        status = row["status"] or "unknown"
+        stats["by_status"][status] = stats["by_status"].get(status, 0) + row["total"]
+    return stats
 
-        # === ЗАЯВКИ ===
-        cursor.execute("SELECT COUNT(*) as cnt FROM callbacks WHERE status = 'new'")
-        new_callbacks = cursor.fetchone()['cnt']
 
-        cursor.execute("SELECT COUNT(*) as cnt FROM callbacks WHERE status = 'processing'")
-        processing_callbacks = cursor.fetchone()['cnt']
+def _calc_change(current, previous):
+    """Изменение к предыдущему периоду, %"""
+    if previous == 0:
+        return 100 if current > 0 else 0
+    return round(((current - previous) / previous) * 100, 2)
 
-        cursor.execute("SELECT COUNT(*) as cnt FROM callbacks WHERE created_at >= ?", (start_str,))
-        period_callbacks = cursor.fetchone()['cnt']
 
-        cursor.execute("SELECT COUNT(*) as cnt FROM callbacks WHERE created_at >= ? AND created_at < ?",
-                      (prev_start_str, prev_end_str))
-        prev_period_callbacks = cursor.fetchone()['cnt']
+def _avg(amount, count):
+    return amount / count if count > 0 else 0
 
-        cursor.execute("SELECT COUNT(*) as cnt FROM callbacks")
-        total_callbacks = cursor.fetchone()['cnt']
 
-        # === КЛИЕНТЫ ===
-        cursor.execute('''
-            SELECT
-                COUNT(*) as total,
-                SUM(CASE WHEN status = 'lead' THEN 1 ELSE 0 END) as leads,
-                SUM(CASE WHEN status = 'active' THEN 1 ELSE 0 END) as active,
-                SUM(CASE WHEN status = 'regular' THEN 1 ELSE 0 END) as regular,
-                SUM(CASE WHEN status = 'inactive' THEN 1 ELSE 0 END) as inactive
-            FROM clients
-        ''')
-        client_stats = dict(cursor.fetchone())
-
-        cursor.execute("SELECT COUNT(*) as cnt FROM clients WHERE created_at >= ?", (start_str,))
-        period_clients = cursor.fetchone()['cnt']
+@router.get("/api/superadmin/stats")
+async def get_superadmin_stats(
+    period: str = "week",
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    user: Dict = Depends(require_superadmin)
+):
+    """
+    Расширенная статистика для Superadmin Dashboard.
+    Счётчики и суммы берутся из дневных агрегатов daily_metrics одним запросом,
+    period: day/week/month или custom с date_from/date_to (YYYY-MM-DD).
+    """
+    start_day, end_day, prev_start_day = _period_days(period, date_from, date_to)
+    return await cached_stats(
+        ("superadmin_stats", period, start_day, end_day),
+        lambda: _superadmin_stats(period, start_day, end_day, prev_start_day)
+    )
+
+
+def _superadmin_stats(period: str, start_day: str, end_day: str, prev_start_day: str) -> Dict:
+    totals = MetricsDB.get_totals(start_day, end_day, prev_start_day)
+    managers_stats = MetricsDB.get_managers()
+    overdue_count = CallbackSLADB.get_overdue_count()
+
+    callbacks = _entity_stats(totals, "callback")
+    clients = _entity_stats(totals, "client")
+    quotes = _entity_stats(totals, "quote")
+    contracts = _entity_stats(totals, "contract")
+    partners = _entity_stats(totals, "partner")
+    users = _entity_stats(totals, "user")
+
+    sources: Dict[str, int] = {}
+    for row in totals:
+        if row["entity"] == "callback":
+            source = row["source"] or "unknown"
+            sources[source] = sources.get(source, 0) + row["total"]
 
-        cursor.execute("SELECT COUNT(*) as cnt FROM clients WHERE created_at >= ? AND created_at < ?",
-                      (prev_start_str, prev_end_str))
-        prev_period_clients = cursor.fetchone()['cnt']
+    with get_db() as conn:
+        cursor = conn.cursor()
 
-        # === КОММЕРЧЕСКИЕ ПРЕДЛОЖЕНИЯ ===
+        # === ВРЕМЯ КОНВЕРСИИ (от клиента до договора) ===
+        cursor.execute('''
+            SELECT AVG(
+                CAST((julianday(ct.created_at) - julianday(c.created_at)) AS INTEGER)
+            ) as avg_days
+            FROM contracts ct
+            INNER JOIN clients c ON ct.client_id = c.id
+            WHERE ct.created_at >= ? AND ct.created_at < ?
+        ''', (start_day, end_day))
+        avg_client_to_contract_days = cursor.fetchone()['avg_days'] or 0
+
+        # === ПОСЛЕДНИЕ АКТИВНОСТИ ===
         cursor.execute('''
-            SELECT
-                COUNT(*) as total,
-                SUM(CASE WHEN status = 'draft' THEN 1 ELSE 0 END) as drafts,
-                SUM(CASE WHEN status = 'sent' THEN 1 ELSE 0 END) as sent,
-                SUM(CASE WHEN status = 'accepted' THEN 1 ELSE 0 END) as accepted,
-                SUM(CASE WHEN status = 'rejected' THEN 1 ELSE 0 END) as rejected
-            FROM quotes
+            SELECT cb.id, cb.contact_name, cb.company_name, cb.status, cb.source, cb.created_at
+            FROM callbacks cb
+            ORDER BY cb.created_at DESC
+            LIMIT 5
         ''')
-        quote_stats = dict(cursor.fetchone())
-
-        cursor.execute("SELECT COUNT(*) as cnt FROM quotes WHERE created_at >= ?", (start_str,))
-        period_quotes = cursor.fetchone()['cnt']
-
-        cursor.execute("SELECT COUNT(*) as cnt FROM quotes WHERE created_at >= ? AND created_at < ?",
-                      (prev_start_str, prev_end_str))
-        prev_period_quotes = cursor.fetchone()['cnt']
+        recent_callbacks = [dict(row) for row in cursor.fetchall()]
 
-        # === ДОГОВОРЫ ===
         cursor.execute('''
-            SELECT
-                COUNT(*) as total,
-                SUM(CASE WHEN status = 'draft' THEN 1 ELSE 0 END) as drafts,
-                SUM(CASE WHEN status = 'active' THEN 1 ELSE 0 END) as active,
-                SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) as completed,
-                SUM(CASE WHEN status = 'cancelled' THEN 1 ELSE 0 END) as cancelled,
-                COALESCE(SUM(total_amount), 0) as total_revenue,
-                COALESCE(SUM(paid_amount), 0) as total_paid
-            FROM contracts
+            SELECT q.id, q.quote_number, q.total_amount, q.status, q.created_at,
+                   c.contact_name as client_name
+            FROM quotes q
+            LEFT JOIN clients c ON q.client_id = c.id
+            ORDER BY q.created_at DESC
+            LIMIT 5
         ''')
-        contract_stats = dict(cursor.fetchone())
-
-        cursor.execute("SELECT COUNT(*) as cnt FROM contracts WHERE created_at >= ?", (start_str,))
-        period_contracts = cursor.fetchone()['cnt']
-
-        cursor.execute("SELECT COUNT(*) as cnt FROM contracts WHERE created_at >= ? AND created_at < ?",
-                      (prev_start_str, prev_end_str))
-        prev_period_contracts = cursor.fetchone()['cnt']
+        recent_quotes = [dict(row) for row in cursor.fetchall()]
 
-        # Выручка за период
-        cursor.execute("SELECT COALESCE(SUM(total_amount), 0) as revenue FROM contracts WHERE created_at >= ?", 
-                      (start_str,))
-        period_revenue = cursor.fetchone()['revenue']
-
-        cursor.execute("SELECT COALESCE(SUM(total_amount), 0) as revenue FROM contracts WHERE created_at >= ? AND created_at < ?",
-                      (prev_start_str, prev_end_str))
-        prev_period_revenue = cursor.fetchone()['revenue']
-
-        # === ПАРТНЁРЫ ===
         cursor.execute('''
-            SELECT
-                COUNT(*) as total,
-                SUM(CASE WHEN status = 'active' THEN 1 ELSE 0 END) as active,
-                SUM(CASE WHEN status = 'pending' THEN 1 ELSE 0 END) as pending,
-                SUM(CASE WHEN status = 'inactive' THEN 1 ELSE 0 END) as inactive
-            FROM partners
+            SELECT ct.id, ct.contract_number, ct.total_amount, ct.status, ct.created_at,
+                   c.contact_name as client_name
+            FROM contracts ct
+            LEFT JOIN clients c ON ct.client_id = c.id
+            ORDER BY ct.created_at DESC
+            LIMIT 5
         ''')
-        partner_stats = dict(cursor.fetchone())
+        recent_contracts = [dict(row) for row in cursor.fetchall()]
 
-        # === ПОЛЬЗОВАТЕЛИ ===
-        cursor.execute("SELECT COUNT(*) as cnt FROM users")
-        total_users = cursor.fetchone()['cnt']
-
-        cursor.execute("SELECT COUNT(*) as cnt FROM users WHERE is_active = 1")
-        active_users = cursor.fetchone()['cnt']
-
-    # Вычисляем изменения
-    def calc_change(current, previous):
-        if previous == 0:
-            return 100 if current > 0 else 0
-        return round(((current - previous) / previous) * 100, 2)
+    def with_checks(stats: Dict) -> Dict:
+        return {
+            **stats,
+            "avg_check": _avg(stats["total_amount"], stats["total"]),
+            "period_avg_check": _avg(stats["period_amount"], stats["period"]),
+            "prev_avg_check": _avg(stats["prev_period_amount"], stats["prev_period"]),
+            "change": _calc_change(stats["period"], stats["prev_period"]),
+            "amount_change": _calc_change(stats["period_amount"], stats["prev_period_amount"]),
+        }
 
     return {
         "period": period,
+        "date_from": start_day,
+        "date_to": end_day,
         "callbacks": {
-            "new": new_callbacks,
-            "processing": processing_callbacks,
-            "total": total_callbacks,
-            "period_count": period_callbacks,
-            "change": calc_change(period_callbacks, prev_period_callbacks)
+            "new": callbacks["by_status"].get("new", 0),
+            "processing": callbacks["by_status"].get("processing", 0),
+            "period": callbacks["period"],
+            "prev_period": callbacks["prev_period"],
+            "total": callbacks["total"],
+            "overdue": overdue_count,
+            "change": _calc_change(callbacks["period"], callbacks["prev_period"]),
+            "by_status": callbacks["by_status"]
         },
         "clients": {
-            **client_stats,
-            "period_count": period_clients,
-            "change": calc_change(period_clients, prev_period_clients)
+            "total": clients["total"],
+            "leads": clients["by_status"].get("lead", 0),
+            "active": clients["by_status"].get("active", 0),
+            "regular": clients["by_status"].get("regular", 0),
+            "inactive": clients["by_status"].get("inactive", 0),
+            "period": clients["period"],
+            "prev_period": clients["prev_period"],
+            "change": _calc_change(clients["period"], clients["prev_period"]),
+            "by_status": clients["by_status"]
         },
-        "quotes": {
-            **quote_stats,
-            "period_count": period_quotes,
-            "change": calc_change(period_quotes, prev_period_quotes)
+        "quotes": with_checks(quotes),
+        "contracts": with_checks(contracts),
+        "partners": {"total": partners["total"], **partners["by_status"]},
+        "users": {"total": users["total"], "active": users["by_status"].get("active", 0)},
+        "funnel": {
+            "callbacks": callbacks["total"],
+            "clients": clients["total"],
+            "quotes": quotes["total"],
+            "contracts": contracts["total"]
         },
-        "contracts": {
-            **contract_stats,
-            "period_count": period_contracts,
-            "change": calc_change(period_contracts, prev_period_contracts),
-            "period_revenue": period_revenue,
-            "revenue_change": calc_change(period_revenue, prev_period_revenue)
+        "conversion": {
+            # Связь заявка -> клиент не хранится
+            "callback_to_client_hours": 0,
+            "client_to_contract_days": round(avg_client_to_contract_days, 1)
         },
-        "partners": partner_stats,
-        "users": {
-            "total": total_users,
-            "active": active_users
+        "managers": managers_stats,
+        "sources": [
+            {"source": source, "count": count}
+            for source, count in sorted(sources.items(), key=lambda item: item[1], reverse=True)
+        ],
+        "recent": {
+            "callbacks": recent_callbacks,
+            "quotes": recent_quotes,
+            "contracts": recent_contracts
         }
     }
 
 
+@router.get("/api/superadmin/stats/services")
+async def get_service_revenue_stats(
+    doc_type: str = "contract",
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    status: Optional[str] = None,
+    user: Dict = Depends(require_superadmin)
+):
+    """Выручка по услугам (doc_type: quote/contract/invoice, даты - YYYY-MM-DD)"""
+    if doc_type not in DocumentLinesDB.DOC_TABLES:
+        raise HTTPException(status_code=400, detail="Недопустимый тип документа")
+    services = await AsyncDocumentLinesDB.get_service_revenue(
+        doc_type=doc_type, date_from=date_from, date_to=date_to, status=status
+    )
+    return {"services": services}
+
+
+# Период графика по умолчанию (дней) и максимум точек в ответе
+SERIES_DEFAULT_DAYS = {"hour": 2, "day": 30, "week": 84}
+MAX_SERIES_POINTS = 1000
+# Сущность daily_metrics -> ряд графика с количеством
+SERIES_COUNTS = {"callback": "callbacks", "client": "clients", "quote": "quotes", "contract": "contracts"}
+
+
+def _series_labels(bucket: str, start: date, end: date) -> List[str]:
+    """Все интервалы дней [start, end) подряд - пустые тоже, чтобы на графике не было разрывов"""
+    if bucket == "hour":
+        step, label_format = timedelta(hours=1), "%Y-%m-%d %H:00"
+    elif bucket == "week":
+        step, label_format = timedelta(days=7), "%Y-%m-%d"
+    else:
+        step, label_format = timedelta(days=1), "%Y-%m-%d"
+    labels = []
+    point = datetime.combine(start, datetime.min.time())
+    while point.date() < end:
+        labels.append(point.strftime(label_format))
+        point += step
+    return labels
+
+
+def _ai_cost_series(bucket: str, start: str, end: str) -> List[Dict]:
+    """Стоимость токенов AI-консультанта по интервалам (у консультанта своя БД)"""
+    bucket_sql = MetricsDB.SERIES_BUCKETS[bucket].format(column="created_at")
+    try:
+        with get_ai_db() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f'''
+                SELECT {bucket_sql} as bucket, COALESCE(SUM(cost_usd), 0) as cost
+                FROM ai_token_usage
+                WHERE created_at >= ? AND created_at < ?
+                GROUP BY 1
+            ''', (start, end))
+            return [dict(row) for row in cursor.fetchall()]
+    except sqlite3.Error as e:
+        logger.warning(f"AI cost series unavailable: {e}")
+        return []
+
+
+def _stats_series(bucket: str, start: date, end: date) -> Dict:
+    labels = _series_labels(bucket, start, end)
+    positions = {label: i for i, label in enumerate(labels)}
+    series = {name: [0] * len(labels) for name in (*SERIES_COUNTS.values(), "revenue", "ai_cost_usd")}
+
+    start_str, end_str = start.isoformat(), end.isoformat()
+    for row in MetricsDB.get_series(bucket, start_str, end_str):
+        i = positions.get(row["bucket"])
+        if i is None:
+            continue
+        series[SERIES_COUNTS[row["entity"]]][i] = row["count"]
+        if row["entity"] == "contract":
+            series["revenue"][i] = row["amount"]
+
+    for row in _ai_cost_series(bucket, start_str, end_str):
+        i = positions.get(row["bucket"])
+        if i is not None:
+            series["ai_cost_usd"][i] = row["cost"]
+
+    return {
+        "bucket": bucket,
+        "date_from": start_str,
+        "date_to": (end - timedelta(days=1)).isoformat(),
+        "labels": labels,
+        "series": series
+    }
+
+
+@router.get("/api/superadmin/stats/series")
+async def get_stats_series(
+    bucket: str = "day",
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    user: Dict = Depends(require_superadmin)
+):
+    """
+    Ряды для графиков: заявки, новые клиенты, КП, договоры, выручка и стоимость AI
+    по интервалам bucket (hour/day/week) за даты date_from..date_to включительно (YYYY-MM-DD, UTC).
+    Пустые интервалы заполнены нулями, labels - начала интервалов (недели - с понедельника).
+    """
+    if bucket not in MetricsDB.SERIES_BUCKETS:
+        raise HTTPException(status_code=400, detail="Недопустимый интервал (hour, day, week)")
+    try:
+        end = (date.fromisoformat(date_to) if date_to else datetime.utcnow().date()) + timedelta(days=1)
+        if date_from:
+            start = date.fromisoformat(date_from)
+        else:
+            start = end - timedelta(days=SERIES_DEFAULT_DAYS[bucket])
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Некорректная дата периода")
+    if bucket == "week":
+        start -= timedelta(days=start.weekday())
+    if end <= start:
+        raise HTTPException(status_code=400, detail="Дата начала позже даты окончания")
+    if len(_series_labels(bucket, start, end)) > MAX_SERIES_POINTS:
+        raise HTTPException(status_code=400, detail=f"Слишком много точек (максимум {MAX_SERIES_POINTS})")
+
+    return await cached_stats(
+        ("stats_series", bucket, start, end),
+        lambda: _stats_series(bucket, start, end)
+    )
+
+
 # ======================== DASHBOARD STATS ========================
 
 @router.get("/api/stats/dashboard")
-async def get_dashboard_stats(user: Dict = Depends(require_employee)):
+def get_dashboard_stats(user: Dict = Depends(require_employee)):
     """Общая статистика для дашборда"""
     with get_db() as conn:
         cursor = conn.cursor()
@@ -336,7 +493,7 @@ async def get_dashboard_stats(user: Dict = Depends(require_employee)):
 # ======================== TNVED STATS ========================
 
 @router.get("/api/tnved/stats")
-async def get_tnved_stats(user: Dict = Depends(require_employee)):
+def get_tnved_stats(user: Dict = Depends(require_employee)):
     """Статистика по поиску ТН ВЭД кодов"""
     with get_db() as conn:
         cursor = conn.cursor()
@@ -370,7 +527,7 @@ async def get_tnved_stats(user: Dict = Depends(require_employee)):
 # ======================== EMAIL STATS ========================
 
 @router.get("/api/email/stats")
-async def get_email_stats(user: Dict = Depends(require_admin)):
+def get_email_stats(user: Dict = Depends(require_admin)):
     """Статистика по email рассылкам"""
     with get_db() as conn:
         cursor = conn.cursor()
@@ -1,27 +1,31 @@
 """
 API эндпоинты для ТНВЭД и маркировки
-/api/tnved/* - поиск и статистика ТН ВЭД
+/api/tnved/* - поиск и статистика ТН ВЭД, проверка CSV/XLSX файлов
 /api/check/* - проверка товаров на маркировку
 /api/marking/timeline/* - сроки маркировки
 """
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Depends, File, Request, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Optional, List, Dict
-from datetime import datetime, timedelta
-import os
+from datetime import date
+from urllib.parse import quote as url_quote
 import json
 import logging
+import os
+import tempfile
+
+from auth import require_employee
+from catalog import get_catalog, get_timeline_stats_with_upcoming
+from precomputed import precomputed_response
+from tnved_bulk import annotate_rows, iter_csv_chunks, iter_csv_rows, iter_xlsx_rows
 
 logger = logging.getLogger(__name__)
 
 # ======================== ROUTER ========================
 router = APIRouter(prefix="/api", tags=["tnved"])
 
-# ======================== CACHE ========================
-_tnved_data = None
-_tnved_stats_cache = None
-_timeline_data_cache = None
-
 # ======================== PYDANTIC MODELS ========================
 
 class CheckProductRequest(BaseModel):
@@ -44,121 +48,19 @@ class CheckProductResponse(BaseModel):
     steps: List[str]
     message: str
 
-# ======================== DATA LOADING FUNCTIONS ========================
+class BatchAssessRequest(BaseModel):
+    items: List[str]  # ID товаров из CATEGORIES_DATA, "tnved_<код>" или коды ТН ВЭД
+    stream: bool = False  # NDJSON: по строке на позицию, последней - сводка
 
-def get_tnved_data():
-    """Загрузить данные ТН ВЭД из JSON"""
-    global _tnved_data
-    if _tnved_data is None:
-        json_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'tnved.json')
-        try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                _tnved_data = json.load(f)
-            logger.info(f"Loaded {len(_tnved_data)} TNVED codes from JSON")
-        except FileNotFoundError:
-            logger.warning("TNVED JSON not found, returning empty list")
-            _tnved_data = []
-    return _tnved_data
-
-def get_tnved_stats_cached():
-    """Закэшированная статистика ТН ВЭД"""
-    global _tnved_stats_cache
-    if _tnved_stats_cache is None:
-        # Import here to avoid circular dependency
-        from server import CATEGORIES_DATA
-        
-        data = get_tnved_data()
-        total = len(data) if data else 0
-        mandatory = 0
-        experimental = 0
-        for category in CATEGORIES_DATA:
-            for subcategory in category.get("subcategories", []):
-                for product in subcategory.get("products", []):
-                    status = product.get("marking_status", "not_required")
-                    if status == "mandatory":
-                        mandatory += 1
-                    elif status == "experiment":
-                        experimental += 1
-        _tnved_stats_cache = {
-            "loaded": True,
-            "total": total,
-            "mandatory": mandatory,
-            "experimental": experimental,
-            "not_required": total - mandatory - experimental
-        }
-    return _tnved_stats_cache
-
-def get_timeline_data_cached():
-    """Закэшированные данные timeline"""
-    global _timeline_data_cache
-    if _timeline_data_cache is None:
-        try:
-            timeline_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'marking_timeline.json')
-            if os.path.exists(timeline_path):
-                with open(timeline_path, 'r', encoding='utf-8') as f:
-                    _timeline_data_cache = json.load(f)
-                logger.info("Loaded marking_timeline.json")
-        except Exception as e:
-            logger.error(f"Failed to load marking_timeline.json: {e}")
-            _timeline_data_cache = {}
-    return _timeline_data_cache
-
-def get_timeline_stats_with_upcoming():
-    """Расчёт статистики с ближайшими дедлайнами"""
-    data = get_timeline_data_cached()
-    if not data:
-        return {
-            "active": 0,
-            "partial": 0,
-            "upcoming_count": 0,
-            "upcoming_events": []
-        }
-
-    categories = data.get("categories", {})
-    today = datetime.now().date()
-    six_months_later = today + timedelta(days=180)
-
-    active = 0
-    partial = 0
-    upcoming_events = []
-
-    for cat_name, cat_data in categories.items():
-        status = cat_data.get("status", "")
-        if status == "active":
-            active += 1
-        elif status == "partial":
-            partial += 1
-
-        # Собираем будущие события
-        for event in cat_data.get("events", []):
-            if not event.get("is_completed", False):
-                date_str = event.get("date", "")
-                if date_str:
-                    try:
-                        event_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-                        if today < event_date <= six_months_later:
-                            upcoming_events.append({
-                                "date": date_str,
-                                "date_display": event.get("date_display", ""),
-                                "category": cat_name,
-                                "title": event.get("title", ""),
-                                "type_label": event.get("type_label", ""),
-                                "description": event.get("description", "")[:200] if event.get("description") else ""
-                            })
-                    except:
-                        pass
-
-    # Сортируем по дате
-    upcoming_events.sort(key=lambda x: x["date"])
+# ======================== CONSTANTS ========================
 
-    return {
-        "active": active,
-        "partial": partial,
-        "upcoming_count": len(upcoming_events),
-        "upcoming_events": upcoming_events[:10]  # Топ 10 ближайших
-    }
+# Максимум позиций в одном пакетном запросе
+MAX_BATCH_ITEMS = 10000
 
-# ======================== CONSTANTS ========================
+# Максимальный размер загружаемого файла для массовой проверки
+MAX_UPLOAD_BYTES = 100 * 1024 * 1024
+# Размер куска при копировании загрузки
+UPLOAD_CHUNK_BYTES = 1024 * 1024
 
 MARKING_STEPS = [
     "Зарегистрироваться в системе Честный ЗНАК (честныйзнак.рф)",
@@ -179,47 +81,32 @@ EXPERIMENT_STEPS = [
 # ======================== ENDPOINTS ========================
 
 @router.get("/check/categories")
-async def get_categories():
+async def get_categories(request: Request):
     """Get all product categories and subcategories"""
-    from server import CATEGORIES_DATA
-    return {"groups": CATEGORIES_DATA}
+    catalog = get_catalog()
+    return await precomputed_response(request, "categories", catalog.version, lambda: {"groups": catalog.categories})
 
 @router.get("/check/init")
-async def get_check_init():
+async def get_check_init(request: Request):
     """Unified endpoint for initial page load - returns categories, stats, timeline in one request"""
-    from server import CATEGORIES_DATA
-    
-    timeline_stats = get_timeline_stats_with_upcoming()
+    catalog = get_catalog()
+    # Ближайшие дедлайны зависят от текущей даты, поэтому ответ пересобирается раз в день
+    key = (catalog.version, date.today())
 
-    return {
-        "groups": CATEGORIES_DATA,
-        "tnved_stats": get_tnved_stats_cached(),
-        "timeline_stats": timeline_stats
-    }
+    return await precomputed_response(request, "check_init", key, lambda: {
+        "groups": catalog.categories,
+        "tnved_stats": catalog.tnved_stats,
+        "timeline_stats": get_timeline_stats_with_upcoming(catalog)
+    })
 
 @router.post("/check/assess", response_model=CheckProductResponse)
 async def assess_product(request: CheckProductRequest):
     """Assess if product requires marking"""
-    from server import PRODUCTS_LOOKUP, TNVED_LOOKUP
-
-    # Look up product by product ID first
-    product = None
-    if request.product:
-        product = PRODUCTS_LOOKUP.get(request.product)
-
-        # If not found by ID, try to extract TNVED code from product ID (e.g. "tnved_2203" -> "2203")
-        if not product and request.product.startswith("tnved_"):
-            tnved_code = request.product.replace("tnved_", "")
-            product = TNVED_LOOKUP.get(tnved_code)
-
-            # Try with spaces if not found (e.g. "220300" -> "2203 00")
-            if not product and len(tnved_code) >= 4:
-                # Try common patterns: 220300 -> 2203 00, 22030031 -> 2203 00 31
-                for i in range(4, len(tnved_code)):
-                    spaced = tnved_code[:4] + " " + tnved_code[4:i] + (" " + tnved_code[i:] if i < len(tnved_code) else "")
-                    product = TNVED_LOOKUP.get(spaced.strip())
-                    if product:
-                        break
+    catalog = get_catalog()
+
+    # Look up product by product ID, "tnved_<код>" or TNVED code - the same lookup as the batch
+    # endpoint: longest known code prefix of at least 4 digits ("2203 00 31" finds "2203")
+    product, _, _ = catalog.resolve_product(request.product)
 
     if product:
         marking_status = product.get("marking_status", "not_required")
@@ -273,36 +160,167 @@ async def assess_product(request: CheckProductRequest):
         message="Информация о данном товаре не найдена в базе. Рекомендуем уточнить на сайте честныйзнак.рф"
     )
 
+def _batch_line(catalog, line: int, query: str, cache: Dict) -> Dict:
+    """Результат проверки одной позиции пакета (повторяющиеся коды резолвятся один раз)"""
+    resolved = cache.get(query)
+    if resolved is None:
+        resolved = cache[query] = catalog.resolve_product(query)
+    product, match_type, matched_code = resolved
+
+    if not product:
+        return {"line": line, "query": query, "found": False, "requires_marking": False, "status": "not_found"}
+
+    status = product.get("marking_status", "not_required")
+    if status == "experimental":
+        status = "experiment"
+    return {
+        "line": line,
+        "query": query,
+        "found": True,
+        "match_type": match_type,
+        "matched_code": matched_code,
+        "requires_marking": status == "mandatory",
+        "status": status,
+        "tnved": product.get("tnved"),
+        "name": product.get("name"),
+        "category_name": product.get("category_name"),
+        "mandatory_since": product.get("mandatory_since")
+    }
+
+
+def _add_to_summary(summary: Dict, result: Dict):
+    summary["total"] += 1
+    summary[result["status"] if result["status"] in summary else "not_required"] += 1
+    if result["found"]:
+        summary["found"] += 1
+
+
+def _empty_summary() -> Dict:
+    return {"total": 0, "found": 0, "mandatory": 0, "experiment": 0, "not_required": 0, "not_found": 0}
+
+
+@router.post("/check/assess/batch")
+async def assess_products_batch(request: BatchAssessRequest):
+    """Пакетная проверка маркировки: список ID товаров или кодов ТН ВЭД за один запрос"""
+    if len(request.items) > MAX_BATCH_ITEMS:
+        raise HTTPException(status_code=400, detail=f"Не более {MAX_BATCH_ITEMS} позиций за запрос")
+
+    # Один снимок каталога на весь пакет
+    catalog = get_catalog()
+    cache: Dict = {}
+
+    if request.stream:
+        def generate():
+            summary = _empty_summary()
+            for line, query in enumerate(request.items, start=1):
+                result = _batch_line(catalog, line, query, cache)
+                _add_to_summary(summary, result)
+                yield json.dumps(result, ensure_ascii=False) + "\n"
+            yield json.dumps({"summary": summary}, ensure_ascii=False) + "\n"
+
+        return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+    summary = _empty_summary()
+    results = []
+    for line, query in enumerate(request.items, start=1):
+        result = _batch_line(catalog, line, query, cache)
+        _add_to_summary(summary, result)
+        results.append(result)
+
+    return {"results": results, "summary": summary}
+
+
 @router.get("/tnved/search")
 async def api_tnved_search(q: str = "", limit: int = 50):
     """Поиск по базе ТН ВЭД"""
     if not q or len(q) < 2:
         return {"results": [], "query": q}
 
-    data = get_tnved_data()
-    q_lower = q.lower()
     q_digits = q.replace(' ', '')
 
-    results = []
-    for item in data:
-        # Поиск по коду
-        if q_digits.isdigit():
-            if item['code'].startswith(q_digits):
-                results.append(item)
-        # Поиск по названию
-        elif q_lower in item['name'].lower():
-            results.append(item)
-
-        if len(results) >= limit:
-            break
+    if q_digits.isdigit():
+        # Поиск по коду - через префиксный индекс
+        results = get_catalog().tnved_code_index.prefix(q_digits, limit)
+    else:
+        # Поиск по названию - через инвертированный индекс с ранжированием
+        results = get_catalog().tnved_name_index.search(q, limit)
 
     return {"results": results, "query": q, "count": len(results)}
 
 
+def _prepare_check_file(upload, ext: str, code_column: Optional[int]):
+    """
+    Скопировать загрузку во временный файл и открыть разбор строк (в пуле потоков).
+    UploadFile закрывается до окончания потоковой отдачи ответа, поэтому нужна копия;
+    копирование идёт кусками и прерывается, как только превышен MAX_UPLOAD_BYTES.
+    Возвращает (путь к файлу, открытый файл, строки с результатом).
+    """
+    tmp = tempfile.NamedTemporaryFile(suffix=ext, delete=False)
+    try:
+        with tmp:
+            size = 0
+            while True:
+                chunk = upload.read(UPLOAD_CHUNK_BYTES)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > MAX_UPLOAD_BYTES:
+                    raise HTTPException(status_code=400, detail="Файл слишком большой")
+                tmp.write(chunk)
+
+        source = open(tmp.name, "rb")
+        try:
+            rows = iter_xlsx_rows(source) if ext == ".xlsx" else iter_csv_rows(source)
+            annotated = annotate_rows(rows, get_catalog(), code_column)
+        except Exception:
+            source.close()
+            raise
+    except ValueError as e:
+        os.unlink(tmp.name)
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception:
+        os.unlink(tmp.name)
+        raise
+    return tmp.name, source, annotated
+
+
+@router.post("/tnved/check-file")
+async def api_tnved_check_file(
+    file: UploadFile = File(...),
+    code_column: Optional[int] = None,
+    user: Dict = Depends(require_employee)
+):
+    """
+    Массовая проверка кодов ТН ВЭД из CSV/XLSX.
+    Возвращает исходный файл в CSV с колонками результата, строки отдаются потоком.
+    """
+    filename = file.filename or "file.csv"
+    ext = os.path.splitext(filename)[1].lower()
+    if ext not in (".csv", ".txt", ".xlsx"):
+        raise HTTPException(status_code=400, detail="Поддерживаются файлы CSV и XLSX")
+
+    tmp_name, source, annotated = await run_in_threadpool(_prepare_check_file, file.file, ext, code_column)
+
+    def generate():
+        try:
+            yield from iter_csv_chunks(annotated)
+        finally:
+            source.close()
+            os.unlink(tmp_name)
+
+    logger.info(f"TNVED file check started by {user.get('email')}: {filename}")
+    result_name = os.path.splitext(filename)[0] + "_проверка.csv"
+    return StreamingResponse(
+        generate(),
+        media_type="text/csv; charset=utf-8",
+        headers={"Content-Disposition": f"attachment; filename*=UTF-8''{url_quote(result_name)}"}
+    )
+
+
 @router.get("/tnved/stats")
 async def api_tnved_stats():
     """Статистика: всего кодов из tnved.json, обязательных/эксперимент из CATEGORIES_DATA"""
-    return get_tnved_stats_cached()
+    return get_catalog().tnved_stats
 
 
 @router.get("/marking/timeline/stats")
@@ -315,7 +333,7 @@ async def api_timeline_stats():
 @router.get("/marking/timeline")
 async def api_timeline():
     """Полные данные по срокам маркировки"""
-    data = get_timeline_data_cached()
+    data = get_catalog().timeline
     if not data:
         return {"categories": {}, "groups": [], "statistics": {}}
 
@@ -325,19 +343,9 @@ async def api_timeline():
 @router.get("/marking/timeline/category/{category_id}")
 async def api_timeline_category(category_id: str):
     """Данные по конкретной категории"""
-    data = get_timeline_data_cached()
-    if not data or "categories" not in data:
-        raise HTTPException(status_code=404, detail="Category not found")
-
-    categories = data.get("categories", {})
-
-    if category_id in categories:
-        return categories[category_id]
-
     from urllib.parse import unquote
-    decoded_id = unquote(category_id)
-    for cat_name, cat_data in categories.items():
-        if cat_name == decoded_id or cat_data.get("id") == category_id:
-            return cat_data
+    match = get_catalog().find_timeline_category(unquote(category_id))
+    if match:
+        return match[1]
 
     raise HTTPException(status_code=404, detail="Category not found")
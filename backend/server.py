@@ -18,7 +18,7 @@ import logging
 import httpx
 import uuid
 import json
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from urllib.parse import quote as url_quote
 from collections import defaultdict
 import time
@@ -35,9 +35,14 @@ from database import (
     CompanyDB, QuoteDB, ContractDB, CallbackDB, UserDB,
     ClientDB, InteractionDB, CallbackDBExtended,
     NotificationSettingsDB, CRMSettingsDB, CallbackSLADB,
-    get_next_contract_number, get_db, PartnerDB
+    get_next_contract_number, get_next_invoice_number, get_db, PartnerDB, AsyncClientDB, AsyncSearchDB
 )
 from education_db import EducationDB
+from catalog import get_catalog, get_timeline_stats_with_upcoming, start_catalog_reloader, stop_catalog_reloader
+from precomputed import precomputed_response
+from db_pool import close_all_pools
+from db_async import run_db, shutdown_db_executor
+from pagination import InvalidCursor
 
 # AI Consultant
 from ai_consultant import router as ai_router
@@ -74,6 +79,13 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         content={"detail": exc.errors()}
     )
 
+
+# Курсор пагинации, не выданный этим API
+@app.exception_handler(InvalidCursor)
+async def invalid_cursor_handler(request: Request, exc: InvalidCursor):
+    return JSONResponse(status_code=400, content={"detail": "Некорректный курсор пагинации"})
+
+
 # AI Consultant router
 app.include_router(ai_router, prefix="/api")
 
@@ -302,1520 +314,8 @@ class QuoteResponse(BaseModel):
     created_at: str
     valid_until: str
 
-# ======================== НОВАЯ СТРУКТУРА КАТЕГОРИЙ ========================
-# 3 уровня: Категория → Подкатегория → Товары (products)
-# Товары будут добавляться постепенно через админку
-
-CATEGORIES_DATA = [
-    {
-        "id": "food_drinks",
-        "name": "Продукты питания и напитки",
-        "icon": "utensils",
-        "subcategories": [
-            {"id": "beer_alcohol", "name": "Пиво и слабоалкогольные напитки", "icon": "beer", "products": [
-                {"id": "beer_alcohol_2203", "name": "пиво крепостью от 0,5 % до 8,6 % включительно,; пиво крепостью свыше 8", "tnved": "2203", "marking_status": "mandatory"},
-                {"id": "beer_alcohol_220300", "name": "Пиво солодовое:", "tnved": "2203 00", "marking_status": "mandatory"},
-                {"id": "beer_alcohol_2206", "name": "пиво крепостью от 0,5 % до 8,6 % включительно,; пиво крепостью свыше 8", "tnved": "2206", "marking_status": "mandatory"},
-                {"id": "beer_alcohol_220600", "name": "Напитки прочие сброженные (например, сидр, сидр грушевый, напиток медо", "tnved": "2206 00", "marking_status": "mandatory"},
-                {"id": "beer_alcohol_22060031", "name": "сидр, пуаре", "tnved": "2206 00 31", "marking_status": "mandatory"},
-                {"id": "beer_alcohol_2206003100", "name": "сидр и грушевый сидр", "tnved": "2206 00 310 0", "marking_status": "mandatory"},
-                {"id": "beer_alcohol_22060051", "name": "сидр, пуаре", "tnved": "2206 00 51", "marking_status": "mandatory"},
-                {"id": "beer_alcohol_2206005100", "name": "сидр и грушевый сидр", "tnved": "2206 00 510 0", "marking_status": "mandatory"},
-                {"id": "beer_alcohol_22060081", "name": "сидр, пуаре", "tnved": "2206 00 81", "marking_status": "mandatory"},
-                {"id": "beer_alcohol_2206008100", "name": "сидр и грушевый сидр", "tnved": "2206 00 810 0", "marking_status": "mandatory"},
-                {"id": "beer_alcohol_22060039", "name": "напитки слабоалкогольные брожения", "tnved": "2206 00 39", "marking_status": "mandatory"},
-                {"id": "beer_alcohol_2206003901", "name": "с фактической концентрацией спирта не более 7 об.%", "tnved": "2206 00 390 1", "marking_status": "mandatory"},
-                {"id": "beer_alcohol_22060059", "name": "напитки слабоалкогольные брожения", "tnved": "2206 00 59", "marking_status": "mandatory"},
-                {"id": "beer_alcohol_2206005901", "name": "с фактической концентрацией спирта не более 7 об.%", "tnved": "2206 00 590 1", "marking_status": "mandatory"},
-                {"id": "beer_alcohol_22060089", "name": "напитки слабоалкогольные брожения", "tnved": "2206 00 89", "marking_status": "mandatory"},
-                {"id": "beer_alcohol_2206008901", "name": "с фактической концентрацией спирта не более 7 об.%", "tnved": "2206 00 890 1", "marking_status": "mandatory"}
-            ]},
-            {"id": "dairy", "name": "Молочная продукция", "icon": "milk", "products": [
-                {
-                    "id": "dairy_0401", "name": "Молоко и сливки несгущенные", "tnved": "0401",
-                    "marking_status": "mandatory", "mandatory_since": "2021-12-01",
-                    "timeline": {
-                        "title": "Срок годности до 40 дней",
-                        "start_date": "1 декабря 2021",
-                        "who": ["Производители", "Импортёры", "Оптовики", "Розница"],
-                        "current_requirements": [
-                            "Регистрация в Честном ЗНАКе",
-                            "Нанесение кодов маркировки",
-                            "Передача данных при продаже на кассе",
-                            "Электронный документооборот (ЭДО)"
-                        ]
-                    }
-                },
-                {
-                    "id": "dairy_0402", "name": "Молоко и сливки сгущенные", "tnved": "0402",
-                    "marking_status": "mandatory", "mandatory_since": "2021-09-01",
-                    "timeline": {
-                        "title": "Срок годности более 40 дней",
-                        "start_date": "1 сентября 2021",
-                        "who": ["Производители", "Импортёры", "Оптовики", "Розница"],
-                        "current_requirements": [
-                            "Регистрация в Честном ЗНАКе",
-                            "Нанесение кодов маркировки",
-                            "Передача данных при продаже на кассе",
-                            "Электронный документооборот (ЭДО)"
-                        ]
-                    }
-                },
-                {
-                    "id": "dairy_0403", "name": "Пахта, йогурт, кефир", "tnved": "0403",
-                    "marking_status": "mandatory", "mandatory_since": "2021-12-01",
-                    "timeline": {
-                        "title": "Срок годности до 40 дней",
-                        "start_date": "1 декабря 2021",
-                        "who": ["Производители", "Импортёры", "Оптовики", "Розница"],
-                        "current_requirements": [
-                            "Регистрация в Честном ЗНАКе",
-                            "Нанесение кодов маркировки",
-                            "Передача данных при продаже на кассе",
-                            "Электронный документооборот (ЭДО)"
-                        ]
-                    }
-                },
-                {
-                    "id": "dairy_0404", "name": "Молочная сыворотка", "tnved": "0404",
-                    "marking_status": "mandatory", "mandatory_since": "2021-09-01",
-                    "timeline": {
-                        "title": "Срок годности более 40 дней",
-                        "start_date": "1 сентября 2021",
-                        "who": ["Производители", "Импортёры", "Оптовики", "Розница"],
-                        "current_requirements": [
-                            "Регистрация в Честном ЗНАКе",
-                            "Нанесение кодов маркировки",
-                            "Передача данных при продаже на кассе",
-                            "Электронный документооборот (ЭДО)"
-                        ]
-                    }
-                },
-                {
-                    "id": "dairy_0405", "name": "Сливочное масло", "tnved": "0405",
-                    "marking_status": "mandatory", "mandatory_since": "2021-09-01",
-                    "timeline": {
-                        "title": "Срок годности более 40 дней",
-                        "start_date": "1 сентября 2021",
-                        "who": ["Производители", "Импортёры", "Оптовики", "Розница"],
-                        "current_requirements": [
-                            "Регистрация в Честном ЗНАКе",
-                            "Нанесение кодов маркировки",
-                            "Передача данных при продаже на кассе",
-                            "Электронный документооборот (ЭДО)"
-                        ]
-                    }
-                },
-                {
-                    "id": "dairy_0406", "name": "Сыры и творог", "tnved": "0406",
-                    "marking_status": "mandatory", "mandatory_since": "2021-06-01",
-                    "timeline": {
-                        "title": "Сыры — первая категория",
-                        "start_date": "1 июня 2021",
-                        "who": ["Производители", "Импортёры", "Оптовики", "Розница", "Фермеры (с 1.09.2024)"],
-                        "current_requirements": [
-                            "Регистрация в Честном ЗНАКе",
-                            "Нанесение кодов маркировки",
-                            "Передача данных при продаже на кассе",
-                            "Разрешительный режим на кассах",
-                            "Электронный документооборот (ЭДО)"
-                        ]
-                    }
-                },
-                {
-                    "id": "dairy_210500", "name": "Мороженое", "tnved": "2105 00",
-                    "marking_status": "mandatory", "mandatory_since": "2021-06-01",
-                    "timeline": {
-                        "title": "Мороженое — первая категория",
-                        "start_date": "1 июня 2021",
-                        "who": ["Производители", "Импортёры", "Оптовики", "Розница", "Фермеры (с 1.09.2024)"],
-                        "current_requirements": [
-                            "Регистрация в Честном ЗНАКе",
-                            "Нанесение кодов маркировки",
-                            "Передача данных при продаже на кассе",
-                            "Разрешительный режим на кассах",
-                            "Электронный документооборот (ЭДО)"
-                        ]
-                    }
-                },
-                {
-                    "id": "dairy_2202999100", "name": "Молочные напитки (до 0,2% жира)", "tnved": "2202 99 910 0",
-                    "marking_status": "mandatory", "mandatory_since": "2021-12-01",
-                    "timeline": {
-                        "title": "Молочные напитки",
-                        "start_date": "1 декабря 2021",
-                        "who": ["Производители", "Импортёры", "Оптовики", "Розница"],
-                        "current_requirements": [
-                            "Регистрация в Честном ЗНАКе",
-                            "Нанесение кодов маркировки",
-                            "Передача данных при продаже на кассе",
-                            "Электронный документооборот (ЭДО)"
-                        ]
-                    }
-                },
-                {
-                    "id": "dairy_2202999500", "name": "Молочные напитки (0,2-2% жира)", "tnved": "2202 99 950 0",
-                    "marking_status": "mandatory", "mandatory_since": "2021-12-01",
-                    "timeline": {
-                        "title": "Молочные напитки",
-                        "start_date": "1 декабря 2021",
-                        "who": ["Производители", "Импортёры", "Оптовики", "Розница"],
-                        "current_requirements": [
-                            "Регистрация в Честном ЗНАКе",
-                            "Нанесение кодов маркировки",
-                            "Передача данных при продаже на кассе",
-                            "Электронный документооборот (ЭДО)"
-                        ]
-                    }
-                },
-                {
-                    "id": "dairy_2202999900", "name": "Молочные напитки (от 2% жира)", "tnved": "2202 99 990 0",
-                    "marking_status": "mandatory", "mandatory_since": "2021-12-01",
-                    "timeline": {
-                        "title": "Молочные напитки",
-                        "start_date": "1 декабря 2021",
-                        "who": ["Производители", "Импортёры", "Оптовики", "Розница"],
-                        "current_requirements": [
-                            "Регистрация в Честном ЗНАКе",
-                            "Нанесение кодов маркировки",
-                            "Передача данных при продаже на кассе",
-                            "Электронный документооборот (ЭДО)"
-                        ]
-                    }
-                }
-            ]},
-            {"id": "water", "name": "Упакованная вода", "icon": "droplet", "products": [
-                {"id": "water_220110_1", "name": "Природные минеральные воды газированные", "tnved": "2201 10", "marking_status": "mandatory"},
-                {"id": "water_220110_2", "name": "Природные минеральные воды негазированные", "tnved": "2201 10", "marking_status": "mandatory"},
-                {"id": "water_220110_3", "name": "Природные минеральные воды слабогазированные", "tnved": "2201 10", "marking_status": "mandatory"},
-                {"id": "water_22019000_1", "name": "Вода питьевая газированная", "tnved": "2201 90 000 0", "marking_status": "mandatory"},
-                {"id": "water_22019000_2", "name": "Вода питьевая негазированная", "tnved": "2201 90 000 0", "marking_status": "mandatory"},
-                {"id": "water_22019000_3", "name": "Вода питьевая слабогазированная", "tnved": "2201 90 000 0", "marking_status": "mandatory"},
-                {"id": "water_22019000_4", "name": "Вода питьевая прочая", "tnved": "2201 90 000 0", "marking_status": "mandatory"},
-                {"id": "water_22019000_5", "name": "Вода для детского питания", "tnved": "2201 90 000 0", "marking_status": "mandatory"}
-            ]},
-            {"id": "tobacco", "name": "Табак", "icon": "cigarette", "products": [
-                {"id": "tobacco_2402", "name": "Сигары, сигары с обрезанными концами, сигариллы и сигареты из табака и", "tnved": "2402", "marking_status": "mandatory"},
-                {"id": "tobacco_240220", "name": "сигареты, содержащие табак:", "tnved": "2402 20", "marking_status": "mandatory"},
-                {"id": "tobacco_24022090", "name": "сигареты", "tnved": "2402 20 90", "marking_status": "mandatory"},
-                {"id": "tobacco_2402209000", "name": "прочие", "tnved": "2402 20 900 0", "marking_status": "mandatory"},
-                {"id": "tobacco_2403", "name": "Прочий промышленно изготовленный табак и промышленные заменители табак", "tnved": "2403", "marking_status": "mandatory"},
-                {"id": "tobacco_240311", "name": "табак для кальяна, сигары, сигары с обрезанными концами (черуты), сига", "tnved": "2403 11", "marking_status": "mandatory"},
-                {"id": "tobacco_24031100", "name": "табак для кальяна, сигары, сигары с обрезанными концами (черуты), сига", "tnved": "2403 11 00", "marking_status": "mandatory"},
-                {"id": "tobacco_2403110000", "name": "табак для кальяна, сигары, сигары с обрезанными концами (черуты), сига", "tnved": "2403 11 000 0", "marking_status": "mandatory"},
-                {"id": "tobacco_240210", "name": "табак для кальяна, сигары, сигары с обрезанными концами (черуты), сига", "tnved": "2402 10", "marking_status": "mandatory"},
-                {"id": "tobacco_24021000", "name": "табак для кальяна, сигары, сигары с обрезанными концами (черуты), сига", "tnved": "2402 10 00", "marking_status": "mandatory"},
-                {"id": "tobacco_2402100000", "name": "сигары, сигары с обрезанными концами и сигариллы, содержащие табак", "tnved": "2402 10 000 0", "marking_status": "mandatory"},
-                {"id": "tobacco_24022010", "name": "табак для кальяна, сигары, сигары с обрезанными концами (черуты), сига", "tnved": "2402 20 10", "marking_status": "mandatory"},
-                {"id": "tobacco_2402201000", "name": "содержащие гвоздику", "tnved": "2402 20 100 0", "marking_status": "mandatory"},
-                {"id": "tobacco_240319", "name": "прочий:", "tnved": "2403 19", "marking_status": "mandatory"},
-                {"id": "tobacco_24031910", "name": "табак для кальяна, сигары, сигары с обрезанными концами (черуты), сига", "tnved": "2403 19 10", "marking_status": "mandatory"},
-                {"id": "tobacco_2403191000", "name": "в первичных упаковках нетто-массой не более 500 г", "tnved": "2403 19 100 0", "marking_status": "mandatory"},
-                {"id": "tobacco_240399", "name": "прочий:", "tnved": "2403 99", "marking_status": "mandatory"},
-                {"id": "tobacco_24039910", "name": "табак для кальяна, сигары, сигары с обрезанными концами (черуты), сига", "tnved": "2403 99 10", "marking_status": "mandatory"},
-                {"id": "tobacco_2403991000", "name": "жевательный и нюхательный табак", "tnved": "2403 99 100 0", "marking_status": "mandatory"},
-                {"id": "tobacco_24039990", "name": "табачные изделия, предназначенные для потребления путем нагревания;; к", "tnved": "2403 99 90", "marking_status": "mandatory"},
-                {"id": "tobacco_2403999008", "name": "прочий", "tnved": "2403 99 900 8", "marking_status": "mandatory"},
-                {"id": "tobacco_2404", "name": "Продукция, содержащая табак, восстановленный табак, никотин, или замен", "tnved": "2404", "marking_status": "mandatory"},
-                {"id": "tobacco_240411", "name": "табачные изделия, предназначенные для потребления путем нагревания;; к", "tnved": "2404 11", "marking_status": "mandatory"},
-                {"id": "tobacco_24041100", "name": "табачные изделия, предназначенные для потребления путем нагревания;; к", "tnved": "2404 11 00", "marking_status": "mandatory"},
-                {"id": "tobacco_2404110009", "name": "прочая", "tnved": "2404 11 000 9", "marking_status": "mandatory"},
-                {"id": "tobacco_240419", "name": "табачные изделия, предназначенные для потребления путем нагревания;; к", "tnved": "2404 19", "marking_status": "mandatory"},
-                {"id": "tobacco_24041900", "name": "табачные изделия, предназначенные для потребления путем нагревания;; к", "tnved": "2404 19 00", "marking_status": "mandatory"},
-                {"id": "tobacco_2404190001", "name": "содержащая заменители табака", "tnved": "2404 19 000 1", "marking_status": "mandatory"},
-                {"id": "tobacco_2404110001", "name": "содержащая \"гомогенизированный\" или \"восстановленный\" табак или табачн", "tnved": "2404 11 000 1", "marking_status": "mandatory"},
-                {"id": "tobacco_240412", "name": "Жидкости для электронных систем доставки никотина, в том числе безнико", "tnved": "2404 12", "marking_status": "mandatory"},
-                {"id": "tobacco_24041200", "name": "Жидкости для электронных систем доставки никотина, в том числе безнико", "tnved": "2404 12 00", "marking_status": "mandatory"},
-                {"id": "tobacco_2404120000", "name": "прочая, содержащая никотин", "tnved": "2404 12 000 0", "marking_status": "mandatory"},
-                {"id": "tobacco_2404190009", "name": "прочая", "tnved": "2404 19 000 9", "marking_status": "mandatory"}
-            ]},
-            {"id": "seafood", "name": "Морепродукты (икра)", "icon": "fish", "products": [
-                {"id": "seafood_1604", "name": "Готовая или консервированная рыба; икра осетровых и ее заменители, изг", "tnved": "1604", "marking_status": "mandatory"},
-                {"id": "seafood_160431", "name": "Икра осетровых", "tnved": "1604 31", "marking_status": "mandatory"},
-                {"id": "seafood_16043100", "name": "Икра осетровых", "tnved": "1604 31 00", "marking_status": "mandatory"},
-                {"id": "seafood_1604310000", "name": "икра осетровых", "tnved": "1604 31 000 0", "marking_status": "mandatory"},
-                {"id": "seafood_160432", "name": "Заменители икры осетровых: икра лососевых (красная икра)", "tnved": "1604 32", "marking_status": "mandatory"},
-                {"id": "seafood_16043200", "name": "Заменители икры осетровых: икра лососевых (красная икра)", "tnved": "1604 32 00", "marking_status": "mandatory"},
-                {"id": "seafood_1604320010", "name": "икра лососевых (красная икра)", "tnved": "1604 32 001 0", "marking_status": "mandatory"},
-                {"id": "seafood_0305", "name": "Рыба сушеная, соленая или в рассоле; рыба копченая, не подвергнутая ил", "tnved": "0305", "marking_status": "mandatory"},
-                {"id": "seafood_030520", "name": "Печень, икра и молоки рыб, сушеные, копченые, соленые или в рассоле", "tnved": "0305 20", "marking_status": "mandatory"},
-                {"id": "seafood_03052000", "name": "Печень, икра и молоки рыб, сушеные, копченые, соленые или в рассоле", "tnved": "0305 20 00", "marking_status": "mandatory"},
-                {"id": "seafood_0305200000", "name": "печень, икра и молоки рыбы, сушеные, копченые, соленые или в рассоле", "tnved": "0305 20 000 0", "marking_status": "mandatory"},
-                {"id": "seafood_0302", "name": "Печень, икра и молоки, свежие или охлажденные", "tnved": "0302", "marking_status": "mandatory"},
-                {"id": "seafood_030291", "name": "Печень, икра и молоки, свежие или охлажденные", "tnved": "0302 91", "marking_status": "mandatory"},
-                {"id": "seafood_03029100", "name": "Печень, икра и молоки, свежие или охлажденные", "tnved": "0302 91 00", "marking_status": "mandatory"},
-                {"id": "seafood_0302910000", "name": "печень, икра и молоки", "tnved": "0302 91 000 0", "marking_status": "mandatory"},
-                {"id": "seafood_0303", "name": "Икра и молоки для производства дезоксирибонуклеиновой кислоты или суль", "tnved": "0303", "marking_status": "mandatory"},
-                {"id": "seafood_030391", "name": "печень, икра и молоки:", "tnved": "0303 91", "marking_status": "mandatory"},
-                {"id": "seafood_03039110", "name": "Икра и молоки для производства дезоксирибонуклеиновой кислоты или суль", "tnved": "0303 91 10", "marking_status": "mandatory"},
-                {"id": "seafood_0303911000", "name": "икра и молоки для производства дезоксирибонуклеиновой кислоты или суль", "tnved": "0303 91 100 0", "marking_status": "mandatory"},
-                {"id": "seafood_03039190", "name": "Прочие печень, икра и молоки, мороженые", "tnved": "0303 91 90", "marking_status": "mandatory"},
-                {"id": "seafood_0303919000", "name": "прочие", "tnved": "0303 91 900 0", "marking_status": "mandatory"}
-            ]},
-            {"id": "oils", "name": "Растительные масла", "icon": "flask", "products": [
-                {"id": "oils_1507", "name": "Масло соевое и его фракции, нерафинированные или рафинированные, но бе", "tnved": "1507", "marking_status": "mandatory"},
-                {"id": "oils_150710", "name": "масло сырое, нерафинированное или рафинированное гидратацией:", "tnved": "1507 10", "marking_status": "mandatory"},
-                {"id": "oils_15071090", "name": "Отдельные виды пищевых растительных масел и масложировой продукции, уп", "tnved": "1507 10 90", "marking_status": "mandatory"},
-                {"id": "oils_1507109001", "name": "в первичных упаковках нетто-объемом 10 л или менее", "tnved": "1507 10 900 1", "marking_status": "mandatory"}
-            ]},
-            {"id": "pet_food", "name": "Корма для животных", "icon": "paw", "products": [
-                {"id": "pet_food_dry", "name": "Сухой корм", "tnved": "2309", "marking_status": "mandatory"},
-                {"id": "pet_food_dry_animal", "name": "Сухой корм животного происхождения", "tnved": "2309", "marking_status": "mandatory"},
-                {"id": "pet_food_dry_animal_dog", "name": "Сухой корм животного происхождения для собак", "tnved": "2309", "marking_status": "mandatory"},
-                {"id": "pet_food_dry_animal_cat", "name": "Сухой корм животного происхождения для кошек", "tnved": "2309", "marking_status": "mandatory"},
-                {"id": "pet_food_dry_animal_other", "name": "Сухой корм животного происхождения для прочих животных", "tnved": "2309", "marking_status": "mandatory"},
-                {"id": "pet_food_dry_plant", "name": "Сухой корм растительного происхождения", "tnved": "2309", "marking_status": "mandatory"},
-                {"id": "pet_food_dry_other", "name": "Сухой корм прочий", "tnved": "2309", "marking_status": "mandatory"},
-                {"id": "pet_food_dry_other_dog", "name": "Сухой корм прочий для собак", "tnved": "2309", "marking_status": "mandatory"},
-                {"id": "pet_food_dry_other_cat", "name": "Сухой корм прочий для кошек", "tnved": "2309", "marking_status": "mandatory"},
-                {"id": "pet_food_dry_other_other", "name": "Сухой корм прочий для прочих животных", "tnved": "2309", "marking_status": "mandatory"},
-                {"id": "pet_food_wet", "name": "Влажный корм", "tnved": "2309", "marking_status": "mandatory"},
-                {"id": "pet_food_wet_animal", "name": "Влажный корм животного происхождения", "tnved": "2309", "marking_status": "mandatory"},
-                {"id": "pet_food_wet_animal_dog", "name": "Влажный корм животного происхождения для собак", "tnved": "2309", "marking_status": "mandatory"},
-                {"id": "pet_food_wet_animal_cat", "name": "Влажный корм животного происхождения для кошек", "tnved": "2309", "marking_status": "mandatory"},
-                {"id": "pet_food_wet_animal_other", "name": "Влажный корм животного происхождения для прочих животных", "tnved": "2309", "marking_status": "mandatory"},
-                {"id": "pet_food_wet_plant", "name": "Влажный корм растительного происхождения", "tnved": "2309", "marking_status": "mandatory"},
-                {"id": "pet_food_wet_other", "name": "Влажный корм прочий", "tnved": "2309", "marking_status": "mandatory"},
-                {"id": "pet_food_wet_other_dog", "name": "Влажный корм прочий для собак", "tnved": "2309", "marking_status": "mandatory"},
-                {"id": "pet_food_wet_other_cat", "name": "Влажный корм прочий для кошек", "tnved": "2309", "marking_status": "mandatory"},
-                {"id": "pet_food_wet_other_other", "name": "Влажный корм прочий для прочих животных", "tnved": "2309", "marking_status": "mandatory"}
-            ]},
-            {"id": "canned", "name": "Консервированные продукты", "icon": "archive", "products": [
-                {"id": "canned_1604", "name": "Готовая или консервированная рыба; икра осетровых и ее заменители, изг", "tnved": "1604", "marking_status": "mandatory"},
-                {"id": "canned_160416", "name": "Рыбная консервная продукция и консервированная продукция из морепродук", "tnved": "1604 16", "marking_status": "mandatory"},
-                {"id": "canned_16041604", "name": "Рыбная консервная продукция и консервированная продукция из морепродук", "tnved": "1604 16 04", "marking_status": "mandatory"},
-                {"id": "canned_1604160431", "name": "Рыбная консервная продукция и консервированная продукция из морепродук", "tnved": "1604 16 043 1", "marking_status": "mandatory"},
-                {"id": "canned_1602", "name": "Готовые или консервированные продукты из мяса, мясных субпродуктов, кр", "tnved": "1602", "marking_status": "mandatory"},
-                {"id": "canned_160220", "name": "из печени любых животных:", "tnved": "1602 20", "marking_status": "mandatory"},
-                {"id": "canned_16022001", "name": "Мясная и плодоовощная консервация", "tnved": "1602 20 01", "marking_status": "mandatory"},
-                {"id": "canned_1602200121", "name": "Мясная и плодоовощная консервация", "tnved": "1602 20 012 1", "marking_status": "mandatory"}
-            ]},
-            {"id": "grocery", "name": "Бакалея", "icon": "shopping-basket", "products": [
-                {"id": "snacks_chips_potato", "name": "Чипсы картофельные", "tnved": "1904 10 100 0", "marking_status": "mandatory"},
-                {"id": "snacks_chips_veg", "name": "Чипсы овощные", "tnved": "1904 10 300 0", "marking_status": "mandatory"},
-                {"id": "snacks_chips_other", "name": "Чипсы прочие", "tnved": "1904 10 900 0", "marking_status": "mandatory"},
-                {"id": "snacks_crispbread", "name": "Хлебцы хрустящие", "tnved": "1905 10 000 0", "marking_status": "mandatory"},
-                {"id": "snacks_crackers", "name": "Сухарики", "tnved": "1905 40 100 0", "marking_status": "mandatory"},
-                {"id": "snacks_croutons", "name": "Гренки", "tnved": "1905 40 900 0", "marking_status": "mandatory"},
-                {"id": "snacks_corn_sticks", "name": "Кукурузные палочки", "tnved": "1905 90 550 0", "marking_status": "mandatory"},
-                {"id": "snacks_nachos", "name": "Начос", "tnved": "1905 90 900 0", "marking_status": "mandatory"},
-                {"id": "snacks_popcorn", "name": "Попкорн готовый", "tnved": "2005 20 200 0", "marking_status": "mandatory"},
-                {"id": "snacks_other", "name": "Снековая продукция прочая", "tnved": "2005 20 800 0", "marking_status": "mandatory"},
-                {"id": "spices_onion", "name": "Лук сушеный", "tnved": "0712 20 000 0", "marking_status": "mandatory"},
-                {"id": "spices_veg_dried", "name": "Овощи сушеные прочие", "tnved": "0712 90 900 0", "marking_status": "mandatory"},
-                {"id": "spices_pepper", "name": "Перец (род Piper)", "tnved": "0904", "marking_status": "mandatory"},
-                {"id": "spices_vanilla", "name": "Ваниль", "tnved": "0905", "marking_status": "mandatory"},
-                {"id": "spices_cinnamon", "name": "Корица и цветы коричного дерева", "tnved": "0906", "marking_status": "mandatory"},
-                {"id": "spices_cloves", "name": "Гвоздика", "tnved": "0907", "marking_status": "mandatory"},
-                {"id": "spices_nutmeg", "name": "Мускатный орех, мацис и кардамон", "tnved": "0908", "marking_status": "mandatory"},
-                {"id": "spices_seeds", "name": "Семена аниса, бадьяна, кориандра, тмина", "tnved": "0909", "marking_status": "mandatory"},
-                {"id": "spices_ginger", "name": "Имбирь, шафран, куркума, тимьян, лавровый лист", "tnved": "0910", "marking_status": "mandatory"},
-                {"id": "spices_other", "name": "Пряности пищевые прочие", "tnved": "1211 90 860 8", "marking_status": "mandatory"},
-                {"id": "sauces_main", "name": "Соусы и их компоненты, приправы", "tnved": "2103", "marking_status": "mandatory"},
-                {"id": "sauces_mustard", "name": "Горчица готовая", "tnved": "2103", "marking_status": "mandatory"},
-                {"id": "sauces_soups_dry", "name": "Сухие супы", "tnved": "2104 10 000 0", "marking_status": "mandatory"},
-                {"id": "sauces_broth_dry", "name": "Сухие бульоны", "tnved": "2104 10 000 0", "marking_status": "mandatory"},
-                {"id": "sauces_vinegar", "name": "Уксусы", "tnved": "2209 000", "marking_status": "mandatory"}
-            ]},
-            {"id": "soft_drinks", "name": "Безалкогольные напитки", "icon": "glass-water", "products": [
-                {"id": "soft_drinks_2202100000", "name": "воды, включая минеральные и газированные, содержащие добавки сахара ил", "tnved": "2202 10 000 0", "marking_status": "mandatory"}
-            ]},
-            {"id": "non_alc_beer", "name": "Безалкогольное пиво", "icon": "beer", "products": [
-                {"id": "non_alc_beer_220291", "name": "Безалкогольное пиво", "tnved": "2202 91", "marking_status": "mandatory"},
-                {"id": "non_alc_beer_22029100", "name": "Безалкогольное пиво", "tnved": "2202 91 00", "marking_status": "mandatory"},
-                {"id": "non_alc_beer_2202910000", "name": "безалкогольное пиво", "tnved": "2202 91 000 0", "marking_status": "mandatory"}
-            ]},
-            {"id": "sweets", "name": "Сладости", "icon": "candy", "products": [
-                {"id": "sweets_1704", "name": "Кондитерские изделия из сахара (включая белый шоколад), не содержащие ", "tnved": "1704", "marking_status": "mandatory"},
-                {"id": "sweets_1806", "name": "Шоколад и прочие готовые пищевые продукты, содержащие какао:", "tnved": "1806", "marking_status": "mandatory"},
-                {"id": "sweets_180618", "name": "Шоколадные, ореховые и иные пасты", "tnved": "1806 18", "marking_status": "mandatory"},
-                {"id": "sweets_18061806", "name": "Шоколадные, ореховые и иные пасты", "tnved": "1806 18 06", "marking_status": "mandatory"},
-                {"id": "sweets_1806180610", "name": "Шоколадные, ореховые и иные пасты", "tnved": "1806 18 061 0", "marking_status": "mandatory"},
-                {"id": "sweets_1905", "name": "Хлеб, мучные кондитерские изделия, пирожные, печенье и прочие хлебобул", "tnved": "1905", "marking_status": "mandatory"},
-                {"id": "sweets_190519", "name": "Мучные кондитерские изделия, пирожные, печенье и прочие хлебобулочные ", "tnved": "1905 19", "marking_status": "mandatory"},
-                {"id": "sweets_19051905", "name": "Мучные кондитерские изделия, пирожные, печенье и прочие хлебобулочные ", "tnved": "1905 19 05", "marking_status": "mandatory"},
-                {"id": "sweets_1905190510", "name": "Мучные кондитерские изделия, пирожные, печенье и прочие хлебобулочные ", "tnved": "1905 19 051 0", "marking_status": "mandatory"},
-                {"id": "sweets_2006", "name": "Овощи, фрукты, орехи, кожура плодов и другие части растений, консервир", "tnved": "2006", "marking_status": "mandatory"},
-                {"id": "sweets_200600", "name": "Овощи, фрукты, орехи, кожура плодов и другие части растений, консервир", "tnved": "2006 00", "marking_status": "mandatory"},
-                {"id": "sweets_2007", "name": "Джемы, желе фруктовое, мармелады, пюре фруктовое или ореховое, паста ф", "tnved": "2007", "marking_status": "mandatory"},
-                {"id": "sweets_2008", "name": "Фрукты, орехи и прочие съедобные части растений, приготовленные или ко", "tnved": "2008", "marking_status": "mandatory"},
-                {"id": "sweets_2106", "name": "Пищевые продукты, в другом месте не поименованные или не включенные:", "tnved": "2106", "marking_status": "mandatory"},
-                {"id": "sweets_210621", "name": "Сахаристые кондитерские изделия", "tnved": "2106 21", "marking_status": "mandatory"},
-                {"id": "sweets_21062106", "name": "Сахаристые кондитерские изделия", "tnved": "2106 21 06", "marking_status": "mandatory"},
-                {"id": "sweets_2106210690", "name": "Сахаристые кондитерские изделия", "tnved": "2106 21 069 0", "marking_status": "mandatory"}
-            ]},
-            {"id": "instant_drinks", "name": "Растворимые напитки", "icon": "coffee", "products": [
-                {"id": "instant_drinks_1806", "name": "Шоколад и прочие готовые пищевые продукты, содержащие какао:", "tnved": "1806", "marking_status": "mandatory"},
-                {"id": "instant_drinks_2106", "name": "Пищевые продукты, в другом месте не поименованные или не включенные:", "tnved": "2106", "marking_status": "mandatory"},
-                {"id": "instant_drinks_1805", "name": "Какао-порошок без добавок сахара или других подслащивающих веществ; ка", "tnved": "1805", "marking_status": "mandatory"},
-                {"id": "instant_drinks_180500", "name": "Какао-порошок без добавок сахара или других подслащивающих веществ; ка", "tnved": "1805 00", "marking_status": "mandatory"},
-                {"id": "instant_drinks_18050000", "name": "Какао-порошок без добавок сахара или других подслащивающих веществ; ка", "tnved": "1805 00 00", "marking_status": "mandatory"},
-                {"id": "instant_drinks_1805000000", "name": "Какао-порошок без добавок сахара или других подслащивающих веществ", "tnved": "1805 00 000 0", "marking_status": "mandatory"},
-                {"id": "instant_drinks_180610", "name": "какао-порошок с добавлением сахара или других подслащивающих веществ:", "tnved": "1806 10", "marking_status": "mandatory"},
-                {"id": "instant_drinks_18061090", "name": "Какао-порошок без добавок сахара или других подслащивающих веществ; ка", "tnved": "1806 10 90", "marking_status": "mandatory"},
-                {"id": "instant_drinks_1806109000", "name": "содержащий 80 мас.% или более сахарозы (включая инвертный сахар, выраж", "tnved": "1806 10 900 0", "marking_status": "mandatory"},
-                {"id": "instant_drinks_180690", "name": "прочие:", "tnved": "1806 90", "marking_status": "mandatory"},
-                {"id": "instant_drinks_18069070", "name": "Какао-порошок без добавок сахара или других подслащивающих веществ; ка", "tnved": "1806 90 70", "marking_status": "mandatory"},
-                {"id": "instant_drinks_1806907000", "name": "готовые изделия, содержащие какао и предназначенные для производства и", "tnved": "1806 90 700 0", "marking_status": "mandatory"},
-                {"id": "instant_drinks_210690", "name": "прочие:", "tnved": "2106 90", "marking_status": "mandatory"},
-                {"id": "instant_drinks_21069098", "name": "Какао-порошок без добавок сахара или других подслащивающих веществ; ка", "tnved": "2106 90 98", "marking_status": "mandatory"},
-                {"id": "instant_drinks_2106909808", "name": "прочие", "tnved": "2106 90 980 8", "marking_status": "mandatory"},
-                {"id": "instant_drinks_0902", "name": "Чай со вкусо-ароматическими добавками или без них:", "tnved": "0902", "marking_status": "mandatory"},
-                {"id": "instant_drinks_0903", "name": "Чай со вкусо-ароматическими добавками или без них;; Мате, или парагвай", "tnved": "0903", "marking_status": "mandatory"},
-                {"id": "instant_drinks_090300", "name": "Чай со вкусо-ароматическими добавками или без них;; Мате, или парагвай", "tnved": "0903 00", "marking_status": "mandatory"},
-                {"id": "instant_drinks_09030000", "name": "Чай со вкусо-ароматическими добавками или без них;; Мате, или парагвай", "tnved": "0903 00 00", "marking_status": "mandatory"},
-                {"id": "instant_drinks_0903000000", "name": "Мате, или парагвайский чай", "tnved": "0903 00 000 0", "marking_status": "mandatory"},
-                {"id": "instant_drinks_1211", "name": "Растения и их части (включая семена и плоды), используемые главным обр", "tnved": "1211", "marking_status": "mandatory"},
-                {"id": "instant_drinks_121120", "name": "Чай со вкусо-ароматическими добавками или без них;; Мате, или парагвай", "tnved": "1211 20", "marking_status": "mandatory"},
-                {"id": "instant_drinks_12112000", "name": "Чай со вкусо-ароматическими добавками или без них;; Мате, или парагвай", "tnved": "1211 20 00", "marking_status": "mandatory"},
-                {"id": "instant_drinks_1211200000", "name": "корни женьшеня", "tnved": "1211 20 000 0", "marking_status": "mandatory"},
-                {"id": "instant_drinks_121190", "name": "прочие:", "tnved": "1211 90", "marking_status": "mandatory"},
-                {"id": "instant_drinks_12119086", "name": "Чай со вкусо-ароматическими добавками или без них;; Мате, или парагвай", "tnved": "1211 90 86", "marking_status": "mandatory"},
-                {"id": "instant_drinks_1211908608", "name": "прочие", "tnved": "1211 90 860 8", "marking_status": "mandatory"},
-                {"id": "instant_drinks_2101", "name": "Экстракты, эссенции и концентраты кофе, чая или мате, или парагвайског", "tnved": "2101", "marking_status": "mandatory"},
-                {"id": "instant_drinks_0901", "name": "Кофе, жареный или нежареный, с кофеином или без кофеина; кофейная шелу", "tnved": "0901", "marking_status": "mandatory"}
-            ]}
-        ]
-    },
-    {
-        "id": "pharma",
-        "name": "Фармацевтика и здоровье",
-        "icon": "pill",
-        "subcategories": [
-            {"id": "medicines", "name": "Лекарства", "icon": "pill", "products": [
-                {"id": "medicines_3002", "name": "Кровь человеческая; кровь животных, приготовленная для использования в", "tnved": "3002", "marking_status": "mandatory"},
-                {"id": "medicines_3002150000", "name": "иммунологические продукты, расфасованные в виде дозированных лекарстве", "tnved": "3002 15 000 0", "marking_status": "mandatory"}
-            ]},
-            {"id": "tsr", "name": "Технические средства реабилитации (ТСР)", "icon": "accessibility", "products": [
-                {"id": "tsr_6602", "name": "трости опорные и тактильные, костыли, опоры, поручни;", "tnved": "6602", "marking_status": "mandatory"},
-                {"id": "tsr_660200", "name": "трости опорные и тактильные, костыли, опоры, поручни;", "tnved": "6602 00", "marking_status": "mandatory"},
-                {"id": "tsr_66020000", "name": "трости опорные и тактильные, костыли, опоры, поручни;", "tnved": "6602 00 00", "marking_status": "mandatory"},
-                {"id": "tsr_6602000000", "name": "Трости, трости-сиденья, хлысты, кнуты для верховой езды и аналогичные ", "tnved": "6602 00 000 0", "marking_status": "mandatory"},
-                {"id": "tsr_7326", "name": "Изделия из черных металлов прочие:", "tnved": "7326", "marking_status": "mandatory"},
-                {"id": "tsr_9021", "name": "Приспособления ортопедические, включая костыли, хирургические ремни и ", "tnved": "9021", "marking_status": "mandatory"},
-                {"id": "tsr_902110", "name": "приспособления ортопедические или для лечения переломов:", "tnved": "9021 10", "marking_status": "mandatory"},
-                {"id": "tsr_90211010", "name": "трости опорные и тактильные, костыли, опоры, поручни;", "tnved": "9021 10 10", "marking_status": "mandatory"},
-                {"id": "tsr_9021101000", "name": "приспособления ортопедические", "tnved": "9021 10 100 0", "marking_status": "mandatory"},
-                {"id": "tsr_902190", "name": "прочие:", "tnved": "9021 90", "marking_status": "mandatory"},
-                {"id": "tsr_90219090", "name": "трости опорные и тактильные, костыли, опоры, поручни;", "tnved": "9021 90 90", "marking_status": "mandatory"},
-                {"id": "tsr_9021909009", "name": "прочие", "tnved": "9021 90 900 9", "marking_status": "mandatory"},
-                {"id": "tsr_9403", "name": "Мебель прочая и ее части:", "tnved": "9403", "marking_status": "mandatory"},
-                {"id": "tsr_9620", "name": "трости опорные и тактильные, костыли, опоры, поручни;", "tnved": "9620", "marking_status": "mandatory"},
-                {"id": "tsr_962000", "name": "трости опорные и тактильные, костыли, опоры, поручни;", "tnved": "9620 00", "marking_status": "mandatory"},
-                {"id": "tsr_96200000", "name": "трости опорные и тактильные, костыли, опоры, поручни;", "tnved": "9620 00 00", "marking_status": "mandatory"},
-                {"id": "tsr_9620000009", "name": "прочие", "tnved": "9620 00 000 9", "marking_status": "mandatory"},
-                {"id": "tsr_6212", "name": "Бюстгальтеры, пояса, корсеты, подтяжки, подвязки и аналогичные изделия", "tnved": "6212", "marking_status": "mandatory"},
-                {"id": "tsr_621290", "name": "ортезы, функциональные узлы протезов (из категории товаров \"части и пр", "tnved": "6212 90", "marking_status": "mandatory"},
-                {"id": "tsr_62129000", "name": "ортезы, функциональные узлы протезов (из категории товаров \"части и пр", "tnved": "6212 90 00", "marking_status": "mandatory"},
-                {"id": "tsr_6212900000", "name": "прочие", "tnved": "6212 90 000 0", "marking_status": "mandatory"},
-                {"id": "tsr_902139", "name": "прочие:", "tnved": "9021 39", "marking_status": "mandatory"},
-                {"id": "tsr_90213990", "name": "ортезы, функциональные узлы протезов (из категории товаров \"части и пр", "tnved": "9021 39 90", "marking_status": "mandatory"},
-                {"id": "tsr_9021399000", "name": "прочие", "tnved": "9021 39 900 0", "marking_status": "mandatory"},
-                {"id": "tsr_9019", "name": "Устройства для механотерапии; аппараты массажные; аппаратура для психо", "tnved": "9019", "marking_status": "mandatory"},
-                {"id": "tsr_901910", "name": "устройства для механотерапии; аппараты массажные; аппаратура для психо", "tnved": "9019 10", "marking_status": "mandatory"},
-                {"id": "tsr_90191090", "name": "противопролежневые матрацы и подушки;", "tnved": "9019 10 90", "marking_status": "mandatory"},
-                {"id": "tsr_9019109009", "name": "прочие", "tnved": "9019 10 900 9", "marking_status": "mandatory"},
-                {"id": "tsr_9404", "name": "Основы матрацные; принадлежности постельные и аналогичные изделия мебл", "tnved": "9404", "marking_status": "mandatory"},
-                {"id": "tsr_940421", "name": "из пористой резины или пластмассы, с покрытием или без покрытия:", "tnved": "9404 21", "marking_status": "mandatory"},
-                {"id": "tsr_940429", "name": "из прочих материалов:", "tnved": "9404 29", "marking_status": "mandatory"},
-                {"id": "tsr_94042990", "name": "противопролежневые матрацы и подушки;", "tnved": "9404 29 90", "marking_status": "mandatory"},
-                {"id": "tsr_9404299000", "name": "прочие", "tnved": "9404 29 900 0", "marking_status": "mandatory"},
-                {"id": "tsr_3006", "name": "специальные средства при нарушениях функций выделения (моче- и калопри", "tnved": "3006", "marking_status": "mandatory"},
-                {"id": "tsr_300691", "name": "специальные средства при нарушениях функций выделения (моче- и калопри", "tnved": "3006 91", "marking_status": "mandatory"},
-                {"id": "tsr_30069100", "name": "специальные средства при нарушениях функций выделения (моче- и калопри", "tnved": "3006 91 00", "marking_status": "mandatory"},
-                {"id": "tsr_3006910000", "name": "приспособления, идентифицируемые как приспособления для стомического и", "tnved": "3006 91 000 0", "marking_status": "mandatory"},
-                {"id": "tsr_9018", "name": "Приборы и устройства, применяемые в медицине, хирургии, стоматологии и", "tnved": "9018", "marking_status": "mandatory"},
-                {"id": "tsr_901839", "name": "специальные средства при нарушениях функций выделения (моче- и калопри", "tnved": "9018 39", "marking_status": "mandatory"},
-                {"id": "tsr_90183900", "name": "специальные средства при нарушениях функций выделения (моче- и калопри", "tnved": "9018 39 00", "marking_status": "mandatory"},
-                {"id": "tsr_9018390000", "name": "прочие", "tnved": "9018 39 000 0", "marking_status": "mandatory"},
-                {"id": "tsr_9401", "name": "кресла-стулья с санитарным оснащением;", "tnved": "9401", "marking_status": "mandatory"},
-                {"id": "tsr_940179", "name": "кресла-стулья с санитарным оснащением;", "tnved": "9401 79", "marking_status": "mandatory"},
-                {"id": "tsr_94017900", "name": "кресла-стулья с санитарным оснащением;", "tnved": "9401 79 00", "marking_status": "mandatory"},
-                {"id": "tsr_9401790009", "name": "прочая", "tnved": "9401 79 000 9", "marking_status": "mandatory"},
-                {"id": "tsr_9402", "name": "Мебель медицинская, хирургическая, стоматологическая или ветеринарная ", "tnved": "9402", "marking_status": "mandatory"},
-                {"id": "tsr_940290", "name": "кресла-стулья с санитарным оснащением;", "tnved": "9402 90", "marking_status": "mandatory"},
-                {"id": "tsr_94029000", "name": "кресла-стулья с санитарным оснащением;", "tnved": "9402 90 00", "marking_status": "mandatory"},
-                {"id": "tsr_9402900000", "name": "прочая", "tnved": "9402 90 000 0", "marking_status": "mandatory"},
-                {"id": "tsr_8713", "name": "Коляски для людей, не способных передвигаться, оснащенные или не оснащ", "tnved": "8713", "marking_status": "mandatory"},
-                {"id": "tsr_871310", "name": "кресла-стулья с санитарным оснащением;", "tnved": "8713 10", "marking_status": "mandatory"},
-                {"id": "tsr_87131000", "name": "кресла-стулья с санитарным оснащением;", "tnved": "8713 10 00", "marking_status": "mandatory"},
-                {"id": "tsr_8713100000", "name": "без механических устройств для передвижения", "tnved": "8713 10 000 0", "marking_status": "mandatory"},
-                {"id": "tsr_3926", "name": "специальные средства при нарушениях функций выделения (моче- и калопри", "tnved": "3926", "marking_status": "mandatory"},
-                {"id": "tsr_392690", "name": "прочие:", "tnved": "3926 90", "marking_status": "mandatory"},
-                {"id": "tsr_39269092", "name": "специальные средства при нарушениях функций выделения (моче- и калопри", "tnved": "3926 90 92", "marking_status": "mandatory"},
-                {"id": "tsr_3926909200", "name": "изготовленные из листового материала", "tnved": "3926 90 920 0", "marking_status": "mandatory"},
-                {"id": "tsr_39269097", "name": "специальные средства при нарушениях функций выделения (моче- и калопри", "tnved": "3926 90 97", "marking_status": "mandatory"},
-                {"id": "tsr_3926909709", "name": "прочие", "tnved": "3926 90 970 9", "marking_status": "mandatory"}
-            ]},
-            {"id": "vet", "name": "Ветеринарные препараты", "icon": "stethoscope", "products": [
-                {"id": "vet_3002", "name": "Кровь человеческая; кровь животных, приготовленная для использования в", "tnved": "3002", "marking_status": "mandatory"},
-                {"id": "vet_3002150000", "name": "иммунологические продукты, расфасованные в виде дозированных лекарстве", "tnved": "3002 15 000 0", "marking_status": "mandatory"},
-                {"id": "vet_2936", "name": "Провитамины и витамины, природные или синтезированные (включая природн", "tnved": "2936", "marking_status": "mandatory"},
-                {"id": "vet_2936900009", "name": "прочие", "tnved": "2936 90 000 9", "marking_status": "mandatory"},
-                {"id": "vet_2941", "name": "Антибиотики:", "tnved": "2941", "marking_status": "mandatory"},
-                {"id": "vet_2941900009", "name": "прочие", "tnved": "2941 90 000 9", "marking_status": "mandatory"},
-                {"id": "vet_3001", "name": "Железы и прочие органы, предназначенные для органотерапии, высушенные,", "tnved": "3001", "marking_status": "mandatory"},
-                {"id": "vet_300120", "name": "экстракты желез или прочих органов или их секретов:", "tnved": "3001 20", "marking_status": "mandatory"},
-                {"id": "vet_3001209000", "name": "прочие", "tnved": "3001 20 900 0", "marking_status": "mandatory"},
-                {"id": "vet_3002120002", "name": "прочие", "tnved": "3002 12 000 2", "marking_status": "mandatory"},
-                {"id": "vet_3002120003", "name": "гемоглобин, глобулины крови и сывороточные глобулины", "tnved": "3002 12 000 3", "marking_status": "mandatory"},
-                {"id": "vet_3002120009", "name": "прочие", "tnved": "3002 12 000 9", "marking_status": "mandatory"},
-                {"id": "vet_3002420000", "name": "вакцины ветеринарные", "tnved": "3002 42 000 0", "marking_status": "mandatory"},
-                {"id": "vet_300290", "name": "прочие:", "tnved": "3002 90", "marking_status": "mandatory"},
-                {"id": "vet_3002903000", "name": "кровь животных, приготовленная для использования в терапевтических, пр", "tnved": "3002 90 300 0", "marking_status": "mandatory"}
-            ]},
-            {"id": "pharma_raw", "name": "Фармацевтическое сырьё, лекарственные средства", "icon": "flask", "products": [
-                {"id": "pharma_raw_2932", "name": "Фармсубстанции (с кислородом)", "tnved": "2932", "marking_status": "experiment"},
-                {"id": "pharma_raw_2933", "name": "Фармсубстанции (с азотом)", "tnved": "2933", "marking_status": "experiment"},
-                {"id": "pharma_raw_2934", "name": "Нуклеиновые кислоты", "tnved": "2934", "marking_status": "experiment"},
-                {"id": "pharma_raw_2935", "name": "Сульфонамиды", "tnved": "2935", "marking_status": "experiment"},
-                {"id": "pharma_raw_2936", "name": "Витамины", "tnved": "2936", "marking_status": "experiment"},
-                {"id": "pharma_raw_2937", "name": "Гормоны", "tnved": "2937", "marking_status": "experiment"},
-                {"id": "pharma_raw_2939", "name": "Гликозиды, алкалоиды", "tnved": "2939", "marking_status": "experiment"},
-                {"id": "pharma_raw_2941", "name": "Антибиотики", "tnved": "2941", "marking_status": "experiment"},
-                {"id": "pharma_raw_in_process", "name": "In-process продукты", "tnved": "-", "marking_status": "experiment"},
-                {"id": "pharma_raw_in_bulk", "name": "In-bulk продукты", "tnved": "-", "marking_status": "experiment"},
-                {"id": "pharma_raw_afs", "name": "АФС (активные фармацевтические субстанции)", "tnved": "-", "marking_status": "experiment"}
-            ]},
-            {"id": "medical_devices", "name": "Медицинские изделия", "icon": "heart-pulse", "products": [
-                {"id": "medical_devices_9021", "name": "Приспособления ортопедические, включая костыли, хирургические ремни и ", "tnved": "9021", "marking_status": "mandatory"},
-                {"id": "medical_devices_902110", "name": "приспособления ортопедические или для лечения переломов:", "tnved": "9021 10", "marking_status": "mandatory"},
-                {"id": "medical_devices_90211010", "name": "трости опорные и тактильные, костыли, опоры, поручни;", "tnved": "9021 10 10", "marking_status": "mandatory"},
-                {"id": "medical_devices_9021101000", "name": "приспособления ортопедические", "tnved": "9021 10 100 0", "marking_status": "mandatory"},
-                {"id": "medical_devices_902190", "name": "прочие:", "tnved": "9021 90", "marking_status": "mandatory"},
-                {"id": "medical_devices_90219090", "name": "трости опорные и тактильные, костыли, опоры, поручни;", "tnved": "9021 90 90", "marking_status": "mandatory"},
-                {"id": "medical_devices_3926", "name": "специальные средства при нарушениях функций выделения (моче- и калопри", "tnved": "3926", "marking_status": "mandatory"},
-                {"id": "medical_devices_8421", "name": "Центрифуги, включая центробежные сушилки; оборудование и устройства дл", "tnved": "8421", "marking_status": "mandatory"},
-                {"id": "medical_devices_842139", "name": "прочее:", "tnved": "8421 39", "marking_status": "mandatory"},
-                {"id": "medical_devices_84213920", "name": "131980152690152700182750209360292620336330375930", "tnved": "8421 39 20", "marking_status": "mandatory"},
-                {"id": "medical_devices_8421392008", "name": "прочее", "tnved": "8421 39 200 8", "marking_status": "mandatory"},
-                {"id": "medical_devices_902140", "name": "113850173110202800202810204370210000228560302870", "tnved": "9021 40", "marking_status": "mandatory"},
-                {"id": "medical_devices_90214000", "name": "113850173110202800202810204370210000228560302870", "tnved": "9021 40 00", "marking_status": "mandatory"},
-                {"id": "medical_devices_9021400000", "name": "аппараты слуховые, кроме частей и принадлежностей", "tnved": "9021 40 000 0", "marking_status": "mandatory"},
-                {"id": "medical_devices_9021909001", "name": "стенты коронарные", "tnved": "9021 90 900 1", "marking_status": "mandatory"},
-                {"id": "medical_devices_9022", "name": "Аппаратура, основанная на использовании рентгеновского, альфа-, бета- ", "tnved": "9022", "marking_status": "mandatory"},
-                {"id": "medical_devices_902212", "name": "135190142570280730282030", "tnved": "9022 12", "marking_status": "mandatory"},
-                {"id": "medical_devices_90221200", "name": "135190142570280730282030", "tnved": "9022 12 00", "marking_status": "mandatory"},
-                {"id": "medical_devices_9022120000", "name": "компьютерные томографы", "tnved": "9022 12 000 0", "marking_status": "mandatory"},
-                {"id": "medical_devices_9619", "name": "233730233900280360320550331320331330331830356150126750233860343580", "tnved": "9619", "marking_status": "mandatory"},
-                {"id": "medical_devices_961900", "name": "Женские гигиенические прокладки и тампоны, пеленки, подгузники и анало", "tnved": "9619 00", "marking_status": "mandatory"},
-                {"id": "medical_devices_96190089", "name": "233730233900280360320550331320331330331830356150126750233860343580", "tnved": "9619 00 89", "marking_status": "mandatory"},
-                {"id": "medical_devices_392620", "name": "1225401225601226101226301226401298001299001302201393101393501393601565", "tnved": "3926 20", "marking_status": "mandatory"},
-                {"id": "medical_devices_39262000", "name": "1225401225601226101226301226401298001299001302201393101393501393601565", "tnved": "3926 20 00", "marking_status": "mandatory"},
-                {"id": "medical_devices_3926200000", "name": "одежда и принадлежности к одежде (включая перчатки, рукавицы и митенки", "tnved": "3926 20 000 0", "marking_status": "mandatory"}
-            ]},
-            {"id": "supplements", "name": "БАД", "icon": "apple", "products": [
-                {"id": "supplements_220299", "name": "прочие:", "tnved": "2202 99", "marking_status": "mandatory"},
-                {"id": "supplements_2202999100", "name": "менее 0,2 мас.%", "tnved": "2202 99 910 0", "marking_status": "mandatory"},
-                {"id": "supplements_1602", "name": "Готовые или консервированные продукты из мяса, мясных субпродуктов, кр", "tnved": "1602", "marking_status": "mandatory"},
-                {"id": "supplements_1904", "name": "Готовые пищевые продукты, полученные путем вздувания или обжаривания з", "tnved": "1904", "marking_status": "mandatory"},
-                {"id": "supplements_190410", "name": "готовые пищевые продукты, полученные путем вздувания или обжаривания з", "tnved": "1904 10", "marking_status": "mandatory"},
-                {"id": "supplements_2202100000", "name": "воды, включая минеральные и газированные, содержащие добавки сахара ил", "tnved": "2202 10 000 0", "marking_status": "mandatory"},
-                {"id": "supplements_1704", "name": "Кондитерские изделия из сахара (включая белый шоколад), не содержащие ", "tnved": "1704", "marking_status": "mandatory"},
-                {"id": "supplements_1806", "name": "Шоколад и прочие готовые пищевые продукты, содержащие какао:", "tnved": "1806", "marking_status": "mandatory"},
-                {"id": "supplements_2106", "name": "Пищевые продукты, в другом месте не поименованные или не включенные:", "tnved": "2106", "marking_status": "mandatory"},
-                {"id": "supplements_180690", "name": "прочие:", "tnved": "1806 90", "marking_status": "mandatory"},
-                {"id": "supplements_18069070", "name": "Какао-порошок без добавок сахара или других подслащивающих веществ; ка", "tnved": "1806 90 70", "marking_status": "mandatory"},
-                {"id": "supplements_1806907000", "name": "готовые изделия, содержащие какао и предназначенные для производства и", "tnved": "1806 90 700 0", "marking_status": "mandatory"},
-                {"id": "supplements_210690", "name": "прочие:", "tnved": "2106 90", "marking_status": "mandatory"},
-                {"id": "supplements_21069098", "name": "Какао-порошок без добавок сахара или других подслащивающих веществ; ка", "tnved": "2106 90 98", "marking_status": "mandatory"},
-                {"id": "supplements_2106909808", "name": "прочие", "tnved": "2106 90 980 8", "marking_status": "mandatory"},
-                {"id": "supplements_1211", "name": "Растения и их части (включая семена и плоды), используемые главным обр", "tnved": "1211", "marking_status": "mandatory"},
-                {"id": "supplements_121190", "name": "прочие:", "tnved": "1211 90", "marking_status": "mandatory"},
-                {"id": "supplements_12119086", "name": "Чай со вкусо-ароматическими добавками или без них;; Мате, или парагвай", "tnved": "1211 90 86", "marking_status": "mandatory"},
-                {"id": "supplements_1211908608", "name": "прочие", "tnved": "1211 90 860 8", "marking_status": "mandatory"},
-                {"id": "supplements_2101", "name": "Экстракты, эссенции и концентраты кофе, чая или мате, или парагвайског", "tnved": "2101", "marking_status": "mandatory"},
-                {"id": "supplements_3002", "name": "Кровь человеческая; кровь животных, приготовленная для использования в", "tnved": "3002", "marking_status": "mandatory"},
-                {"id": "supplements_2936", "name": "Провитамины и витамины, природные или синтезированные (включая природн", "tnved": "2936", "marking_status": "mandatory"},
-                {"id": "supplements_3001", "name": "Железы и прочие органы, предназначенные для органотерапии, высушенные,", "tnved": "3001", "marking_status": "mandatory"},
-                {"id": "supplements_300120", "name": "экстракты желез или прочих органов или их секретов:", "tnved": "3001 20", "marking_status": "mandatory"},
-                {"id": "supplements_300290", "name": "прочие:", "tnved": "3002 90", "marking_status": "mandatory"},
-                {"id": "supplements_3002903000", "name": "кровь животных, приготовленная для использования в терапевтических, пр", "tnved": "3002 90 300 0", "marking_status": "mandatory"},
-                {"id": "supplements_120400", "name": "Семена льна, дробленые или недробленые:", "tnved": "1204 00", "marking_status": "mandatory"},
-                {"id": "supplements_1204009000", "name": "прочие", "tnved": "1204 00 900 0", "marking_status": "mandatory"},
-                {"id": "supplements_1208", "name": "Мука тонкого и грубого помола из семян или плодов масличных культур, к", "tnved": "1208", "marking_status": "mandatory"},
-                {"id": "supplements_1208900000", "name": "прочая", "tnved": "1208 90 000 0", "marking_status": "mandatory"},
-                {"id": "supplements_1210", "name": "Шишки хмеля, свежие или сушеные, дробленые или недробленые, в порошкоо", "tnved": "1210", "marking_status": "mandatory"},
-                {"id": "supplements_121020", "name": "шишки хмеля дробленые, в порошкообразном виде или в виде гранул; лупул", "tnved": "1210 20", "marking_status": "mandatory"},
-                {"id": "supplements_1210209000", "name": "прочие", "tnved": "1210 20 900 0", "marking_status": "mandatory"},
-                {"id": "supplements_1212", "name": "Плоды рожкового дерева, морские и прочие водоросли, свекла сахарная и ", "tnved": "1212", "marking_status": "mandatory"},
-                {"id": "supplements_1212210000", "name": "пригодные для употребления в пищу", "tnved": "1212 21 000 0", "marking_status": "mandatory"},
-                {"id": "supplements_1302", "name": "Соки и экстракты растительные; пектиновые вещества, пектинаты и пектат", "tnved": "1302", "marking_status": "mandatory"},
-                {"id": "supplements_130219", "name": "прочие:", "tnved": "1302 19", "marking_status": "mandatory"},
-                {"id": "supplements_1302199000", "name": "прочие", "tnved": "1302 19 900 0", "marking_status": "mandatory"},
-                {"id": "supplements_1504", "name": "Жиры, масла и их фракции, из рыбы или морских млекопитающих, нерафинир", "tnved": "1504", "marking_status": "mandatory"},
-                {"id": "supplements_150410", "name": "жиры из печени рыбы и их фракции:", "tnved": "1504 10", "marking_status": "mandatory"},
-                {"id": "supplements_1504101000", "name": "с содержанием витамина А не более 2500 МЕ/г", "tnved": "1504 10 100 0", "marking_status": "mandatory"},
-                {"id": "supplements_150420", "name": "жиры и масла из рыбы и их фракции, кроме жира из печени:", "tnved": "1504 20", "marking_status": "mandatory"},
-                {"id": "supplements_1504209000", "name": "прочие", "tnved": "1504 20 900 0", "marking_status": "mandatory"},
-                {"id": "supplements_1515", "name": "Прочие нелетучие жиры и масла (включая масло жожоба) растительного или", "tnved": "1515", "marking_status": "mandatory"},
-                {"id": "supplements_1515110000", "name": "масло сырое", "tnved": "1515 11 000 0", "marking_status": "mandatory"},
-                {"id": "supplements_151519", "name": "прочие:", "tnved": "1515 19", "marking_status": "mandatory"},
-                {"id": "supplements_1515199000", "name": "прочие", "tnved": "1515 19 900 0", "marking_status": "mandatory"},
-                {"id": "supplements_151590", "name": "прочие:", "tnved": "1515 90", "marking_status": "mandatory"},
-                {"id": "supplements_1515906900", "name": "в твердом виде, прочие; в жидком виде", "tnved": "1515 90 690 0", "marking_status": "mandatory"},
-                {"id": "supplements_1515908900", "name": "в твердом виде, прочие; в жидком виде", "tnved": "1515 90 890 0", "marking_status": "mandatory"},
-                {"id": "supplements_1516", "name": "Жиры и масла животного, растительного или микробиологического происхож", "tnved": "1516", "marking_status": "mandatory"},
-                {"id": "supplements_151610", "name": "жиры и масла животного происхождения и их фракции:", "tnved": "1516 10", "marking_status": "mandatory"},
-                {"id": "supplements_1516109000", "name": "прочие", "tnved": "1516 10 900 0", "marking_status": "mandatory"},
-                {"id": "supplements_151790", "name": "прочие:", "tnved": "1517 90", "marking_status": "mandatory"},
-                {"id": "supplements_1517909900", "name": "прочие", "tnved": "1517 90 990 0", "marking_status": "mandatory"},
-                {"id": "supplements_160290", "name": "прочие, включая готовые продукты из крови любых животных:", "tnved": "1602 90", "marking_status": "mandatory"},
-                {"id": "supplements_1602909909", "name": "прочие", "tnved": "1602 90 990 9", "marking_status": "mandatory"},
-                {"id": "supplements_1702", "name": "Прочие сахара, включая химически чистые лактозу, мальтозу, глюкозу и ф", "tnved": "1702", "marking_status": "mandatory"},
-                {"id": "supplements_170230", "name": "глюкоза и сироп глюкозы, не содержащие фруктозу или содержащие менее 2", "tnved": "1702 30", "marking_status": "mandatory"},
-                {"id": "supplements_1702305000", "name": "в виде белого кристаллического порошка, агломерированного или неагломе", "tnved": "1702 30 500 0", "marking_status": "mandatory"},
-                {"id": "supplements_170240", "name": "глюкоза и сироп глюкозы, содержащие в сухом состоянии не менее 20 мас.", "tnved": "1702 40", "marking_status": "mandatory"},
-                {"id": "supplements_1702409000", "name": "прочие", "tnved": "1702 40 900 0", "marking_status": "mandatory"},
-                {"id": "supplements_170260", "name": "фруктоза прочая и сироп фруктозы, содержащие в сухом состоянии более 5", "tnved": "1702 60", "marking_status": "mandatory"},
-                {"id": "supplements_1702609500", "name": "прочие", "tnved": "1702 60 950 0", "marking_status": "mandatory"},
-                {"id": "supplements_170290", "name": "прочие, включая инвертный сахар и прочие сахара и сахарные сиропы, сод", "tnved": "1702 90", "marking_status": "mandatory"},
-                {"id": "supplements_1702909500", "name": "прочие", "tnved": "1702 90 950 0", "marking_status": "mandatory"},
-                {"id": "supplements_170490", "name": "прочие:", "tnved": "1704 90", "marking_status": "mandatory"},
-                {"id": "supplements_1704905500", "name": "пастилки от боли в горле и таблетки от кашля", "tnved": "1704 90 550 0", "marking_status": "mandatory"},
-                {"id": "supplements_1704907100", "name": "леденцовая карамель, с начинкой или без начинки", "tnved": "1704 90 710 0", "marking_status": "mandatory"},
-                {"id": "supplements_1704908200", "name": "отпрессованные таблетки", "tnved": "1704 90 820 0", "marking_status": "mandatory"},
-                {"id": "supplements_1806310000", "name": "с начинкой", "tnved": "1806 31 000 0", "marking_status": "mandatory"},
-                {"id": "supplements_180632", "name": "без начинки:", "tnved": "1806 32", "marking_status": "mandatory"},
-                {"id": "supplements_1904109000", "name": "прочие", "tnved": "1904 10 900 0", "marking_status": "mandatory"},
-                {"id": "supplements_210112", "name": "готовые продукты на основе этих экстрактов, эссенций или концентратов ", "tnved": "2101 12", "marking_status": "mandatory"},
-                {"id": "supplements_2101129201", "name": "в первичных упаковках нетто-массой не более 3 кг", "tnved": "2101 12 920 1", "marking_status": "mandatory"},
-                {"id": "supplements_210610", "name": "белковые концентраты и текстурированные белковые вещества:", "tnved": "2106 10", "marking_status": "mandatory"},
-                {"id": "supplements_2106108000", "name": "прочие", "tnved": "2106 10 800 0", "marking_status": "mandatory"},
-                {"id": "supplements_2106905800", "name": "прочие", "tnved": "2106 90 580 0", "marking_status": "mandatory"},
-                {"id": "supplements_2106909300", "name": "не содержащие молочных жиров, сахарозы, изоглюкозы, глюкозы или крахма", "tnved": "2106 90 930 0", "marking_status": "mandatory"},
-                {"id": "supplements_2106909801", "name": "жевательная резинка без сахара (сахарозы) и/или с использованием замен", "tnved": "2106 90 980 1", "marking_status": "mandatory"},
-                {"id": "supplements_2106909803", "name": "смеси витаминов и минеральных веществ, предназначенные для сбалансиров", "tnved": "2106 90 980 3", "marking_status": "mandatory"},
-                {"id": "supplements_2202991800", "name": "прочие", "tnved": "2202 99 180 0", "marking_status": "mandatory"},
-                {"id": "supplements_2922", "name": "Аминосоединения, включающие кислородсодержащую функциональную группу:", "tnved": "2922", "marking_status": "mandatory"},
-                {"id": "supplements_2922410000", "name": "лизин и его сложные эфиры; соли этих соединений", "tnved": "2922 41 000 0", "marking_status": "mandatory"},
-                {"id": "supplements_2922420000", "name": "глутаминовая кислота и ее соли", "tnved": "2922 42 000 0", "marking_status": "mandatory"},
-                {"id": "supplements_2923", "name": "Соли и гидроксиды четвертичного аммониевого основания; лецитины и фосф", "tnved": "2923", "marking_status": "mandatory"},
-                {"id": "supplements_2923200000", "name": "лецитины и фосфоаминолипиды прочие", "tnved": "2923 20 000 0", "marking_status": "mandatory"},
-                {"id": "supplements_2923900009", "name": "прочие", "tnved": "2923 90 000 9", "marking_status": "mandatory"},
-                {"id": "supplements_3002490001", "name": "культуры микроорганизмов", "tnved": "3002 49 000 1", "marking_status": "mandatory"},
-                {"id": "supplements_121299", "name": "прочие:", "tnved": "1212 99", "marking_status": "mandatory"},
-                {"id": "supplements_1212999509", "name": "прочие", "tnved": "1212 99 950 9", "marking_status": "mandatory"},
-                {"id": "supplements_130220", "name": "пектиновые вещества, пектинаты и пектаты:", "tnved": "1302 20", "marking_status": "mandatory"},
-                {"id": "supplements_1302201000", "name": "сухие", "tnved": "1302 20 100 0", "marking_status": "mandatory"},
-                {"id": "supplements_1302209000", "name": "прочие", "tnved": "1302 20 900 0", "marking_status": "mandatory"},
-                {"id": "supplements_1504201000", "name": "твердые фракции", "tnved": "1504 20 100 0", "marking_status": "mandatory"},
-                {"id": "supplements_1516101000", "name": "в первичных упаковках нетто-массой не более 1 кг", "tnved": "1516 10 100 0", "marking_status": "mandatory"},
-                {"id": "supplements_160300", "name": "Экстракты и соки из мяса, рыбы или ракообразных, моллюсков или прочих ", "tnved": "1603 00", "marking_status": "mandatory"},
-                {"id": "supplements_1603001000", "name": "в первичных упаковках нетто-массой 1 кг или менее", "tnved": "1603 00 100 0", "marking_status": "mandatory"},
-                {"id": "supplements_1806903100", "name": "с начинкой", "tnved": "1806 90 310 0", "marking_status": "mandatory"},
-                {"id": "supplements_190190", "name": "прочие:", "tnved": "1901 90", "marking_status": "mandatory"},
-                {"id": "supplements_1901909800", "name": "прочие", "tnved": "1901 90 980 0", "marking_status": "mandatory"},
-                {"id": "supplements_210220", "name": "дрожжи неактивные; прочие мертвые одноклеточные микроорганизмы:", "tnved": "2102 20", "marking_status": "mandatory"},
-                {"id": "supplements_2102201100", "name": "в виде таблеток, кубиков или в аналогичной форме, или в первичных упак", "tnved": "2102 20 110 0", "marking_status": "mandatory"},
-                {"id": "supplements_292249", "name": "прочие:", "tnved": "2922 49", "marking_status": "mandatory"},
-                {"id": "supplements_2922498500", "name": "прочие", "tnved": "2922 49 850 0", "marking_status": "mandatory"},
-                {"id": "supplements_2925", "name": "Соединения, содержащие карбоксимидную функциональную группу (включая с", "tnved": "2925", "marking_status": "mandatory"},
-                {"id": "supplements_2925290000", "name": "прочие", "tnved": "2925 29 000 0", "marking_status": "mandatory"},
-                {"id": "supplements_3502", "name": "Альбумины (включая концентраты двух или более сывороточных белков, сод", "tnved": "3502", "marking_status": "mandatory"},
-                {"id": "supplements_350290", "name": "прочие:", "tnved": "3502 90", "marking_status": "mandatory"},
-                {"id": "supplements_3502907000", "name": "прочие", "tnved": "3502 90 700 0", "marking_status": "mandatory"},
-                {"id": "supplements_3802", "name": "Уголь активированный; продукты минеральные природные активированные; у", "tnved": "3802", "marking_status": "mandatory"},
-                {"id": "supplements_3802100000", "name": "уголь активированный", "tnved": "3802 10 000 0", "marking_status": "mandatory"},
-                {"id": "supplements_3913", "name": "Полимеры природные (например, альгиновая кислота) и полимеры природные", "tnved": "3913", "marking_status": "mandatory"},
-                {"id": "supplements_3913100000", "name": "кислота альгиновая, ее соли и сложные эфиры", "tnved": "3913 10 000 0", "marking_status": "mandatory"},
-                {"id": "supplements_1504109900", "name": "прочие", "tnved": "1504 10 990 0", "marking_status": "mandatory"},
-                {"id": "supplements_3507", "name": "Ферменты; ферментные препараты, в другом месте не поименованные или не", "tnved": "3507", "marking_status": "mandatory"},
-                {"id": "supplements_350790", "name": "прочие:", "tnved": "3507 90", "marking_status": "mandatory"}
-            ]},
-            {"id": "antiseptics", "name": "Антисептики и дезинфицирующие средства", "icon": "spray-can", "products": []},
-            {"id": "wheelchairs", "name": "Кресла-коляски", "icon": "wheelchair", "products": [
-                {"id": "wheelchairs_8713", "name": "Коляски для людей, не способных передвигаться, оснащенные или не оснащ", "tnved": "8713", "marking_status": "mandatory"},
-                {"id": "wheelchairs_871310", "name": "кресла-стулья с санитарным оснащением;", "tnved": "8713 10", "marking_status": "mandatory"},
-                {"id": "wheelchairs_87131000", "name": "кресла-стулья с санитарным оснащением;", "tnved": "8713 10 00", "marking_status": "mandatory"},
-                {"id": "wheelchairs_8713100000", "name": "без механических устройств для передвижения", "tnved": "8713 10 000 0", "marking_status": "mandatory"},
-                {"id": "wheelchairs_871390", "name": "Кресла-коляски электрические (прочие, оснащенные двигателем или другим", "tnved": "8713 90", "marking_status": "mandatory"},
-                {"id": "wheelchairs_87139000", "name": "Кресла-коляски электрические (прочие, оснащенные двигателем или другим", "tnved": "8713 90 00", "marking_status": "mandatory"},
-                {"id": "wheelchairs_8713900000", "name": "прочие", "tnved": "8713 90 000 0", "marking_status": "mandatory"},
-                {"id": "wheelchairs_3092", "name": "Коляски инвалидные, кроме частей и принадлежностей", "tnved": "3092", "marking_status": "mandatory"},
-                {"id": "wheelchairs_309220", "name": "Коляски инвалидные, кроме частей и принадлежностей", "tnved": "3092 20", "marking_status": "mandatory"},
-                {"id": "wheelchairs_30922000", "name": "Коляски инвалидные, кроме частей и принадлежностей", "tnved": "3092 20 00", "marking_status": "mandatory"},
-                {"id": "wheelchairs_3250", "name": "Изделия медицинские, в том числе хирургические, прочие, не включенные ", "tnved": "3250", "marking_status": "mandatory"},
-                {"id": "wheelchairs_325050", "name": "Изделия медицинские, в том числе хирургические, прочие, не включенные ", "tnved": "3250 50", "marking_status": "mandatory"},
-                {"id": "wheelchairs_32505019", "name": "Изделия медицинские, в том числе хирургические, прочие, не включенные ", "tnved": "3250 50 19", "marking_status": "mandatory"},
-                {"id": "wheelchairs_3099", "name": "Средства транспортные и оборудование прочие, не включенные в другие гр", "tnved": "3099", "marking_status": "mandatory"},
-                {"id": "wheelchairs_309910", "name": "Средства транспортные и оборудование прочие, не включенные в другие гр", "tnved": "3099 10", "marking_status": "mandatory"},
-                {"id": "wheelchairs_30991019", "name": "Средства транспортные и оборудование прочие, не включенные в другие гр", "tnved": "3099 10 19", "marking_status": "mandatory"}
-            ]},
-            {"id": "sports_nutrition", "name": "Спортивное питание", "icon": "dumbbell", "products": [
-                {"id": "sports_nutrition_0210", "name": "Мясо и пищевые мясные субпродукты, соленые, в рассоле, сушеные или коп", "tnved": "0210", "marking_status": "mandatory"}
-            ]}
-        ]
-    },
-    {
-        "id": "cosmetics",
-        "name": "Косметика, гигиена и бытовая химия",
-        "icon": "sparkles",
-        "subcategories": [
-            {"id": "perfume", "name": "Духи и туалетная вода", "icon": "spray-can", "products": [
-                {"id": "perfume_330300", "name": "Духи и туалетная вода:", "tnved": "3303 00", "marking_status": "mandatory"},
-                {"id": "perfume_dukhi", "name": "Духи", "tnved": "3303 00", "marking_status": "mandatory"},
-                {"id": "perfume_tualetnaya_voda", "name": "Туалетная вода", "tnved": "3303 00", "marking_status": "mandatory"},
-                {"id": "perfume_odekolon", "name": "Одеколон", "tnved": "3303 00", "marking_status": "mandatory"},
-                {"id": "perfume_parfyumernaya_voda", "name": "Парфюмерная вода", "tnved": "3303 00", "marking_status": "mandatory"},
-                {"id": "perfume_nabory", "name": "Наборы парфюмерной продукции (импорт)", "tnved": "3303 00", "marking_status": "mandatory"}
-            ]},
-            {"id": "cosmetics_hygiene", "name": "Косметика, бытовая химия и товары личной гигиены", "icon": "sparkles", "products": [
-                {"id": "cosmetics_hygiene_3304", "name": "Косметические средства или средства для макияжа и средства для ухода з", "tnved": "3304", "marking_status": "mandatory"},
-                {"id": "cosmetics_hygiene_3401", "name": "Мыло; поверхностно-активные органические вещества и средства, применяе", "tnved": "3401", "marking_status": "mandatory"},
-                {"id": "cosmetics_hygiene_340134", "name": "Мыло, моющие средства, бытовая химия и т.д.", "tnved": "3401 34", "marking_status": "mandatory"},
-                {"id": "cosmetics_hygiene_34013402", "name": "Мыло, моющие средства, бытовая химия и т.д.", "tnved": "3401 34 02", "marking_status": "mandatory"},
-                {"id": "cosmetics_hygiene_3401340250", "name": "Мыло, моющие средства, бытовая химия и т.д.", "tnved": "3401 34 025 0", "marking_status": "mandatory"},
-                {"id": "cosmetics_hygiene_3305", "name": "Средства для волос:", "tnved": "3305", "marking_status": "mandatory"},
-                {"id": "cosmetics_hygiene_330533", "name": "Средства для волос, средства для бритья, дезодоранты, ароматизаторы и ", "tnved": "3305 33", "marking_status": "mandatory"},
-                {"id": "cosmetics_hygiene_33053307", "name": "Средства для волос, средства для бритья, дезодоранты, ароматизаторы и ", "tnved": "3305 33 07", "marking_status": "mandatory"},
-                {"id": "cosmetics_hygiene_3305330733", "name": "Средства для волос, средства для бритья, дезодоранты, ароматизаторы и ", "tnved": "3305 33 073 3", "marking_status": "mandatory"},
-                {"id": "cosmetics_hygiene_330433", "name": "Косметические средства, декоративная косметика, средства для ухода за ", "tnved": "3304 33", "marking_status": "mandatory"},
-                {"id": "cosmetics_hygiene_33043304", "name": "Косметические средства, декоративная косметика, средства для ухода за ", "tnved": "3304 33 04", "marking_status": "mandatory"},
-                {"id": "cosmetics_hygiene_3304330499", "name": "Косметические средства, декоративная косметика, средства для ухода за ", "tnved": "3304 33 049 9", "marking_status": "mandatory"},
-                {"id": "cosmetics_hygiene_8212", "name": "Бритвы и лезвия для них (включая полосовые заготовки для лезвий):", "tnved": "8212", "marking_status": "mandatory"},
-                {"id": "cosmetics_hygiene_821210", "name": "бритвы:", "tnved": "8212 10", "marking_status": "mandatory"},
-                {"id": "cosmetics_hygiene_82121010", "name": "Бритвы и лезвия для них, включая полосовые заготовки для лезвий", "tnved": "8212 10 10", "marking_status": "mandatory"},
-                {"id": "cosmetics_hygiene_8212101000", "name": "безопасные бритвы с несменяемыми лезвиями", "tnved": "8212 10 100 0", "marking_status": "mandatory"},
-                {"id": "cosmetics_mylo_tualetnoe", "name": "Мыло туалетное", "tnved": "3401", "marking_status": "mandatory"},
-                {"id": "cosmetics_mylo_hozyaystvennoe", "name": "Мыло хозяйственное", "tnved": "3401", "marking_status": "mandatory"},
-                {"id": "cosmetics_moyushchie_pav", "name": "Моющие средства ПАВ", "tnved": "3402 50 000 0", "marking_status": "mandatory"},
-                {"id": "cosmetics_chistka_obuvi", "name": "Средства для чистки обуви", "tnved": "3405 40 00 0", "marking_status": "mandatory"},
-                {"id": "cosmetics_shampuni", "name": "Шампуни", "tnved": "3305", "marking_status": "mandatory"},
-                {"id": "cosmetics_kondicionery_volos", "name": "Кондиционеры для волос", "tnved": "3305", "marking_status": "mandatory"},
-                {"id": "cosmetics_laki_volos", "name": "Лаки для волос", "tnved": "3305", "marking_status": "mandatory"},
-                {"id": "cosmetics_kraski_volos", "name": "Краски для волос", "tnved": "3305", "marking_status": "mandatory"},
-                {"id": "cosmetics_sredstva_britya", "name": "Средства для бритья", "tnved": "3307", "marking_status": "mandatory"},
-                {"id": "cosmetics_dezodoranty", "name": "Дезодоранты", "tnved": "3307", "marking_status": "mandatory"},
-                {"id": "cosmetics_aromatizatory", "name": "Ароматизаторы помещений", "tnved": "3307", "marking_status": "mandatory"},
-                {"id": "cosmetics_kremy_lico", "name": "Кремы для лица", "tnved": "3304", "marking_status": "mandatory"},
-                {"id": "cosmetics_kremy_ruki_telo", "name": "Кремы для рук и тела", "tnved": "3304", "marking_status": "mandatory"},
-                {"id": "cosmetics_dekorativnaya", "name": "Декоративная косметика", "tnved": "3304", "marking_status": "mandatory"},
-                {"id": "cosmetics_laki_nogtey", "name": "Лаки для ногтей", "tnved": "3304", "marking_status": "mandatory"},
-                {"id": "cosmetics_sredstva_zagara", "name": "Средства для загара", "tnved": "3304", "marking_status": "mandatory"},
-                {"id": "cosmetics_zubnaya_pasta", "name": "Зубная паста", "tnved": "3306", "marking_status": "mandatory"},
-                {"id": "cosmetics_opolaskivateli_rta", "name": "Ополаскиватели для рта", "tnved": "3306", "marking_status": "mandatory"},
-                {"id": "cosmetics_britvy_bezopasnye", "name": "Бритвы безопасные", "tnved": "8212 10 100 0", "marking_status": "mandatory"},
-                {"id": "cosmetics_britvy_prochie", "name": "Бритвы прочие", "tnved": "8212 10 900 0", "marking_status": "mandatory"},
-                {"id": "cosmetics_lezviya_britv", "name": "Лезвия для бритв", "tnved": "8212 20 000 0", "marking_status": "mandatory"},
-                {"id": "cosmetics_zagotovki_lezviy", "name": "Заготовки для лезвий", "tnved": "8212 90 000 0", "marking_status": "mandatory"}
-            ]}
-        ]
-    },
-    {
-        "id": "non_food",
-        "name": "Непродовольственные товары",
-        "icon": "box",
-        "subcategories": [
-            {"id": "light_industry", "name": "Товары лёгкой промышленности", "icon": "shirt", "products": [
-                {"id": "light_industry_6212", "name": "Бюстгальтеры, пояса, корсеты, подтяжки, подвязки и аналогичные изделия", "tnved": "6212", "marking_status": "mandatory"},
-                {"id": "light_industry_4203", "name": "Предметы одежды и принадлежности к одежде, из натуральной кожи или ком", "tnved": "4203", "marking_status": "mandatory"},
-                {"id": "light_industry_420310", "name": "Предметы одежды, включая рабочую одежду, изготовленные из натуральной ", "tnved": "4203 10", "marking_status": "mandatory"},
-                {"id": "light_industry_42031000", "name": "Предметы одежды, включая рабочую одежду, изготовленные из натуральной ", "tnved": "4203 10 00", "marking_status": "mandatory"},
-                {"id": "light_industry_6106", "name": "Блузки, блузы и блузоны трикотажные машинного или ручного вязания, жен", "tnved": "6106", "marking_status": "mandatory"},
-                {"id": "light_industry_6201", "name": "Пальто, полупальто, накидки, плащи, куртки (включая лыжные), ветровки,", "tnved": "6201", "marking_status": "mandatory"},
-                {"id": "light_industry_6202", "name": "Пальто, полупальто, накидки, плащи, куртки (включая лыжные), ветровки,", "tnved": "6202", "marking_status": "mandatory"},
-                {"id": "light_industry_6302", "name": "Белье постельное, столовое, туалетное и кухонное:", "tnved": "6302", "marking_status": "mandatory"},
-                {"id": "light_industry_6105", "name": "Рубашки трикотажные машинного или ручного вязания, мужские или для мал", "tnved": "6105", "marking_status": "mandatory"},
-                {"id": "light_industry_4304", "name": "Предметы одежды из искусственного меха", "tnved": "4304", "marking_status": "mandatory"},
-                {"id": "light_industry_430400", "name": "Предметы одежды из искусственного меха", "tnved": "4304 00", "marking_status": "mandatory"},
-                {"id": "light_industry_43040000", "name": "Предметы одежды из искусственного меха", "tnved": "4304 00 00", "marking_status": "mandatory"},
-                {"id": "light_industry_4304000000", "name": "Мех искусственный и изделия из него", "tnved": "4304 00 000 0", "marking_status": "mandatory"},
-                {"id": "light_industry_6210", "name": "Одежда из фетра или нетканых материалов, текстильных материалов с проп", "tnved": "6210", "marking_status": "mandatory"},
-                {"id": "light_industry_6113", "name": "Одежда из фетра или нетканых материалов, текстильных материалов с проп", "tnved": "6113", "marking_status": "mandatory"},
-                {"id": "light_industry_611300", "name": "Одежда из фетра или нетканых материалов, текстильных материалов с проп", "tnved": "6113 00", "marking_status": "mandatory"},
-                {"id": "light_industry_6101", "name": "Пальто, куртки, плащи, плащи с капюшонами, анораки, ветровки, штормовк", "tnved": "6101", "marking_status": "mandatory"},
-                {"id": "light_industry_6102", "name": "Пальто, куртки, плащи, плащи с капюшонами, анораки, ветровки, штормовк", "tnved": "6102", "marking_status": "mandatory"},
-                {"id": "light_industry_6205", "name": "Рубашки мужские или для мальчиков:", "tnved": "6205", "marking_status": "mandatory"},
-                {"id": "light_industry_6206", "name": "Блузки, блузы и блузоны женские или для девочек:", "tnved": "6206", "marking_status": "mandatory"},
-                {"id": "light_industry_6211", "name": "Костюмы спортивные, лыжные и купальные; предметы одежды прочие:", "tnved": "6211", "marking_status": "mandatory"},
-                {"id": "light_industry_6103", "name": "Костюмы, комплекты, пиджаки, блайзеры, брюки, комбинезоны с нагрудника", "tnved": "6103", "marking_status": "mandatory"},
-                {"id": "light_industry_6104", "name": "Костюмы, комплекты, жакеты, блайзеры, платья, юбки, юбки-брюки, брюки,", "tnved": "6104", "marking_status": "mandatory"},
-                {"id": "light_industry_6203", "name": "Костюмы, комплекты, пиджаки, блайзеры, брюки, комбинезоны с нагрудника", "tnved": "6203", "marking_status": "mandatory"},
-                {"id": "light_industry_6204", "name": "Костюмы, комплекты, жакеты, блайзеры, платья, юбки, юбки-брюки, брюки,", "tnved": "6204", "marking_status": "mandatory"},
-                {"id": "light_industry_6110", "name": "Свитеры, пуловеры, кардиганы, жилеты и аналогичные изделия трикотажные", "tnved": "6110", "marking_status": "mandatory"},
-                {"id": "light_industry_6112", "name": "Костюмы спортивные, лыжные и купальные трикотажные машинного или ручно", "tnved": "6112", "marking_status": "mandatory"},
-                {"id": "light_industry_611211", "name": "Костюмы спортивные, лыжные, трикотажные машинного или ручного вязания ", "tnved": "6112 11", "marking_status": "mandatory"},
-                {"id": "light_industry_61121100", "name": "Костюмы спортивные, лыжные, трикотажные машинного или ручного вязания ", "tnved": "6112 11 00", "marking_status": "mandatory"},
-                {"id": "light_industry_6112110000", "name": "из хлопчатобумажной пряжи", "tnved": "6112 11 000 0", "marking_status": "mandatory"},
-                {"id": "light_industry_611212", "name": "Костюмы спортивные, лыжные, трикотажные машинного или ручного вязания ", "tnved": "6112 12", "marking_status": "mandatory"},
-                {"id": "light_industry_61121200", "name": "Костюмы спортивные, лыжные, трикотажные машинного или ручного вязания ", "tnved": "6112 12 00", "marking_status": "mandatory"},
-                {"id": "light_industry_6112120000", "name": "из синтетических нитей", "tnved": "6112 12 000 0", "marking_status": "mandatory"},
-                {"id": "light_industry_611219", "name": "Костюмы спортивные, лыжные, трикотажные машинного или ручного вязания ", "tnved": "6112 19", "marking_status": "mandatory"},
-                {"id": "light_industry_61121900", "name": "Костюмы спортивные, лыжные, трикотажные машинного или ручного вязания ", "tnved": "6112 19 00", "marking_status": "mandatory"},
-                {"id": "light_industry_6112190000", "name": "из прочих текстильных материалов", "tnved": "6112 19 000 0", "marking_status": "mandatory"},
-                {"id": "light_industry_611220", "name": "Костюмы спортивные, лыжные, трикотажные машинного или ручного вязания ", "tnved": "6112 20", "marking_status": "mandatory"},
-                {"id": "light_industry_61122000", "name": "Костюмы спортивные, лыжные, трикотажные машинного или ручного вязания ", "tnved": "6112 20 00", "marking_status": "mandatory"},
-                {"id": "light_industry_6112200000", "name": "лыжные костюмы", "tnved": "6112 20 000 0", "marking_status": "mandatory"},
-                {"id": "light_industry_6214", "name": "Шали, шарфы, кашне, мантильи, вуали и аналогичные изделия:", "tnved": "6214", "marking_status": "mandatory"},
-                {"id": "light_industry_6215", "name": "Галстуки, галстуки-бабочки и шейные платки:", "tnved": "6215", "marking_status": "mandatory"},
-                {"id": "light_industry_6107", "name": "Кальсоны, трусы, ночные сорочки, пижамы, купальные халаты, домашние ха", "tnved": "6107", "marking_status": "mandatory"},
-                {"id": "light_industry_6207", "name": "Майки и нательные фуфайки прочие, кальсоны, трусы, ночные сорочки, пиж", "tnved": "6207", "marking_status": "mandatory"},
-                {"id": "light_industry_6108", "name": "Комбинации, нижние юбки, трусы, панталоны, ночные сорочки, пижамы, пен", "tnved": "6108", "marking_status": "mandatory"},
-                {"id": "light_industry_6208", "name": "Майки и нательные фуфайки прочие, комбинации, нижние юбки, трусы, пант", "tnved": "6208", "marking_status": "mandatory"},
-                {"id": "light_industry_6109", "name": "Майки, фуфайки с рукавами и прочие нательные фуфайки трикотажные машин", "tnved": "6109", "marking_status": "mandatory"},
-                {"id": "light_industry_6111", "name": "Детская одежда и принадлежности к детской одежде трикотажные машинного", "tnved": "6111", "marking_status": "mandatory"},
-                {"id": "light_industry_6209", "name": "Детская одежда и принадлежности к детской одежде:", "tnved": "6209", "marking_status": "mandatory"},
-                {"id": "light_industry_611231", "name": "из синтетических нитей:", "tnved": "6112 31", "marking_status": "mandatory"},
-                {"id": "light_industry_611239", "name": "из прочих текстильных материалов:", "tnved": "6112 39", "marking_status": "mandatory"},
-                {"id": "light_industry_611241", "name": "из синтетических нитей:", "tnved": "6112 41", "marking_status": "mandatory"},
-                {"id": "light_industry_611249", "name": "из прочих текстильных материалов:", "tnved": "6112 49", "marking_status": "mandatory"},
-                {"id": "light_industry_621111", "name": "Купальные костюмы", "tnved": "6211 11", "marking_status": "mandatory"},
-                {"id": "light_industry_62111100", "name": "Купальные костюмы", "tnved": "6211 11 00", "marking_status": "mandatory"},
-                {"id": "light_industry_6211110000", "name": "мужские или для мальчиков", "tnved": "6211 11 000 0", "marking_status": "mandatory"},
-                {"id": "light_industry_621112", "name": "Купальные костюмы", "tnved": "6211 12", "marking_status": "mandatory"},
-                {"id": "light_industry_62111200", "name": "Купальные костюмы", "tnved": "6211 12 00", "marking_status": "mandatory"},
-                {"id": "light_industry_6211120000", "name": "женские или для девочек", "tnved": "6211 12 000 0", "marking_status": "mandatory"},
-                {"id": "light_industry_6115", "name": "Колготы, чулки, гольфы, носки и подследники и прочие чулочно-носочные ", "tnved": "6115", "marking_status": "mandatory"},
-                {"id": "light_industry_420321", "name": "Перчатки, рукавицы и митенки", "tnved": "4203 21", "marking_status": "mandatory"},
-                {"id": "light_industry_42032100", "name": "Перчатки, рукавицы и митенки", "tnved": "4203 21 00", "marking_status": "mandatory"},
-                {"id": "light_industry_4203210000", "name": "специально предназначенные для спортивных целей", "tnved": "4203 21 000 0", "marking_status": "mandatory"},
-                {"id": "light_industry_420329", "name": "прочие:", "tnved": "4203 29", "marking_status": "mandatory"},
-                {"id": "light_industry_6116", "name": "Перчатки, рукавицы и митенки трикотажные машинного или ручного вязания", "tnved": "6116", "marking_status": "mandatory"},
-                {"id": "light_industry_6216", "name": "Перчатки, рукавицы и митенки", "tnved": "6216", "marking_status": "mandatory"},
-                {"id": "light_industry_621600", "name": "Перчатки, рукавицы и митенки", "tnved": "6216 00", "marking_status": "mandatory"},
-                {"id": "light_industry_62160000", "name": "Перчатки, рукавицы и митенки", "tnved": "6216 00 00", "marking_status": "mandatory"},
-                {"id": "light_industry_6216000000", "name": "Перчатки, рукавицы и митенки", "tnved": "6216 00 000 0", "marking_status": "mandatory"},
-                {"id": "light_industry_6114", "name": "Предметы одежды прочие трикотажные машинного или ручного вязания:", "tnved": "6114", "marking_status": "mandatory"},
-                {"id": "light_industry_6117", "name": "Принадлежности к одежде трикотажные машинного или ручного вязания гото", "tnved": "6117", "marking_status": "mandatory"},
-                {"id": "light_industry_611710", "name": "Предметы одежды и принадлежности к одежде готовые прочие, в том числе ", "tnved": "6117 10", "marking_status": "mandatory"},
-                {"id": "light_industry_61171000", "name": "Предметы одежды и принадлежности к одежде готовые прочие, в том числе ", "tnved": "6117 10 00", "marking_status": "mandatory"},
-                {"id": "light_industry_6117100000", "name": "шали, шарфы, кашне, мантильи, вуали и аналогичные изделия", "tnved": "6117 10 000 0", "marking_status": "mandatory"},
-                {"id": "light_industry_611780", "name": "принадлежности прочие:", "tnved": "6117 80", "marking_status": "mandatory"},
-                {"id": "light_industry_61178010", "name": "Предметы одежды и принадлежности к одежде готовые прочие, в том числе ", "tnved": "6117 80 10", "marking_status": "mandatory"},
-                {"id": "light_industry_6117801009", "name": "прочие", "tnved": "6117 80 100 9", "marking_status": "mandatory"},
-                {"id": "light_industry_61178080", "name": "Предметы одежды и принадлежности к одежде готовые прочие, в том числе ", "tnved": "6117 80 80", "marking_status": "mandatory"},
-                {"id": "light_industry_6117808009", "name": "прочие", "tnved": "6117 80 800 9", "marking_status": "mandatory"},
-                {"id": "light_industry_6217", "name": "Предметы одежды и принадлежности к одежде готовые прочие, в том числе ", "tnved": "6217", "marking_status": "mandatory"},
-                {"id": "light_industry_621710", "name": "Предметы одежды и принадлежности к одежде готовые прочие, в том числе ", "tnved": "6217 10", "marking_status": "mandatory"},
-                {"id": "light_industry_62171000", "name": "Предметы одежды и принадлежности к одежде готовые прочие, в том числе ", "tnved": "6217 10 00", "marking_status": "mandatory"},
-                {"id": "light_industry_6217100000", "name": "принадлежности", "tnved": "6217 10 000 0", "marking_status": "mandatory"},
-                {"id": "light_industry_6213", "name": "Платки:", "tnved": "6213", "marking_status": "mandatory"},
-                {"id": "light_industry_6117808001", "name": "галстуки, галстуки-бабочки и шейные платки", "tnved": "6117 80 800 1", "marking_status": "mandatory"},
-                {"id": "light_industry_6406", "name": "Детали обуви (включая заготовки верха обуви с прикрепленной или неприк", "tnved": "6406", "marking_status": "mandatory"},
-                {"id": "light_industry_640690", "name": "прочие:", "tnved": "6406 90", "marking_status": "mandatory"},
-                {"id": "light_industry_64069090", "name": "Гетры, гамаши и аналогичные изделия", "tnved": "6406 90 90", "marking_status": "mandatory"},
-                {"id": "light_industry_6406909000", "name": "прочие", "tnved": "6406 90 900 0", "marking_status": "mandatory"},
-                {"id": "light_industry_6504", "name": "Шляпы и прочие головные уборы", "tnved": "6504", "marking_status": "mandatory"},
-                {"id": "light_industry_650400", "name": "Шляпы и прочие головные уборы", "tnved": "6504 00", "marking_status": "mandatory"},
-                {"id": "light_industry_65040000", "name": "Шляпы и прочие головные уборы", "tnved": "6504 00 00", "marking_status": "mandatory"},
-                {"id": "light_industry_6504000000", "name": "Шляпы и прочие головные уборы, плетеные или изготовленные путем соедин", "tnved": "6504 00 000 0", "marking_status": "mandatory"},
-                {"id": "light_industry_6505", "name": "Шляпы и прочие головные уборы", "tnved": "6505", "marking_status": "mandatory"},
-                {"id": "light_industry_650500", "name": "Шляпы и прочие головные уборы трикотажные машинного или ручного вязани", "tnved": "6505 00", "marking_status": "mandatory"},
-                {"id": "light_industry_6506", "name": "Головные уборы прочие, с подкладкой или без подкладки или с отделкой и", "tnved": "6506", "marking_status": "mandatory"},
-                {"id": "light_industry_650699", "name": "из прочих материалов:", "tnved": "6506 99", "marking_status": "mandatory"}
-            ]},
-            {"id": "shoes", "name": "Обувь", "icon": "footprints", "products": [
-                {"id": "shoes_6401", "name": "Водонепроницаемая обувь с подошвой и с верхом из резины или пластмассы", "tnved": "6401", "marking_status": "mandatory"},
-                {"id": "shoes_6402", "name": "Прочая обувь с подошвой и с верхом из резины или пластмассы:", "tnved": "6402", "marking_status": "mandatory"},
-                {"id": "shoes_6403", "name": "Обувь с подошвой из резины, пластмассы, натуральной или композиционной", "tnved": "6403", "marking_status": "mandatory"},
-                {"id": "shoes_6404", "name": "Обувь с подошвой из резины, пластмассы, натуральной или композиционной", "tnved": "6404", "marking_status": "mandatory"},
-                {"id": "shoes_6405", "name": "Обувь прочая:", "tnved": "6405", "marking_status": "mandatory"},
-                {"id": "shoes_sportivnaya", "name": "Обувь спортивная", "tnved": "6402; 6403; 6404", "marking_status": "mandatory"}
-            ]},
-            {"id": "furs", "name": "Шубы", "icon": "shirt", "products": [
-                {"id": "furs_4303", "name": "Предметы одежды, принадлежности к одежде и прочие изделия, из натураль", "tnved": "4303", "marking_status": "mandatory"},
-                {"id": "furs_430310", "name": "предметы одежды и принадлежности к одежде:", "tnved": "4303 10", "marking_status": "mandatory"},
-                {"id": "furs_43031090", "name": "Предметы одежды из норки.", "tnved": "4303 10 90", "marking_status": "mandatory"},
-                {"id": "furs_4303109010", "name": "предметы одежды из норки", "tnved": "4303 10 901 0", "marking_status": "mandatory"},
-                {"id": "furs_4303109020", "name": "предметы одежды из нутрии", "tnved": "4303 10 902 0", "marking_status": "mandatory"},
-                {"id": "furs_4303109030", "name": "предметы одежды из песца или лисицы", "tnved": "4303 10 903 0", "marking_status": "mandatory"},
-                {"id": "furs_4303109040", "name": "предметы одежды из кролика или зайца", "tnved": "4303 10 904 0", "marking_status": "mandatory"},
-                {"id": "furs_4303109050", "name": "предметы одежды из енота", "tnved": "4303 10 905 0", "marking_status": "mandatory"},
-                {"id": "furs_4303109060", "name": "предметы одежды из овчины", "tnved": "4303 10 906 0", "marking_status": "mandatory"},
-                {"id": "furs_4303109080", "name": "предметы одежды прочие", "tnved": "4303 10 908 0", "marking_status": "mandatory"}
-            ]},
-            {"id": "toys", "name": "Детские игрушки", "icon": "puzzle", "products": [
-                {"id": "toys_9503", "name": "Игрушки, предназначенные для детей в возрасте до 14 лет — самокаты, пе", "tnved": "9503", "marking_status": "mandatory"},
-                {"id": "toys_950300", "name": "Трехколесные велосипеды, самокаты, педальные автомобили и аналогичные ", "tnved": "9503 00", "marking_status": "mandatory"},
-                {"id": "toys_9504", "name": "Консоли и оборудование для видеоигр, настольные или комнатные игры, вк", "tnved": "9504", "marking_status": "mandatory"},
-                {"id": "toys_9504400000", "name": "карты игральные", "tnved": "9504 40 000 0", "marking_status": "mandatory"},
-                {"id": "toys_950490", "name": "прочие:", "tnved": "9504 90", "marking_status": "mandatory"},
-                {"id": "toys_9504901000", "name": "наборы электрических гоночных автомобилей для соревновательных игр", "tnved": "9504 90 100 0", "marking_status": "mandatory"},
-                {"id": "toys_9504908009", "name": "прочие", "tnved": "9504 90 800 9", "marking_status": "mandatory"},
-                {"id": "toys_kolyaski_kukol", "name": "Коляски для кукол", "tnved": "9503 00", "marking_status": "mandatory"},
-                {"id": "toys_kukly", "name": "Куклы", "tnved": "9503 00", "marking_status": "mandatory"},
-                {"id": "toys_igrushki_prochie", "name": "Игрушки прочие", "tnved": "9503 00", "marking_status": "mandatory"},
-                {"id": "toys_modeli", "name": "Модели в масштабе", "tnved": "9503 00", "marking_status": "mandatory"},
-                {"id": "toys_golovolomki", "name": "Головоломки всех видов", "tnved": "9503 00", "marking_status": "mandatory"}
-            ]},
-            {"id": "bicycles", "name": "Велосипеды", "icon": "bike", "products": [
-                {"id": "bicycles_8711", "name": "Мотоциклы (включая мопеды) и велосипеды с установленным вспомогательны", "tnved": "8711", "marking_status": "mandatory"},
-                {"id": "bicycles_871187", "name": "Велосипеды (в том числе с установленным вспомогательным двигателем и т", "tnved": "8711 87", "marking_status": "mandatory"},
-                {"id": "bicycles_87118712", "name": "Велосипеды (в том числе с установленным вспомогательным двигателем и т", "tnved": "8711 87 12", "marking_status": "mandatory"},
-                {"id": "bicycles_8711871200", "name": "Велосипеды (в том числе с установленным вспомогательным двигателем и т", "tnved": "8711 87 120 0", "marking_status": "mandatory"},
-                {"id": "bicycles_871200", "name": "Велосипеды двухколёсные", "tnved": "8712 00", "marking_status": "mandatory"},
-                {"id": "bicycles_871491100", "name": "Рамы велосипедные", "tnved": "8714 91 100", "marking_status": "mandatory"},
-                {"id": "bicycles_950300100", "name": "Велосипеды трёхколёсные, самокаты детские", "tnved": "9503 00 100", "marking_status": "mandatory"}
-            ]}
-        ]
-    },
-    {
-        "id": "auto",
-        "name": "Автомобильная отрасль",
-        "icon": "car",
-        "subcategories": [
-            {"id": "tires", "name": "Шины и покрышки", "icon": "circle", "products": [
-                {"id": "tires_4011", "name": "Шины и покрышки пневматические резиновые новые:", "tnved": "4011", "marking_status": "mandatory"},
-                {"id": "tires_401110", "name": "Шины и покрышки пневматические резиновые новые", "tnved": "4011 10", "marking_status": "mandatory"},
-                {"id": "tires_40111000", "name": "Шины и покрышки пневматические резиновые новые", "tnved": "4011 10 00", "marking_status": "mandatory"},
-                {"id": "tires_4011100003", "name": "с посадочным диаметром не более 16 дюймов", "tnved": "4011 10 000 3", "marking_status": "mandatory"},
-                {"id": "tires_4011100009", "name": "прочие", "tnved": "4011 10 000 9", "marking_status": "mandatory"},
-                {"id": "tires_401120", "name": "для автобусов или моторных транспортных средств для перевозки грузов:", "tnved": "4011 20", "marking_status": "mandatory"},
-                {"id": "tires_40112010", "name": "Шины и покрышки пневматические резиновые новые", "tnved": "4011 20 10", "marking_status": "mandatory"},
-                {"id": "tires_4011201000", "name": "с индексом нагрузки не более 121", "tnved": "4011 20 100 0", "marking_status": "mandatory"},
-                {"id": "tires_40112090", "name": "Шины и покрышки пневматические резиновые новые", "tnved": "4011 20 90", "marking_status": "mandatory"},
-                {"id": "tires_4011209000", "name": "с индексом нагрузки более 121", "tnved": "4011 20 900 0", "marking_status": "mandatory"},
-                {"id": "tires_401140", "name": "Шины и покрышки пневматические резиновые новые", "tnved": "4011 40", "marking_status": "mandatory"},
-                {"id": "tires_40114000", "name": "Шины и покрышки пневматические резиновые новые", "tnved": "4011 40 00", "marking_status": "mandatory"},
-                {"id": "tires_4011400000", "name": "для мотоциклов", "tnved": "4011 40 000 0", "marking_status": "mandatory"},
-                {"id": "tires_401170", "name": "Шины и покрышки пневматические резиновые новые", "tnved": "4011 70", "marking_status": "mandatory"},
-                {"id": "tires_40117000", "name": "Шины и покрышки пневматические резиновые новые", "tnved": "4011 70 00", "marking_status": "mandatory"},
-                {"id": "tires_4011700000", "name": "для сельскохозяйственных или лесохозяйственных транспортных средств и ", "tnved": "4011 70 000 0", "marking_status": "mandatory"},
-                {"id": "tires_401180", "name": "Шины и покрышки пневматические резиновые новые", "tnved": "4011 80", "marking_status": "mandatory"},
-                {"id": "tires_40118000", "name": "Шины и покрышки пневматические резиновые новые", "tnved": "4011 80 00", "marking_status": "mandatory"},
-                {"id": "tires_4011800000", "name": "для транспортных средств и машин, используемых в строительстве, горном", "tnved": "4011 80 000 0", "marking_status": "mandatory"},
-                {"id": "tires_401190", "name": "Шины и покрышки пневматические резиновые новые", "tnved": "4011 90", "marking_status": "mandatory"},
-                {"id": "tires_40119000", "name": "Шины и покрышки пневматические резиновые новые", "tnved": "4011 90 00", "marking_status": "mandatory"},
-                {"id": "tires_4011900000", "name": "прочие", "tnved": "4011 90 000 0", "marking_status": "mandatory"}
-            ]},
-            {"id": "motor_oils", "name": "Моторные масла", "icon": "droplet", "products": [
-                {"id": "motor_oils_2710", "name": "Нефть и нефтепродукты, полученные из битуминозных пород, кроме сырых; ", "tnved": "2710", "marking_status": "mandatory"},
-                {"id": "motor_oils_271019", "name": "прочие:", "tnved": "2710 19", "marking_status": "mandatory"},
-                {"id": "motor_oils_27101982", "name": "Моторные масла, компрессорное смазочное масло, турбинное смазочное мас", "tnved": "2710 19 82", "marking_status": "mandatory"},
-                {"id": "motor_oils_2710198200", "name": "моторные масла, компрессорное смазочное масло, турбинное смазочное мас", "tnved": "2710 19 820 0", "marking_status": "mandatory"},
-                {"id": "motor_oils_27101988", "name": "Масло для шестерен и масло для редукторов (например, масло трансмиссио", "tnved": "2710 19 88", "marking_status": "mandatory"},
-                {"id": "motor_oils_2710198800", "name": "масло для шестерен и масло для редукторов", "tnved": "2710 19 880 0", "marking_status": "mandatory"},
-                {"id": "motor_oils_3403", "name": "Материалы смазочные (включая смазочно-охлаждающие эмульсии для режущих", "tnved": "3403", "marking_status": "mandatory"},
-                {"id": "motor_oils_340319", "name": "прочие:", "tnved": "3403 19", "marking_status": "mandatory"},
-                {"id": "motor_oils_34031910", "name": "Прочие материалы смазочные, содержащие не в качестве основного компоне", "tnved": "3403 19 10", "marking_status": "mandatory"},
-                {"id": "motor_oils_3403191000", "name": "содержащие не в качестве основного компонента 70 мас.% или более нефти", "tnved": "3403 19 100 0", "marking_status": "mandatory"},
-                {"id": "motor_oils_34031990", "name": "Средства для смазки машин, механизмов и транспортных средств. В данную", "tnved": "3403 19 90", "marking_status": "mandatory"},
-                {"id": "motor_oils_3403199000", "name": "прочие", "tnved": "3403 19 900 0", "marking_status": "mandatory"},
-                {"id": "motor_oils_340399", "name": "Материалы смазочные (включая смазочно-охлаждающие эмульсии для режущих", "tnved": "3403 99", "marking_status": "mandatory"},
-                {"id": "motor_oils_34039900", "name": "Материалы смазочные (включая смазочно-охлаждающие эмульсии для режущих", "tnved": "3403 99 00", "marking_status": "mandatory"},
-                {"id": "motor_oils_3403990000", "name": "прочие", "tnved": "3403 99 000 0", "marking_status": "mandatory"},
-                {"id": "motor_oils_3819", "name": "Жидкости тормозные гидравлические и жидкости готовые прочие для гидрав", "tnved": "3819", "marking_status": "mandatory"},
-                {"id": "motor_oils_381900", "name": "Жидкости тормозные гидравлические и жидкости готовые прочие для гидрав", "tnved": "3819 00", "marking_status": "mandatory"},
-                {"id": "motor_oils_38190000", "name": "Жидкости тормозные гидравлические и жидкости готовые прочие для гидрав", "tnved": "3819 00 00", "marking_status": "mandatory"},
-                {"id": "motor_oils_3819000000", "name": "Жидкости тормозные гидравлические и жидкости готовые прочие для гидрав", "tnved": "3819 00 000 0", "marking_status": "mandatory"},
-                {"id": "motor_oils_3820", "name": "Антифризы и жидкости антиобледенительные готовые (например, омыватель ", "tnved": "3820", "marking_status": "mandatory"},
-                {"id": "motor_oils_382000", "name": "Антифризы и жидкости антиобледенительные готовые (например, омыватель ", "tnved": "3820 00", "marking_status": "mandatory"},
-                {"id": "motor_oils_38200000", "name": "Антифризы и жидкости антиобледенительные готовые (например, омыватель ", "tnved": "3820 00 00", "marking_status": "mandatory"},
-                {"id": "motor_oils_3820000000", "name": "Антифризы и жидкости антиобледенительные готовые", "tnved": "3820 00 000 0", "marking_status": "mandatory"},
-                {"id": "motor_oils_kompressornye", "name": "Компрессорные масла", "tnved": "2710 19 820 0", "marking_status": "mandatory"},
-                {"id": "motor_oils_turbinnye", "name": "Турбинные масла", "tnved": "2710 19 820 0", "marking_status": "mandatory"},
-                {"id": "motor_oils_reduktory", "name": "Масла для редукторов", "tnved": "2710 19 880 0", "marking_status": "mandatory"},
-                {"id": "motor_oils_smazki_prochie", "name": "Смазки прочие (эмульсии, антикоррозионные)", "tnved": "3403 99 000 0", "marking_status": "mandatory"},
-                {"id": "motor_oils_omyvateli", "name": "Омыватели стёкол", "tnved": "3820 00 000 0", "marking_status": "mandatory"}
-            ]}
-        ]
-    },
-    {
-        "id": "construction",
-        "name": "Строительство и инфраструктура",
-        "icon": "hard-hat",
-        "subcategories": [
-            {"id": "building_materials", "name": "Строительные материалы", "icon": "hammer", "products": [
-                {"id": "building_materials_2520", "name": "Гипс; ангидрит; гипсовые вяжущие (представляющие собой кальцинированны", "tnved": "2520", "marking_status": "mandatory"},
-                {"id": "building_materials_2523", "name": "Портландцемент, цемент глиноземистый, цемент шлаковый, цемент суперсул", "tnved": "2523", "marking_status": "mandatory"},
-                {"id": "building_materials_3816", "name": "Цементы огнеупорные, растворы строительные огнеупорные, бетоны огнеупо", "tnved": "3816", "marking_status": "mandatory"},
-                {"id": "building_materials_381600", "name": "Цементы огнеупорные, растворы строительные огнеупорные, бетоны огнеупо", "tnved": "3816 00", "marking_status": "mandatory"},
-                {"id": "building_materials_38160000", "name": "Цементы огнеупорные, растворы строительные огнеупорные, бетоны огнеупо", "tnved": "3816 00 00", "marking_status": "mandatory"},
-                {"id": "building_materials_3816000000", "name": "Цементы огнеупорные, растворы строительные огнеупорные, бетоны огнеупо", "tnved": "3816 00 000 0", "marking_status": "mandatory"},
-                {"id": "building_materials_3824", "name": "Готовые связующие вещества для производства литейных форм или литейных", "tnved": "3824", "marking_status": "mandatory"},
-                {"id": "building_materials_382450", "name": "неогнеупорные строительные растворы и бетоны:", "tnved": "3824 50", "marking_status": "mandatory"},
-                {"id": "building_materials_38245090", "name": "Смеси строительные, растворы строительные", "tnved": "3824 50 90", "marking_status": "mandatory"},
-                {"id": "building_materials_3824509000", "name": "прочие", "tnved": "3824 50 900 0", "marking_status": "mandatory"},
-                {"id": "building_materials_3214", "name": "Замазки стекольная и садовая, цементы смоляные, составы для уплотнения", "tnved": "3214", "marking_status": "mandatory"},
-                {"id": "building_materials_gips_stroit", "name": "Гипс строительный", "tnved": "2520", "marking_status": "mandatory"},
-                {"id": "building_materials_gips_tech", "name": "Гипс технический", "tnved": "2520", "marking_status": "mandatory"},
-                {"id": "building_materials_gips_med", "name": "Гипс медицинский", "tnved": "2520", "marking_status": "mandatory"},
-                {"id": "building_materials_gips_form", "name": "Гипс формовочный", "tnved": "2520", "marking_status": "mandatory"},
-                {"id": "building_materials_portland_bez", "name": "Портландцемент без добавок", "tnved": "2523", "marking_status": "mandatory"},
-                {"id": "building_materials_portland_s", "name": "Портландцемент с добавками", "tnved": "2523", "marking_status": "mandatory"},
-                {"id": "building_materials_shlako", "name": "Шлакопортландцемент", "tnved": "2523", "marking_status": "mandatory"},
-                {"id": "building_materials_kompozit", "name": "Цемент композиционный", "tnved": "2523", "marking_status": "mandatory"},
-                {"id": "building_materials_belye", "name": "Портландцементы белые/цветные", "tnved": "2523", "marking_status": "mandatory"},
-                {"id": "building_materials_tampon", "name": "Цемент тампонажный", "tnved": "2523", "marking_status": "mandatory"},
-                {"id": "building_materials_glinozem", "name": "Цементы глинозёмистые", "tnved": "2523", "marking_status": "mandatory"},
-                {"id": "building_materials_cement_proch", "name": "Цементы прочие", "tnved": "2523", "marking_status": "mandatory"},
-                {"id": "building_materials_rastvory_ogn", "name": "Растворы огнеупорные", "tnved": "3816 00 000 0", "marking_status": "mandatory"},
-                {"id": "building_materials_betony_ogn", "name": "Бетоны огнеупорные", "tnved": "3816 00 000 0", "marking_status": "mandatory"},
-                {"id": "building_materials_rastvory_str", "name": "Растворы строительные", "tnved": "3824 50 900 0", "marking_status": "mandatory"},
-                {"id": "building_materials_shpatlyovki", "name": "Шпатлёвки", "tnved": "3214", "marking_status": "mandatory"},
-                {"id": "building_materials_zamazki", "name": "Замазки", "tnved": "3214", "marking_status": "mandatory"},
-                {"id": "building_materials_germetiki", "name": "Герметики", "tnved": "3214", "marking_status": "mandatory"},
-                {"id": "building_materials_mastiki", "name": "Мастики", "tnved": "3214", "marking_status": "mandatory"},
-                {"id": "building_materials_pasty", "name": "Пасты строительные", "tnved": "3214", "marking_status": "mandatory"}
-            ]}
-        ]
-    },
-    {
-        "id": "electronics",
-        "name": "Электроника и техника",
-        "icon": "cpu",
-        "subcategories": [
-            {"id": "cameras", "name": "Фотоаппараты и лампы-вспышки", "icon": "camera", "products": [
-                {"id": "cameras_9006", "name": "Фотокамеры (кроме кинематографических)", "tnved": "9006", "marking_status": "mandatory", "mandatory_since": "2020-10-01",
-                    "timeline": {
-                        "title": "Фотоаппараты и лампы-вспышки",
-                        "start_date": "1 октября 2020",
-                        "who": ["Производители", "Импортёры", "Оптовики", "Розница"],
-                        "current_requirements": [
-                            "Регистрация в Честном ЗНАКе",
-                            "Нанесение кодов маркировки",
-                            "Передача данных при продаже на кассе",
-                            "Электронный документооборот (ЭДО)",
-                            "Разрешительный режим на кассах (с 01.11.2024)"
-                        ]
-                    }
-                },
-                {"id": "cameras_900610", "name": "Фотоаппараты для изготовления печатных пластин/цилиндров", "tnved": "9006 10", "marking_status": "mandatory"},
-                {"id": "cameras_900630", "name": "Фотоаппараты специальные для подводной/аэросъёмки", "tnved": "9006 30", "marking_status": "mandatory"},
-                {"id": "cameras_900640", "name": "Фотоаппараты для моментальной печати", "tnved": "9006 40", "marking_status": "mandatory"},
-                {"id": "cameras_900651", "name": "Фотоаппараты прочие с видоискателем (зеркальные)", "tnved": "9006 51", "marking_status": "mandatory"},
-                {"id": "cameras_900652", "name": "Фотоаппараты прочие для плёнки шириной менее 35мм", "tnved": "9006 52", "marking_status": "mandatory"},
-                {"id": "cameras_900653", "name": "Фотоаппараты прочие для плёнки шириной 35мм", "tnved": "9006 53", "marking_status": "mandatory"},
-                {"id": "cameras_900659", "name": "Фотоаппараты прочие", "tnved": "9006 59", "marking_status": "mandatory"},
-                {"id": "cameras_900661", "name": "Лампы-вспышки с газоразрядной трубкой", "tnved": "9006 61", "marking_status": "mandatory"},
-                {"id": "cameras_900669", "name": "Лампы-вспышки прочие", "tnved": "9006 69", "marking_status": "mandatory"}
-            ]}
-        ]
-    },
-    {
-        "id": "pilot",
-        "name": "Пилотные проекты",
-        "icon": "rocket",
-        "subcategories": [
-            {
-                "id": "pilot_титановая_металлопродукция",
-                "name": "Титановая металлопродукция (завершен)",
-                "products": [
-                    {"id": "pilot_титановая_металлопродукция_8108_20_000_6", "name": "Слитки из титановых сплавов", "tnved": "8108 20 000 6", "marking_status": "not_required"},
-                    {"id": "pilot_титановая_металлопродукция_8108_20_000_7", "name": "Слябы из титановых сплавов", "tnved": "8108 20 000 7", "marking_status": "not_required"},
-                    {"id": "pilot_титановая_металлопродукция_8108_90_300_8", "name": "Прутки и биллеты из титановых сплавов", "tnved": "8108 90 300 8", "marking_status": "not_required"},
-                    {"id": "pilot_титановая_металлопродукция_8108_90_300_8_1", "name": "Плиты и листы из титановых сплавов", "tnved": "8108 90 300 8", "marking_status": "not_required"},
-                    {"id": "pilot_титановая_металлопродукция_8108_90_300_8_2", "name": "Поковки прямоугольной формы из титановых сплавов", "tnved": "8108 90 300 8", "marking_status": "not_required"},
-                    {"id": "pilot_титановая_металлопродукция_8108_90_500_8", "name": "Плиты и листы из титановых сплавов", "tnved": "8108 90 500 8", "marking_status": "not_required"}
-                ]
-            },
-            {
-                "id": "pilot_оптоволоконная_продукция",
-                "name": "Оптоволоконная продукция",
-                "products": [
-                    {"id": "pilot_оптоволоконная_продукция_9001_10_900_1", "name": "Волокна оптические", "tnved": "9001 10 900 1", "marking_status": "experiment"},
-                    {"id": "pilot_оптоволоконная_продукция_8544_70_000_0", "name": "Кабели волоконно-оптические", "tnved": "8544 70 000 0", "marking_status": "experiment"}
-                ]
-            },
-            {
-                "id": "pilot_отопительные_приборы",
-                "name": "Отопительные приборы",
-                "products": [
-                    {"id": "pilot_отопительные_приборы_7322_11_000_0", "name": "Радиаторы центрального отопления чугунные", "tnved": "7322 11 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_отопительные_приборы_7322_19_000_0", "name": "Радиаторы центрального отопления прочие", "tnved": "7322 19 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_отопительные_приборы_7616_99_100_2", "name": "Радиаторы алюминиевые", "tnved": "7616 99 100 2", "marking_status": "experiment"},
-                    {"id": "pilot_отопительные_приборы_7616_99_100_3", "name": "Радиаторы алюминиевые", "tnved": "7616 99 100 3", "marking_status": "experiment"},
-                    {"id": "pilot_отопительные_приборы_7616_99_900_8", "name": "Радиаторы алюминиевые прочие", "tnved": "7616 99 900 8", "marking_status": "experiment"},
-                    {"id": "pilot_отопительные_приборы_7322_90_000_9", "name": "Конвекторы отопительные", "tnved": "7322 90 000 9", "marking_status": "experiment"},
-                    {"id": "pilot_отопительные_приборы_7419_80_000_0", "name": "Конвекторы отопительные медные", "tnved": "7419 80 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_отопительные_приборы_8403_10_900_0", "name": "Котлы центрального отопления", "tnved": "8403 10 900 0", "marking_status": "experiment"}
-                ]
-            },
-            {
-                "id": "pilot_слабоалкогольная_продукция_до_9",
-                "name": "Слабоалкогольная продукция (до 9%)",
-                "products": [
-                    {"id": "pilot_слабоалкогольная_продукция_до_9_2206_00_590_1", "name": "Алкогольная продукция до 9%", "tnved": "2206 00 590 1", "marking_status": "experiment"},
-                    {"id": "pilot_слабоалкогольная_продукция_до_9_2206_00_390_1", "name": "Алкогольная продукция до 9%", "tnved": "2206 00 390 1", "marking_status": "experiment"},
-                    {"id": "pilot_слабоалкогольная_продукция_до_9_2206_00_890_1", "name": "Алкогольная продукция до 9%", "tnved": "2206 00 890 1", "marking_status": "experiment"},
-                    {"id": "pilot_слабоалкогольная_продукция_до_9_2208_90_690_1", "name": "Алкогольная продукция до 9%", "tnved": "2208 90 690 1", "marking_status": "experiment"},
-                    {"id": "pilot_слабоалкогольная_продукция_до_9_2208_90_780_1", "name": "Алкогольная продукция до 9%", "tnved": "2208 90 780 1", "marking_status": "experiment"},
-                    {"id": "pilot_слабоалкогольная_продукция_до_9_2206_00_390_9", "name": "Алкогольная продукция до 9%", "tnved": "2206 00 390 9", "marking_status": "experiment"},
-                    {"id": "pilot_слабоалкогольная_продукция_до_9_2206_00_590_9", "name": "Алкогольная продукция до 9%", "tnved": "2206 00 590 9", "marking_status": "experiment"},
-                    {"id": "pilot_слабоалкогольная_продукция_до_9_2206_00_890_9", "name": "Алкогольная продукция до 9%", "tnved": "2206 00 890 9", "marking_status": "experiment"},
-                    {"id": "pilot_слабоалкогольная_продукция_до_9_2208_90_690_9", "name": "Алкогольная продукция до 9%", "tnved": "2208 90 690 9", "marking_status": "experiment"},
-                    {"id": "pilot_слабоалкогольная_продукция_до_9_2208_90_780_9", "name": "Алкогольная продукция до 9%", "tnved": "2208 90 780 9", "marking_status": "experiment"}
-                ]
-            },
-            {
-                "id": "pilot_пиротехника_и_пожарная_безопасность",
-                "name": "Пиротехника и пожарная безопасность",
-                "products": [
-                    {"id": "pilot_пиротехника_и_пожарная_безопасность_3604", "name": "Изделия пиротехнические I, II, III классов", "tnved": "3604", "marking_status": "experiment"},
-                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8424_10_000_0", "name": "Огнетушители", "tnved": "8424 10 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_пиротехника_и_пожарная_безопасность_3813_00_000_0", "name": "Составы и заряды для огнетушителей", "tnved": "3813 00 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8526_92_000_8", "name": "Извещатели пожарные", "tnved": "8526 92 000 8", "marking_status": "experiment"},
-                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8531_10", "name": "Извещатели пожарные", "tnved": "8531 10", "marking_status": "experiment"},
-                    {"id": "pilot_пиротехника_и_пожарная_безопасность_9022_29_000_0", "name": "Извещатели пожарные", "tnved": "9022 29 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_пиротехника_и_пожарная_безопасность_9027_10", "name": "Извещатели пожарные", "tnved": "9027 10", "marking_status": "experiment"},
-                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8504_40_300_4", "name": "Источники бесперебойного питания пожарной автоматики", "tnved": "8504 40 300 4", "marking_status": "experiment"},
-                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8504_40_300_8", "name": "Источники бесперебойного питания пожарной автоматики", "tnved": "8504 40 300 8", "marking_status": "experiment"},
-                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8504_40_550_0", "name": "Источники бесперебойного питания пожарной автоматики", "tnved": "8504 40 550 0", "marking_status": "experiment"},
-                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8504_40_830_0", "name": "Источники бесперебойного питания пожарной автоматики", "tnved": "8504 40 830 0", "marking_status": "experiment"},
-                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8504_40_850_0", "name": "Источники бесперебойного питания пожарной автоматики", "tnved": "8504 40 850 0", "marking_status": "experiment"},
-                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8504_40_870_0", "name": "Источники бесперебойного питания пожарной автоматики", "tnved": "8504 40 870 0", "marking_status": "experiment"},
-                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8504_40_910_0", "name": "Источники бесперебойного питания пожарной автоматики", "tnved": "8504 40 910 0", "marking_status": "experiment"},
-                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8517_62_000_9", "name": "Оповещатели пожарные", "tnved": "8517 62 000 9", "marking_status": "experiment"},
-                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8518_21_000_0", "name": "Оповещатели пожарные", "tnved": "8518 21 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8518_22_000_9", "name": "Оповещатели пожарные", "tnved": "8518 22 000 9", "marking_status": "experiment"},
-                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8518_29_300_8", "name": "Оповещатели пожарные", "tnved": "8518 29 300 8", "marking_status": "experiment"},
-                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8518_29_960_0", "name": "Оповещатели пожарные", "tnved": "8518 29 960 0", "marking_status": "experiment"},
-                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8531_20_200_0", "name": "Выносные устройства индикации", "tnved": "8531 20 200 0", "marking_status": "experiment"},
-                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8531_80_950_0", "name": "Выносные устройства индикации", "tnved": "8531 80 950 0", "marking_status": "experiment"},
-                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8537_10", "name": "Приборы приемно-контрольные пожарные", "tnved": "8537 10", "marking_status": "experiment"},
-                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8517_61_000", "name": "Системы передачи извещений о пожаре", "tnved": "8517 61 000", "marking_status": "experiment"},
-                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8517_62_000", "name": "Системы передачи извещений о пожаре", "tnved": "8517 62 000", "marking_status": "experiment"},
-                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8517_69_390_0", "name": "Системы передачи извещений о пожаре", "tnved": "8517 69 390 0", "marking_status": "experiment"},
-                    {"id": "pilot_пиротехника_и_пожарная_безопасность_8517_69_900_0", "name": "Системы передачи извещений о пожаре", "tnved": "8517 69 900 0", "marking_status": "experiment"}
-                ]
-            },
-            {
-                "id": "pilot_компоненты_транспортных_средств",
-                "name": "Компоненты транспортных средств",
-                "products": [
-                    {"id": "pilot_компоненты_транспортных_средств_4823_90_859_7", "name": "Фильтры", "tnved": "4823 90 859 7", "marking_status": "experiment"},
-                    {"id": "pilot_компоненты_транспортных_средств_5911_90_900_0", "name": "Фильтры", "tnved": "5911 90 900 0", "marking_status": "experiment"},
-                    {"id": "pilot_компоненты_транспортных_средств_8421_23_000_0", "name": "Фильтры масляные", "tnved": "8421 23 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_компоненты_транспортных_средств_8421_29_000_9", "name": "Фильтры прочие", "tnved": "8421 29 000 9", "marking_status": "experiment"},
-                    {"id": "pilot_компоненты_транспортных_средств_8421_31_000_0", "name": "Фильтры воздушные", "tnved": "8421 31 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_компоненты_транспортных_средств_8421_32_000_0", "name": "Фильтры воздушные", "tnved": "8421 32 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_компоненты_транспортных_средств_8421_39_200_8", "name": "Фильтры прочие", "tnved": "8421 39 200 8", "marking_status": "experiment"},
-                    {"id": "pilot_компоненты_транспортных_средств_8421_99_000_6", "name": "Фильтры части", "tnved": "8421 99 000 6", "marking_status": "experiment"},
-                    {"id": "pilot_компоненты_транспортных_средств_7007_11_100_1", "name": "Стекло закаленное безопасное", "tnved": "7007 11 100 1", "marking_status": "experiment"},
-                    {"id": "pilot_компоненты_транспортных_средств_7007_11_100_9", "name": "Стекло закаленное безопасное", "tnved": "7007 11 100 9", "marking_status": "experiment"},
-                    {"id": "pilot_компоненты_транспортных_средств_7007_11_900_0", "name": "Стекло закаленное безопасное", "tnved": "7007 11 900 0", "marking_status": "experiment"},
-                    {"id": "pilot_компоненты_транспортных_средств_7007_21_200_1", "name": "Стекло многослойное безопасное", "tnved": "7007 21 200 1", "marking_status": "experiment"},
-                    {"id": "pilot_компоненты_транспортных_средств_7007_21_200_9", "name": "Стекло многослойное безопасное", "tnved": "7007 21 200 9", "marking_status": "experiment"},
-                    {"id": "pilot_компоненты_транспортных_средств_7007_21_800_9", "name": "Стекло многослойное безопасное", "tnved": "7007 21 800 9", "marking_status": "experiment"},
-                    {"id": "pilot_компоненты_транспортных_средств_7007_29_000_0", "name": "Стекло многослойное безопасное", "tnved": "7007 29 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_компоненты_транспортных_средств_8511_10_000_1", "name": "Свечи зажигания", "tnved": "8511 10 000 1", "marking_status": "experiment"},
-                    {"id": "pilot_компоненты_транспортных_средств_8511_10_000_9", "name": "Свечи зажигания", "tnved": "8511 10 000 9", "marking_status": "experiment"},
-                    {"id": "pilot_компоненты_транспортных_средств_8708_22_000_1", "name": "Лобовые стекла", "tnved": "8708 22 000 1", "marking_status": "experiment"},
-                    {"id": "pilot_компоненты_транспортных_средств_8708_22_000_9", "name": "Лобовые стекла", "tnved": "8708 22 000 9", "marking_status": "experiment"},
-                    {"id": "pilot_компоненты_транспортных_средств_8708_30_910_1", "name": "Тормозные диски, колодки", "tnved": "8708 30 910 1", "marking_status": "experiment"},
-                    {"id": "pilot_компоненты_транспортных_средств_8708_30_910_9", "name": "Тормозные диски, колодки", "tnved": "8708 30 910 9", "marking_status": "experiment"},
-                    {"id": "pilot_компоненты_транспортных_средств_8708_30_990_9", "name": "Тормозные диски, колодки", "tnved": "8708 30 990 9", "marking_status": "experiment"},
-                    {"id": "pilot_компоненты_транспортных_средств_8714_10_100_0", "name": "Тормозные диски, колодки мото", "tnved": "8714 10 100 0", "marking_status": "experiment"},
-                    {"id": "pilot_компоненты_транспортных_средств_8708_70_500_1", "name": "Колеса ходовые, диски", "tnved": "8708 70 500 1", "marking_status": "experiment"},
-                    {"id": "pilot_компоненты_транспортных_средств_8708_70_500_9", "name": "Колеса ходовые, диски", "tnved": "8708 70 500 9", "marking_status": "experiment"},
-                    {"id": "pilot_компоненты_транспортных_средств_8708_70_990_1", "name": "Колеса ходовые, диски", "tnved": "8708 70 990 1", "marking_status": "experiment"},
-                    {"id": "pilot_компоненты_транспортных_средств_8708_70_990_9", "name": "Колеса ходовые, диски", "tnved": "8708 70 990 9", "marking_status": "experiment"},
-                    {"id": "pilot_компоненты_транспортных_средств_8714_10_300_0", "name": "Колеса ходовые мото", "tnved": "8714 10 300 0", "marking_status": "experiment"}
-                ]
-            },
-            {
-                "id": "pilot_товары_для_дома_и_интерьера",
-                "name": "Товары для дома и интерьера",
-                "products": [
-                    {"id": "pilot_товары_для_дома_и_интерьера_3924_10_000_0", "name": "Посуда пластиковая столовая", "tnved": "3924 10 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_3924_90_000_9", "name": "Посуда пластиковая прочая", "tnved": "3924 90 000 9", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_4419", "name": "Посуда деревянная", "tnved": "4419", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_4806_10_000_0", "name": "Бумага пергаментная", "tnved": "4806 10 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_4806_20_000_0", "name": "Бумага жиронепроницаемая", "tnved": "4806 20 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_4806_40_100_0", "name": "Бумага пергаментная прочая", "tnved": "4806 40 100 0", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_4818_30_000_0", "name": "Скатерти бумажные", "tnved": "4818 30 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_4823_61_000_0", "name": "Подносы бумажные", "tnved": "4823 61 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_4823_69", "name": "Посуда бумажная прочая", "tnved": "4823 69", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_6911", "name": "Посуда фарфоровая", "tnved": "6911", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_6912_00", "name": "Посуда керамическая", "tnved": "6912 00", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_7013", "name": "Посуда стеклянная", "tnved": "7013", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_7323_91_000_0", "name": "Посуда чугунная эмалированная", "tnved": "7323 91 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_7323_92_000_0", "name": "Посуда чугунная прочая", "tnved": "7323 92 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_7323_93_000_0", "name": "Посуда из нержавеющей стали", "tnved": "7323 93 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_7323_94_000_0", "name": "Посуда стальная эмалированная", "tnved": "7323 94 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_7323_99_000_0", "name": "Посуда стальная прочая", "tnved": "7323 99 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_7326_20_000_2", "name": "Изделия из проволоки", "tnved": "7326 20 000 2", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_7418_10_100_0", "name": "Посуда медная", "tnved": "7418 10 100 0", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_7615_10_100_0", "name": "Посуда алюминиевая", "tnved": "7615 10 100 0", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_7615_10_300_0", "name": "Посуда алюминиевая", "tnved": "7615 10 300 0", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_7615_10_800_9", "name": "Посуда алюминиевая прочая", "tnved": "7615 10 800 9", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_8205_51_009_0", "name": "Инструменты кухонные", "tnved": "8205 51 009 0", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_8211_10_000_0", "name": "Наборы ножей", "tnved": "8211 10 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_8211_91_000", "name": "Ножи столовые", "tnved": "8211 91 000", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_8211_92_000_0", "name": "Ножи кухонные", "tnved": "8211 92 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_8213_00_000_0", "name": "Ножницы", "tnved": "8213 00 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_8215", "name": "Столовые приборы", "tnved": "8215", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_9616_10", "name": "Пульверизаторы", "tnved": "9616 10", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_9617_00_000", "name": "Термосы", "tnved": "9617 00 000", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_6307_10", "name": "Тряпки для уборки", "tnved": "6307 10", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_9603_10_000_0", "name": "Метлы", "tnved": "9603 10 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_9603_90", "name": "Щетки и швабры", "tnved": "9603 90", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_9604_00_000_0", "name": "Сита", "tnved": "9604 00 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_3406_00_000_0", "name": "Свечи", "tnved": "3406 00 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_3926_40_000_0", "name": "Статуэтки пластиковые", "tnved": "3926 40 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_4414", "name": "Рамки деревянные", "tnved": "4414", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_4420_11_000_0", "name": "Статуэтки деревянные", "tnved": "4420 11 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_4420_19_000_0", "name": "Статуэтки деревянные прочие", "tnved": "4420 19 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_4421_10_000_0", "name": "Вешалки деревянные", "tnved": "4421 10 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_4602", "name": "Изделия плетеные", "tnved": "4602", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_6702", "name": "Искусственные цветы", "tnved": "6702", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_6810_99_000_0", "name": "Изделия из цемента", "tnved": "6810 99 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_6913", "name": "Статуэтки керамические", "tnved": "6913", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_7009_91_000_0", "name": "Зеркала без рамы", "tnved": "7009 91 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_7009_92_000_0", "name": "Зеркала в раме", "tnved": "7009 92 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_8306_21_000_0", "name": "Статуэтки металлические", "tnved": "8306 21 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_8306_29_000", "name": "Статуэтки металлические прочие", "tnved": "8306 29 000", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_8306_30_000_0", "name": "Рамки для фото металлические", "tnved": "8306 30 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_9105_19_000_0", "name": "Часы настенные", "tnved": "9105 19 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_9105_29_000_0", "name": "Часы настенные прочие", "tnved": "9105 29 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_9105_96_000_0", "name": "Часы настенные прочие", "tnved": "9105 96 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_товары_для_дома_и_интерьера_9405_50_000_0", "name": "Подсвечники", "tnved": "9405 50 000 0", "marking_status": "experiment"}
-                ]
-            },
-            {
-                "id": "pilot_бакалейная_продукция",
-                "name": "Бакалейная продукция",
-                "products": [
-                    {"id": "pilot_бакалейная_продукция_0713_10_900_9", "name": "Горох прочий", "tnved": "0713 10 900 9", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_0713_20_000_0", "name": "Нут сушеный", "tnved": "0713 20 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_0713_31_000_0", "name": "Фасоль VINGA MUNGO", "tnved": "0713 31 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_0713_32_000_0", "name": "Фасоль мелкая красная (адзуки)", "tnved": "0713 32 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_0713_33_900_0", "name": "Фасоль обыкновенная", "tnved": "0713 33 900 0", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_0713_34_000_9", "name": "Земляной орех бамбарский", "tnved": "0713 34 000 9", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_0713_35_000_9", "name": "Коровий горох", "tnved": "0713 35 000 9", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_0713_39_000_9", "name": "Фасоль прочая", "tnved": "0713 39 000 9", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_0713_40_000_0", "name": "Чечевица", "tnved": "0713 40 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_0713_60_000_9", "name": "Голубиный горох", "tnved": "0713 60 000 9", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_0713_90_000_9", "name": "Прочие бобовые", "tnved": "0713 90 000 9", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_1006", "name": "Рис (кроме 1006 10)", "tnved": "1006", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_1007_90_000_0", "name": "Сорго зерновое", "tnved": "1007 90 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_1008_10_000_0", "name": "Гречиха", "tnved": "1008 10 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_1008_29_000_0", "name": "Просо и прочие злаки", "tnved": "1008 29 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_1008_50_000_0", "name": "Киноа", "tnved": "1008 50 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_1008_90_000_0", "name": "Прочие злаки", "tnved": "1008 90 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_1101_00", "name": "Мука пшеничная", "tnved": "1101 00", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_1102", "name": "Мука из зерна злаков", "tnved": "1102", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_1103", "name": "Крупа из зерна злаков", "tnved": "1103", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_1104", "name": "Зерно злаков обработанное", "tnved": "1104", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_1105", "name": "Мука картофельная, хлопья", "tnved": "1105", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_1106", "name": "Мука из бобовых", "tnved": "1106", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_1208", "name": "Мука из масличных культур", "tnved": "1208", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_1212", "name": "Продукты растительного происхождения", "tnved": "1212", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_1901_10_000_0", "name": "Готовые продукты для детей", "tnved": "1901 10 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_1901_20_000_0", "name": "Смеси для теста", "tnved": "1901 20 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_1902", "name": "Макаронные изделия", "tnved": "1902", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_1904_10", "name": "Готовые продукты из злаков вздутые", "tnved": "1904 10", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_1904_20", "name": "Мюсли, хлопья", "tnved": "1904 20", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_1904_30_000_0", "name": "Булгур", "tnved": "1904 30 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_1904_90", "name": "Злаки готовые прочие", "tnved": "1904 90", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_1905_90", "name": "Смеси для хлебобулочных изделий", "tnved": "1905 90", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_2004_90_500_0", "name": "Горох и фасоль в стручках", "tnved": "2004 90 500 0", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_2005_20_100_0", "name": "Картофель быстрого приготовления", "tnved": "2005 20 100 0", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_2005_40_000_0", "name": "Горох консервированный", "tnved": "2005 40 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_2005_51_000_0", "name": "Фасоль лущеная консервированная", "tnved": "2005 51 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_2005_59_000_0", "name": "Фасоль прочая консервированная", "tnved": "2005 59 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_0409_00_000_0", "name": "Мёд натуральный", "tnved": "0409 00 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_1212_99_950_9", "name": "Продукты растительные пищевые", "tnved": "1212 99 950 9", "marking_status": "experiment"},
-                    {"id": "pilot_бакалейная_продукция_1702", "name": "Искусственный мёд, сахара прочие", "tnved": "1702", "marking_status": "experiment"}
-                ]
-            },
-            {
-                "id": "pilot_полуфабрикаты_и_замороженная_продукция",
-                "name": "Полуфабрикаты и замороженная продукция",
-                "products": [
-                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_0201", "name": "Мясо крупного рогатого скота, свежее или охлажденное", "tnved": "0201", "marking_status": "experiment"},
-                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_0202", "name": "Мясо крупного рогатого скота, замороженное", "tnved": "0202", "marking_status": "experiment"},
-                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_0203", "name": "Свинина свежая, охлажденная или замороженная", "tnved": "0203", "marking_status": "experiment"},
-                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_0204", "name": "Баранина или козлятина", "tnved": "0204", "marking_status": "experiment"},
-                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_0205_00", "name": "Мясо лошадей, ослов, мулов", "tnved": "0205 00", "marking_status": "experiment"},
-                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_0206", "name": "Пищевые субпродукты", "tnved": "0206", "marking_status": "experiment"},
-                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_0207", "name": "Мясо и субпродукты домашней птицы", "tnved": "0207", "marking_status": "experiment"},
-                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_0208", "name": "Прочее мясо и субпродукты", "tnved": "0208", "marking_status": "experiment"},
-                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_0209", "name": "Свиной жир и жир птицы", "tnved": "0209", "marking_status": "experiment"},
-                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_0304", "name": "Филе рыбное и прочее мясо рыбы", "tnved": "0304", "marking_status": "experiment"},
-                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_0306", "name": "Ракообразные", "tnved": "0306", "marking_status": "experiment"},
-                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_0307", "name": "Моллюски", "tnved": "0307", "marking_status": "experiment"},
-                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_0710", "name": "Овощи замороженные", "tnved": "0710", "marking_status": "experiment"},
-                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_0811", "name": "Фрукты и орехи замороженные", "tnved": "0811", "marking_status": "experiment"},
-                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_1501_10_900_0", "name": "Жир свиной топленый", "tnved": "1501 10 900 0", "marking_status": "experiment"},
-                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_1501_20_900_0", "name": "Жир свиной прочий", "tnved": "1501 20 900 0", "marking_status": "experiment"},
-                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_1501_90_000_0", "name": "Жир домашней птицы", "tnved": "1501 90 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_1601_00", "name": "Колбасы и аналогичные продукты из мяса", "tnved": "1601 00", "marking_status": "experiment"},
-                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_1602", "name": "Готовые или консервированные продукты из мяса", "tnved": "1602", "marking_status": "experiment"},
-                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_1604", "name": "Готовая или консервированная рыба", "tnved": "1604", "marking_status": "experiment"},
-                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_1901_20_000_0", "name": "Смеси для приготовления", "tnved": "1901 20 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_1902", "name": "Макаронные изделия замороженные", "tnved": "1902", "marking_status": "experiment"},
-                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_1904_90_100_0", "name": "Злаки готовые", "tnved": "1904 90 100 0", "marking_status": "experiment"},
-                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_1905_90", "name": "Хлебобулочные изделия замороженные", "tnved": "1905 90", "marking_status": "experiment"},
-                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_2003", "name": "Грибы готовые или консервированные", "tnved": "2003", "marking_status": "experiment"},
-                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_2004", "name": "Овощи готовые замороженные", "tnved": "2004", "marking_status": "experiment"},
-                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_2005", "name": "Овощи готовые незамороженные", "tnved": "2005", "marking_status": "experiment"},
-                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_2104", "name": "Супы, бульоны готовые", "tnved": "2104", "marking_status": "experiment"},
-                    {"id": "pilot_полуфабрикаты_и_замороженная_продукция_2106", "name": "Пищевые продукты прочие (кроме исключений)", "tnved": "2106", "marking_status": "experiment"}
-                ]
-            },
-            {
-                "id": "pilot_радиоэлектроника_i_этап",
-                "name": "Радиоэлектроника (I этап) (завершен)",
-                "products": [
-                    {"id": "pilot_радиоэлектроника_i_этап_8504_40_830_0", "name": "Выпрямители прочие", "tnved": "8504 40 830 0", "marking_status": "not_required"},
-                    {"id": "pilot_радиоэлектроника_i_этап_8504_40_910_0", "name": "Преобразователи статические прочие", "tnved": "8504 40 910 0", "marking_status": "not_required"},
-                    {"id": "pilot_радиоэлектроника_i_этап_8536_49_000_0", "name": "Реле на напряжение не более 1000 В", "tnved": "8536 49 000 0", "marking_status": "not_required"},
-                    {"id": "pilot_радиоэлектроника_i_этап_8536_69_900_8", "name": "Штепсели и розетки", "tnved": "8536 69 900 8", "marking_status": "not_required"},
-                    {"id": "pilot_радиоэлектроника_i_этап_8536_90_100_0", "name": "Соединители для проводов и кабелей", "tnved": "8536 90 100 0", "marking_status": "not_required"},
-                    {"id": "pilot_радиоэлектроника_i_этап_8536_90_850_0", "name": "Аппаратура электрическая прочая", "tnved": "8536 90 850 0", "marking_status": "not_required"},
-                    {"id": "pilot_радиоэлектроника_i_этап_8537_10_980_0", "name": "Пульты, панели, распределительные щиты", "tnved": "8537 10 980 0", "marking_status": "not_required"},
-                    {"id": "pilot_радиоэлектроника_i_этап_8539", "name": "Лампы накаливания и газоразрядные", "tnved": "8539", "marking_status": "not_required"},
-                    {"id": "pilot_радиоэлектроника_i_этап_8541_41_000", "name": "Светодиоды (LED)", "tnved": "8541 41 000", "marking_status": "not_required"},
-                    {"id": "pilot_радиоэлектроника_i_этап_8541_42_000_0", "name": "Фотогальванические элементы", "tnved": "8541 42 000 0", "marking_status": "not_required"},
-                    {"id": "pilot_радиоэлектроника_i_этап_8541_43_000_0", "name": "Фоточувствительные приборы", "tnved": "8541 43 000 0", "marking_status": "not_required"},
-                    {"id": "pilot_радиоэлектроника_i_этап_8541_49_000_0", "name": "Приборы полупроводниковые прочие", "tnved": "8541 49 000 0", "marking_status": "not_required"},
-                    {"id": "pilot_радиоэлектроника_i_этап_8512_20_000", "name": "Приборы освещения для транспорта", "tnved": "8512 20 000", "marking_status": "not_required"},
-                    {"id": "pilot_радиоэлектроника_i_этап_8513_10_000_0", "name": "Фонари портативные", "tnved": "8513 10 000 0", "marking_status": "not_required"},
-                    {"id": "pilot_радиоэлектроника_i_этап_9405_11_00", "name": "Люстры и светильники потолочные", "tnved": "9405 11 00", "marking_status": "not_required"},
-                    {"id": "pilot_радиоэлектроника_i_этап_9405_19_00", "name": "Светильники прочие", "tnved": "9405 19 00", "marking_status": "not_required"},
-                    {"id": "pilot_радиоэлектроника_i_этап_9405_21_00", "name": "Лампы настольные LED", "tnved": "9405 21 00", "marking_status": "not_required"},
-                    {"id": "pilot_радиоэлектроника_i_этап_9405_29_00", "name": "Лампы настольные прочие", "tnved": "9405 29 00", "marking_status": "not_required"},
-                    {"id": "pilot_радиоэлектроника_i_этап_9405_31_000_0", "name": "Гирлянды световые LED", "tnved": "9405 31 000 0", "marking_status": "not_required"},
-                    {"id": "pilot_радиоэлектроника_i_этап_9405_39_000_0", "name": "Гирлянды световые прочие", "tnved": "9405 39 000 0", "marking_status": "not_required"},
-                    {"id": "pilot_радиоэлектроника_i_этап_9405_41_00", "name": "Фотогальванические светильники", "tnved": "9405 41 00", "marking_status": "not_required"},
-                    {"id": "pilot_радиоэлектроника_i_этап_9405_42_00", "name": "Светильники LED прочие", "tnved": "9405 42 00", "marking_status": "not_required"},
-                    {"id": "pilot_радиоэлектроника_i_этап_9405_49_00", "name": "Светильники прочие", "tnved": "9405 49 00", "marking_status": "not_required"},
-                    {"id": "pilot_радиоэлектроника_i_этап_9405_92_000_8", "name": "Части светильников пластиковые", "tnved": "9405 92 000 8", "marking_status": "not_required"},
-                    {"id": "pilot_радиоэлектроника_i_этап_9405_99_000_8", "name": "Части светильников прочие", "tnved": "9405 99 000 8", "marking_status": "not_required"}
-                ]
-            },
-            {
-                "id": "pilot_радиоэлектроника_ii_этап",
-                "name": "Радиоэлектроника (II этап) (завершен)",
-                "products": [
-                    {"id": "pilot_радиоэлектроника_ii_этап_8471_30_000_0", "name": "Ноутбуки портативные до 10 кг", "tnved": "8471 30 000 0", "marking_status": "not_required"},
-                    {"id": "pilot_радиоэлектроника_ii_этап_8517_11_000_0", "name": "Телефоны проводные с беспроводной трубкой", "tnved": "8517 11 000 0", "marking_status": "not_required"},
-                    {"id": "pilot_радиоэлектроника_ii_этап_8517_13_000_0", "name": "Смартфоны", "tnved": "8517 13 000 0", "marking_status": "not_required"},
-                    {"id": "pilot_радиоэлектроника_ii_этап_8517_14_000_0", "name": "Телефоны для сотовых сетей прочие", "tnved": "8517 14 000 0", "marking_status": "not_required"},
-                    {"id": "pilot_радиоэлектроника_ii_этап_8517_18_000_0", "name": "Телефонные аппараты прочие", "tnved": "8517 18 000 0", "marking_status": "not_required"}
-                ]
-            },
-            {
-                "id": "pilot_радиоэлектроника_iii_этап",
-                "name": "Радиоэлектроника (III этап) (завершен)",
-                "products": [
-                    {"id": "pilot_радиоэлектроника_iii_этап_8534_00_110_0", "name": "Печатные схемы многослойные", "tnved": "8534 00 110 0", "marking_status": "not_required"},
-                    {"id": "pilot_радиоэлектроника_iii_этап_8534_00_190_0", "name": "Печатные схемы прочие", "tnved": "8534 00 190 0", "marking_status": "not_required"},
-                    {"id": "pilot_радиоэлектроника_iii_этап_8534_00_900_0", "name": "Печатные схемы с пассивными элементами", "tnved": "8534 00 900 0", "marking_status": "not_required"}
-                ]
-            },
-            {
-                "id": "pilot_радиоэлектроника_iv_этап",
-                "name": "Радиоэлектроника (IV этап)",
-                "products": [
-                    {"id": "pilot_радиоэлектроника_iv_этап_8543_40_000_0", "name": "Электронные сигареты многоразовые", "tnved": "8543 40 000 0", "marking_status": "experiment"}
-                ]
-            },
-            {
-                "id": "pilot_печатная_продукция",
-                "name": "Печатная продукция (завершен)",
-                "products": [
-                    {"id": "pilot_печатная_продукция_4901_99_000_0", "name": "Учебники печатные общеобразовательные", "tnved": "4901 99 000 0", "marking_status": "not_required"}
-                ]
-            },
-            {
-                "id": "pilot_кабельная_продукция",
-                "name": "Кабельная продукция",
-                "products": [
-                    {"id": "pilot_кабельная_продукция_8544_49_990_0", "name": "Кабели и провода на напряжение 1000 В", "tnved": "8544 49 990 0", "marking_status": "experiment"},
-                    {"id": "pilot_кабельная_продукция_8544_49_910_8", "name": "Кабели с изолированными проводниками >0,51 мм", "tnved": "8544 49 910 8", "marking_status": "experiment"}
-                ]
-            },
-            {
-                "id": "pilot_медицинские_изделия_2.0",
-                "name": "Медицинские изделия 2.0",
-                "products": [
-                    {"id": "pilot_медицинские_изделия_2.0_4014_10_000_0", "name": "Презервативы", "tnved": "4014 10 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_медицинские_изделия_2.0_9018_31", "name": "Шприцы", "tnved": "9018 31", "marking_status": "experiment"},
-                    {"id": "pilot_медицинские_изделия_2.0_9018_90_500", "name": "Инфузионные системы", "tnved": "9018 90 500", "marking_status": "experiment"},
-                    {"id": "pilot_медицинские_изделия_2.0_3005_10_000_0", "name": "Салфетки медицинские", "tnved": "3005 10 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_медицинские_изделия_2.0_3005_90_310_0", "name": "Салфетки медицинские", "tnved": "3005 90 310 0", "marking_status": "experiment"},
-                    {"id": "pilot_медицинские_изделия_2.0_3005_90_500_0", "name": "Салфетки медицинские", "tnved": "3005 90 500 0", "marking_status": "experiment"},
-                    {"id": "pilot_медицинские_изделия_2.0_3005_90_990_0", "name": "Салфетки медицинские прочие", "tnved": "3005 90 990 0", "marking_status": "experiment"},
-                    {"id": "pilot_медицинские_изделия_2.0_4803_00_900_0", "name": "Салфетки бумажные медицинские", "tnved": "4803 00 900 0", "marking_status": "experiment"},
-                    {"id": "pilot_медицинские_изделия_2.0_4818_20", "name": "Салфетки носовые медицинские", "tnved": "4818 20", "marking_status": "experiment"},
-                    {"id": "pilot_медицинские_изделия_2.0_4818_30_000_0", "name": "Скатерти медицинские", "tnved": "4818 30 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_медицинские_изделия_2.0_4818_90", "name": "Изделия бумажные медицинские", "tnved": "4818 90", "marking_status": "experiment"},
-                    {"id": "pilot_медицинские_изделия_2.0_5603", "name": "Нетканые материалы медицинские", "tnved": "5603", "marking_status": "experiment"},
-                    {"id": "pilot_медицинские_изделия_2.0_6307_90_920_0", "name": "Изделия текстильные медицинские", "tnved": "6307 90 920 0", "marking_status": "experiment"},
-                    {"id": "pilot_медицинские_изделия_2.0_6307_90_980_0", "name": "Изделия текстильные медицинские прочие", "tnved": "6307 90 980 0", "marking_status": "experiment"},
-                    {"id": "pilot_медицинские_изделия_2.0_3307_90_000_8", "name": "Салфетки косметические медицинские", "tnved": "3307 90 000 8", "marking_status": "experiment"},
-                    {"id": "pilot_медицинские_изделия_2.0_3926_90_970_9", "name": "Пробирки пластиковые", "tnved": "3926 90 970 9", "marking_status": "experiment"},
-                    {"id": "pilot_медицинские_изделия_2.0_7010_10_000_0", "name": "Пробирки стеклянные (ампулы)", "tnved": "7010 10 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_медицинские_изделия_2.0_7017", "name": "Пробирки лабораторные стеклянные", "tnved": "7017", "marking_status": "experiment"},
-                    {"id": "pilot_медицинские_изделия_2.0_9019_10", "name": "Аппаратура для озоновой/кислородной терапии", "tnved": "9019 10", "marking_status": "experiment"},
-                    {"id": "pilot_медицинские_изделия_2.0_9019_20_000_0", "name": "Аппаратура терапевтическая дыхательная", "tnved": "9019 20 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_медицинские_изделия_2.0_9018_90_840_9", "name": "Инкубаторы для новорожденных", "tnved": "9018 90 840 9", "marking_status": "experiment"},
-                    {"id": "pilot_медицинские_изделия_2.0_3006_10_900_0", "name": "Филлеры для пластической хирургии", "tnved": "3006 10 900 0", "marking_status": "experiment"},
-                    {"id": "pilot_медицинские_изделия_2.0_9021_90_900_9", "name": "Имплантаты косметические (нити)", "tnved": "9021 90 900 9", "marking_status": "experiment"},
-                    {"id": "pilot_медицинские_изделия_2.0_3926_20_000_0", "name": "Маски медицинские пластиковые", "tnved": "3926 20 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_медицинские_изделия_2.0_4818_90_100_0", "name": "Маски медицинские бумажные", "tnved": "4818 90 100 0", "marking_status": "experiment"},
-                    {"id": "pilot_медицинские_изделия_2.0_9020_00_000_0", "name": "Маски медицинские дыхательные", "tnved": "9020 00 000 0", "marking_status": "experiment"}
-                ]
-            },
-            {
-                "id": "pilot_полимерные_трубы",
-                "name": "Полимерные трубы",
-                "products": [
-                    {"id": "pilot_полимерные_трубы_3917_21_100_0", "name": "Трубы бесшовные из полимеров этилена", "tnved": "3917 21 100 0", "marking_status": "experiment"},
-                    {"id": "pilot_полимерные_трубы_3917_22", "name": "Трубы из полимеров пропилена (кроме 3917 22 900 1)", "tnved": "3917 22", "marking_status": "experiment"},
-                    {"id": "pilot_полимерные_трубы_3917_23", "name": "Трубы из полимеров винилхлорида", "tnved": "3917 23", "marking_status": "experiment"},
-                    {"id": "pilot_полимерные_трубы_3917_29_000_9", "name": "Трубы из прочих пластмасс", "tnved": "3917 29 000 9", "marking_status": "experiment"},
-                    {"id": "pilot_полимерные_трубы_3917_31_000_8", "name": "Трубы гибкие, давление ≥27,6 МПа", "tnved": "3917 31 000 8", "marking_status": "experiment"},
-                    {"id": "pilot_полимерные_трубы_3917_32_000", "name": "Трубы не армированные без фитингов", "tnved": "3917 32 000", "marking_status": "experiment"},
-                    {"id": "pilot_полимерные_трубы_3917_33_000_9", "name": "Трубы не армированные с фитингами", "tnved": "3917 33 000 9", "marking_status": "experiment"},
-                    {"id": "pilot_полимерные_трубы_3917_40_000_9", "name": "Фитинги из пластмасс", "tnved": "3917 40 000 9", "marking_status": "experiment"},
-                    {"id": "pilot_полимерные_трубы_3901_20_900_9", "name": "Композиции полиэтилена для труб", "tnved": "3901 20 900 9", "marking_status": "experiment"},
-                    {"id": "pilot_полимерные_трубы_3902_10_000_0", "name": "Композиции полипропилена для труб", "tnved": "3902 10 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_полимерные_трубы_3904_10_000_9", "name": "Композиции поливинилхлорида для труб", "tnved": "3904 10 000 9", "marking_status": "experiment"}
-                ]
-            },
-            {
-                "id": "pilot_средства_гигиены",
-                "name": "Средства гигиены",
-                "products": [
-                    {"id": "pilot_средства_гигиены_9603_21_000_0", "name": "Щетки зубные", "tnved": "9603 21 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_средства_гигиены_9603_29_300_0", "name": "Щетки для волос", "tnved": "9603 29 300 0", "marking_status": "experiment"},
-                    {"id": "pilot_средства_гигиены_9603_29_800_0", "name": "Помазки, щеточки для ногтей/ресниц", "tnved": "9603 29 800 0", "marking_status": "experiment"},
-                    {"id": "pilot_средства_гигиены_5601_21_100_0", "name": "Вата из хлопковых волокон", "tnved": "5601 21 100 0", "marking_status": "experiment"},
-                    {"id": "pilot_средства_гигиены_5601_21_900_0", "name": "Вата из хлопковых волокон прочая", "tnved": "5601 21 900 0", "marking_status": "experiment"},
-                    {"id": "pilot_средства_гигиены_8214_20_000_0", "name": "Наборы маникюрные/педикюрные", "tnved": "8214 20 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_средства_гигиены_4818_10_100_0", "name": "Бумага туалетная", "tnved": "4818 10 100 0", "marking_status": "experiment"},
-                    {"id": "pilot_средства_гигиены_4818_10_900_0", "name": "Бумага туалетная прочая", "tnved": "4818 10 900 0", "marking_status": "experiment"},
-                    {"id": "pilot_средства_гигиены_4818_20_100_0", "name": "Платки носовые, косметические салфетки", "tnved": "4818 20 100 0", "marking_status": "experiment"},
-                    {"id": "pilot_средства_гигиены_4818_20_910_0", "name": "Полотенца для рук", "tnved": "4818 20 910 0", "marking_status": "experiment"},
-                    {"id": "pilot_средства_гигиены_4818_20_990_0", "name": "Полотенца для рук прочие", "tnved": "4818 20 990 0", "marking_status": "experiment"},
-                    {"id": "pilot_средства_гигиены_9615_11_000_0", "name": "Расчески из резины/пластмасс", "tnved": "9615 11 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_средства_гигиены_9615_19_000_0", "name": "Расчески прочие", "tnved": "9615 19 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_средства_гигиены_9619_00", "name": "Прокладки, тампоны, подгузники", "tnved": "9619 00", "marking_status": "experiment"},
-                    {"id": "pilot_средства_гигиены_9019_10_900_9", "name": "Аппараты массажные", "tnved": "9019 10 900 9", "marking_status": "experiment"},
-                    {"id": "pilot_средства_гигиены_2513_10_000_0", "name": "Пемза", "tnved": "2513 10 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_средства_гигиены_8203_20_000_1", "name": "Пинцеты", "tnved": "8203 20 000 1", "marking_status": "experiment"},
-                    {"id": "pilot_средства_гигиены_3306_20_000_0", "name": "Нити зубные (зубной шелк)", "tnved": "3306 20 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_средства_гигиены_3924_90_000_1", "name": "Губки и мочалки пластиковые", "tnved": "3924 90 000 1", "marking_status": "experiment"},
-                    {"id": "pilot_средства_гигиены_7323_10_000_0", "name": "Губки и мочалки металлические", "tnved": "7323 10 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_средства_гигиены_7418_10_900_0", "name": "Губки медные", "tnved": "7418 10 900 0", "marking_status": "experiment"},
-                    {"id": "pilot_средства_гигиены_7615_10_800_1", "name": "Губки алюминиевые", "tnved": "7615 10 800 1", "marking_status": "experiment"}
-                ]
-            },
-            {
-                "id": "pilot_удобрения",
-                "name": "Удобрения",
-                "products": [
-                    {"id": "pilot_удобрения_3105", "name": "Удобрения минеральные (N, P, K)", "tnved": "3105", "marking_status": "experiment"},
-                    {"id": "pilot_удобрения_2834_21_000_0", "name": "Нитраты калия", "tnved": "2834 21 000 0", "marking_status": "experiment"},
-                    {"id": "pilot_удобрения_2834_29_800_0", "name": "Нитраты прочие", "tnved": "2834 29 800 0", "marking_status": "experiment"},
-                    {"id": "pilot_удобрения_2835_24_000_0", "name": "Фосфаты калия", "tnved": "2835 24 000 0", "marking_status": "experiment"}
-                ]
-            },
-            {
-                "id": "pilot_мясные_изделия",
-                "name": "Мясные изделия",
-                "products": [
-                    {"id": "pilot_мясные_изделия_1601_00", "name": "Колбасы и аналогичные продукты", "tnved": "1601 00", "marking_status": "experiment"},
-                    {"id": "pilot_мясные_изделия_1602", "name": "Готовые/консервированные продукты из мяса", "tnved": "1602", "marking_status": "experiment"},
-                    {"id": "pilot_мясные_изделия_0209_00", "name": "Свиной жир и жир птицы", "tnved": "0209 00", "marking_status": "experiment"},
-                    {"id": "pilot_мясные_изделия_0210_11", "name": "Свиные окорока, лопатки необваленные", "tnved": "0210 11", "marking_status": "experiment"},
-                    {"id": "pilot_мясные_изделия_0210_12", "name": "Свиные грудинки", "tnved": "0210 12", "marking_status": "experiment"},
-                    {"id": "pilot_мясные_изделия_0210_19", "name": "Прочие части туш свиней", "tnved": "0210 19", "marking_status": "experiment"},
-                    {"id": "pilot_мясные_изделия_0210_20", "name": "Мясо КРС соленое/сушеное/копченое", "tnved": "0210 20", "marking_status": "experiment"},
-                    {"id": "pilot_мясные_изделия_0210_99_100_0", "name": "Мясо лошадей соленое/сушеное", "tnved": "0210 99 100 0", "marking_status": "experiment"},
-                    {"id": "pilot_мясные_изделия_0210_99_210_0", "name": "Баранина/козлятина необваленная", "tnved": "0210 99 210 0", "marking_status": "experiment"},
-                    {"id": "pilot_мясные_изделия_0210_99_290_0", "name": "Баранина/козлятина обваленная", "tnved": "0210 99 290 0", "marking_status": "experiment"},
-                    {"id": "pilot_мясные_изделия_0210_99_310_0", "name": "Мясо северных оленей", "tnved": "0210 99 310 0", "marking_status": "experiment"},
-                    {"id": "pilot_мясные_изделия_0210_99_390_0", "name": "Прочее мясо", "tnved": "0210 99 390 0", "marking_status": "experiment"},
-                    {"id": "pilot_мясные_изделия_0210_99_410_0", "name": "Печень", "tnved": "0210 99 410 0", "marking_status": "experiment"},
-                    {"id": "pilot_мясные_изделия_0210_99_490_0", "name": "Субпродукты свиные прочие", "tnved": "0210 99 490 0", "marking_status": "experiment"},
-                    {"id": "pilot_мясные_изделия_0210_99_510_0", "name": "Диафрагма КРС", "tnved": "0210 99 510 0", "marking_status": "experiment"},
-                    {"id": "pilot_мясные_изделия_0210_99_590_0", "name": "Субпродукты КРС прочие", "tnved": "0210 99 590 0", "marking_status": "experiment"},
-                    {"id": "pilot_мясные_изделия_0210_99_710_0", "name": "Жирная печень гусей/уток соленая", "tnved": "0210 99 710 0", "marking_status": "experiment"},
-                    {"id": "pilot_мясные_изделия_0210_99_790_0", "name": "Жирная печень гусей/уток прочая", "tnved": "0210 99 790 0", "marking_status": "experiment"},
-                    {"id": "pilot_мясные_изделия_0210_99_850_0", "name": "Жирная печень прочая", "tnved": "0210 99 850 0", "marking_status": "experiment"},
-                    {"id": "pilot_мясные_изделия_1501_10_900_0", "name": "Лярд прочий", "tnved": "1501 10 900 0", "marking_status": "experiment"},
-                    {"id": "pilot_мясные_изделия_1501_20_900_0", "name": "Жир свиной прочий", "tnved": "1501 20 900 0", "marking_status": "experiment"},
-                    {"id": "pilot_мясные_изделия_1501_90_000_0", "name": "Жир свиной и жир птицы прочий", "tnved": "1501 90 000 0", "marking_status": "experiment"}
-                ]
-            }
-        ]
-    }
-]
-
-# Build lookup dictionary for quick access (новая 3-уровневая структура)
-PRODUCTS_LOOKUP = {}
-for category in CATEGORIES_DATA:
-    for sub in category.get("subcategories", []):
-        for product in sub.get("products", []):
-            PRODUCTS_LOOKUP[product["id"]] = {
-                "category_id": category["id"],
-                "category_name": category["name"],
-                "subcategory_id": sub["id"],
-                "subcategory_name": sub["name"],
-                "name": product["name"],
-                "tnved": product.get("tnved", ""),
-                "marking_status": product.get("marking_status", "not_required"),
-                "mandatory_since": product.get("mandatory_since"),
-                "timeline": product.get("timeline")
-            }
-
-# Build TNVED lookup from tnved.json (единая база) + CATEGORIES_DATA (детали)
-def _build_tnved_lookup():
-    import json as _json
-    import os as _os
-    
-    lookup = {}
-    
-    # 1. Сначала загружаем из tnved.json (все коды с маркировкой)
-    json_path = _os.path.join(_os.path.dirname(__file__), 'data', 'tnved.json')
-    try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            tnved_data = _json.load(f)
-        
-        for item in tnved_data:
-            if item.get('requires_marking') or item.get('is_experimental'):
-                code = item.get('code', '')
-                if code:
-                    entry = {
-                        "category_id": "tnved",
-                        "category_name": item.get('marking_group', 'ТН ВЭД'),
-                        "subcategory_id": "tnved",
-                        "subcategory_name": item.get('marking_subcategory', ''),
-                        "name": item.get('name', ''),
-                        "tnved": item.get('code_formatted', code),
-                        "marking_status": item.get('marking_status', 'not_required'),
-                        "mandatory_since": None,
-                        "timeline": None
-                    }
-                    lookup[code] = entry
-                    # Также по нормализованному коду
-                    normalized = code.replace(' ', '')
-                    if normalized != code:
-                        lookup[normalized] = entry
-    except Exception as e:
-        print(f"Warning: Could not load tnved.json: {e}")
-    
-    # 2. Дополняем/перезаписываем из CATEGORIES_DATA (более детальная инфо)
-    for category in CATEGORIES_DATA:
-        for sub in category.get("subcategories", []):
-            for product in sub.get("products", []):
-                tnved = product.get("tnved", "")
-                if tnved and tnved != '-' and ';' not in tnved:
-                    entry = {
-                        "category_id": category["id"],
-                        "category_name": category["name"],
-                        "subcategory_id": sub["id"],
-                        "subcategory_name": sub["name"],
-                        "name": product["name"],
-                        "tnved": tnved,
-                        "marking_status": product.get("marking_status", "not_required"),
-                        "mandatory_since": product.get("mandatory_since"),
-                        "timeline": product.get("timeline")
-                    }
-                    lookup[tnved] = entry
-                    # Также по нормализованному коду
-                    normalized = tnved.replace(" ", "")
-                    if normalized != tnved:
-                        lookup[normalized] = entry
-    
-    return lookup
-
-TNVED_LOOKUP = _build_tnved_lookup()
+# ======================== СПРАВОЧНИК КАТЕГОРИЙ ========================
+# CATEGORIES_DATA и индексы по нему (PRODUCTS_LOOKUP, TNVED_LOOKUP) живут в catalog.py
 
 MARKING_STEPS = [
     "Зарегистрироваться в системе Честный ЗНАК (честныйзнак.рф)",
@@ -2596,49 +1096,57 @@ def format_contact_email(data: ContactRequest, callback_id: int = None) -> str:
 
 # ======================== API ENDPOINTS ========================
 
+@app.on_event("startup")
+async def load_catalog_on_startup():
+    """Загрузить справочники до первого запроса и следить за их обновлением"""
+    get_catalog()
+    start_catalog_reloader()
+
+@app.on_event("shutdown")
+async def stop_catalog_on_shutdown():
+    stop_catalog_reloader()
+    shutdown_db_executor()
+    close_all_pools()
+
 @app.get("/api/health")
 async def health_check():
     """Health check endpoint"""
-    return {"status": "ok", "service": "promarkirui", "products_count": len(PRODUCTS_LOOKUP)}
+    catalog = get_catalog()
+    return {
+        "status": "ok",
+        "service": "promarkirui",
+        "products_count": len(catalog.products_lookup),
+        "catalog_version": catalog.version
+    }
 
 @app.get("/api/check/categories")
-async def get_categories():
+async def get_categories(request: Request):
     """Get all product categories and subcategories"""
-    return {"groups": CATEGORIES_DATA}
+    catalog = get_catalog()
+    return await precomputed_response(request, "categories", catalog.version, lambda: {"groups": catalog.categories})
 
 @app.get("/api/check/init")
-async def get_check_init():
+async def get_check_init(request: Request):
     """Unified endpoint for initial page load - returns categories, stats, timeline in one request"""
-    timeline_stats = get_timeline_stats_with_upcoming()
-
-    return {
-        "groups": CATEGORIES_DATA,
-        "tnved_stats": get_tnved_stats_cached(),
-        "timeline_stats": timeline_stats
-    }
+    catalog = get_catalog()
+    # Ближайшие дедлайны зависят от текущей даты, поэтому ответ пересобирается раз в день
+    key = (catalog.version, date.today())
+
+    return await precomputed_response(request, "check_init", key, lambda: {
+        "groups": catalog.categories,
+        "tnved_stats": catalog.tnved_stats,
+        "timeline_stats": get_timeline_stats_with_upcoming(catalog)
+    })
 
 @app.post("/api/check/assess", response_model=CheckProductResponse)
 async def assess_product(request: CheckProductRequest):
     """Assess if product requires marking"""
 
-    # Look up product by product ID first
-    product = None
-    if request.product:
-        product = PRODUCTS_LOOKUP.get(request.product)
-
-        # If not found by ID, try to extract TNVED code from product ID (e.g. "tnved_2203" -> "2203")
-        if not product and request.product.startswith("tnved_"):
-            tnved_code = request.product.replace("tnved_", "")
-            product = TNVED_LOOKUP.get(tnved_code)
-
-            # Try with spaces if not found (e.g. "220300" -> "2203 00")
-            if not product and len(tnved_code) >= 4:
-                # Try common patterns: 220300 -> 2203 00, 22030031 -> 2203 00 31
-                for i in range(4, len(tnved_code)):
-                    spaced = tnved_code[:4] + " " + tnved_code[4:i] + (" " + tnved_code[i:] if i < len(tnved_code) else "")
-                    product = TNVED_LOOKUP.get(spaced.strip())
-                    if product:
-                        break
+    catalog = get_catalog()
+
+    # Look up product by product ID, "tnved_<код>" or TNVED code - the same lookup as the batch
+    # endpoint: longest known code prefix of at least 4 digits ("2203 00 31" finds "2203")
+    product, _, _ = catalog.resolve_product(request.product)
 
     if product:
         marking_status = product.get("marking_status", "not_required")
@@ -2698,9 +1206,10 @@ async def get_countries():
     return {"countries": COUNTRIES}
 
 @app.get("/api/import/categories")
-async def get_import_categories():
+async def get_import_categories(request: Request):
     """Get categories for import (reuse check categories)"""
-    return {"groups": CATEGORIES_DATA}
+    catalog = get_catalog()
+    return await precomputed_response(request, "categories", catalog.version, lambda: {"groups": catalog.categories})
 
 @app.get("/api/import/schemes")
 async def get_import_schemes(country: str, category: str):
@@ -2738,7 +1247,7 @@ async def recommend_equipment(request: EquipmentRequest):
     )
 
 @app.post("/api/contact/send")
-async def send_contact(request: ContactRequest, background_tasks: BackgroundTasks):
+def send_contact(request: ContactRequest, background_tasks: BackgroundTasks):
     """Send contact form to email and save to database"""
 
     # Определяем источник
@@ -2856,7 +1365,7 @@ def format_training_enrollment_email(request: TrainingEnrollRequest, enrollment_
 
 
 @app.post("/api/training/enroll")
-async def training_enroll(request: TrainingEnrollRequest, background_tasks: BackgroundTasks):
+def training_enroll(request: TrainingEnrollRequest, background_tasks: BackgroundTasks):
     """Отправка заявки на обучение"""
 
     if not request.name or not request.phone:
@@ -3109,7 +1618,7 @@ async def get_services_list():
     }
 
 @app.post("/api/quote/create")
-async def create_quote(request: QuoteRequest, background_tasks: BackgroundTasks):
+def create_quote(request: QuoteRequest, background_tasks: BackgroundTasks):
     """
     Создать коммерческое предложение.
     Рассчитывает итоговую сумму, сохраняет в БД и отправляет КП на email.
@@ -3511,7 +2020,7 @@ class ContractGenerateRequest(BaseModel):
 
 
 @app.post("/api/contract/generate")
-async def generate_contract(request: ContractGenerateRequest):
+def generate_contract(request: ContractGenerateRequest):
     """
     Генерирует PDF договора.
     Возвращает PDF файл для скачивания.
@@ -3662,7 +2171,7 @@ class QuotePDFRequest(BaseModel):
 
 
 @app.post("/api/quote/pdf")
-async def generate_quote_pdf_endpoint(request: QuotePDFRequest):
+def generate_quote_pdf_endpoint(request: QuotePDFRequest):
     """
     Генерирует PDF коммерческого предложения.
     Возвращает PDF файл для скачивания.
@@ -3736,7 +2245,7 @@ class ActGenerateRequest(BaseModel):
 
 
 @app.post("/api/act/generate")
-async def generate_act(request: ActGenerateRequest):
+def generate_act(request: ActGenerateRequest):
     """
     Генерирует PDF акта выполненных работ.
     Возвращает PDF файл для скачивания.
@@ -3801,20 +2310,20 @@ async def generate_act(request: ActGenerateRequest):
 # ======================== АВТОРИЗАЦИЯ ========================
 
 @app.post("/api/auth/register")
-async def api_register(data: UserRegister):
+def api_register(data: UserRegister):
     """Регистрация нового пользователя"""
     return register_user(data.email, data.password, name=data.name, phone=data.phone, inn=data.inn,
                          company_name=data.company_name, city=data.city, region=data.region, source=data.source)
 
 
 @app.post("/api/auth/login")
-async def api_login(data: UserLogin):
+def api_login(data: UserLogin):
     """Вход в систему"""
     return login_user(data.email, data.password)
 
 
 @app.get("/api/auth/me")
-async def api_get_me(user: Dict = Depends(require_auth)):
+def api_get_me(user: Dict = Depends(require_auth)):
     """Получить данные текущего пользователя"""
     # Получаем полные данные пользователя из БД
     full_user = UserDB.get_by_id(user["id"])
@@ -3835,14 +2344,14 @@ async def api_get_me(user: Dict = Depends(require_auth)):
 
 
 @app.get("/api/auth/verify-email")
-async def api_verify_email(token: str):
+def api_verify_email(token: str):
     """Подтверждение email по токену из письма"""
     from auth import verify_email
     return verify_email(token)
 
 
 @app.post("/api/auth/resend-verification")
-async def api_resend_verification(user: Dict = Depends(require_auth)):
+def api_resend_verification(user: Dict = Depends(require_auth)):
     """Повторная отправка письма подтверждения"""
     from auth import resend_verification_email
     return resend_verification_email(user["id"], user["email"])
@@ -3858,7 +2367,7 @@ class ResetPasswordRequest(BaseModel):
 
 
 @app.post("/api/auth/forgot-password")
-async def api_forgot_password(data: ForgotPasswordRequest):
+def api_forgot_password(data: ForgotPasswordRequest):
     """Запрос на сброс пароля - отправляет письмо с ссылкой"""
     from database import UserDB, PasswordResetDB
     from email_service import generate_verification_token, send_password_reset_email
@@ -3898,7 +2407,7 @@ async def api_forgot_password(data: ForgotPasswordRequest):
 
 
 @app.get("/api/auth/verify-reset-token")
-async def api_verify_reset_token(token: str):
+def api_verify_reset_token(token: str):
     """Проверка токена сброса пароля (для валидации перед показом формы)"""
     from database import PasswordResetDB
 
@@ -3914,7 +2423,7 @@ async def api_verify_reset_token(token: str):
 
 
 @app.post("/api/auth/reset-password")
-async def api_reset_password(data: ResetPasswordRequest):
+def api_reset_password(data: ResetPasswordRequest):
     """Установка нового пароля по токену"""
     from database import PasswordResetDB
 
@@ -3940,21 +2449,21 @@ async def api_reset_password(data: ResetPasswordRequest):
 # ======================== ЛИЧНЫЙ КАБИНЕТ ========================
 
 @app.get("/api/cabinet/quotes")
-async def api_get_user_quotes(user: Dict = Depends(require_auth)):
+def api_get_user_quotes(user: Dict = Depends(require_auth)):
     """Получить все КП пользователя"""
     quotes = QuoteDB.get_by_user(user["id"])
     return {"quotes": quotes}
 
 
 @app.get("/api/cabinet/contracts")
-async def api_get_user_contracts(user: Dict = Depends(require_auth)):
+def api_get_user_contracts(user: Dict = Depends(require_auth)):
     """Получить все договоры пользователя"""
     contracts = ContractDB.get_by_user(user["id"])
     return {"contracts": contracts}
 
 
 @app.get("/api/cabinet/companies")
-async def api_get_user_companies(user: Dict = Depends(require_auth)):
+def api_get_user_companies(user: Dict = Depends(require_auth)):
     """Получить все компании пользователя"""
     companies = CompanyDB.get_by_user(user["id"])
     return {"companies": companies}
@@ -4066,7 +2575,7 @@ def format_callback_email(callback_id: int, data: CallbackRequest, contact_name:
 
 
 @app.post("/api/callback/create")
-async def api_create_callback(
+def api_create_callback(
     data: CallbackRequest,
     background_tasks: BackgroundTasks,
     user: Optional[Dict] = Depends(get_current_user)
@@ -4144,7 +2653,7 @@ class RepresentativeRequestData(BaseModel):
     comment: Optional[str] = None
 
 @app.post("/api/partner-request")
-async def api_create_partner_request(
+def api_create_partner_request(
     data: PartnerRequestData,
     background_tasks: BackgroundTasks
 ):
@@ -4269,7 +2778,7 @@ async def api_create_partner_request(
 
 
 @app.post("/api/representative-request")
-async def api_create_representative_request(
+def api_create_representative_request(
     data: RepresentativeRequestData,
     background_tasks: BackgroundTasks
 ):
@@ -4354,14 +2863,14 @@ async def api_create_representative_request(
 # ======================== АДМИНКА ========================
 
 @app.get("/api/admin/callbacks")
-async def api_admin_get_callbacks(user: Dict = Depends(require_admin)):
+def api_admin_get_callbacks(user: Dict = Depends(require_admin)):
     """Получить все заявки на звонок (админка)"""
     callbacks = CallbackDB.get_all()
     return callbacks
 
 
 @app.put("/api/admin/callbacks/{callback_id}")
-async def api_admin_update_callback(
+def api_admin_update_callback(
     callback_id: int,
     data: Dict,
     user: Dict = Depends(require_admin)
@@ -4374,7 +2883,7 @@ async def api_admin_update_callback(
 
 
 @app.delete("/api/admin/callbacks/{callback_id}")
-async def api_admin_delete_callback(
+def api_admin_delete_callback(
     callback_id: int,
     user: Dict = Depends(require_admin)
 ):
@@ -4389,7 +2898,7 @@ async def api_admin_delete_callback(
 
 
 @app.delete("/api/employee/callbacks/{callback_id}")
-async def api_employee_delete_callback(
+def api_employee_delete_callback(
     callback_id: int,
     user: Dict = Depends(require_employee)
 ):
@@ -4404,7 +2913,7 @@ async def api_employee_delete_callback(
 
 
 @app.get("/api/admin/users")
-async def api_admin_get_users(user: Dict = Depends(require_admin)):
+def api_admin_get_users(user: Dict = Depends(require_admin)):
     """Получить всех пользователей (админка)"""
     with get_db() as conn:
         cursor = conn.cursor()
@@ -4418,7 +2927,7 @@ async def api_admin_get_users(user: Dict = Depends(require_admin)):
 
 
 @app.post("/api/admin/users")
-async def api_admin_create_user(
+def api_admin_create_user(
     data: Dict,
     user: Dict = Depends(require_employee)
 ):
@@ -4442,7 +2951,7 @@ async def api_admin_create_user(
 
 
 @app.post("/api/admin/users/{user_id}/send-invitation")
-async def api_admin_send_invitation(
+def api_admin_send_invitation(
     user_id: int,
     data: Dict,
     user: Dict = Depends(require_employee)
@@ -4487,7 +2996,7 @@ PROTECTED_ADMIN_EMAIL = 'damirslk@mail.ru'
 
 
 @app.put("/api/admin/users/{user_id}")
-async def api_admin_update_user(
+def api_admin_update_user(
     user_id: int,
     data: Dict,
     current_user: Dict = Depends(require_employee)
@@ -4537,7 +3046,7 @@ async def api_admin_update_user(
 
 
 @app.delete("/api/admin/users/{user_id}")
-async def api_admin_delete_user(
+def api_admin_delete_user(
     user_id: int,
     current_user: Dict = Depends(require_employee)
 ):
@@ -4558,7 +3067,7 @@ async def api_admin_delete_user(
 
 
 @app.get("/api/admin/stats")
-async def api_admin_get_stats(user: Dict = Depends(require_admin)):
+def api_admin_get_stats(user: Dict = Depends(require_admin)):
     """Получить статистику (админка)"""
     with get_db() as conn:
         cursor = conn.cursor()
@@ -4643,7 +3152,7 @@ class InteractionCreate(BaseModel):
 
 # --- Статистика для дашборда ---
 @app.get("/api/employee/stats")
-async def api_employee_stats(user: Dict = Depends(require_employee)):
+def api_employee_stats(user: Dict = Depends(require_employee)):
     """Статистика для Employee Dashboard"""
     with get_db() as conn:
         cursor = conn.cursor()
@@ -4683,295 +3192,18 @@ async def api_employee_stats(user: Dict = Depends(require_employee)):
     }
 
 
-# --- Расширенная статистика для Superadmin ---
-@app.get("/api/superadmin/stats")
-async def api_superadmin_stats(
-    period: str = "week",
-    user: Dict = Depends(require_employee)
-):
-    """Расширенная статистика для Superadmin Dashboard"""
-    from datetime import timedelta
-
-    # Определяем текущий и предыдущий периоды для сравнения
-    now = datetime.now()
-    if period == "day":
-        start_date = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        prev_start = start_date - timedelta(days=1)
-        prev_end = start_date
-    elif period == "week":
-        start_date = now - timedelta(days=7)
-        prev_start = now - timedelta(days=14)
-        prev_end = start_date
-    elif period == "month":
-        start_date = now - timedelta(days=30)
-        prev_start = now - timedelta(days=60)
-        prev_end = start_date
-    else:
-        start_date = now - timedelta(days=7)
-        prev_start = now - timedelta(days=14)
-        prev_end = start_date
-
-    start_str = start_date.strftime('%Y-%m-%d %H:%M:%S')
-    prev_start_str = prev_start.strftime('%Y-%m-%d %H:%M:%S')
-    prev_end_str = prev_end.strftime('%Y-%m-%d %H:%M:%S')
-
-    with get_db() as conn:
-        cursor = conn.cursor()
-
-        # === ЗАЯВКИ ===
-        cursor.execute("SELECT COUNT(*) as cnt FROM callbacks WHERE status = 'new'")
-        new_callbacks = cursor.fetchone()['cnt']
-
-        cursor.execute("SELECT COUNT(*) as cnt FROM callbacks WHERE status = 'processing'")
-        processing_callbacks = cursor.fetchone()['cnt']
-
-        cursor.execute("SELECT COUNT(*) as cnt FROM callbacks WHERE created_at >= ?", (start_str,))
-        period_callbacks = cursor.fetchone()['cnt']
-
-        # Заявки за предыдущий период
-        cursor.execute("SELECT COUNT(*) as cnt FROM callbacks WHERE created_at >= ? AND created_at < ?",
-                      (prev_start_str, prev_end_str))
-        prev_period_callbacks = cursor.fetchone()['cnt']
-
-        cursor.execute("SELECT COUNT(*) as cnt FROM callbacks")
-        total_callbacks = cursor.fetchone()['cnt']
-
-        # === КЛИЕНТЫ ===
-        cursor.execute('''
-            SELECT
-                COUNT(*) as total,
-                SUM(CASE WHEN status = 'lead' THEN 1 ELSE 0 END) as leads,
-                SUM(CASE WHEN status = 'active' THEN 1 ELSE 0 END) as active,
-                SUM(CASE WHEN status = 'regular' THEN 1 ELSE 0 END) as regular,
-                SUM(CASE WHEN status = 'inactive' THEN 1 ELSE 0 END) as inactive
-            FROM clients
-        ''')
-        client_stats = dict(cursor.fetchone())
-
-        cursor.execute("SELECT COUNT(*) as cnt FROM clients WHERE created_at >= ?", (start_str,))
-        period_clients = cursor.fetchone()['cnt']
-
-        # Клиенты за предыдущий период
-        cursor.execute("SELECT COUNT(*) as cnt FROM clients WHERE created_at >= ? AND created_at < ?",
-                      (prev_start_str, prev_end_str))
-        prev_period_clients = cursor.fetchone()['cnt']
-
-        # === КП ===
-        cursor.execute('''
-            SELECT
-                COUNT(*) as total,
-                SUM(CASE WHEN status = 'created' THEN 1 ELSE 0 END) as created,
-                SUM(CASE WHEN status = 'sent' THEN 1 ELSE 0 END) as sent,
-                SUM(CASE WHEN status = 'accepted' THEN 1 ELSE 0 END) as accepted,
-                SUM(CASE WHEN status = 'rejected' THEN 1 ELSE 0 END) as rejected,
-                COALESCE(SUM(total_amount), 0) as total_amount
-            FROM quotes
-        ''')
-        quote_stats = dict(cursor.fetchone())
-
-        cursor.execute('''
-            SELECT COUNT(*) as cnt, COALESCE(SUM(total_amount), 0) as amount
-            FROM quotes WHERE created_at >= ?
-        ''', (start_str,))
-        row = cursor.fetchone()
-        period_quotes = row['cnt']
-        period_quotes_amount = row['amount']
-
-        # КП за предыдущий период
-        cursor.execute('''
-            SELECT COUNT(*) as cnt, COALESCE(SUM(total_amount), 0) as amount
-            FROM quotes WHERE created_at >= ? AND created_at < ?
-        ''', (prev_start_str, prev_end_str))
-        row = cursor.fetchone()
-        prev_period_quotes = row['cnt']
-        prev_period_quotes_amount = row['amount']
-
-        # === ДОГОВОРЫ ===
-        cursor.execute('''
-            SELECT
-                COUNT(*) as total,
-                SUM(CASE WHEN status = 'draft' THEN 1 ELSE 0 END) as draft,
-                SUM(CASE WHEN status = 'signed' THEN 1 ELSE 0 END) as signed,
-                SUM(CASE WHEN status = 'active' THEN 1 ELSE 0 END) as active,
-                SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) as completed,
-                COALESCE(SUM(total_amount), 0) as total_amount
-            FROM contracts
-        ''')
-        contract_stats = dict(cursor.fetchone())
-
-        cursor.execute('''
-            SELECT COUNT(*) as cnt, COALESCE(SUM(total_amount), 0) as amount
-            FROM contracts WHERE created_at >= ?
-        ''', (start_str,))
-        row = cursor.fetchone()
-        period_contracts = row['cnt']
-        period_contracts_amount = row['amount']
-
-        # Договоры за предыдущий период
-        cursor.execute('''
-            SELECT COUNT(*) as cnt, COALESCE(SUM(total_amount), 0) as amount
-            FROM contracts WHERE created_at >= ? AND created_at < ?
-        ''', (prev_start_str, prev_end_str))
-        row = cursor.fetchone()
-        prev_period_contracts = row['cnt']
-        prev_period_contracts_amount = row['amount']
-
-        # === СРЕДНИЙ ЧЕК ===
-        avg_quote_check = quote_stats['total_amount'] / quote_stats['total'] if quote_stats['total'] > 0 else 0
-        avg_contract_check = contract_stats['total_amount'] / contract_stats['total'] if contract_stats['total'] > 0 else 0
-
-        # Средний чек за период
-        period_avg_quote = period_quotes_amount / period_quotes if period_quotes > 0 else 0
-        period_avg_contract = period_contracts_amount / period_contracts if period_contracts > 0 else 0
-
-        # Средний чек за предыдущий период
-        prev_avg_quote = prev_period_quotes_amount / prev_period_quotes if prev_period_quotes > 0 else 0
-        prev_avg_contract = prev_period_contracts_amount / prev_period_contracts if prev_period_contracts > 0 else 0
-
-        # === ВРЕМЯ КОНВЕРСИИ (от клиента до договора) ===
-        # Примечание: связь callback_id -> client не хранится, поэтому считаем только client -> contract
-        avg_callback_to_client_hours = 0  # Нет данных о связи заявка-клиент
-
-        cursor.execute('''
-            SELECT AVG(
-                CAST((julianday(ct.created_at) - julianday(c.created_at)) AS INTEGER)
-            ) as avg_days
-            FROM contracts ct
-            INNER JOIN clients c ON ct.client_id = c.id
-            WHERE ct.created_at >= ?
-        ''', (start_str,))
-        row = cursor.fetchone()
-        avg_client_to_contract_days = row['avg_days'] or 0
-
-        # === ВОРОНКА ПРОДАЖ ===
-        funnel = {
-            "callbacks": total_callbacks,
-            "clients": client_stats['total'] or 0,
-            "quotes": quote_stats['total'] or 0,
-            "contracts": contract_stats['total'] or 0
-        }
-
-        # === СТАТИСТИКА ПО МЕНЕДЖЕРАМ ===
-        cursor.execute('''
-            SELECT
-                u.id,
-                u.email,
-                COUNT(DISTINCT c.id) as clients_count,
-                COUNT(DISTINCT q.id) as quotes_count,
-                COUNT(DISTINCT ct.id) as contracts_count,
-                COALESCE(SUM(ct.total_amount), 0) as contracts_amount
-            FROM users u
-            LEFT JOIN clients c ON c.assigned_manager_id = u.id
-            LEFT JOIN quotes q ON q.client_id IN (SELECT id FROM clients WHERE assigned_manager_id = u.id)
-            LEFT JOIN contracts ct ON ct.client_id IN (SELECT id FROM clients WHERE assigned_manager_id = u.id)
-            WHERE u.role IN ('employee', 'superadmin')
-            GROUP BY u.id, u.email
-            ORDER BY contracts_count DESC
-        ''')
-        managers_stats = [dict(row) for row in cursor.fetchall()]
-
-        # === ИСТОЧНИКИ ЗАЯВОК ===
-        cursor.execute('''
-            SELECT
-                COALESCE(source, 'unknown') as source,
-                COUNT(*) as count
-            FROM callbacks
-            GROUP BY source
-            ORDER BY count DESC
-        ''')
-        sources = [dict(row) for row in cursor.fetchall()]
-
-        # === ПОСЛЕДНИЕ АКТИВНОСТИ ===
-        cursor.execute('''
-            SELECT cb.id, cb.contact_name, cb.company_name, cb.status, cb.source, cb.created_at
-            FROM callbacks cb
-            ORDER BY cb.created_at DESC
-            LIMIT 5
-        ''')
-        recent_callbacks = [dict(row) for row in cursor.fetchall()]
-
-        cursor.execute('''
-            SELECT q.id, q.quote_number, q.total_amount, q.status, q.created_at,
-                   c.contact_name as client_name
-            FROM quotes q
-            LEFT JOIN clients c ON q.client_id = c.id
-            ORDER BY q.created_at DESC
-            LIMIT 5
-        ''')
-        recent_quotes = [dict(row) for row in cursor.fetchall()]
-
-        cursor.execute('''
-            SELECT ct.id, ct.contract_number, ct.total_amount, ct.status, ct.created_at,
-                   c.contact_name as client_name
-            FROM contracts ct
-            LEFT JOIN clients c ON ct.client_id = c.id
-            ORDER BY ct.created_at DESC
-            LIMIT 5
-        ''')
-        recent_contracts = [dict(row) for row in cursor.fetchall()]
-
-    # === ПРОСРОЧЕННЫЕ ЗАЯВКИ ===
-    overdue_count = CallbackSLADB.get_overdue_count()
-
-    return {
-        "period": period,
-        "callbacks": {
-            "new": new_callbacks,
-            "processing": processing_callbacks,
-            "period": period_callbacks,
-            "prev_period": prev_period_callbacks,
-            "total": total_callbacks,
-            "overdue": overdue_count
-        },
-        "clients": {
-            **client_stats,
-            "period": period_clients,
-            "prev_period": prev_period_clients
-        },
-        "quotes": {
-            **quote_stats,
-            "period": period_quotes,
-            "period_amount": period_quotes_amount,
-            "prev_period": prev_period_quotes,
-            "prev_period_amount": prev_period_quotes_amount,
-            "avg_check": avg_quote_check,
-            "period_avg_check": period_avg_quote,
-            "prev_avg_check": prev_avg_quote
-        },
-        "contracts": {
-            **contract_stats,
-            "period": period_contracts,
-            "period_amount": period_contracts_amount,
-            "prev_period": prev_period_contracts,
-            "prev_period_amount": prev_period_contracts_amount,
-            "avg_check": avg_contract_check,
-            "period_avg_check": period_avg_contract,
-            "prev_avg_check": prev_avg_contract
-        },
-        "funnel": funnel,
-        "conversion": {
-            "callback_to_client_hours": round(avg_callback_to_client_hours, 1),
-            "client_to_contract_days": round(avg_client_to_contract_days, 1)
-        },
-        "managers": managers_stats,
-        "sources": sources,
-        "recent": {
-            "callbacks": recent_callbacks,
-            "quotes": recent_quotes,
-            "contracts": recent_contracts
-        }
-    }
+# --- Расширенная статистика для Superadmin: routes/stats.py (daily_metrics) ---
 
 
 # --- Настройки уведомлений (Superadmin) ---
 @app.get("/api/superadmin/notifications")
-async def api_get_notification_settings(user: Dict = Depends(require_employee)):
+def api_get_notification_settings(user: Dict = Depends(require_employee)):
     """Получить настройки уведомлений"""
     return {"notifications": NotificationSettingsDB.get_all()}
 
 
 @app.post("/api/superadmin/notifications")
-async def api_add_notification_setting(
+def api_add_notification_setting(
     data: Dict,
     user: Dict = Depends(require_employee)
 ):
@@ -4989,7 +3221,7 @@ async def api_add_notification_setting(
 
 
 @app.put("/api/superadmin/notifications/{notification_id}")
-async def api_update_notification_setting(
+def api_update_notification_setting(
     notification_id: int,
     data: Dict,
     user: Dict = Depends(require_employee)
@@ -5000,7 +3232,7 @@ async def api_update_notification_setting(
 
 
 @app.delete("/api/superadmin/notifications/{notification_id}")
-async def api_delete_notification_setting(
+def api_delete_notification_setting(
     notification_id: int,
     user: Dict = Depends(require_employee)
 ):
@@ -5011,13 +3243,13 @@ async def api_delete_notification_setting(
 
 # --- Настройки CRM (SLA и др.) ---
 @app.get("/api/superadmin/settings")
-async def api_get_crm_settings(user: Dict = Depends(require_employee)):
+def api_get_crm_settings(user: Dict = Depends(require_employee)):
     """Получить все настройки CRM"""
     return {"settings": CRMSettingsDB.get_all()}
 
 
 @app.put("/api/superadmin/settings/{key}")
-async def api_update_crm_setting(
+def api_update_crm_setting(
     key: str,
     data: Dict,
     user: Dict = Depends(require_employee)
@@ -5033,7 +3265,7 @@ async def api_update_crm_setting(
 
 # --- Просроченные заявки ---
 @app.get("/api/employee/callbacks/overdue")
-async def api_get_overdue_callbacks(user: Dict = Depends(require_employee)):
+def api_get_overdue_callbacks(user: Dict = Depends(require_employee)):
     """Получить просроченные заявки"""
     # Superadmin видит все, employee только свои
     if user['role'] == 'superadmin':
@@ -5046,7 +3278,7 @@ async def api_get_overdue_callbacks(user: Dict = Depends(require_employee)):
 
 # --- Профиль сотрудника ---
 @app.get("/api/employee/profile")
-async def api_get_employee_profile(user: Dict = Depends(require_employee)):
+def api_get_employee_profile(user: Dict = Depends(require_employee)):
     """Получить профиль текущего сотрудника"""
     with get_db() as conn:
         cursor = conn.cursor()
@@ -5061,7 +3293,7 @@ async def api_get_employee_profile(user: Dict = Depends(require_employee)):
 
 
 @app.put("/api/employee/profile")
-async def api_update_employee_profile(data: Dict, user: Dict = Depends(require_employee)):
+def api_update_employee_profile(data: Dict, user: Dict = Depends(require_employee)):
     """Обновить профиль сотрудника (имя, телефон)"""
     name = data.get("name")
     phone = data.get("phone")
@@ -5080,7 +3312,7 @@ async def api_update_employee_profile(data: Dict, user: Dict = Depends(require_e
 
 # --- Список менеджеров (для назначения заявок) ---
 @app.get("/api/employee/managers")
-async def api_get_managers(user: Dict = Depends(require_employee)):
+def api_get_managers(user: Dict = Depends(require_employee)):
     """Получить список менеджеров для назначения заявок"""
     with get_db() as conn:
         cursor = conn.cursor()
@@ -5096,7 +3328,7 @@ async def api_get_managers(user: Dict = Depends(require_employee)):
 
 # --- Назначение заявки на конкретного менеджера (для Superadmin) ---
 @app.put("/api/superadmin/callbacks/{callback_id}/assign")
-async def api_superadmin_assign_callback(
+def api_superadmin_assign_callback(
     callback_id: int,
     data: Dict,
     user: Dict = Depends(require_employee)
@@ -5112,7 +3344,7 @@ async def api_superadmin_assign_callback(
 
 # --- Назначение заявки на себя (для любого менеджера) ---
 @app.put("/api/employee/callbacks/{callback_id}/assign")
-async def api_employee_assign_callback(
+def api_employee_assign_callback(
     callback_id: int,
     data: Dict,
     user: Dict = Depends(require_employee)
@@ -5132,7 +3364,7 @@ async def api_employee_assign_callback(
 
 # --- Список КП для менеджеров ---
 @app.get("/api/employee/quotes")
-async def api_employee_get_quotes(
+def api_employee_get_quotes(
     status: Optional[str] = None,
     client_id: Optional[int] = None,
     user: Dict = Depends(require_employee)
@@ -5192,24 +3424,26 @@ async def api_employee_update_quote_status(
     if new_status not in ['created', 'sent', 'accepted', 'rejected']:
         raise HTTPException(status_code=400, detail="Недопустимый статус")
 
-    with get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM quotes WHERE id = ?', (quote_id,))
-        quote = cursor.fetchone()
-        if not quote:
-            raise HTTPException(status_code=404, detail="КП не найдено")
+    def update_status():
+        with get_db() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT * FROM quotes WHERE id = ?', (quote_id,))
+            quote = cursor.fetchone()
+            if not quote:
+                raise HTTPException(status_code=404, detail="КП не найдено")
 
-        cursor.execute(
-            'UPDATE quotes SET status = ? WHERE id = ?',
-            (new_status, quote_id)
-        )
+            cursor.execute(
+                'UPDATE quotes SET status = ? WHERE id = ?',
+                (new_status, quote_id)
+            )
 
+    await run_db(update_status)
     return {"success": True, "status": new_status}
 
 
 # --- Скачать PDF КП ---
 @app.get("/api/employee/quotes/{quote_id}/pdf")
-async def api_employee_download_quote_pdf(
+def api_employee_download_quote_pdf(
     quote_id: int,
     user: Dict = Depends(require_employee)
 ):
@@ -5281,7 +3515,7 @@ async def api_employee_download_quote_pdf(
 
 # --- Список договоров для менеджеров ---
 @app.get("/api/employee/contracts")
-async def api_employee_get_contracts(
+def api_employee_get_contracts(
     status: Optional[str] = None,
     client_id: Optional[int] = None,
     user: Dict = Depends(require_employee)
@@ -5333,7 +3567,7 @@ async def api_employee_get_contracts(
 
 # --- Заявки (Callbacks) ---
 @app.get("/api/employee/callbacks")
-async def api_employee_get_callbacks(
+def api_employee_get_callbacks(
     status: Optional[str] = None,
     period: Optional[str] = None,
     user: Dict = Depends(require_employee)
@@ -5379,7 +3613,7 @@ async def api_employee_get_callbacks(
 
 
 @app.get("/api/employee/callbacks/{callback_id}")
-async def api_employee_get_callback(
+def api_employee_get_callback(
     callback_id: int,
     user: Dict = Depends(require_employee)
 ):
@@ -5391,7 +3625,7 @@ async def api_employee_get_callback(
 
 
 @app.put("/api/employee/callbacks/{callback_id}/assign")
-async def api_employee_assign_callback(
+def api_employee_assign_callback(
     callback_id: int,
     user: Dict = Depends(require_employee)
 ):
@@ -5403,7 +3637,7 @@ async def api_employee_assign_callback(
 
 
 @app.put("/api/employee/callbacks/{callback_id}/status")
-async def api_employee_update_callback_status(
+def api_employee_update_callback_status(
     callback_id: int,
     status: str,
     user: Dict = Depends(require_employee)
@@ -5417,7 +3651,7 @@ async def api_employee_update_callback_status(
 
 
 @app.put("/api/employee/callbacks/{callback_id}/comment")
-async def api_employee_update_callback_comment(
+def api_employee_update_callback_comment(
     callback_id: int,
     data: dict,
     user: Dict = Depends(require_employee)
@@ -5441,7 +3675,7 @@ class BulkDeleteRequest(BaseModel):
     ids: List[int]
 
 @app.delete("/api/employee/callbacks/{callback_id}")
-async def api_employee_delete_callback(
+def api_employee_delete_callback(
     callback_id: int,
     user: Dict = Depends(require_employee)
 ):
@@ -5454,7 +3688,7 @@ async def api_employee_delete_callback(
     return {"success": True}
 
 @app.post("/api/employee/callbacks/bulk-delete")
-async def api_employee_bulk_delete_callbacks(
+def api_employee_bulk_delete_callbacks(
     request: BulkDeleteRequest,
     user: Dict = Depends(require_employee)
 ):
@@ -5470,7 +3704,7 @@ async def api_employee_bulk_delete_callbacks(
 
 
 @app.post("/api/employee/callbacks/{callback_id}/convert")
-async def api_employee_convert_callback(
+def api_employee_convert_callback(
     callback_id: int,
     user: Dict = Depends(require_employee)
 ):
@@ -5490,54 +3724,23 @@ async def api_employee_convert_callback(
 async def api_employee_get_clients(
     status: Optional[str] = None,
     search: Optional[str] = None,
+    sort: str = "created_at",
+    order: str = "desc",
+    limit: Optional[int] = None,
+    offset: int = 0,
+    cursor: Optional[str] = None,
     user: Dict = Depends(require_employee)
 ):
     """
     Получить клиентов с статистикой по КП и договорам.
+    Сортировка: sort - поле клиента (created_at, company_name, status...) или агрегат
+    (quotes_total, contracts_total, tasks_count...), order - asc/desc.
+    Пагинация: limit/offset, в ответе total - всего клиентов под фильтром.
+    В порядке по умолчанию - курсором: cursor из next_cursor предыдущей страницы.
     """
-    if search:
-        clients = ClientDB.search(search)
-    else:
-        clients = ClientDB.get_all(status=status)
-
-    # Добавляем статистику по КП и договорам для каждого клиента
-    with get_db() as conn:
-        cursor = conn.cursor()
-        for client in clients:
-            client_id = client['id']
-
-            # Количество и сумма КП
-            cursor.execute('''
-                SELECT COUNT(*) as count, COALESCE(SUM(total_amount), 0) as total
-                FROM quotes WHERE client_id = ?
-            ''', (client_id,))
-            quotes_stats = cursor.fetchone()
-            client['quotes_count'] = quotes_stats['count'] if quotes_stats else 0
-            client['quotes_total'] = quotes_stats['total'] if quotes_stats else 0
-
-            # Количество и сумма договоров
-            cursor.execute('''
-                SELECT COUNT(*) as count, COALESCE(SUM(total_amount), 0) as total
-                FROM contracts WHERE client_id = ?
-            ''', (client_id,))
-            contracts_stats = cursor.fetchone()
-            client['contracts_count'] = contracts_stats['count'] if contracts_stats else 0
-            client['contracts_total'] = contracts_stats['total'] if contracts_stats else 0
-
-            # Менеджер
-            if client.get('assigned_manager_id'):
-                cursor.execute('SELECT email, name FROM users WHERE id = ?', (client['assigned_manager_id'],))
-                manager = cursor.fetchone()
-                if manager:
-                    client['manager_name'] = manager['name'] or manager['email'].split('@')[0]
-                    client['manager_email'] = manager['email']
-
-            # Количество задач
-            cursor.execute("SELECT COUNT(*) as cnt FROM tasks WHERE client_id = ? AND status != 'completed'", (client_id,))
-            tasks_row = cursor.fetchone()
-            client["tasks_count"] = tasks_row["cnt"] if tasks_row else 0
-
-    return {"clients": clients}
+    return await AsyncClientDB.get_list_with_stats(
+        status=status, search=search, sort=sort, order=order, limit=limit, offset=offset, cursor=cursor
+    )
 
 
 
@@ -5550,67 +3753,7 @@ async def check_client_duplicate(
     user: Dict = Depends(require_employee)
 ):
     """Проверить есть ли клиент с таким телефоном/email/ИНН"""
-    duplicates = []
-    
-    with get_db() as conn:
-        cursor = conn.cursor()
-        
-        if phone and len(phone) >= 5:
-            # Очищаем телефон от форматирования для поиска
-            clean_phone = ''.join(filter(str.isdigit, phone))
-            if len(clean_phone) >= 5:
-                cursor.execute('''
-                    SELECT id, contact_name, company_name, contact_phone, contact_email
-                    FROM clients 
-                    WHERE REPLACE(REPLACE(REPLACE(REPLACE(contact_phone, ' ', ''), '-', ''), '(', ''), ')', '') LIKE ?
-                    LIMIT 5
-                ''', (f'%{clean_phone[-10:]}%',))
-                for row in cursor.fetchall():
-                    duplicates.append({
-                        "id": row["id"],
-                        "name": row["contact_name"],
-                        "company": row["company_name"],
-                        "phone": row["contact_phone"],
-                        "email": row["contact_email"],
-                        "match_type": "phone"
-                    })
-        
-        if email and len(email) >= 3 and '@' in email:
-            cursor.execute('''
-                SELECT id, contact_name, company_name, contact_phone, contact_email
-                FROM clients 
-                WHERE LOWER(contact_email) = LOWER(?)
-                LIMIT 5
-            ''', (email,))
-            for row in cursor.fetchall():
-                if not any(d["id"] == row["id"] for d in duplicates):
-                    duplicates.append({
-                        "id": row["id"],
-                        "name": row["contact_name"],
-                        "company": row["company_name"],
-                        "phone": row["contact_phone"],
-                        "email": row["contact_email"],
-                        "match_type": "email"
-                    })
-        
-        if inn and len(inn) >= 10:
-            cursor.execute('''
-                SELECT id, contact_name, company_name, contact_phone, contact_email, inn
-                FROM clients 
-                WHERE inn = ?
-                LIMIT 5
-            ''', (inn,))
-            for row in cursor.fetchall():
-                if not any(d["id"] == row["id"] for d in duplicates):
-                    duplicates.append({
-                        "id": row["id"],
-                        "name": row["contact_name"],
-                        "company": row["company_name"],
-                        "phone": row["contact_phone"],
-                        "email": row["contact_email"],
-                        "match_type": "inn"
-                    })
-    
+    duplicates = await AsyncClientDB.find_duplicates(phone=phone, email=email, inn=inn)
     return {
         "has_duplicates": len(duplicates) > 0,
         "duplicates": duplicates
@@ -5618,7 +3761,7 @@ async def check_client_duplicate(
 
 
 @app.post("/api/employee/clients")
-async def api_employee_create_client(
+def api_employee_create_client(
     data: ClientCreate,
     user: Dict = Depends(require_employee)
 ):
@@ -5638,7 +3781,7 @@ async def api_employee_create_client(
 
 
 @app.get("/api/employee/clients/{client_id}")
-async def api_employee_get_client(
+def api_employee_get_client(
     client_id: int,
     user: Dict = Depends(require_employee)
 ):
@@ -5679,7 +3822,7 @@ async def api_employee_get_client(
 
 
 @app.put("/api/employee/clients/{client_id}")
-async def api_employee_update_client(
+def api_employee_update_client(
     client_id: int,
     data: ClientUpdate,
     user: Dict = Depends(require_employee)
@@ -5709,7 +3852,7 @@ async def api_employee_update_client(
 
 
 @app.delete("/api/employee/clients/{client_id}")
-async def api_employee_delete_client(
+def api_employee_delete_client(
     client_id: int,
     user: Dict = Depends(require_employee)
 ):
@@ -5722,7 +3865,7 @@ async def api_employee_delete_client(
 
 # --- История взаимодействий ---
 @app.get("/api/employee/clients/{client_id}/history")
-async def api_employee_get_client_history(
+def api_employee_get_client_history(
     client_id: int,
     user: Dict = Depends(require_employee)
 ):
@@ -5732,7 +3875,7 @@ async def api_employee_get_client_history(
 
 
 @app.post("/api/employee/clients/{client_id}/history")
-async def api_employee_add_interaction(
+def api_employee_add_interaction(
     client_id: int,
     data: InteractionCreate,
     user: Dict = Depends(require_employee)
@@ -5756,7 +3899,7 @@ async def api_employee_add_interaction(
 
 # --- КП для клиента ---
 @app.post("/api/employee/clients/{client_id}/quote")
-async def api_employee_create_client_quote(
+def api_employee_create_client_quote(
     client_id: int,
     services: List[Dict],
     background_tasks: BackgroundTasks,
@@ -5839,7 +3982,7 @@ class EmployeeQuoteFullRequest(BaseModel):
 
 
 @app.post("/api/employee/clients/{client_id}/quote/full")
-async def api_employee_create_client_quote_full(
+def api_employee_create_client_quote_full(
     client_id: int,
     request: EmployeeQuoteFullRequest,
     background_tasks: BackgroundTasks,
@@ -5946,95 +4089,96 @@ async def api_employee_create_contract_full(
     """Создать договор с товарами и услугами (аналог КП, но сразу договор)"""
     data = await request.json()
 
-    client = ClientDB.get_by_id(client_id)
-    if not client:
-        raise HTTPException(status_code=404, detail="Клиент не найден")
+    def create_contract():
+        client = ClientDB.get_by_id(client_id)
+        if not client:
+            raise HTTPException(status_code=404, detail="Клиент не найден")
 
-    if not client.get('inn'):
-        raise HTTPException(
-            status_code=400,
-            detail="Заполните данные компании клиента (ИНН) перед созданием договора"
-        )
+        if not client.get('inn'):
+            raise HTTPException(
+                status_code=400,
+                detail="Заполните данные компании клиента (ИНН) перед созданием договора"
+            )
 
-    # Создаём компанию из данных клиента
-    company_data = {
-        'inn': client['inn'],
-        'kpp': client.get('kpp'),
-        'ogrn': client.get('ogrn'),
-        'name': client.get('company_name') or client.get('contact_name'),
-        'type': client.get('company_type', 'LEGAL'),
-        'address': client.get('address'),
-        'management_name': client.get('director_name'),
-        'management_post': 'Генеральный директор'
-    }
-    company_id = CompanyDB.create(company_data)
+        # Создаём компанию из данных клиента
+        company_data = {
+            'inn': client['inn'],
+            'kpp': client.get('kpp'),
+            'ogrn': client.get('ogrn'),
+            'name': client.get('company_name') or client.get('contact_name'),
+            'type': client.get('company_type', 'LEGAL'),
+            'address': client.get('address'),
+            'management_name': client.get('director_name'),
+            'management_post': 'Генеральный директор'
+        }
+        company_id = CompanyDB.create(company_data)
 
-    # Получаем услуги из запроса
-    services_list = data.get('services', [])
-    products_list = data.get('products', [])
+        # Получаем услуги из запроса
+        services_list = data.get('services', [])
+        products_list = data.get('products', [])
 
-    # Считаем общую сумму
-    total_amount = sum(
-        (s.get('price', 0) * s.get('quantity', 1))
-        for s in services_list
-    )
+        # Считаем общую сумму
+        total_amount = sum(
+            (s.get('price', 0) * s.get('quantity', 1))
+            for s in services_list
+        )
 
-    # Создаём договор с услугами
-    contract_data = {
-        'quote_id': None,
-        'user_id': client.get('user_id'),
-        'manager_id': user['id'],
-        'client_id': client_id,
-        'company_id': company_id,
-        'services': services_list,
-        'total_amount': total_amount
-    }
+        # Создаём договор с услугами
+        contract_data = {
+            'quote_id': None,
+            'user_id': client.get('user_id'),
+            'manager_id': user['id'],
+            'client_id': client_id,
+            'company_id': company_id,
+            'services': services_list,
+            'total_amount': total_amount
+        }
 
-    result = ContractDB.create(contract_data)
+        result = ContractDB.create(contract_data)
 
-    # Добавляем в историю
-    InteractionDB.create({
-        'client_id': client_id,
-        'manager_id': user["id"],
-        'type': 'contract_created',
-        'subject': f'Создан договор {result["contract_number"]}',
-        'description': f'Сумма: {total_amount:,.0f} ₽. Услуг: {len(services_list)}. Товаров: {len(products_list)}',
-        'contract_id': result['id']
-    })
+        # Добавляем в историю
+        InteractionDB.create({
+            'client_id': client_id,
+            'manager_id': user["id"],
+            'type': 'contract_created',
+            'subject': f'Создан договор {result["contract_number"]}',
+            'description': f'Сумма: {total_amount:,.0f} ₽. Услуг: {len(services_list)}. Товаров: {len(products_list)}',
+            'contract_id': result['id']
+        })
 
-    # Автоматически создаём счёт
-    invoice_number = get_next_invoice_number(result['contract_number'], result['id'])
-    invoice_id = None
-    try:
-        with get_db() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO invoices (
-                    invoice_number, contract_id, company_id, amount,
-                    status, description, services_json, manager_id, client_name
-                ) VALUES (?, ?, ?, ?, 'created', ?, ?, ?, ?)
-            """, (
-                invoice_number,
-                result['id'],
-                company_id,
-                total_amount,
-                f'Счёт по договору {result["contract_number"]}',
-                json.dumps(services_list, ensure_ascii=False) if services_list else '[]',
-                user['id'],
-                client.get('company_name') or client.get('contact_name')
-            ))
-            invoice_id = cursor.lastrowid
-        logger.info(f"Auto-created invoice {invoice_number} for contract {result['contract_number']}")
-    except Exception as e:
-        logger.error(f"Failed to auto-create invoice: {e}")
-    # === Уведомления админам ===
-    try:
-        client_name = client.get('company_name') or client.get('contact_name', 'Клиент')
-        client_phone = client.get('contact_phone', '')
-        manager_name = user.get('name', user.get('email', 'Менеджер'))
+        # Автоматически создаём счёт
+        invoice_number = get_next_invoice_number(result['contract_number'], result['id'])
+        invoice_id = None
+        try:
+            with get_db() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    INSERT INTO invoices (
+                        invoice_number, contract_id, company_id, amount,
+                        status, description, services_json, manager_id, client_name
+                    ) VALUES (?, ?, ?, ?, 'created', ?, ?, ?, ?)
+                """, (
+                    invoice_number,
+                    result['id'],
+                    company_id,
+                    total_amount,
+                    f'Счёт по договору {result["contract_number"]}',
+                    json.dumps(services_list, ensure_ascii=False) if services_list else '[]',
+                    user['id'],
+                    client.get('company_name') or client.get('contact_name')
+                ))
+                invoice_id = cursor.lastrowid
+            logger.info(f"Auto-created invoice {invoice_number} for contract {result['contract_number']}")
+        except Exception as e:
+            logger.error(f"Failed to auto-create invoice: {e}")
+        # === Уведомления админам ===
+        try:
+            client_name = client.get('company_name') or client.get('contact_name', 'Клиент')
+            client_phone = client.get('contact_phone', '')
+            manager_name = user.get('name', user.get('email', 'Менеджер'))
         
-        # Telegram уведомление
-        tg_text = f"""📝 <b>Новый договор</b>
+            # Telegram уведомление
+            tg_text = f"""📝 <b>Новый договор</b>
 
 📋 <b>{result['contract_number']}</b>
 💰 Сумма: {total_amount:,.0f} ₽
@@ -6046,17 +4190,17 @@ async def api_employee_create_contract_full(
 📄 Услуг: {len(services_list)}
 📦 Товаров: {len(products_list)}"""
 
-        if invoice_number:
-            tg_text += f"""
+            if invoice_number:
+                tg_text += f"""
 
 🧾 Счёт: {invoice_number}"""
         
-        background_tasks.add_task(send_telegram_notification, tg_text)
+            background_tasks.add_task(send_telegram_notification, tg_text)
         
-        # Email уведомление
-        manager_emails = os.getenv('CONTACT_TO_EMAIL', 'damirslk@mail.ru,turbin.ar8@gmail.com').split(',')
-        subject = f"Новый договор {result['contract_number']} - {client_name}"
-        body = f"""Создан новый договор из CRM
+            # Email уведомление
+            manager_emails = os.getenv('CONTACT_TO_EMAIL', 'damirslk@mail.ru,turbin.ar8@gmail.com').split(',')
+            subject = f"Новый договор {result['contract_number']} - {client_name}"
+            body = f"""Создан новый договор из CRM
 
 Номер договора: {result['contract_number']}
 Клиент: {client_name}
@@ -6070,28 +4214,30 @@ async def api_employee_create_contract_full(
 ---
 Про.Маркируй CRM"""
         
-        for email in manager_emails:
-            if email.strip():
-                background_tasks.add_task(send_email, email.strip(), subject, body)
-    except Exception as e:
-        logger.error(f"Failed to send notifications: {e}")
+            for email in manager_emails:
+                if email.strip():
+                    background_tasks.add_task(send_email, email.strip(), subject, body)
+        except Exception as e:
+            logger.error(f"Failed to send notifications: {e}")
 
 
 
-    return {
-        "success": True,
-        "contract_id": result['id'],
-        "contract_number": result['contract_number'],
-        "total_amount": total_amount,
-        "invoice_id": invoice_id,
-        "invoice_number": invoice_number if invoice_id else None
-    }
+        return {
+            "success": True,
+            "contract_id": result['id'],
+            "contract_number": result['contract_number'],
+            "total_amount": total_amount,
+            "invoice_id": invoice_id,
+            "invoice_number": invoice_number if invoice_id else None
+        }
+
+    return await run_db(create_contract)
 
 
 # --- Создать договор напрямую (без КП) ---
 # ВАЖНО: этот роут должен быть ПЕРЕД /contract, иначе FastAPI матчит /contract первым
 @app.post("/api/employee/clients/{client_id}/contract/direct")
-async def api_employee_create_contract_direct(
+def api_employee_create_contract_direct(
     client_id: int,
     user: Dict = Depends(require_employee)
 ):
@@ -6151,7 +4297,7 @@ async def api_employee_create_contract_direct(
 
 # --- Договор для клиента (из КП) ---
 @app.post("/api/employee/clients/{client_id}/contract")
-async def api_employee_create_client_contract(
+def api_employee_create_client_contract(
     client_id: int,
     quote_id: int = None,
     services: List[Dict] = None,
@@ -6309,24 +4455,26 @@ async def api_employee_update_contract_status(
     if new_status not in ['draft', 'sent', 'signed', 'active', 'completed', 'cancelled']:
         raise HTTPException(status_code=400, detail="Недопустимый статус")
 
-    with get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM contracts WHERE id = ?', (contract_id,))
-        contract = cursor.fetchone()
-        if not contract:
-            raise HTTPException(status_code=404, detail="Договор не найден")
+    def update_status():
+        with get_db() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT * FROM contracts WHERE id = ?', (contract_id,))
+            contract = cursor.fetchone()
+            if not contract:
+                raise HTTPException(status_code=404, detail="Договор не найден")
 
-        cursor.execute(
-            'UPDATE contracts SET status = ? WHERE id = ?',
-            (new_status, contract_id)
-        )
+            cursor.execute(
+                'UPDATE contracts SET status = ? WHERE id = ?',
+                (new_status, contract_id)
+            )
 
+    await run_db(update_status)
     return {"success": True, "status": new_status}
 
 
 # --- Скачать PDF договора ---
 @app.get("/api/employee/contracts/{contract_id}/pdf")
-async def api_employee_download_contract_pdf(
+def api_employee_download_contract_pdf(
     contract_id: int,
     user: Dict = Depends(require_employee)
 ):
@@ -6391,7 +4539,7 @@ async def api_employee_download_contract_pdf(
 
 # --- Отправка документов ---
 @app.post("/api/employee/clients/{client_id}/send-documents")
-async def api_employee_send_documents(
+def api_employee_send_documents(
     client_id: int,
     document_type: str,  # quote, contract, invoice
     document_id: int,
@@ -6422,66 +4570,7 @@ async def api_employee_send_documents(
 
 # ======================== ТЕСТ ТН ВЭД ========================
 
-# Загружаем базу ТН ВЭД из JSON при старте (с кэшированием)
-_tnved_data = None
-_tnved_stats_cache = None
-_timeline_data_cache = None
-
-def get_tnved_data():
-    """Загрузить данные ТН ВЭД из JSON"""
-    global _tnved_data
-    if _tnved_data is None:
-        import json
-        json_path = os.path.join(os.path.dirname(__file__), 'data', 'tnved.json')
-        try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                _tnved_data = json.load(f)
-            logger.info(f"Loaded {len(_tnved_data)} TNVED codes from JSON")
-        except FileNotFoundError:
-            logger.warning("TNVED JSON not found, returning empty list")
-            _tnved_data = []
-    return _tnved_data
-
-def get_tnved_stats_cached():
-    """Закэшированная статистика ТН ВЭД"""
-    global _tnved_stats_cache
-    if _tnved_stats_cache is None:
-        data = get_tnved_data()
-        total = len(data) if data else 0
-        mandatory = 0
-        experimental = 0
-        for category in CATEGORIES_DATA:
-            for subcategory in category.get("subcategories", []):
-                for product in subcategory.get("products", []):
-                    status = product.get("marking_status", "not_required")
-                    if status == "mandatory":
-                        mandatory += 1
-                    elif status == "experiment":
-                        experimental += 1
-        _tnved_stats_cache = {
-            "loaded": True,
-            "total": total,
-            "mandatory": mandatory,
-            "experimental": experimental,
-            "not_required": total - mandatory - experimental
-        }
-    return _tnved_stats_cache
-
-def get_timeline_data_cached():
-    """Закэшированные данные timeline"""
-    global _timeline_data_cache
-    if _timeline_data_cache is None:
-        try:
-            timeline_path = os.path.join(os.path.dirname(__file__), 'data', 'marking_timeline.json')
-            if os.path.exists(timeline_path):
-                with open(timeline_path, 'r', encoding='utf-8') as f:
-                    _timeline_data_cache = json.load(f)
-                logger.info("Loaded marking_timeline.json")
-        except Exception as e:
-            logger.error(f"Failed to load marking_timeline.json: {e}")
-            _timeline_data_cache = {}
-    return _timeline_data_cache
-
+# Справочники и индексы загружаются один раз в catalog.py
 
 @app.get("/api/tnved/search")
 async def api_tnved_search(q: str = "", limit: int = 50):
@@ -6489,22 +4578,14 @@ async def api_tnved_search(q: str = "", limit: int = 50):
     if not q or len(q) < 2:
         return {"results": [], "query": q}
 
-    data = get_tnved_data()
-    q_lower = q.lower()
     q_digits = q.replace(' ', '')
 
-    results = []
-    for item in data:
-        # Поиск по коду
-        if q_digits.isdigit():
-            if item['code'].startswith(q_digits):
-                results.append(item)
-        # Поиск по названию
-        elif q_lower in item['name'].lower():
-            results.append(item)
-
-        if len(results) >= limit:
-            break
+    if q_digits.isdigit():
+        # Поиск по коду - через префиксный индекс
+        results = get_catalog().tnved_code_index.prefix(q_digits, limit)
+    else:
+        # Поиск по названию - через инвертированный индекс с ранжированием
+        results = get_catalog().tnved_name_index.search(q, limit)
 
     return {"results": results, "query": q, "count": len(results)}
 
@@ -6512,68 +4593,11 @@ async def api_tnved_search(q: str = "", limit: int = 50):
 @app.get("/api/tnved/stats")
 async def api_tnved_stats():
     """Статистика: всего кодов из tnved.json, обязательных/эксперимент из CATEGORIES_DATA"""
-    return get_tnved_stats_cached()
+    return get_catalog().tnved_stats
 
 
 # ======================== TIMELINE API ========================
 
-def get_timeline_stats_with_upcoming():
-    """Расчёт статистики с ближайшими дедлайнами"""
-    from datetime import datetime, timedelta
-
-    data = get_timeline_data_cached()
-    if not data:
-        return {
-            "active": 0,
-            "partial": 0,
-            "upcoming_count": 0,
-            "upcoming_events": []
-        }
-
-    categories = data.get("categories", {})
-    today = datetime.now().date()
-    six_months_later = today + timedelta(days=180)
-
-    active = 0
-    partial = 0
-    upcoming_events = []
-
-    for cat_name, cat_data in categories.items():
-        status = cat_data.get("status", "")
-        if status == "active":
-            active += 1
-        elif status == "partial":
-            partial += 1
-
-        # Собираем будущие события
-        for event in cat_data.get("events", []):
-            if not event.get("is_completed", False):
-                date_str = event.get("date", "")
-                if date_str:
-                    try:
-                        event_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-                        if today < event_date <= six_months_later:
-                            upcoming_events.append({
-                                "date": date_str,
-                                "date_display": event.get("date_display", ""),
-                                "category": cat_name,
-                                "title": event.get("title", ""),
-                                "type_label": event.get("type_label", ""),
-                                "description": event.get("description", "")[:200] if event.get("description") else ""
-                            })
-                    except:
-                        pass
-
-    # Сортируем по дате
-    upcoming_events.sort(key=lambda x: x["date"])
-
-    return {
-        "active": active,
-        "partial": partial,
-        "upcoming_count": len(upcoming_events),
-        "upcoming_events": upcoming_events[:10]  # Топ 10 ближайших
-    }
-
 @app.get("/api/marking/timeline/stats")
 async def api_timeline_stats():
     """Статистика по срокам маркировки с ближайшими дедлайнами"""
@@ -6584,7 +4608,7 @@ async def api_timeline_stats():
 @app.get("/api/marking/timeline")
 async def api_timeline():
     """Полные данные по срокам маркировки"""
-    data = get_timeline_data_cached()
+    data = get_catalog().timeline
     if not data:
         return {"categories": {}, "groups": [], "statistics": {}}
 
@@ -6594,20 +4618,10 @@ async def api_timeline():
 @app.get("/api/marking/timeline/category/{category_id}")
 async def api_timeline_category(category_id: str):
     """Данные по конкретной категории"""
-    data = get_timeline_data_cached()
-    if not data or "categories" not in data:
-        raise HTTPException(status_code=404, detail="Category not found")
-
-    categories = data.get("categories", {})
-
-    if category_id in categories:
-        return categories[category_id]
-
     from urllib.parse import unquote
-    decoded_id = unquote(category_id)
-    for cat_name, cat_data in categories.items():
-        if cat_name == decoded_id or cat_data.get("id") == category_id:
-            return cat_data
+    match = get_catalog().find_timeline_category(unquote(category_id))
+    if match:
+        return match[1]
 
     raise HTTPException(status_code=404, detail="Category not found")
 
@@ -6683,7 +4697,7 @@ class PartnerUpdateRequest(BaseModel):
     status: Optional[str] = None
 
 @app.get("/api/employee/partners")
-async def get_partners(status: Optional[str] = None, current_user: dict = Depends(require_employee)):
+def get_partners(status: Optional[str] = None, current_user: dict = Depends(require_employee)):
     """Получить список партнёров"""
     partners = PartnerDB.get_all(status)
 
@@ -6702,7 +4716,7 @@ async def get_partners(status: Optional[str] = None, current_user: dict = Depend
     }
 
 @app.post("/api/employee/partners")
-async def create_partner(data: PartnerCreateRequest, current_user: dict = Depends(require_employee)):
+def create_partner(data: PartnerCreateRequest, current_user: dict = Depends(require_employee)):
     """Создать партнёра"""
     try:
         result = PartnerDB.create(data.dict(), created_by=current_user.get('id'))
@@ -6716,23 +4730,10 @@ async def create_partner(data: PartnerCreateRequest, current_user: dict = Depend
         logger.error(f"Failed to create partner: {e}")
         raise HTTPException(status_code=400, detail=str(e))
 
-@app.get("/api/employee/partners/{partner_id}")
-async def get_partner(partner_id: int, current_user: dict = Depends(require_employee)):
-    """Получить партнёра по ID"""
-    partner = PartnerDB.get_by_id(partner_id)
-    if not partner:
-        raise HTTPException(status_code=404, detail="Partner not found")
-
-    # Получаем статистику
-    stats = PartnerDB.get_stats(partner_id)
-
-    return {
-        "partner": partner,
-        "stats": stats
-    }
+# GET /api/employee/partners/{partner_id}: routes/partners.py (partner_ledger)
 
 @app.put("/api/employee/partners/{partner_id}")
-async def update_partner(partner_id: int, data: PartnerUpdateRequest, current_user: dict = Depends(require_employee)):
+def update_partner(partner_id: int, data: PartnerUpdateRequest, current_user: dict = Depends(require_employee)):
     """Обновить партнёра"""
     update_data = {k: v for k, v in data.dict().items() if v is not None}
     if not update_data:
@@ -6745,7 +4746,7 @@ async def update_partner(partner_id: int, data: PartnerUpdateRequest, current_us
     return {"success": True}
 
 @app.post("/api/employee/partners/{partner_id}/activate")
-async def activate_partner(partner_id: int, current_user: dict = Depends(require_employee)):
+def activate_partner(partner_id: int, current_user: dict = Depends(require_employee)):
     """Активировать партнёра"""
     success = PartnerDB.activate(partner_id)
     if not success:
@@ -6753,7 +4754,7 @@ async def activate_partner(partner_id: int, current_user: dict = Depends(require
     return {"success": True}
 
 @app.post("/api/employee/partners/{partner_id}/deactivate")
-async def deactivate_partner(partner_id: int, current_user: dict = Depends(require_employee)):
+def deactivate_partner(partner_id: int, current_user: dict = Depends(require_employee)):
     """Деактивировать партнёра"""
     success = PartnerDB.deactivate(partner_id)
     if not success:
@@ -6761,7 +4762,7 @@ async def deactivate_partner(partner_id: int, current_user: dict = Depends(requi
     return {"success": True}
 
 @app.post("/api/employee/partners/{partner_id}/invite")
-async def send_partner_invite(partner_id: int, current_user: dict = Depends(require_employee)):
+def send_partner_invite(partner_id: int, current_user: dict = Depends(require_employee)):
     """Отправить приглашение партнёру"""
     partner = PartnerDB.get_by_id(partner_id)
     if not partner:
@@ -6794,7 +4795,7 @@ class AcceptInviteRequest(BaseModel):
 
 
 @app.post("/api/partner/accept-invite")
-async def accept_partner_invite(data: AcceptInviteRequest):
+def accept_partner_invite(data: AcceptInviteRequest):
     """Партнёр принимает приглашение и устанавливает пароль"""
     partner = PartnerDB.accept_invitation(data.token, data.password)
     if not partner:
@@ -6808,7 +4809,7 @@ async def accept_partner_invite(data: AcceptInviteRequest):
 
 
 @app.get("/api/partner/invite/{token}")
-async def get_invite_info(token: str):
+def get_invite_info(token: str):
     """Получить информацию о приглашении по токену"""
     partner = PartnerDB.get_by_invite_token(token)
     if not partner:
@@ -6825,7 +4826,7 @@ async def get_invite_info(token: str):
     }
 
 @app.delete("/api/employee/partners/{partner_id}")
-async def delete_partner(partner_id: int, current_user: dict = Depends(require_employee)):
+def delete_partner(partner_id: int, current_user: dict = Depends(require_employee)):
     """Удалить партнёра (для сотрудников)"""
     success = PartnerDB.delete(partner_id)
     if not success:
@@ -6833,7 +4834,7 @@ async def delete_partner(partner_id: int, current_user: dict = Depends(require_e
     return {"success": True}
 
 @app.delete("/api/admin/partners/{partner_id}")
-async def admin_delete_partner(partner_id: int, current_user: dict = Depends(require_superadmin)):
+def admin_delete_partner(partner_id: int, current_user: dict = Depends(require_superadmin)):
     """Удалить партнёра (для супер-админов)"""
     success = PartnerDB.delete(partner_id)
     if not success:
@@ -6842,7 +4843,7 @@ async def admin_delete_partner(partner_id: int, current_user: dict = Depends(req
 
 # Partner cabinet API
 @app.get("/api/partner/me")
-async def get_partner_me(current_user: dict = Depends(require_auth)):
+def get_partner_me(current_user: dict = Depends(require_auth)):
     """Получить данные текущего партнёра"""
     if current_user.get('role') != 'partner':
         raise HTTPException(status_code=403, detail="Not a partner")
@@ -6853,38 +4854,11 @@ async def get_partner_me(current_user: dict = Depends(require_auth)):
 
     return {"partner": partner}
 
-@app.get("/api/partner/stats")
-async def get_partner_stats(current_user: dict = Depends(require_auth)):
-    """Получить статистику партнёра"""
-    if current_user.get('role') != 'partner':
-        raise HTTPException(status_code=403, detail="Not a partner")
-
-    partner = PartnerDB.get_by_user_id(current_user['id'])
-    if not partner:
-        raise HTTPException(status_code=404, detail="Partner not found")
-
-    stats = PartnerDB.get_stats(partner["id"])
-    # Добавляем алиасы для совместимости с фронтендом
-    stats["total_amount"] = stats.get("quotes_amount", 0)
-    stats["total_commission"] = stats.get("commission_earned", 0)
-    return {"stats": stats}
-
-@app.get("/api/partner/leads")
-async def get_partner_leads(current_user: dict = Depends(require_auth)):
-    """Получить клиентов партнёра"""
-    if current_user.get('role') != 'partner':
-        raise HTTPException(status_code=403, detail="Not a partner")
-
-    partner = PartnerDB.get_by_user_id(current_user['id'])
-    if not partner:
-        raise HTTPException(status_code=404, detail="Partner not found")
-
-    leads = PartnerDB.get_leads(partner['id'])
-    return {"leads": leads}
+# /api/partner/stats и /api/partner/leads: routes/partners.py (partner_ledger)
 
 # Public API for ref code validation
 @app.get("/api/ref/{ref_code}")
-async def validate_ref_code(ref_code: str):
+def validate_ref_code(ref_code: str):
     """Проверить валидность реферального кода"""
     partner = PartnerDB.get_by_ref_code(ref_code)
     if not partner:
@@ -6905,7 +4879,7 @@ if __name__ == "__main__":
 
 # --- Список курсов партнёра ---
 @app.get("/api/partner/courses")
-async def get_partner_courses(user: Dict = Depends(require_partner)):
+def get_partner_courses(user: Dict = Depends(require_partner)):
     """Получить курсы с прогрессом партнёра"""
     with get_db() as conn:
         # Получаем partner_id из users
@@ -6922,7 +4896,7 @@ async def get_partner_courses(user: Dict = Depends(require_partner)):
 
 # --- Детали курса с главами ---
 @app.get("/api/partner/courses/{course_id}")
-async def get_partner_course_detail(course_id: int, user: Dict = Depends(require_partner)):
+def get_partner_course_detail(course_id: int, user: Dict = Depends(require_partner)):
     """Получить курс с главами и прогрессом"""
     with get_db() as conn:
         cursor = conn.cursor()
@@ -6940,7 +4914,7 @@ async def get_partner_course_detail(course_id: int, user: Dict = Depends(require
 
 # --- Начать главу ---
 @app.post("/api/partner/chapters/{chapter_id}/start")
-async def start_chapter(chapter_id: int, user: Dict = Depends(require_partner)):
+def start_chapter(chapter_id: int, user: Dict = Depends(require_partner)):
     """Начать прохождение главы"""
     with get_db() as conn:
         cursor = conn.cursor()
@@ -6975,7 +4949,7 @@ class VideoProgressRequest(BaseModel):
     watched: bool = False
 
 @app.post("/api/partner/chapters/{chapter_id}/video-progress")
-async def update_video_progress(
+def update_video_progress(
     chapter_id: int,
     request: VideoProgressRequest,
     user: Dict = Depends(require_partner)
@@ -7001,7 +4975,7 @@ async def update_video_progress(
 
 # --- Получить тест главы ---
 @app.get("/api/partner/chapters/{chapter_id}/test")
-async def get_chapter_test(chapter_id: int, user: Dict = Depends(require_partner)):
+def get_chapter_test(chapter_id: int, user: Dict = Depends(require_partner)):
     """Получить тест главы (без правильных ответов!)"""
     import json as json_lib
     with get_db() as conn:
@@ -7041,7 +5015,7 @@ class SubmitTestRequest(BaseModel):
     answers: dict  # {"1": [0], "2": [1, 2], ...}
 
 @app.post("/api/partner/tests/{test_id}/submit")
-async def submit_test(
+def submit_test(
     test_id: int,
     request: SubmitTestRequest,
     user: Dict = Depends(require_partner)
@@ -7073,7 +5047,7 @@ async def submit_test(
 
 # --- Статистика обучения ---
 @app.get("/api/admin/education/stats")
-async def get_education_stats(user: Dict = Depends(require_admin)):
+def get_education_stats(user: Dict = Depends(require_admin)):
     """Статистика по обучению"""
     with get_db() as conn:
         stats = EducationDB.get_education_stats(conn)
@@ -7086,7 +5060,7 @@ async def get_education_stats(user: Dict = Depends(require_admin)):
 
 # --- Прогресс партнёров ---
 @app.get("/api/admin/education/progress")
-async def get_partners_progress(
+def get_partners_progress(
     course_id: Optional[int] = None,
     user: Dict = Depends(require_admin)
 ):
@@ -7114,7 +5088,7 @@ async def get_partners_progress(
 
 # --- Список курсов для админки ---
 @app.get("/api/admin/education/courses")
-async def admin_get_courses(user: Dict = Depends(require_admin)):
+def admin_get_courses(user: Dict = Depends(require_admin)):
     """Получить все курсы (включая неактивные)"""
     with get_db() as conn:
         courses = EducationDB.get_all_courses(conn, include_inactive=True)
@@ -7129,7 +5103,7 @@ class CreateCourseRequest(BaseModel):
     price: float = 0
 
 @app.post("/api/admin/education/courses")
-async def admin_create_course(
+def admin_create_course(
     request: CreateCourseRequest,
     user: Dict = Depends(require_admin)
 ):
@@ -7155,7 +5129,7 @@ class UpdateCourseRequest(BaseModel):
     sort_order: Optional[int] = None
 
 @app.put("/api/admin/education/courses/{course_id}")
-async def admin_update_course(
+def admin_update_course(
     course_id: int,
     request: UpdateCourseRequest,
     user: Dict = Depends(require_admin)
@@ -7170,7 +5144,7 @@ async def admin_update_course(
 
 # --- Получить главы курса ---
 @app.get("/api/admin/education/courses/{course_id}/chapters")
-async def admin_get_chapters(course_id: int, user: Dict = Depends(require_admin)):
+def admin_get_chapters(course_id: int, user: Dict = Depends(require_admin)):
     """Получить главы курса"""
     with get_db() as conn:
         chapters = EducationDB.get_course_chapters(conn, course_id, include_inactive=True)
@@ -7186,7 +5160,7 @@ class CreateChapterRequest(BaseModel):
     content_html: Optional[str] = None
 
 @app.post("/api/admin/education/courses/{course_id}/chapters")
-async def admin_create_chapter(
+def admin_create_chapter(
     course_id: int,
     request: CreateChapterRequest,
     user: Dict = Depends(require_admin)
@@ -7216,7 +5190,7 @@ class UpdateChapterRequest(BaseModel):
     is_active: Optional[bool] = None
 
 @app.put("/api/admin/education/chapters/{chapter_id}")
-async def admin_update_chapter(
+def admin_update_chapter(
     chapter_id: int,
     request: UpdateChapterRequest,
     user: Dict = Depends(require_admin)
@@ -7231,7 +5205,7 @@ async def admin_update_chapter(
 
 # --- Удалить главу ---
 @app.delete("/api/admin/education/chapters/{chapter_id}")
-async def admin_delete_chapter(chapter_id: int, user: Dict = Depends(require_admin)):
+def admin_delete_chapter(chapter_id: int, user: Dict = Depends(require_admin)):
     """Удалить главу"""
     with get_db() as conn:
         EducationDB.delete_chapter(conn, chapter_id)
@@ -7240,7 +5214,7 @@ async def admin_delete_chapter(chapter_id: int, user: Dict = Depends(require_adm
 
 # --- Получить тест главы (для админа) ---
 @app.get("/api/admin/education/chapters/{chapter_id}/test")
-async def admin_get_test(chapter_id: int, user: Dict = Depends(require_admin)):
+def admin_get_test(chapter_id: int, user: Dict = Depends(require_admin)):
     """Получить тест главы"""
     import json as json_lib
     with get_db() as conn:
@@ -7258,7 +5232,7 @@ class SaveTestRequest(BaseModel):
     questions: list  # Список вопросов
 
 @app.post("/api/admin/education/chapters/{chapter_id}/test")
-async def admin_save_test(
+def admin_save_test(
     chapter_id: int,
     request: SaveTestRequest,
     user: Dict = Depends(require_admin)
@@ -7284,7 +5258,7 @@ class GrantAccessRequest(BaseModel):
     expires_at: Optional[str] = None
 
 @app.post("/api/admin/education/grant-access")
-async def admin_grant_access(
+def admin_grant_access(
     request: GrantAccessRequest,
     user: Dict = Depends(require_admin)
 ):
@@ -7302,7 +5276,7 @@ async def admin_grant_access(
 
 # --- Отозвать доступ к курсу ---
 @app.delete("/api/admin/education/access/{partner_id}/{course_id}")
-async def admin_revoke_access(
+def admin_revoke_access(
     partner_id: int,
     course_id: int,
     user: Dict = Depends(require_admin)
@@ -7316,7 +5290,7 @@ async def admin_revoke_access(
 # ======================== СЕРТИФИКАТ ========================
 
 @app.get("/api/partner/courses/{course_id}/certificate")
-async def get_certificate(course_id: int, user: Dict = Depends(require_partner)):
+def get_certificate(course_id: int, user: Dict = Depends(require_partner)):
     """Получить информацию о сертификате"""
     with get_db() as conn:
         cursor = conn.cursor()
@@ -7343,15 +5317,7 @@ async def get_certificate(course_id: int, user: Dict = Depends(require_partner))
 
         # Генерируем номер сертификата если его нет
         if not data.get('certificate_number'):
-            import datetime
-            cert_num = f"CERT-{datetime.datetime.now().strftime('%Y%m%d')}-{partner_id}-{course_id}"
-            cursor.execute('''
-                UPDATE partner_course_progress
-                SET certificate_number = ?
-                WHERE partner_id = ? AND course_id = ?
-            ''', (cert_num, partner_id, course_id))
-            conn.commit()
-            data['certificate_number'] = cert_num
+            data['certificate_number'] = EducationDB.assign_certificate_number(conn, partner_id, course_id)
 
         return {
             "certificate_number": data['certificate_number'],
@@ -7364,7 +5330,7 @@ async def get_certificate(course_id: int, user: Dict = Depends(require_partner))
 
 
 @app.get("/api/partner/courses/{course_id}/certificate/download")
-async def download_certificate(course_id: int, user: Dict = Depends(require_partner)):
+def download_certificate(course_id: int, user: Dict = Depends(require_partner)):
     """Скачать PDF сертификат"""
     from certificate_generator import CertificateGenerator
 
@@ -7392,15 +5358,7 @@ async def download_certificate(course_id: int, user: Dict = Depends(require_part
 
         # Генерируем номер если нет
         if not data.get('certificate_number'):
-            import datetime
-            cert_num = f"CERT-{datetime.datetime.now().strftime('%Y%m%d')}-{partner_id}-{course_id}"
-            cursor.execute('''
-                UPDATE partner_course_progress
-                SET certificate_number = ?
-                WHERE partner_id = ? AND course_id = ?
-            ''', (cert_num, partner_id, course_id))
-            conn.commit()
-            data['certificate_number'] = cert_num
+            data['certificate_number'] = EducationDB.assign_certificate_number(conn, partner_id, course_id)
 
         # Генерируем PDF
         generator = CertificateGenerator()
@@ -7423,7 +5381,7 @@ async def download_certificate(course_id: int, user: Dict = Depends(require_part
 
 # --- Удаление клиентов ---
 @app.delete("/api/employee/clients/{client_id}")
-async def api_employee_delete_client(client_id: int, user: Dict = Depends(require_employee)):
+def api_employee_delete_client(client_id: int, user: Dict = Depends(require_employee)):
     """Удалить одного клиента"""
     with get_db() as conn:
         cursor = conn.cursor()
@@ -7433,7 +5391,7 @@ async def api_employee_delete_client(client_id: int, user: Dict = Depends(requir
     return {"success": True}
 
 @app.post("/api/employee/clients/bulk-delete")
-async def api_employee_bulk_delete_clients(request: BulkDeleteRequest, user: Dict = Depends(require_employee)):
+def api_employee_bulk_delete_clients(request: BulkDeleteRequest, user: Dict = Depends(require_employee)):
     """Массовое удаление клиентов"""
     if not request.ids:
         raise HTTPException(status_code=400, detail="Не выбраны клиенты")
@@ -7446,7 +5404,7 @@ async def api_employee_bulk_delete_clients(request: BulkDeleteRequest, user: Dic
 
 # --- Удаление договоров ---
 @app.delete("/api/employee/contracts/{contract_id}")
-async def api_employee_delete_contract(contract_id: int, user: Dict = Depends(require_employee)):
+def api_employee_delete_contract(contract_id: int, user: Dict = Depends(require_employee)):
     """Удалить один договор"""
     with get_db() as conn:
         cursor = conn.cursor()
@@ -7456,7 +5414,7 @@ async def api_employee_delete_contract(contract_id: int, user: Dict = Depends(re
     return {"success": True}
 
 @app.post("/api/employee/contracts/bulk-delete")
-async def api_employee_bulk_delete_contracts(request: BulkDeleteRequest, user: Dict = Depends(require_employee)):
+def api_employee_bulk_delete_contracts(request: BulkDeleteRequest, user: Dict = Depends(require_employee)):
     """Массовое удаление договоров"""
     if not request.ids:
         raise HTTPException(status_code=400, detail="Не выбраны договоры")
@@ -7469,7 +5427,7 @@ async def api_employee_bulk_delete_contracts(request: BulkDeleteRequest, user: D
 
 # --- Удаление КП ---
 @app.delete("/api/employee/quotes/{quote_id}")
-async def api_employee_delete_quote(quote_id: int, user: Dict = Depends(require_employee)):
+def api_employee_delete_quote(quote_id: int, user: Dict = Depends(require_employee)):
     """Удалить одно КП"""
     with get_db() as conn:
         cursor = conn.cursor()
@@ -7479,7 +5437,7 @@ async def api_employee_delete_quote(quote_id: int, user: Dict = Depends(require_
     return {"success": True}
 
 @app.post("/api/employee/quotes/bulk-delete")
-async def api_employee_bulk_delete_quotes(request: BulkDeleteRequest, user: Dict = Depends(require_employee)):
+def api_employee_bulk_delete_quotes(request: BulkDeleteRequest, user: Dict = Depends(require_employee)):
     """Массовое удаление КП"""
     if not request.ids:
         raise HTTPException(status_code=400, detail="Не выбраны КП")
@@ -7492,7 +5450,7 @@ async def api_employee_bulk_delete_quotes(request: BulkDeleteRequest, user: Dict
 
 # --- Удаление счетов ---
 @app.delete("/api/employee/invoices/{invoice_id}")
-async def api_employee_delete_invoice(invoice_id: int, user: Dict = Depends(require_employee)):
+def api_employee_delete_invoice(invoice_id: int, user: Dict = Depends(require_employee)):
     """Удалить один счёт"""
     with get_db() as conn:
         cursor = conn.cursor()
@@ -7502,7 +5460,7 @@ async def api_employee_delete_invoice(invoice_id: int, user: Dict = Depends(requ
     return {"success": True}
 
 @app.post("/api/employee/invoices/bulk-delete")
-async def api_employee_bulk_delete_invoices(request: BulkDeleteRequest, user: Dict = Depends(require_employee)):
+def api_employee_bulk_delete_invoices(request: BulkDeleteRequest, user: Dict = Depends(require_employee)):
     """Массовое удаление счетов"""
     if not request.ids:
         raise HTTPException(status_code=400, detail="Не выбраны счета")
@@ -7516,7 +5474,7 @@ async def api_employee_bulk_delete_invoices(request: BulkDeleteRequest, user: Di
 
 # --- Удаление курса ---
 @app.delete("/api/admin/education/courses/{course_id}")
-async def admin_delete_course(
+def admin_delete_course(
     course_id: int,
     user: Dict = Depends(require_admin)
 ):
@@ -7564,7 +5522,7 @@ async def admin_delete_course(
 
 
 @app.get("/api/admin/education/courses/{course_id}/access")
-async def get_course_access_list(
+def get_course_access_list(
     course_id: int,
     user: Dict = Depends(require_admin)
 ):
@@ -7598,7 +5556,7 @@ async def get_course_access_list(
 
 # --- Выдать доступ всем партнёрам ---
 @app.post("/api/admin/education/courses/{course_id}/grant-all")
-async def grant_access_to_all_partners(
+def grant_access_to_all_partners(
     course_id: int,
     user: Dict = Depends(require_admin)
 ):
@@ -7637,7 +5595,7 @@ async def grant_access_to_all_partners(
 
 # --- Получить уведомления пользователя ---
 @app.get("/api/notifications")
-async def get_notifications(
+def get_notifications(
     limit: int = 50,
     unread_only: bool = False,
     user: Dict = Depends(get_current_user)
@@ -7685,7 +5643,7 @@ async def get_notifications(
 
 
 @app.put("/api/notifications/{notification_id}/read")
-async def mark_notification_read(
+def mark_notification_read(
     notification_id: int,
     user: Dict = Depends(get_current_user)
 ):
@@ -7702,7 +5660,7 @@ async def mark_notification_read(
 
 
 @app.put("/api/notifications/read-all")
-async def mark_all_notifications_read(user: Dict = Depends(get_current_user)):
+def mark_all_notifications_read(user: Dict = Depends(get_current_user)):
     """Пометить все уведомления как прочитанные"""
     with get_db() as conn:
         cursor = conn.cursor()
@@ -7727,7 +5685,7 @@ async def mark_all_notifications_read(user: Dict = Depends(get_current_user)):
 
 
 @app.delete("/api/notifications/{notification_id}")
-async def delete_notification(
+def delete_notification(
     notification_id: int,
     user: Dict = Depends(get_current_user)
 ):
@@ -7740,7 +5698,7 @@ async def delete_notification(
 
 
 @app.delete("/api/notifications/clear-read")
-async def clear_read_notifications(user: Dict = Depends(get_current_user)):
+def clear_read_notifications(user: Dict = Depends(get_current_user)):
     """Удалить все прочитанные уведомления"""
     with get_db() as conn:
         cursor = conn.cursor()
@@ -7791,189 +5749,23 @@ def notify_all_employees(conn, notif_type, title, message, link=None, icon='bell
 
 @app.get("/api/search")
 async def global_search(q: str, limit: int = 15, user: Dict = Depends(get_current_user)):
-    """Глобальный поиск по клиентам, заявкам, партнёрам, договорам"""
-    if not q or len(q) < 2:
+    """
+    Глобальный поиск по клиентам, заявкам, партнёрам, договорам и КП.
+    Один запрос к FTS5-индексу search_index с ранжированием bm25
+    (слова запроса ищутся как префиксы, регистр не важен).
+    """
+    if not q or len(q.strip()) < 2:
         return {"results": []}
-    
-    results = []
-    
-    # Для кириллицы делаем варианты регистра
-    q_original = q.strip()
-    q_capitalized = q_original.capitalize()
-    q_lower = q_original.lower()
-    q_upper = q_original.upper()
-    
-    search_variants = list(set([
-        f"%{q_original}%",
-        f"%{q_capitalized}%", 
-        f"%{q_lower}%",
-        f"%{q_upper}%"
-    ]))
-    
-    with get_db() as conn:
-        cursor = conn.cursor()
-        
-        # Поиск по клиентам
-        client_conditions = []
-        client_params = []
-        for field in ['company_name', 'contact_name', 'contact_phone', 'inn']:
-            for v in search_variants:
-                client_conditions.append(f"{field} LIKE ?")
-                client_params.append(v)
-        
-        cursor.execute(f'''
-            SELECT id, company_name, contact_name, contact_phone, inn
-            FROM clients
-            WHERE {" OR ".join(client_conditions)}
-            ORDER BY created_at DESC
-            LIMIT ?
-        ''', client_params + [limit])
-        
-        for row in cursor.fetchall():
-            client = dict(row)
-            results.append({
-                "type": "client",
-                "id": client["id"],
-                "title": client["company_name"] or client["contact_name"],
-                "subtitle": f"{client.get('contact_phone', '')} • ИНН: {client.get('inn', '-')}"
-            })
-        
-        # Поиск по заявкам (callbacks)
-        cb_conditions = []
-        cb_params = []
-        for field in ['contact_name', 'contact_phone', 'company_name']:
-            for v in search_variants:
-                cb_conditions.append(f"{field} LIKE ?")
-                cb_params.append(v)
-        
-        cursor.execute(f'''
-            SELECT id, contact_name, contact_phone, company_name
-            FROM callbacks
-            WHERE {" OR ".join(cb_conditions)}
-            ORDER BY created_at DESC
-            LIMIT ?
-        ''', cb_params + [limit])
-        
-        for row in cursor.fetchall():
-            cb = dict(row)
-            results.append({
-                "type": "callback",
-                "id": cb["id"],
-                "title": cb["contact_name"],
-                "subtitle": f"{cb.get('contact_phone', '')} • {cb.get('company_name', '')}"
-            })
-        
-        # Поиск по партнёрам
-        partner_conditions = []
-        partner_params = []
-        for field in ['company_name', 'contact_name', 'contact_phone', 'inn']:
-            for v in search_variants:
-                partner_conditions.append(f"{field} LIKE ?")
-                partner_params.append(v)
-        
-        cursor.execute(f'''
-            SELECT id, company_name, contact_name, contact_phone, inn
-            FROM partners
-            WHERE {" OR ".join(partner_conditions)}
-            ORDER BY created_at DESC
-            LIMIT ?
-        ''', partner_params + [limit])
-        
-        for row in cursor.fetchall():
-            partner = dict(row)
-            results.append({
-                "type": "partner",
-                "id": partner["id"],
-                "title": partner["company_name"] or partner["contact_name"],
-                "subtitle": f"{partner.get('contact_phone', '')} • ИНН: {partner.get('inn', '-')}"
-            })
-        
-        # Поиск по договорам (только по номеру и клиенту)
-        contract_conditions = []
-        contract_params = []
-        for field in ['c.contract_number', 'cl.company_name', 'cl.contact_name']:
-            for v in search_variants:
-                contract_conditions.append(f"{field} LIKE ?")
-                contract_params.append(v)
-        
-        cursor.execute(f'''
-            SELECT c.id, c.contract_number, c.total_amount, cl.company_name as client_name, cl.contact_name
-            FROM contracts c
-            LEFT JOIN clients cl ON cl.id = c.client_id
-            WHERE {" OR ".join(contract_conditions)}
-            ORDER BY c.created_at DESC
-            LIMIT ?
-        ''', contract_params + [limit])
-        
-        for row in cursor.fetchall():
-            contract = dict(row)
-            client_display = contract.get('client_name') or contract.get('contact_name') or ''
-            results.append({
-                "type": "contract",
-                "id": contract["id"],
-                "title": f"Договор {contract.get('contract_number', '')}",
-                "subtitle": client_display
-            })
-        
-        # Поиск по КП (только по номеру и клиенту)
-        quote_conditions = []
-        quote_params = []
-        for field in ['q.quote_number', 'cl.company_name', 'cl.contact_name', 'q.contact_name']:
-            for v in search_variants:
-                quote_conditions.append(f"{field} LIKE ?")
-                quote_params.append(v)
-        
-        cursor.execute(f'''
-            SELECT q.id, q.quote_number, q.total_amount, cl.company_name as client_name, 
-                   COALESCE(cl.contact_name, q.contact_name) as contact
-            FROM quotes q
-            LEFT JOIN clients cl ON cl.id = q.client_id
-            WHERE {" OR ".join(quote_conditions)}
-            ORDER BY q.created_at DESC
-            LIMIT ?
-        ''', quote_params + [limit])
-        
-        for row in cursor.fetchall():
-            quote = dict(row)
-            client_display = quote.get('client_name') or quote.get('contact') or ''
-            results.append({
-                "type": "quote",
-                "id": quote["id"],
-                "title": f"КП {quote.get('quote_number', '')}",
-                "subtitle": client_display
-            })
-    
-    # Убираем дубликаты
-    seen = set()
-    unique_results = []
-    for item in results:
-        key = (item["type"], item["id"])
-        if key not in seen:
-            seen.add(key)
-            unique_results.append(item)
-    
-    # Сортируем по релевантности
-    def relevance_score(item):
-        title_lower = (item.get("title") or "").lower()
-        q_check = q.lower()
-        if title_lower == q_check:
-            return 0
-        if title_lower.startswith(q_check):
-            return 1
-        if q_check in title_lower:
-            return 2
-        return 3
-    
-    unique_results.sort(key=relevance_score)
-    
-    return {"results": unique_results[:limit]}
+
+    limit = max(1, min(limit, 50))
+    return {"results": await AsyncSearchDB.search(q.strip(), limit)}
 
 
 # ======================== СИСТЕМА ЗАДАЧ ДЛЯ МЕНЕДЖЕРОВ ========================
 
 # --- Получить задачи ---
 @app.get("/api/employee/tasks")
-async def get_tasks(
+def get_tasks(
     status: str = None,
     assigned_to: int = None,
     client_id: int = None,
@@ -8046,36 +5838,39 @@ async def create_task(
     if user.get("role") != "superadmin" and int(assigned_to) != user["id"]:
         raise HTTPException(status_code=403, detail="Вы можете назначать задачи только себе")
     
-    with get_db() as conn:
-        cursor = conn.cursor()
+    def save_task():
+        with get_db() as conn:
+            cursor = conn.cursor()
         
-        cursor.execute('''
-            INSERT INTO tasks (title, description, assigned_to, created_by, client_id, priority, due_date)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            title,
-            data.get('description'),
-            assigned_to,
-            user['id'],
-            data.get('client_id'),
-            data.get('priority', 'normal'),
-            data.get('due_date')
-        ))
-        conn.commit()
-        task_id = cursor.lastrowid
+            cursor.execute('''
+                INSERT INTO tasks (title, description, assigned_to, created_by, client_id, priority, due_date)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                title,
+                data.get('description'),
+                assigned_to,
+                user['id'],
+                data.get('client_id'),
+                data.get('priority', 'normal'),
+                data.get('due_date')
+            ))
+            conn.commit()
+            task_id = cursor.lastrowid
         
-        create_notification(
-            conn, 
-            assigned_to, 
-            'employee',
-            'task',
-            'Новая задача',
-            title,
-            f'/employee/tasks?id={task_id}',
-            'file'
-        )
+            create_notification(
+                conn, 
+                assigned_to, 
+                'employee',
+                'task',
+                'Новая задача',
+                title,
+                f'/employee/tasks?id={task_id}',
+                'file'
+            )
         
-        return {"success": True, "task_id": task_id}
+            return {"success": True, "task_id": task_id}
+
+    return await run_db(save_task)
 
 
 # --- Обновить задачу ---
@@ -8088,61 +5883,64 @@ async def update_task(
     """Обновить статус или данные задачи"""
     data = await request.json()
     
-    with get_db() as conn:
-        cursor = conn.cursor()
+    def save_task():
+        with get_db() as conn:
+            cursor = conn.cursor()
         
-        cursor.execute('SELECT * FROM tasks WHERE id = ?', (task_id,))
-        task = cursor.fetchone()
+            cursor.execute('SELECT * FROM tasks WHERE id = ?', (task_id,))
+            task = cursor.fetchone()
         
-        if not task:
-            raise HTTPException(status_code=404, detail="Задача не найдена")
+            if not task:
+                raise HTTPException(status_code=404, detail="Задача не найдена")
         
-        is_superadmin = user.get('role') == 'superadmin'
-        is_assigned = task['assigned_to'] == user['id']
+            is_superadmin = user.get('role') == 'superadmin'
+            is_assigned = task['assigned_to'] == user['id']
         
-        if not is_superadmin and not is_assigned:
-            raise HTTPException(status_code=403, detail="Нет доступа к этой задаче")
+            if not is_superadmin and not is_assigned:
+                raise HTTPException(status_code=403, detail="Нет доступа к этой задаче")
         
-        if not is_superadmin:
-            new_status = data.get('status')
-            if new_status:
-                if new_status == 'completed':
-                    cursor.execute('''
-                        UPDATE tasks SET status = ?, completed_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP
-                        WHERE id = ?
-                    ''', (new_status, task_id))
-                else:
-                    cursor.execute('''
-                        UPDATE tasks SET status = ?, completed_at = NULL, updated_at = CURRENT_TIMESTAMP
-                        WHERE id = ?
-                    ''', (new_status, task_id))
-        else:
-            updates = []
-            params = []
+            if not is_superadmin:
+                new_status = data.get('status')
+                if new_status:
+                    if new_status == 'completed':
+                        cursor.execute('''
+                            UPDATE tasks SET status = ?, completed_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP
+                            WHERE id = ?
+                        ''', (new_status, task_id))
+                    else:
+                        cursor.execute('''
+                            UPDATE tasks SET status = ?, completed_at = NULL, updated_at = CURRENT_TIMESTAMP
+                            WHERE id = ?
+                        ''', (new_status, task_id))
+            else:
+                updates = []
+                params = []
             
-            for field in ['title', 'description', 'assigned_to', 'client_id', 'priority', 'status', 'due_date']:
-                if field in data:
-                    updates.append(f'{field} = ?')
-                    params.append(data[field])
+                for field in ['title', 'description', 'assigned_to', 'client_id', 'priority', 'status', 'due_date']:
+                    if field in data:
+                        updates.append(f'{field} = ?')
+                        params.append(data[field])
             
-            if data.get('status') == 'completed':
-                updates.append('completed_at = CURRENT_TIMESTAMP')
-            elif data.get('status') and data.get('status') != 'completed':
-                updates.append('completed_at = NULL')
+                if data.get('status') == 'completed':
+                    updates.append('completed_at = CURRENT_TIMESTAMP')
+                elif data.get('status') and data.get('status') != 'completed':
+                    updates.append('completed_at = NULL')
             
-            if updates:
-                updates.append('updated_at = CURRENT_TIMESTAMP')
-                params.append(task_id)
-                query = f"UPDATE tasks SET {', '.join(updates)} WHERE id = ?"
-                cursor.execute(query, params)
+                if updates:
+                    updates.append('updated_at = CURRENT_TIMESTAMP')
+                    params.append(task_id)
+                    query = f"UPDATE tasks SET {', '.join(updates)} WHERE id = ?"
+                    cursor.execute(query, params)
         
-        conn.commit()
-        return {"success": True}
+            conn.commit()
+            return {"success": True}
+
+    return await run_db(save_task)
 
 
 # --- Удалить задачу (только superadmin) ---
 @app.delete("/api/employee/tasks/{task_id}")
-async def delete_task(
+def delete_task(
     task_id: int,
     user: Dict = Depends(require_employee)
 ):
@@ -8159,7 +5957,7 @@ async def delete_task(
 
 # --- Получить сотрудников для назначения задач ---
 @app.get("/api/employee/staff-list")
-async def get_staff_list(user: Dict = Depends(require_employee)):
+def get_staff_list(user: Dict = Depends(require_employee)):
     """Получить список сотрудников для выбора исполнителя"""
     with get_db() as conn:
         cursor = conn.cursor()
@@ -8174,22 +5972,10 @@ async def get_staff_list(user: Dict = Depends(require_employee)):
 
 # ======================== CATEGORY REQUIREMENTS API ========================
 
-def get_category_requirements_data():
-    """Load category_requirements.json"""
-    try:
-        path = os.path.join(os.path.dirname(__file__), 'data', 'category_requirements.json')
-        if os.path.exists(path):
-            with open(path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-    except Exception as e:
-        logger.error(f"Failed to load category_requirements.json: {e}")
-    return None
-
-
 @app.get("/api/marking/requirements")
 async def api_all_requirements():
     """Получить требования по всем категориям"""
-    data = get_category_requirements_data()
+    data = get_catalog().category_requirements
     if not data:
         return {"categories": {}, "total": 0}
     
@@ -8202,7 +5988,7 @@ async def api_all_requirements():
 @app.get("/api/marking/requirements/{category_name}")
 async def api_category_requirements(category_name: str):
     """Получить требования по конкретной категории (сроки, исключения, чек-лист)"""
-    data = get_category_requirements_data()
+    data = get_catalog().category_requirements
     if not data:
         raise HTTPException(status_code=404, detail="Requirements data not found")
     
@@ -8230,7 +6016,7 @@ async def api_category_requirements(category_name: str):
 @app.get("/api/marking/deadlines")
 async def api_all_deadlines():
     """Получить все сроки по всем категориям (для сводной таблицы)"""
-    data = get_category_requirements_data()
+    data = get_catalog().category_requirements
     if not data:
         return {"deadlines": []}
     
@@ -8248,7 +6034,7 @@ async def api_all_deadlines():
 @app.get("/api/marking/exceptions")
 async def api_all_exceptions():
     """Получить все исключения по всем категориям"""
-    data = get_category_requirements_data()
+    data = get_catalog().category_requirements
     if not data:
         return {"exceptions": []}
     
@@ -8381,7 +6167,7 @@ def fetch_emails_from_account(account, folder='INBOX', limit=50):
     return emails
 
 @app.get("/api/email/accounts")
-async def get_email_accounts(user: Dict = Depends(require_employee)):
+def get_email_accounts(user: Dict = Depends(require_employee)):
     """Получить список почтовых ящиков с учётом прав доступа"""
     # Superadmin видит все ящики
     if user.get('role') == 'superadmin':
@@ -8401,7 +6187,7 @@ async def get_email_accounts(user: Dict = Depends(require_employee)):
     return {"accounts": []}
 
 @app.get("/api/email/messages")
-async def get_email_messages(
+def get_email_messages(
     account: str = None,
     folder: str = 'INBOX',
     limit: int = 50,
@@ -8662,7 +6448,7 @@ async def get_email_stats(user: Dict = Depends(require_employee)):
 # ==================== EMAIL ACCESS MANAGEMENT ====================
 
 @app.get("/api/email/access")
-async def get_email_access_settings(user: Dict = Depends(require_employee)):
+def get_email_access_settings(user: Dict = Depends(require_employee)):
     """Получить настройки доступа к почте (только для superadmin)"""
     if user.get('role') != 'superadmin':
         raise HTTPException(status_code=403, detail="Доступ запрещён")
@@ -8692,7 +6478,7 @@ async def get_email_access_settings(user: Dict = Depends(require_employee)):
 
 
 @app.post("/api/email/access")
-async def update_email_access(
+def update_email_access(
     data: Dict,
     user: Dict = Depends(require_employee)
 ):
@@ -8721,7 +6507,7 @@ async def update_email_access(
 # ==================== TELEGRAM BOT LEADS ====================
 
 @app.get("/api/admin/telegram-leads")
-async def get_telegram_leads(
+def get_telegram_leads(
     status: str = None,
     client_type: str = None,
     has_phone: bool = None,
@@ -8785,7 +6571,7 @@ async def get_telegram_leads(
 
 
 @app.get("/api/admin/telegram-leads/{lead_id}")
-async def get_telegram_lead(lead_id: int, user: Dict = Depends(require_employee)):
+def get_telegram_lead(lead_id: int, user: Dict = Depends(require_employee)):
     """Получить детали лида"""
     if user.get("role") != "superadmin":
         raise HTTPException(status_code=403, detail="Доступ запрещён")
@@ -8801,7 +6587,7 @@ async def get_telegram_lead(lead_id: int, user: Dict = Depends(require_employee)
 
 
 @app.put("/api/admin/telegram-leads/{lead_id}")
-async def update_telegram_lead(
+def update_telegram_lead(
     lead_id: int,
     data: Dict,
     user: Dict = Depends(require_employee)
@@ -8865,21 +6651,24 @@ async def send_telegram_broadcast(
     if not bot_token:
         raise HTTPException(status_code=500, detail="Токен бота не настроен")
 
-    with get_db() as conn:
-        cursor = conn.cursor()
+    def load_leads():
+        with get_db() as conn:
+            cursor = conn.cursor()
 
-        if lead_ids:
-            # Рассылка по конкретным ID
-            placeholders = ','.join(['?' for _ in lead_ids])
-            cursor.execute(f"SELECT telegram_id FROM telegram_leads WHERE id IN ({placeholders})", lead_ids)
-        elif target == 'subscribed':
-            cursor.execute("SELECT telegram_id FROM telegram_leads WHERE subscribed = 1")
-        elif target == 'with_phone':
-            cursor.execute("SELECT telegram_id FROM telegram_leads WHERE phone IS NOT NULL AND phone != ''")
-        else:
-            cursor.execute("SELECT telegram_id FROM telegram_leads")
+            if lead_ids:
+                # Рассылка по конкретным ID
+                placeholders = ','.join(['?' for _ in lead_ids])
+                cursor.execute(f"SELECT telegram_id FROM telegram_leads WHERE id IN ({placeholders})", lead_ids)
+            elif target == 'subscribed':
+                cursor.execute("SELECT telegram_id FROM telegram_leads WHERE subscribed = 1")
+            elif target == 'with_phone':
+                cursor.execute("SELECT telegram_id FROM telegram_leads WHERE phone IS NOT NULL AND phone != ''")
+            else:
+                cursor.execute("SELECT telegram_id FROM telegram_leads")
 
-        leads = cursor.fetchall()
+            return cursor.fetchall()
+
+    leads = await run_db(load_leads)
 
     sent = 0
     failed = 0
@@ -8911,67 +6700,11 @@ async def send_telegram_broadcast(
     }
 
 
-@app.get("/api/admin/telegram-stats")
-async def get_telegram_stats(user: Dict = Depends(require_employee)):
-    """Статистика по боту"""
-    if user.get("role") != "superadmin":
-        raise HTTPException(status_code=403, detail="Доступ запрещён")
-    with get_db() as conn:
-        cursor = conn.cursor()
-
-        # Общая статистика
-        cursor.execute("""
-            SELECT
-                COUNT(*) as total,
-                SUM(CASE WHEN subscribed = 1 THEN 1 ELSE 0 END) as subscribed,
-                SUM(CASE WHEN phone IS NOT NULL AND phone != '' THEN 1 ELSE 0 END) as with_phone,
-                SUM(CASE WHEN date(created_at) = date('now') THEN 1 ELSE 0 END) as today,
-                SUM(CASE WHEN date(created_at) >= date('now', '-7 days') THEN 1 ELSE 0 END) as week,
-                SUM(queries_count) as total_queries
-            FROM telegram_leads
-        """)
-        stats = dict(cursor.fetchone())
-
-        # По статусам
-        cursor.execute("""
-            SELECT status, COUNT(*) as count
-            FROM telegram_leads
-            GROUP BY status
-        """)
-        by_status = {row['status']: row['count'] for row in cursor.fetchall()}
-
-        # По типам клиентов
-        cursor.execute("""
-            SELECT client_type, COUNT(*) as count
-            FROM telegram_leads
-            WHERE client_type IS NOT NULL
-            GROUP BY client_type
-        """)
-        by_client_type = {row['client_type']: row['count'] for row in cursor.fetchall()}
-
-        # Топ категорий
-        cursor.execute("SELECT interested_categories FROM telegram_leads WHERE interested_categories IS NOT NULL")
-        categories = {}
-        for row in cursor.fetchall():
-            try:
-                cats = json.loads(row['interested_categories'])
-                for cat in cats:
-                    categories[cat] = categories.get(cat, 0) + 1
-            except:
-                pass
-
-        top_categories = sorted(categories.items(), key=lambda x: x[1], reverse=True)[:10]
-
-    return {
-        "stats": stats,
-        "by_status": by_status,
-        "by_client_type": by_client_type,
-        "top_categories": top_categories
-    }
+# GET /api/admin/telegram-stats: routes/admin.py (топ категорий из telegram_lead_categories)
 
 
 @app.delete("/api/admin/telegram-leads/{lead_id}")
-async def delete_telegram_lead(lead_id: int, user: Dict = Depends(require_employee)):
+def delete_telegram_lead(lead_id: int, user: Dict = Depends(require_employee)):
     """Удалить лида из Telegram бота"""
     if user.get("role") != "superadmin":
         raise HTTPException(status_code=403, detail="Доступ запрещён")
@@ -8990,7 +6723,7 @@ class CommissionUpdateRequest(BaseModel):
     reason: Optional[str] = None
 
 @app.put("/api/employee/partners/{partner_id}/commission")
-async def update_partner_commission(
+def update_partner_commission(
     partner_id: int, 
     data: CommissionUpdateRequest, 
     background_tasks: BackgroundTasks,
@@ -9059,50 +6792,8 @@ class InvoiceUpdateRequest(BaseModel):
     status: str  # created, sent, paid, cancelled
 
 
-def get_next_invoice_number(contract_number: str = None, contract_id: int = None) -> str:
-    """Генерирует следующий номер счёта в формате СЧ-{номер_договора}/{порядковый}"""
-    
-    if contract_number:
-        # Убираем префикс DOG- если есть
-        base_number = contract_number.replace('DOG-', '').replace('dog-', '')
-        
-        with get_db() as conn:
-            cursor = conn.cursor()
-            # Считаем сколько счетов уже есть по этому договору
-            if contract_id:
-                cursor.execute(
-                    "SELECT COUNT(*) FROM invoices WHERE contract_id = ?",
-                    (contract_id,)
-                )
-            else:
-                cursor.execute(
-                    "SELECT COUNT(*) FROM invoices WHERE invoice_number LIKE ?",
-                    (f"СЧ-{base_number}/%",)
-                )
-            row = cursor.fetchone()
-            next_num = (row[0] or 0) + 1
-        
-        return f"СЧ-{base_number}/{next_num}"
-    else:
-        # Fallback - старый формат если нет contract_number
-        from datetime import datetime
-        today = datetime.now()
-        date_prefix = today.strftime("%y%m%d")
-        
-        with get_db() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT MAX(CAST(SUBSTR(invoice_number, -4) AS INTEGER)) FROM invoices WHERE invoice_number LIKE ?",
-                (f"СЧ-{date_prefix}-%",)
-            )
-            row = cursor.fetchone()
-            next_num = (row[0] or 0) + 1
-        
-        return f"СЧ-{date_prefix}-{next_num:04d}"
-
-
 @app.post("/api/employee/invoices")
-async def create_invoice(
+def create_invoice(
     request: InvoiceCreateRequest,
     user: Dict = Depends(require_employee)
 ):
@@ -9162,7 +6853,7 @@ async def create_invoice(
 
 
 @app.get("/api/employee/invoices")
-async def get_invoices(
+def get_invoices(
     contract_id: Optional[int] = None,
     status: Optional[str] = None,
     user: Dict = Depends(require_employee)
@@ -9210,7 +6901,7 @@ async def get_invoices(
 
 
 @app.get("/api/employee/contracts/{contract_id}/invoices")
-async def get_contract_invoices(
+def get_contract_invoices(
     contract_id: int,
     user: Dict = Depends(require_employee)
 ):
@@ -9271,7 +6962,7 @@ async def get_contract_invoices(
 
 
 @app.put("/api/employee/invoices/{invoice_id}/status")
-async def update_invoice_status(
+def update_invoice_status(
     invoice_id: int,
     request: InvoiceUpdateRequest,
     user: Dict = Depends(require_employee)
@@ -9341,7 +7032,7 @@ async def update_invoice_status(
 
 
 @app.delete("/api/employee/invoices/{invoice_id}")
-async def delete_invoice(
+def delete_invoice(
     invoice_id: int,
     user: Dict = Depends(require_employee)
 ):
@@ -9370,7 +7061,7 @@ async def delete_invoice(
 # ==================== Invoice PDF & Email ====================
 
 @app.get("/api/invoices/{invoice_id}/pdf")
-async def get_invoice_pdf(
+def get_invoice_pdf(
     invoice_id: int,
     user: Dict = Depends(require_employee)
 ):
@@ -9443,7 +7134,7 @@ class InvoiceEmailRequest(BaseModel):
 
 
 @app.post("/api/invoices/{invoice_id}/send-email")
-async def send_invoice_email(
+def send_invoice_email(
     invoice_id: int,
     request: InvoiceEmailRequest,
     background_tasks: BackgroundTasks,
@@ -9530,7 +7221,7 @@ class EmployeeInvoiceFullRequest(BaseModel):
 
 
 @app.post("/api/employee/clients/{client_id}/invoice/full")
-async def api_employee_create_client_invoice_full(
+def api_employee_create_client_invoice_full(
     client_id: int,
     request: EmployeeInvoiceFullRequest,
     user: Dict = Depends(require_employee)
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+Кэш ответов статистики (дашборды админки, сотрудников, суперадмина и партнёров)
+Открытые вкладки периодически опрашивают /stats-эндпоинты; без кэша каждый опрос
+заново считает одни и те же агрегаты. Ответ хранится STATS_CACHE_TTL секунд по
+ключу (эндпоинт, роль или пользователь, параметры), а одновременные запросы с
+одним ключом ждут одно вычисление (single-flight).
+
+Записи через CallbackDB, QuoteDB и ContractDB (декоратор invalidates_stats)
+сбрасывают кэш, поэтому после изменения данных статистика сразу пересчитывается.
+Остальные изменения видны не позже чем через STATS_CACHE_TTL. Кэш свой у
+каждого процесса.
+"""
+
+import asyncio
+import functools
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+from db_async import run_db
+
+# Сколько секунд отдавать посчитанную статистику без пересчёта
+STATS_CACHE_TTL = float(os.getenv('STATS_CACHE_TTL', '15'))
+# Сколько ключей хранить, прежде чем чистить просроченные
+STATS_CACHE_MAX_KEYS = 256
+
+_lock = threading.Lock()
+# Номер версии данных: растёт при каждой инвалидации
+_generation = 0
+# ключ -> (время истечения, ответ)
+_entries: Dict[Hashable, Tuple[float, Any]] = {}
+# (ключ, версия) -> вычисление, которое ждут запросы (только из event loop)
+_inflight: Dict[Tuple[Hashable, int], 'asyncio.Future'] = {}
+
+
+def invalidate_stats():
+    """Сбросить кэш статистики. Можно вызывать из любого потока"""
+    global _generation
+    with _lock:
+        _generation += 1
+        _entries.clear()
+
+
+def invalidates_stats(func: Callable) -> Callable:
+    """Декоратор метода записи: после успешного выполнения (и коммита) сбрасывает кэш статистики"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        result = func(*args, **kwargs)
+        invalidate_stats()
+        return result
+    return wrapper
+
+
+async def cached_stats(key: Hashable, compute: Callable[[], Any]) -> Any:
+    """
+    Ответ статистики по ключу из кэша или результат compute().
+    compute - синхронная функция, она выполняется в пуле потоков БД.
+    Исключения (в том числе HTTPException) не кэшируются и достаются всем ожидающим.
+    Ответ общий для всех запросов с этим ключом - изменять его нельзя.
+    """
+    with _lock:
+        generation = _generation
+        entry = _entries.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+
+    flight_key = (key, generation)
+    future = _inflight.get(flight_key)
+    if future is None:
+        future = asyncio.ensure_future(_compute(key, generation, compute))
+        _inflight[flight_key] = future
+    # shield: отмена одного запроса не отменяет вычисление для остальных
+    return await asyncio.shield(future)
+
+
+async def _compute(key: Hashable, generation: int, compute: Callable[[], Any]) -> Any:
+    try:
+        value = await run_db(compute)
+    finally:
+        _inflight.pop((key, generation), None)
+
+    with _lock:
+        # Данные изменились, пока шло вычисление - результат не кэшируем
+        if generation == _generation:
+            now = time.monotonic()
+            if len(_entries) >= STATS_CACHE_MAX_KEYS:
+                for stale_key in [k for k, (expires, _) in _entries.items() if expires <= now]:
+                    del _entries[stale_key]
+                if len(_entries) >= STATS_CACHE_MAX_KEYS:
+                    _entries.clear()
+            _entries[key] = (now + STATS_CACHE_TTL, value)
+    return value
@@ -10,7 +10,6 @@ import logging
 import os
 import re
 import hashlib
-import sqlite3
 from typing import Optional, Dict
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, KeyboardButton, ReplyKeyboardMarkup, ReplyKeyboardRemove
 from telegram.ext import (
@@ -24,6 +23,11 @@ from telegram.ext import (
 )
 from dotenv import load_dotenv
 
+from catalog import get_catalog, start_catalog_reloader
+from db_pool import PooledConnection, get_pool
+from normalize import normalize_phone
+import partner_ledger
+
 load_dotenv()
 
 logging.basicConfig(
@@ -33,14 +37,9 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
-TNVED_MARKING_PATH = os.path.join(DATA_DIR, 'tnved_marking.json')
-CATEGORY_REQUIREMENTS_PATH = os.path.join(DATA_DIR, 'category_requirements.json')
-TIMELINE_PATH = os.path.join(DATA_DIR, 'marking_timeline.json')
 DB_PATH = os.path.join(DATA_DIR, 'promarkirui.db')
 
-tnved_marking: Dict = {}
-category_requirements: Dict = {}
-marking_timeline: Dict = {}
+# Справочники (tnved_marking, category_requirements, marking_timeline) - в catalog.py
 category_id_map: Dict = {}
 
 # States для ConversationHandler
@@ -249,9 +248,8 @@ PRODUCT_KEYWORDS = {
 # ==================== DATABASE ====================
 
 def get_db():
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+    # conn.close() возвращает соединение в общий пул
+    return PooledConnection(get_pool(DB_PATH))
 
 
 def save_lead(telegram_id: int, username: str, first_name: str, last_name: str, phone: str = None, client_type: str = None):
@@ -304,7 +302,7 @@ def update_lead_query(telegram_id: int, query: str, category: str = None):
         conn = get_db()
         cursor = conn.cursor()
 
-        cursor.execute("SELECT interested_categories FROM telegram_leads WHERE telegram_id = ?", (telegram_id,))
+        cursor.execute("SELECT id, interested_categories FROM telegram_leads WHERE telegram_id = ?", (telegram_id,))
         row = cursor.fetchone()
 
         if row:
@@ -327,6 +325,13 @@ def update_lead_query(telegram_id: int, query: str, category: str = None):
                 WHERE telegram_id = ?
             """, (query, json.dumps(categories, ensure_ascii=False), telegram_id))
 
+            # Категории отдельными строками - для топа категорий в статистике
+            if category:
+                cursor.execute(
+                    "INSERT OR IGNORE INTO telegram_lead_categories (category, lead_id) VALUES (?, ?)",
+                    (category, row['id'])
+                )
+
             conn.commit()
         conn.close()
     except Exception as e:
@@ -360,21 +365,6 @@ def check_lead_has_type(telegram_id: int) -> bool:
 
 BOT_USERNAME = "promarkirui_bot"  # Имя бота для ссылок
 
-def normalize_phone(phone: str) -> str:
-    """Нормализация телефона: +79274521553"""
-    if not phone:
-        return ""
-    # Убираем всё кроме цифр
-    digits = re.sub(r'\D', '', phone)
-    # Если начинается с 8, меняем на 7
-    if digits.startswith('8') and len(digits) == 11:
-        digits = '7' + digits[1:]
-    # Добавляем + если нужно
-    if not digits.startswith('+'):
-        digits = '+' + digits
-    return digits
-
-
 def get_partner_by_telegram_id(telegram_id: int) -> Optional[Dict]:
     """Получить партнёра по telegram_id"""
     try:
@@ -400,17 +390,18 @@ def get_partner_by_phone(phone: str) -> Optional[Dict]:
     """Получить партнёра по телефону"""
     try:
         normalized = normalize_phone(phone)
+        if not normalized:
+            return None
         conn = get_db()
         cursor = conn.cursor()
-        # Ищем по нормализованному телефону (убираем + для сравнения)
+        # Ищем по нормализованному телефону (индекс по phone_e164)
         cursor.execute('''
             SELECT id, ref_code, contact_name, company_name, contact_phone, 
                    contact_email, commission_rate, status, telegram_id, created_at
             FROM partners 
-            WHERE REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(contact_phone, '+', ''), '-', ''), ' ', ''), '(', ''), ')', '') 
-                  LIKE '%' || ? || '%'
+            WHERE phone_e164 = ?
               AND status = 'active'
-        ''', (normalized.replace('+', '')[-10:],))  # Последние 10 цифр
+        ''', (normalized,))
         row = cursor.fetchone()
         conn.close()
         if row:
@@ -510,23 +501,19 @@ def save_lead_with_ref(telegram_id: int, username: str, first_name: str,
 
 def get_partner_stats(partner_id: int = None, ref_code: str = None) -> Dict:
     """Получить статистику партнёра (telegram + сайт)"""
+    empty = {'referrals_count': 0, 'referrals_with_phone': 0, 'earned': 0, 'quotes_count': 0}
     try:
         conn = get_db()
         cursor = conn.cursor()
         
-        if not ref_code and partner_id:
-            cursor.execute("SELECT ref_code, commission_rate FROM partners WHERE id = ?", (partner_id,))
-            row = cursor.fetchone()
-            ref_code = row['ref_code'] if row else None
-            commission_rate = row['commission_rate'] if row else 10.0
+        if partner_id:
+            cursor.execute("SELECT id, ref_code FROM partners WHERE id = ?", (partner_id,))
         else:
-            cursor.execute("SELECT commission_rate FROM partners WHERE ref_code = ?", (ref_code.upper() if ref_code else '',))
-            row = cursor.fetchone()
-            commission_rate = row['commission_rate'] if row else 10.0
-        
-        if not ref_code:
+            cursor.execute("SELECT id, ref_code FROM partners WHERE ref_code = ?", (ref_code.upper() if ref_code else '',))
+        partner = cursor.fetchone()
+        if not partner or not partner['ref_code']:
             conn.close()
-            return {'referrals_count': 0, 'referrals_with_phone': 0, 'earned': 0, 'quotes_count': 0}
+            return empty
         
         # Считаем рефералов из Telegram
         cursor.execute('''
@@ -535,70 +522,47 @@ def get_partner_stats(partner_id: int = None, ref_code: str = None) -> Dict:
                 SUM(CASE WHEN phone IS NOT NULL AND phone != '' THEN 1 ELSE 0 END) as with_phone
             FROM telegram_leads
             WHERE ref_code = ?
-        ''', (ref_code.upper(),))
+        ''', (partner['ref_code'].upper(),))
         tg_row = cursor.fetchone()
         tg_referrals = tg_row['total'] if tg_row else 0
         tg_with_phone = tg_row['with_phone'] if tg_row else 0
         
-        # Считаем заявки с сайта (КП)
-        cursor.execute('''
-            SELECT 
-                COUNT(*) as quotes_count,
-                COALESCE(SUM(total_amount), 0) as quotes_amount
-            FROM quotes
-            WHERE ref_code = ?
-        ''', (ref_code.upper(),))
-        site_row = cursor.fetchone()
-        quotes_count = site_row['quotes_count'] if site_row else 0
-        quotes_amount = site_row['quotes_amount'] if site_row else 0
-        
-        # Считаем комиссию с оплаченных договоров
-        cursor.execute('''
-            SELECT COALESCE(SUM(c.total_amount), 0) as paid_amount
-            FROM contracts c
-            JOIN quotes q ON c.quote_id = q.id
-            WHERE q.ref_code = ? AND c.status IN ('signed', 'active', 'completed')
-        ''', (ref_code.upper(),))
-        paid_row = cursor.fetchone()
-        paid_amount = paid_row['paid_amount'] if paid_row else 0
-        earned = paid_amount * commission_rate / 100
-        
+        # Заявки с сайта (КП) и комиссия с оплаченных договоров - из журнала партнёра
+        totals = partner_ledger.get_totals(conn, partner['id'])
         conn.close()
+        if not totals:
+            return empty
         
         return {
-            'referrals_count': tg_referrals + quotes_count,  # Всего рефералов
+            'referrals_count': tg_referrals + totals['total_leads'],  # Всего рефералов
             'referrals_with_phone': tg_with_phone,
-            'quotes_count': quotes_count,  # Заявок с сайта
-            'quotes_amount': quotes_amount,
-            'earned': earned,
-            'commission_rate': commission_rate
+            'quotes_count': totals['total_leads'],  # Заявок с сайта
+            'quotes_amount': totals['quotes_amount'],
+            'earned': totals['commission_earned'],
+            'commission_rate': totals['commission_rate']
         }
     except Exception as e:
         logger.error(f"Error getting partner stats: {e}")
-        return {'referrals_count': 0, 'referrals_with_phone': 0, 'earned': 0, 'quotes_count': 0}
+        return empty
 
-def get_partner_referrals(ref_code: str, limit: int = 10) -> list:
-    """Получить список рефералов партнёра"""
+def get_partner_referrals(partner_id: int, limit: int = 10) -> list:
+    """Получить список рефералов партнёра (КП из журнала партнёра)"""
     try:
         conn = get_db()
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT 
-                q.contact_name as first_name,
-                q.quote_number,
-                q.created_at,
-                q.contact_phone as phone,
-                q.total_amount,
-                q.status,
-                CASE WHEN q.contact_phone IS NOT NULL AND q.contact_phone != "" THEN 1 ELSE 0 END as has_phone
-            FROM quotes q
-            WHERE q.ref_code = ?
-            ORDER BY q.created_at DESC
-            LIMIT ?
-        """, (ref_code, limit))
-        rows = cursor.fetchall()
+        leads = partner_ledger.get_leads(conn, partner_id, limit)
         conn.close()
-        return [dict(row) for row in rows]
+        return [
+            {
+                'first_name': lead['contact_name'],
+                'quote_number': lead['quote_number'],
+                'created_at': lead['created_at'],
+                'phone': lead['contact_phone'],
+                'total_amount': lead['total_amount'],
+                'status': lead['quote_status'],
+                'has_phone': 1 if lead['contact_phone'] else 0,
+            }
+            for lead in leads
+        ]
     except Exception as e:
         logger.error(f"Error getting partner referrals: {e}")
         return []
@@ -618,30 +582,14 @@ def get_category_by_id(cat_id: str) -> Optional[str]:
 
 
 def load_data():
-    global tnved_marking, category_requirements, marking_timeline
-
-    try:
-        with open(TNVED_MARKING_PATH, 'r', encoding='utf-8') as f:
-            tnved_marking = json.load(f)
-        logger.info(f"Загружено {len(tnved_marking)} кодов ТНВЭД")
-    except Exception as e:
-        logger.error(f"Ошибка загрузки tnved_marking.json: {e}")
+    """Загрузить общий каталог и зарегистрировать короткие id категорий"""
+    catalog = get_catalog()
+    logger.info(f"Загружено {len(catalog.tnved_marking)} кодов ТНВЭД")
 
-    try:
-        with open(CATEGORY_REQUIREMENTS_PATH, 'r', encoding='utf-8') as f:
-            category_requirements = json.load(f)
-        for cat_name in category_requirements.keys():
-            get_category_id(cat_name)
-    except Exception as e:
-        logger.error(f"Ошибка загрузки category_requirements.json: {e}")
-
-    try:
-        with open(TIMELINE_PATH, 'r', encoding='utf-8') as f:
-            marking_timeline = json.load(f)
-        for cat_name in marking_timeline.get('categories', {}).keys():
-            get_category_id(cat_name)
-    except Exception as e:
-        logger.error(f"Ошибка загрузки marking_timeline.json: {e}")
+    for cat_name in catalog.category_requirements.keys():
+        get_category_id(cat_name)
+    for cat_name in catalog.timeline_categories.keys():
+        get_category_id(cat_name)
 
 
 # ==================== SEARCH FUNCTIONS ====================
@@ -661,7 +609,7 @@ def find_by_keyword(text: str) -> Optional[Dict]:
             return data
 
     results = []
-    for code, entries in tnved_marking.items():
+    for code, entries in get_catalog().tnved_marking.items():
         for entry in entries:
             product = entry.get('product', '').lower()
             subcategory = entry.get('subcategory', '').lower()
@@ -681,46 +629,21 @@ def find_by_keyword(text: str) -> Optional[Dict]:
 
 
 def find_marking_info(code: str) -> Optional[Dict]:
-    code = normalize_code(code)
-
-    if code in tnved_marking:
-        return {'code': code, 'entries': tnved_marking[code], 'match_type': 'exact'}
-
-    for length in range(len(code) - 1, 3, -1):
-        prefix = code[:length]
-        if prefix in tnved_marking:
-            return {'code': code, 'matched_prefix': prefix, 'entries': tnved_marking[prefix], 'match_type': 'prefix'}
-
-    return None
+    return get_catalog().find_marking_info(normalize_code(code))
 
 
 def get_category_details(subcategory: str) -> Optional[Dict]:
-    subcategory_lower = subcategory.lower().strip()
-
-    for cat_name, cat_data in category_requirements.items():
-        if cat_name.lower() == subcategory_lower:
-            return {'category': cat_name, 'data': cat_data}
-
-    for cat_name, cat_data in category_requirements.items():
-        if subcategory_lower in cat_name.lower() or cat_name.lower() in subcategory_lower:
-            return {'category': cat_name, 'data': cat_data}
-
-    return None
+    match = get_catalog().find_category_requirements(subcategory)
+    if not match:
+        return None
+    return {'category': match[0], 'data': match[1]}
 
 
 def get_timeline_for_category(category: str) -> Optional[Dict]:
-    category_lower = category.lower().strip()
-    categories = marking_timeline.get('categories', {})
-
-    for cat_name, cat_data in categories.items():
-        if cat_name.lower() == category_lower:
-            return {'category': cat_name, 'data': cat_data}
-
-    for cat_name, cat_data in categories.items():
-        if category_lower in cat_name.lower() or cat_name.lower() in category_lower:
-            return {'category': cat_name, 'data': cat_data}
-
-    return None
+    match = get_catalog().find_timeline_category(category)
+    if not match:
+        return None
+    return {'category': match[0], 'data': match[1]}
 
 
 # ==================== FORMATTERS ====================
@@ -814,6 +737,7 @@ def format_keyword_result(keyword_data: Dict, search_text: str) -> str:
         result += f"📦 Категория: {category}\n\n"
         result += "🔢 Коды ТНВЭД:\n"
 
+        tnved_marking = get_catalog().tnved_marking
         for code in codes[:4]:
             if code in tnved_marking:
                 entry = tnved_marking[code][0]
@@ -1387,7 +1311,7 @@ async def fines_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
 async def categories_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     text = "📚 КАТЕГОРИИ МАРКИРОВКИ\n"
     text += "━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
-    for i, (cat_name, cat_data) in enumerate(category_requirements.items(), 1):
+    for i, (cat_name, cat_data) in enumerate(get_catalog().category_requirements.items(), 1):
         decree = cat_data.get('decree', {})
         text += f"{i}. {cat_name}\n   📋 ПП РФ № {decree.get('number', '?')}\n\n"
     text += "━━━━━━━━━━━━━━━━━━━━━━━━━━"
@@ -1512,7 +1436,7 @@ async def show_partner_cabinet(query, partner):
     name = partner.get('contact_name', 'Партнёр')
     
     # Получаем статистику
-    stats = get_partner_stats(ref_code=ref_code)
+    stats = get_partner_stats(partner_id=partner['id'])
     
     earned = stats.get('earned', 0)
     earned_str = f"{earned:,.0f}".replace(',', ' ') if earned else "0"
@@ -1544,7 +1468,7 @@ async def show_partner_cabinet(query, partner):
 async def show_partner_referrals(query, partner):
     """Показать список рефералов партнёра"""
     ref_code = partner['ref_code']
-    referrals = get_partner_referrals(ref_code, limit=10)
+    referrals = get_partner_referrals(partner['id'], limit=10)
     
     if not referrals:
         text = (
@@ -1743,7 +1667,7 @@ async def callback_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
         text += "━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
 
         buttons = []
-        for cat_name in category_requirements.keys():
+        for cat_name in get_catalog().category_requirements.keys():
             cat_id = get_category_id(cat_name)
             # Сокращаем длинные названия
             short_name = cat_name if len(cat_name) <= 25 else cat_name[:22] + "..."
@@ -1806,6 +1730,7 @@ async def callback_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
 def main():
     """Запуск бота"""
     load_data()
+    start_catalog_reloader()
 
     token = os.getenv("TELEGRAM_BOT_TOKEN")
     if not token:
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""
+Массовая проверка кодов ТН ВЭД из CSV/XLSX файлов
+Файл читается построчно, каждая строка дополняется результатом проверки
+и сразу отдаётся в выходной CSV, поэтому память не зависит от размера файла.
+"""
+
+import csv
+import io
+import re
+from typing import IO, Iterator, List, Optional
+
+from tnved_parser import format_code
+
+# Максимум строк в одном файле
+MAX_ROWS = 200_000
+# Сколько строк копить перед отдачей очередного куска ответа
+CHUNK_ROWS = 500
+# Объём начала CSV файла для определения кодировки и разделителя
+SNIFF_BYTES = 64 * 1024
+
+# Заголовки колонки с кодом (сравнение по вхождению, в нижнем регистре)
+CODE_HEADER_HINTS = ('тн вэд', 'тнвэд', 'тн-вэд', 'tnved', 'hs code', 'код')
+
+RESULT_HEADERS = ['Код ТН ВЭД', 'Маркировка', 'Совпадение', 'Группа', 'Подкатегория', 'Товар']
+
+_CODE_VALUE_RE = re.compile(r'^\s*\d{4}[\d\s.]*$')
+
+
+class _SemicolonDialect(csv.excel):
+    """CSV из русского Excel по умолчанию"""
+    delimiter = ';'
+
+
+def iter_csv_rows(fileobj: IO[bytes]) -> Iterator[List[str]]:
+    """Построчное чтение CSV (UTF-8 или Windows-1251, разделитель ; , или TAB)"""
+    sample = fileobj.read(SNIFF_BYTES)
+    fileobj.seek(0)
+
+    encoding = 'utf-8-sig'
+    try:
+        sample.decode(encoding)
+    except UnicodeDecodeError as e:
+        # Обрезанный на границе выборки многобайтовый символ - не повод менять кодировку
+        if e.start < len(sample) - 4:
+            encoding = 'cp1251'
+
+    text_sample = sample.decode(encoding, errors='ignore')
+    try:
+        dialect = csv.Sniffer().sniff(text_sample, delimiters=';,\t')
+    except csv.Error:
+        dialect = _SemicolonDialect
+
+    text = io.TextIOWrapper(fileobj, encoding=encoding, errors='replace', newline='')
+    try:
+        yield from csv.reader(text, dialect)
+    finally:
+        text.detach()
+
+
+def iter_xlsx_rows(fileobj: IO[bytes]) -> Iterator[List[str]]:
+    """Построчное чтение первого листа XLSX (режим read_only)"""
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ValueError("Чтение XLSX недоступно: не установлен openpyxl")
+
+    workbook = load_workbook(fileobj, read_only=True, data_only=True)
+    try:
+        sheet = workbook.worksheets[0]
+        for row in sheet.iter_rows(values_only=True):
+            yield ['' if value is None else _cell_to_str(value) for value in row]
+    finally:
+        workbook.close()
+
+
+def _cell_to_str(value) -> str:
+    # Excel хранит коды как числа: 6403999300.0 -> "6403999300"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def detect_code_column(header: List[str], first_row: Optional[List[str]] = None) -> Optional[int]:
+    """Номер колонки с кодом ТН ВЭД: по заголовку, иначе по значению первой строки"""
+    lowered = [cell.strip().lower() for cell in header]
+    for hint in CODE_HEADER_HINTS:
+        for idx, cell in enumerate(lowered):
+            if hint in cell:
+                return idx
+
+    for row in (header, first_row or []):
+        for idx, cell in enumerate(row):
+            if _CODE_VALUE_RE.match(cell or ''):
+                return idx
+    return None
+
+
+def annotate_row(catalog, raw_code: str) -> List[str]:
+    """Колонки результата для одного кода"""
+    digits = re.sub(r'\D', '', raw_code or '')
+    if len(digits) < 4:
+        return ['', 'Нет кода', '', '', '', '']
+
+    info = catalog.find_marking_info(digits)
+    if not info:
+        return [format_code(digits), 'Не подлежит', '', '', '', '']
+
+    entry = info['entries'][0] if info['entries'] else {}
+    if info['match_type'] == 'exact':
+        match = 'Точное'
+    else:
+        match = f"По группе {format_code(info['matched_prefix'])}"
+    return [
+        format_code(digits),
+        'Подлежит маркировке',
+        match,
+        entry.get('group', ''),
+        entry.get('subcategory', ''),
+        entry.get('product', ''),
+    ]
+
+
+def annotate_rows(rows: Iterator[List[str]], catalog, code_column: Optional[int] = None) -> Iterator[List[str]]:
+    """
+    Дополнить строки результатами проверки.
+    Колонка с кодом определяется сразу (ValueError, если её нет),
+    сами строки обрабатываются лениво по мере чтения результата.
+    Первая строка считается заголовком, если в ней нет кода ТН ВЭД.
+    """
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        raise ValueError("Файл пуст")
+
+    second = next(rows, None)
+    if code_column is None:
+        code_column = detect_code_column(first, second)
+    if code_column is None:
+        raise ValueError("Не найдена колонка с кодом ТН ВЭД")
+
+    has_header = not _CODE_VALUE_RE.match(first[code_column] if code_column < len(first) else '')
+    head = [first] if second is None else [first, second]
+    return _annotate(head, rows, catalog, code_column, has_header)
+
+
+def _annotate(head: List[List[str]], tail: Iterator[List[str]], catalog,
+              code_column: int, has_header: bool) -> Iterator[List[str]]:
+    count = 0
+    for idx, row in enumerate(_chain(head, tail)):
+        if idx == 0 and has_header:
+            yield row + RESULT_HEADERS
+            continue
+        count += 1
+        if count > MAX_ROWS:
+            yield [f"Обработка остановлена: файл содержит больше {MAX_ROWS} строк"]
+            return
+        code = row[code_column] if code_column < len(row) else ''
+        yield row + annotate_row(catalog, code)
+
+
+def _chain(head: List[List[str]], tail: Iterator[List[str]]) -> Iterator[List[str]]:
+    yield from head
+    yield from tail
+
+
+def iter_csv_chunks(rows: Iterator[List[str]]) -> Iterator[bytes]:
+    """Сериализация строк в CSV для Excel (UTF-8 с BOM, разделитель ;) кусками"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter=';')
+    buffer.write('\ufeff')
+
+    pending = 0
+    for row in rows:
+        writer.writerow(row)
+        pending += 1
+        if pending >= CHUNK_ROWS:
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+
+    if buffer.tell():
+        yield buffer.getvalue().encode('utf-8')
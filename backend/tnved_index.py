@@ -0,0 +1,341 @@
+# -*- coding: utf-8 -*-
+"""
+Индексы для быстрого поиска по справочнику ТН ВЭД
+Префиксное дерево по цифровым кодам (точный, префиксный и longest-prefix поиск)
+Инвертированный индекс по названиям (токенизация, лёгкий стемминг, BM25)
+Словарь категорий по нормализованным названиям, id и синонимам с нечётким поиском по триграммам
+"""
+
+import heapq
+import math
+import re
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+_NON_DIGITS_RE = re.compile(r'\D+')
+_TOKEN_RE = re.compile(r'[0-9a-zа-я]+')
+_NON_WORD_RE = re.compile(r'[^0-9a-zа-я]+')
+
+# Окончания для лёгкого стемминга (от длинных к коротким)
+_RU_ENDINGS = sorted([
+    'иями', 'ями', 'ами', 'ого', 'его', 'ому', 'ему', 'ыми', 'ими', 'ых', 'их',
+    'ей', 'ой', 'ий', 'ый', 'ая', 'яя', 'ое', 'ее', 'ые', 'ие', 'ую', 'юю',
+    'ов', 'ев', 'ам', 'ям', 'ах', 'ях', 'ом', 'ем',
+    'а', 'я', 'о', 'е', 'ы', 'и', 'у', 'ю', 'ь', 'й',
+], key=len, reverse=True)
+_MIN_STEM_LENGTH = 3
+
+
+def normalize_tnved_code(code: str) -> str:
+    """Нормализовать код ТН ВЭД: оставить только цифры ("2203 00 31" -> "22030031")"""
+    if not code:
+        return ''
+    return _NON_DIGITS_RE.sub('', str(code))
+
+
+class CodeTrie:
+    """
+    Компактное префиксное дерево по нормализованным кодам ТН ВЭД.
+
+    Коды хранятся в отсортированном массиве, а каждый узел дерева знает
+    диапазон [lo, hi) своих кодов в этом массиве. Поэтому любой запрос
+    проходит не больше len(code) узлов, а выдача по префиксу - это срез.
+    Индекс строится один раз и после этого только читается.
+    """
+
+    __slots__ = ('_codes', '_values', '_children', '_lo', '_hi', '_exact')
+
+    def __init__(self, items: Iterable[Tuple[str, Any]] = ()):
+        pairs = []
+        for position, (code, value) in enumerate(items):
+            normalized = normalize_tnved_code(code)
+            if normalized:
+                pairs.append((normalized, position, value))
+        # Сортировка по коду, при равных кодах - в порядке поступления
+        pairs.sort(key=lambda pair: (pair[0], pair[1]))
+
+        self._codes: List[str] = [pair[0] for pair in pairs]
+        self._values: List[Any] = [pair[2] for pair in pairs]
+        self._children: List[Dict[str, int]] = [{}]
+        self._lo: List[int] = [0]
+        self._hi: List[int] = [len(pairs)]
+        self._exact: List[int] = [-1]
+
+        for idx, code in enumerate(self._codes):
+            node = 0
+            for digit in code:
+                child = self._children[node].get(digit)
+                if child is None:
+                    child = len(self._children)
+                    self._children[node][digit] = child
+                    self._children.append({})
+                    self._lo.append(idx)
+                    self._hi.append(idx + 1)
+                    self._exact.append(-1)
+                else:
+                    self._hi[child] = idx + 1
+                node = child
+            if self._exact[node] == -1:
+                self._exact[node] = idx
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def __contains__(self, code: str) -> bool:
+        node = self._find_node(normalize_tnved_code(code))
+        return node is not None and self._exact[node] != -1
+
+    def _find_node(self, code: str) -> Optional[int]:
+        node = 0
+        for digit in code:
+            node = self._children[node].get(digit)
+            if node is None:
+                return None
+        return node
+
+    def get(self, code: str, default: Any = None) -> Any:
+        """Точное совпадение кода"""
+        normalized = normalize_tnved_code(code)
+        if not normalized:
+            return default
+        node = self._find_node(normalized)
+        if node is None or self._exact[node] == -1:
+            return default
+        return self._values[self._exact[node]]
+
+    def prefix(self, code: str, limit: Optional[int] = None) -> List[Any]:
+        """Все значения, коды которых начинаются с code (в порядке кодов)"""
+        normalized = normalize_tnved_code(code)
+        node = self._find_node(normalized)
+        if node is None:
+            return []
+        lo, hi = self._lo[node], self._hi[node]
+        if limit is not None:
+            hi = min(hi, lo + max(limit, 0))
+        return self._values[lo:hi]
+
+    def count_prefix(self, code: str) -> int:
+        """Количество кодов с заданным префиксом"""
+        node = self._find_node(normalize_tnved_code(code))
+        if node is None:
+            return 0
+        return self._hi[node] - self._lo[node]
+
+    def longest_prefix(self, code: str, min_length: int = 1) -> Optional[Tuple[str, Any]]:
+        """
+        Самый длинный известный код, являющийся префиксом code.
+        Возвращает (найденный код, значение) или None.
+        """
+        normalized = normalize_tnved_code(code)
+        node = 0
+        best = -1
+        for depth, digit in enumerate(normalized, start=1):
+            node = self._children[node].get(digit)
+            if node is None:
+                break
+            if depth >= min_length and self._exact[node] != -1:
+                best = self._exact[node]
+        if best == -1:
+            return None
+        return self._codes[best], self._values[best]
+
+
+def stem_ru(word: str) -> str:
+    """Лёгкий стемминг: отрезать типичное окончание ("обуви", "обувь" -> "обув")"""
+    for ending in _RU_ENDINGS:
+        if word.endswith(ending) and len(word) - len(ending) >= _MIN_STEM_LENGTH:
+            return word[:-len(ending)]
+    return word
+
+
+def tokenize_ru(text: str) -> List[str]:
+    """Разбить текст на нормализованные основы слов"""
+    if not text:
+        return []
+    return [stem_ru(token) for token in _TOKEN_RE.findall(text.lower().replace('ё', 'е'))]
+
+
+class NameIndex:
+    """
+    Инвертированный индекс по названиям товаров с ранжированием BM25.
+
+    Каждое слово запроса сопоставляется с основами из словаря по префиксу,
+    так что "обув" находит и "обувь", и "обуви". Документ попадает в выдачу,
+    только если содержит все слова запроса (пересечение списков),
+    и сортируется по убыванию релевантности.
+    """
+
+    K1 = 1.2
+    B = 0.75
+    # Сколько основ из словаря максимум подставлять вместо одного префикса
+    MAX_PREFIX_EXPANSIONS = 64
+    # Вес совпадения по префиксу относительно точного совпадения основы
+    PREFIX_WEIGHT = 0.8
+
+    __slots__ = ('_values', '_doc_lengths', '_avg_length', '_postings', '_vocabulary')
+
+    def __init__(self, items: Iterable[Tuple[str, Any]] = ()):
+        self._values: List[Any] = []
+        self._doc_lengths: List[int] = []
+        self._postings: Dict[str, Dict[int, int]] = {}
+
+        for name, value in items:
+            doc_id = len(self._values)
+            tokens = tokenize_ru(name)
+            self._values.append(value)
+            self._doc_lengths.append(len(tokens))
+            for token in tokens:
+                postings = self._postings.setdefault(token, {})
+                postings[doc_id] = postings.get(doc_id, 0) + 1
+
+        total = sum(self._doc_lengths)
+        self._avg_length = total / len(self._doc_lengths) if self._doc_lengths else 0.0
+        self._vocabulary: List[str] = sorted(self._postings)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def _expand(self, term: str) -> List[Tuple[str, float]]:
+        """Основы словаря, начинающиеся с term, с весами"""
+        expansions = []
+        start = bisect_left(self._vocabulary, term)
+        for word in self._vocabulary[start:start + self.MAX_PREFIX_EXPANSIONS]:
+            if not word.startswith(term):
+                break
+            expansions.append((word, 1.0 if word == term else self.PREFIX_WEIGHT))
+        return expansions
+
+    def _term_scores(self, term: str) -> Dict[int, float]:
+        """BM25-вклад одного слова запроса для каждого подходящего документа"""
+        n_docs = len(self._values)
+        scores: Dict[int, float] = {}
+        for word, weight in self._expand(term):
+            postings = self._postings[word]
+            idf = math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, tf in postings.items():
+                norm = self.K1 * (1 - self.B + self.B * self._doc_lengths[doc_id] / self._avg_length)
+                score = weight * idf * tf * (self.K1 + 1) / (tf + norm)
+                if score > scores.get(doc_id, 0.0):
+                    scores[doc_id] = score
+        return scores
+
+    def search(self, query: str, limit: int = 50) -> List[Any]:
+        """Найти документы по всем словам запроса, самые релевантные первыми"""
+        terms = list(dict.fromkeys(tokenize_ru(query)))
+        if not terms or not self._values or limit <= 0:
+            return []
+
+        per_term = [self._term_scores(term) for term in terms]
+        per_term.sort(key=len)
+        if not per_term[0]:
+            return []
+
+        totals: Dict[int, float] = {}
+        for doc_id, score in per_term[0].items():
+            for other in per_term[1:]:
+                other_score = other.get(doc_id)
+                if other_score is None:
+                    break
+                score += other_score
+            else:
+                totals[doc_id] = score
+
+        # При равной релевантности сохраняем порядок файла
+        best = heapq.nsmallest(limit, totals.items(), key=lambda pair: (-pair[1], pair[0]))
+        return [self._values[doc_id] for doc_id, _ in best]
+
+
+def normalize_name(text: str) -> str:
+    """Нормализовать название для сравнения: нижний регистр, ё -> е, без знаков препинания"""
+    if not text:
+        return ''
+    return _NON_WORD_RE.sub(' ', str(text).lower().replace('ё', 'е')).strip()
+
+
+def trigrams(text: str) -> frozenset:
+    """Множество триграмм нормализованной строки (с пробелами по краям)"""
+    padded = f' {text} '
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+class CategoryIndex:
+    """
+    Поиск категории по названию, id или синониму.
+
+    Точное совпадение нормализованного ключа - одно обращение к словарю.
+    Если его нет, кандидаты берутся по общим триграммам: сначала ищется
+    вхождение запроса в название (или названия в запрос), затем самое
+    похожее название по коэффициенту Жаккара. При равенстве побеждает
+    категория, идущая раньше в файле.
+    """
+
+    # Минимальная похожесть названия для нечёткого совпадения
+    MIN_SIMILARITY = 0.4
+
+    __slots__ = ('_names', '_normalized', '_values', '_keys', '_trigrams', '_postings')
+
+    def __init__(self, items: Iterable[Tuple[str, Any, Iterable[str]]] = ()):
+        self._names: List[str] = []
+        self._normalized: List[str] = []
+        self._values: List[Any] = []
+        self._keys: Dict[str, int] = {}
+        self._trigrams: List[frozenset] = []
+        self._postings: Dict[str, List[int]] = {}
+
+        for name, value, aliases in items:
+            doc_id = len(self._names)
+            normalized = normalize_name(name)
+            self._names.append(name)
+            self._normalized.append(normalized)
+            self._values.append(value)
+            self._trigrams.append(trigrams(normalized))
+            for gram in self._trigrams[doc_id]:
+                self._postings.setdefault(gram, []).append(doc_id)
+            # Название важнее синонимов: его ключ не перезаписывается
+            for key in (normalized, *(normalize_name(alias) for alias in aliases)):
+                if key:
+                    self._keys.setdefault(key, doc_id)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def _result(self, doc_id: int) -> Tuple[str, Any]:
+        return self._names[doc_id], self._values[doc_id]
+
+    def get(self, query: str) -> Optional[Tuple[str, Any]]:
+        """Точное совпадение названия, id или синонима. Возвращает (название, значение)"""
+        doc_id = self._keys.get(normalize_name(query))
+        return None if doc_id is None else self._result(doc_id)
+
+    def find(self, query: str) -> Optional[Tuple[str, Any]]:
+        """Точное совпадение, иначе вхождение подстроки, иначе самое похожее название"""
+        normalized = normalize_name(query)
+        if not normalized:
+            return None
+        doc_id = self._keys.get(normalized)
+        if doc_id is not None:
+            return self._result(doc_id)
+
+        query_grams = trigrams(normalized)
+        shared: Dict[int, int] = {}
+        for gram in query_grams:
+            for candidate in self._postings.get(gram, ()):
+                shared[candidate] = shared.get(candidate, 0) + 1
+        if not shared:
+            return None
+
+        candidates = sorted(shared)
+        for candidate in candidates:
+            name = self._normalized[candidate]
+            if normalized in name or name in normalized:
+                return self._result(candidate)
+
+        best, best_score = -1, 0.0
+        for candidate in candidates:
+            union = len(query_grams) + len(self._trigrams[candidate]) - shared[candidate]
+            score = shared[candidate] / union
+            if score > best_score:
+                best, best_score = candidate, score
+        if best_score < self.MIN_SIMILARITY:
+            return None
+        return self._result(best)
@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+"""
+Модули бэкенда импортируются плоско (from normalize import ...), как в server.py.
+Фикстура db - отдельная БД во временной папке со всеми миграциями.
+"""
+
+import os
+import sys
+
+import pytest
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend')
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """Модуль database, направленный на новую БД с применёнными миграциями"""
+    import database
+    from db_pool import get_pool
+
+    path = str(tmp_path / 'test.db')
+    monkeypatch.setattr(database, 'DB_PATH', path)
+    database.init_database()
+    yield database
+    get_pool(path).close_all()
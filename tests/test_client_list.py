@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""Список клиентов с агрегатами (ClientDB.get_list_with_stats)"""
+
+import pytest
+
+from database import ClientDB
+from pagination import InvalidCursor
+
+
+@pytest.fixture
+def clients(db):
+    with db.get_db() as conn:
+        for client_id in range(1, 6):
+            conn.execute('''
+                INSERT INTO clients (id, contact_name, contact_phone, company_name, created_at)
+                VALUES (?, ?, '+79990000000', ?, ?)
+            ''', (client_id, f'Контакт {client_id}', f'Компания {client_id}', f'2024-01-0{client_id} 10:00:00'))
+        conn.executemany('''
+            INSERT INTO quotes (quote_number, company_id, client_id, services_json, total_amount)
+            VALUES (?, 1, 1, '[]', ?)
+        ''', [('Q1', 100), ('Q2', 250)])
+        conn.execute('''
+            INSERT INTO contracts (contract_number, company_id, client_id, services_json, total_amount)
+            VALUES ('C1', 1, 2, '[]', 1000)
+        ''')
+        conn.executemany("INSERT INTO tasks (title, client_id, status) VALUES (?, 1, ?)",
+                         [('Позвонить', 'pending'), ('Отправить КП', 'completed')])
+    return db
+
+
+def test_aggregates(clients):
+    result = ClientDB.get_list_with_stats()
+    assert result['total'] == 5
+    by_id = {item['id']: item for item in result['clients']}
+    assert [item['id'] for item in result['clients']] == [5, 4, 3, 2, 1]
+    assert (by_id[1]['quotes_count'], by_id[1]['quotes_total'], by_id[1]['tasks_count']) == (2, 350, 1)
+    assert (by_id[2]['contracts_count'], by_id[2]['contracts_total']) == (1, 1000)
+    assert by_id[3]['quotes_count'] == by_id[3]['contracts_count'] == 0
+
+
+def test_sort_by_aggregate(clients):
+    result = ClientDB.get_list_with_stats(sort='quotes_total', order='desc', limit=2)
+    assert result['clients'][0]['id'] == 1
+    assert result['total'] == 5
+
+
+def test_cursor_pages(clients):
+    ids, cursor = [], None
+    while True:
+        result = ClientDB.get_list_with_stats(limit=2, cursor=cursor)
+        ids += [item['id'] for item in result['clients']]
+        cursor = result['next_cursor']
+        if cursor is None:
+            break
+    assert ids == [5, 4, 3, 2, 1]
+
+
+def test_cursor_requires_default_order(clients):
+    cursor = ClientDB.get_list_with_stats(limit=2)['next_cursor']
+    with pytest.raises(InvalidCursor):
+        ClientDB.get_list_with_stats(sort='company_name', cursor=cursor)
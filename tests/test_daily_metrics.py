@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""Дневные агрегаты daily_metrics: триггеры держат их равными подсчёту по таблицам (migrations/0009_daily_metrics.py)"""
+
+import pytest
+
+from database import MetricsDB
+
+# Прямой подсчёт по таблицам: сущность -> (таблица, статус, менеджер, источник, сумма)
+DIRECT = {
+    'callback': ('callbacks', 'status', 'assigned_to', 'source', '0'),
+    'client': ('clients', 'status', 'assigned_manager_id', "''", '0'),
+    'quote': ('quotes', 'status', 'manager_id', "''", 'total_amount'),
+    'contract': ('contracts', 'status', 'manager_id', "''", 'total_amount'),
+}
+
+
+def _direct(conn):
+    result = {}
+    for entity, (table, status, manager, source, amount) in DIRECT.items():
+        rows = conn.execute(f'''
+            SELECT date(created_at), COALESCE({status}, ''), COALESCE({manager}, 0), COALESCE({source}, ''),
+                   COUNT(*), COALESCE(SUM({amount}), 0)
+            FROM {table} GROUP BY 1, 2, 3, 4
+        ''').fetchall()
+        for day, status_value, manager_id, source_value, count, total in rows:
+            result[(day, entity, status_value, manager_id, source_value)] = (count, total)
+    return result
+
+
+def _metrics(conn):
+    rows = conn.execute('''
+        SELECT day, entity, status, manager_id, source, count, amount FROM daily_metrics
+        WHERE entity IN ('callback', 'client', 'quote', 'contract') AND count != 0
+    ''').fetchall()
+    return {tuple(row[:5]): (row[5], row[6]) for row in rows}
+
+
+def _assert_matches_tables(db):
+    with db.get_db() as conn:
+        assert _metrics(conn) == pytest.approx(_direct(conn))
+
+
+@pytest.fixture
+def crm(db):
+    with db.get_db() as conn:
+        conn.executemany('''
+            INSERT INTO callbacks (id, contact_name, contact_phone, status, source, assigned_to, created_at)
+            VALUES (?, 'Заявка', '+79990000000', ?, ?, ?, ?)
+        ''', [
+            (1, 'new', 'site', None, '2024-03-01 09:00:00'),
+            (2, 'new', 'telegram', 5, '2024-03-01 12:00:00'),
+            (3, 'processed', 'site', 5, '2024-03-02 10:00:00'),
+        ])
+        conn.executemany('''
+            INSERT INTO clients (id, contact_name, contact_phone, status, assigned_manager_id, created_at)
+            VALUES (?, 'Клиент', '+79990000000', ?, ?, ?)
+        ''', [(1, 'lead', 5, '2024-03-01 10:00:00'), (2, 'active', None, '2024-03-03 10:00:00')])
+        conn.executemany('''
+            INSERT INTO quotes (id, quote_number, company_id, status, manager_id, services_json, total_amount, created_at)
+            VALUES (?, ?, 1, ?, ?, '[]', ?, ?)
+        ''', [
+            (1, 'KP-1', 'draft', 5, 1000, '2024-03-01 11:00:00'),
+            (2, 'KP-2', 'approved', 5, 2500, '2024-03-02 11:00:00'),
+        ])
+        conn.execute('''
+            INSERT INTO contracts (id, contract_number, company_id, status, manager_id, services_json, total_amount, created_at)
+            VALUES (1, 'DOG-1', 1, 'signed', 5, '[]', 2500, '2024-03-02 15:00:00')
+        ''')
+    return db
+
+
+def test_metrics_match_tables(crm):
+    _assert_matches_tables(crm)
+
+
+def test_metrics_follow_changes(crm):
+    with crm.get_db() as conn:
+        conn.execute("UPDATE callbacks SET status = 'processed', assigned_to = 7 WHERE id = 1")
+        conn.execute("UPDATE quotes SET status = 'approved', total_amount = 1200 WHERE id = 1")
+        conn.execute("UPDATE contracts SET created_at = '2024-03-05 08:00:00' WHERE id = 1")
+        conn.execute("UPDATE clients SET assigned_manager_id = 7 WHERE id = 2")
+        # Изменение других колонок не трогает агрегаты
+        conn.execute("UPDATE quotes SET services_json = '[{\"id\": \"x\"}]' WHERE id = 2")
+    _assert_matches_tables(crm)
+
+    with crm.get_db() as conn:
+        conn.execute('DELETE FROM callbacks WHERE id = 2')
+        conn.execute('DELETE FROM quotes WHERE id = 2')
+        conn.execute('''
+            INSERT INTO quotes (id, quote_number, company_id, status, services_json, total_amount, created_at)
+            VALUES (3, 'KP-3', 1, 'sent', '[]', 300, '2024-03-05 09:00:00')
+        ''')
+    _assert_matches_tables(crm)
+
+
+def test_totals_and_managers(crm):
+    totals = {(row['entity'], row['status'], row['source']): row for row in
+              MetricsDB.get_totals('2024-03-02', '2024-03-03', '2024-03-01')}
+    site_new = totals[('callback', 'new', 'site')]
+    assert (site_new['total'], site_new['period'], site_new['prev_period']) == (1, 0, 1)
+    approved = totals[('quote', 'approved', '')]
+    assert (approved['total'], approved['period_amount']) == (1, 2500)
+
+    with crm.get_db() as conn:
+        conn.execute("INSERT INTO users (id, email, password_hash, role) VALUES (5, 'm@example.com', 'x', 'employee')")
+    manager = next(row for row in MetricsDB.get_managers() if row['id'] == 5)
+    assert (manager['clients_count'], manager['quotes_count'], manager['contracts_count'],
+            manager['contracts_amount']) == (1, 2, 1, 2500)
+
+
+def test_daily_series(crm):
+    series = {(row['bucket'], row['entity']): row['count'] for row in
+              MetricsDB.get_series('day', '2024-03-01', '2024-03-03')}
+    assert series == {
+        ('2024-03-01', 'callback'): 2, ('2024-03-01', 'client'): 1, ('2024-03-01', 'quote'): 1,
+        ('2024-03-02', 'callback'): 1, ('2024-03-02', 'quote'): 1, ('2024-03-02', 'contract'): 1,
+    }
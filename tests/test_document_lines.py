@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""Строки документов document_lines: триггеры разбирают services_json (migrations/0008_document_lines.py)"""
+
+import json
+
+import pytest
+
+from database import DocumentLinesDB
+
+SERVICES = [
+    {'id': 'reg', 'name': 'Регистрация', 'unit': 'шт', 'price': 1000, 'quantity': 2, 'subtotal': 2000},
+    {'id': 'codes', 'name': 'Коды', 'price': 5, 'quantity': 100},
+]
+
+
+def _lines(db, doc_type, doc_id):
+    with db.get_db() as conn:
+        rows = conn.execute('''
+            SELECT position, service_id, name, price, quantity, subtotal FROM document_lines
+            WHERE doc_type = ? AND doc_id = ? ORDER BY position
+        ''', (doc_type, doc_id)).fetchall()
+    return [tuple(row) for row in rows]
+
+
+def _insert(conn, doc_type, doc_id, services_json):
+    if doc_type == 'quote':
+        conn.execute('''
+            INSERT INTO quotes (id, quote_number, company_id, services_json, total_amount)
+            VALUES (?, ?, 1, ?, 0)
+        ''', (doc_id, f'KP-{doc_id}', services_json))
+    elif doc_type == 'contract':
+        conn.execute('''
+            INSERT INTO contracts (id, contract_number, company_id, services_json, total_amount)
+            VALUES (?, ?, 1, ?, 0)
+        ''', (doc_id, f'DOG-{doc_id}', services_json))
+    else:
+        conn.execute('''
+            INSERT INTO invoices (id, invoice_number, company_id, amount, services_json)
+            VALUES (?, ?, 1, 0, ?)
+        ''', (doc_id, f'СЧ-{doc_id}', services_json))
+
+
+@pytest.mark.parametrize('doc_type', list(DocumentLinesDB.DOC_TABLES))
+def test_lines_follow_document(db, doc_type):
+    table = DocumentLinesDB.DOC_TABLES[doc_type]
+    with db.get_db() as conn:
+        _insert(conn, doc_type, 1, json.dumps(SERVICES, ensure_ascii=False))
+    # subtotal без явного значения - price * quantity
+    assert _lines(db, doc_type, 1) == [
+        (0, 'reg', 'Регистрация', 1000, 2, 2000),
+        (1, 'codes', 'Коды', 5, 100, 500),
+    ]
+
+    with db.get_db() as conn:
+        conn.execute(f'UPDATE {table} SET services_json = ? WHERE id = 1',
+                     (json.dumps(SERVICES[1:], ensure_ascii=False),))
+    assert _lines(db, doc_type, 1) == [(0, 'codes', 'Коды', 5, 100, 500)]
+
+    with db.get_db() as conn:
+        conn.execute(f'DELETE FROM {table} WHERE id = 1')
+    assert _lines(db, doc_type, 1) == []
+
+
+@pytest.mark.parametrize('services_json', [None, '', 'не json', '{"id": "reg"}', '[1, "x", null]'])
+def test_invalid_services_json_gives_no_lines(db, services_json):
+    # У счетов services_json может быть NULL
+    with db.get_db() as conn:
+        _insert(conn, 'invoice', 1, services_json)
+    assert _lines(db, 'invoice', 1) == []
+
+
+def test_service_revenue(db):
+    with db.get_db() as conn:
+        _insert(conn, 'contract', 1, json.dumps(SERVICES, ensure_ascii=False))
+        _insert(conn, 'contract', 2, json.dumps(SERVICES[:1], ensure_ascii=False))
+        _insert(conn, 'quote', 3, json.dumps(SERVICES, ensure_ascii=False))
+        conn.execute("UPDATE contracts SET status = 'signed' WHERE id = 1")
+
+    revenue = DocumentLinesDB.get_service_revenue('contract')
+    assert [(row['service_id'], row['documents'], row['quantity'], row['revenue']) for row in revenue] == [
+        ('reg', 2, 4, 4000),
+        ('codes', 1, 100, 500),
+    ]
+    signed = DocumentLinesDB.get_service_revenue('contract', status='signed')
+    assert [row['revenue'] for row in signed] == [2000, 500]
+    with pytest.raises(ValueError):
+        DocumentLinesDB.get_service_revenue('act')
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""Нумерация документов (database.next_sequence_value): параллельные вызовы и продолжение старых номеров"""
+
+import threading
+from datetime import datetime
+
+
+def test_concurrent_allocation_gives_unique_numbers(db):
+    threads_count, per_thread = 8, 25
+    results = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(threads_count)
+
+    def worker():
+        barrier.wait()
+        numbers = [db.next_sequence_value('quote', 2024) for _ in range(per_thread)]
+        with lock:
+            results.extend(numbers)
+
+    threads = [threading.Thread(target=worker) for _ in range(threads_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(results) == list(range(1, threads_count * per_thread + 1))
+
+
+def test_counters_are_separate_per_type_and_year(db):
+    assert db.next_sequence_value('quote', 2024) == 1
+    assert db.next_sequence_value('quote', 2024) == 2
+    assert db.next_sequence_value('contract', 2024) == 1
+    assert db.next_sequence_value('quote', 2025) == 1
+
+
+def test_new_counter_continues_issued_numbers(db):
+    with db.get_db() as conn:
+        conn.execute("INSERT INTO invoices (invoice_number, company_id, amount) VALUES ('СЧ-010124-0001/7', 1, 0)")
+
+    assert db.get_next_invoice_number('DOG-010124-0001', 1) == 'СЧ-010124-0001/8'
+    assert db.get_next_invoice_number('DOG-010124-0001', 1) == 'СЧ-010124-0001/9'
+    assert db.get_next_invoice_number('DOG-010124-0002', 2) == 'СЧ-010124-0002/1'
+
+
+def test_invoice_without_contract_keeps_legacy_format(db):
+    date_key = datetime.now().strftime('%d%m%y')
+    with db.get_db() as conn:
+        conn.execute('INSERT INTO invoices (invoice_number, company_id, amount) VALUES (?, 1, 0)',
+                     (f'СЧЁТ-{date_key}-012',))
+
+    assert db.get_next_invoice_number() == f'СЧЁТ-{date_key}-013'
+    # Договор без номера - формат СЧ-ГГММДД со своим счётчиком
+    assert db.get_next_invoice_number(None, 5) == f"СЧ-{datetime.now().strftime('%y%m%d')}-0001"
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""Версионные миграции (migrations/): повторный запуск и откат упавшей миграции"""
+
+import sqlite3
+
+import pytest
+
+from migrations import MIGRATIONS_DIR, discover_migrations, run_migrations
+
+
+def _schema(conn):
+    return conn.execute('SELECT type, name, sql FROM sqlite_master ORDER BY type, name').fetchall()
+
+
+def _versions(conn):
+    return [row[0] for row in conn.execute('SELECT version FROM schema_version ORDER BY version')]
+
+
+def _write(directory, filename, body):
+    (directory / filename).write_text(f'def upgrade(conn):\n{body}\n', encoding='utf-8')
+
+
+@pytest.fixture
+def conn(tmp_path):
+    conn = sqlite3.connect(str(tmp_path / 'test.db'))
+    yield conn
+    conn.close()
+
+
+def test_all_migrations_apply_once(conn):
+    versions = [version for version, _, _ in discover_migrations(MIGRATIONS_DIR)]
+    assert run_migrations(conn) == versions
+    schema = _schema(conn)
+
+    assert run_migrations(conn) == []
+    assert _schema(conn) == schema
+    assert _versions(conn) == versions
+
+
+def test_migrations_on_database_with_existing_tables(conn):
+    # Таблица, созданная вручную до миграций, сохраняется и получает недостающее
+    conn.execute('CREATE TABLE telegram_leads (id INTEGER PRIMARY KEY, telegram_id INTEGER, phone TEXT, '
+                 'ref_code TEXT, interested_categories TEXT, created_at TIMESTAMP)')
+    conn.execute("INSERT INTO telegram_leads (telegram_id, phone, interested_categories) "
+                 "VALUES (1, '8 (999) 123-45-67', '[\"Обувь\", \"Шины\"]')")
+    run_migrations(conn)
+
+    assert conn.execute('SELECT phone_e164 FROM telegram_leads').fetchone() == ('+79991234567',)
+    assert sorted(conn.execute('SELECT category FROM telegram_lead_categories')) == [('Обувь',), ('Шины',)]
+
+
+def test_failed_migration_is_rolled_back(tmp_path, conn):
+    directory = tmp_path / 'migrations'
+    directory.mkdir()
+    _write(directory, '0001_first.py', "    conn.execute('CREATE TABLE a (id INTEGER)')")
+    _write(directory, '0002_broken.py', "    conn.execute('CREATE TABLE b (id INTEGER)')\n"
+                                        "    conn.execute('INSERT INTO missing VALUES (1)')")
+
+    with pytest.raises(sqlite3.OperationalError):
+        run_migrations(conn, str(directory))
+    assert _versions(conn) == [1]
+    tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    assert 'a' in tables and 'b' not in tables
+
+    # Исправленная миграция применяется при следующем запуске
+    _write(directory, '0002_broken.py', "    conn.execute('CREATE TABLE b (id INTEGER)')")
+    assert run_migrations(conn, str(directory)) == [2]
+    assert _versions(conn) == [1, 2]
+
+
+def test_create_index_on_missing_table_fails(tmp_path, conn):
+    directory = tmp_path / 'migrations'
+    directory.mkdir()
+    (directory / '0001_index.py').write_text(
+        'from migrations import create_index\n\n'
+        'def upgrade(conn):\n'
+        "    create_index(conn, 'idx_missing', 'missing', 'id')\n", encoding='utf-8')
+
+    with pytest.raises(RuntimeError):
+        run_migrations(conn, str(directory))
+    assert _versions(conn) == []
+
+
+def test_duplicate_versions_are_rejected(tmp_path):
+    directory = tmp_path / 'migrations'
+    directory.mkdir()
+    _write(directory, '0001_one.py', '    pass')
+    _write(directory, '0001_two.py', '    pass')
+    with pytest.raises(RuntimeError):
+        discover_migrations(str(directory))
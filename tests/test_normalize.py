@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Python- и SQL-версии нормализации контактов (normalize.py) должны совпадать:
+SQL-версии заполняют phone_e164 / email_lower в триггерах, а Python-версии
+нормализуют значения для поиска дублей по этим колонкам.
+"""
+
+import sqlite3
+
+import pytest
+
+from normalize import email_lower_sql, normalize_email, normalize_inn, normalize_phone, phone_e164_sql
+
+PHONES = [
+    # российские номера: 11 цифр с 8/7, 10 цифр без кода страны
+    ('8 (999) 123-45-67', '+79991234567'),
+    ('+7 999 123 45 67', '+79991234567'),
+    ('79991234567', '+79991234567'),
+    ('89991234567', '+79991234567'),
+    ('9991234567', '+79991234567'),
+    ('8.999.123.45.67', '+79991234567'),
+    # прочие номера - только цифры с +
+    ('+1 (202) 555-0100', '+12025550100'),
+    ('99912345678', '+99912345678'),
+    ('123', '+123'),
+    # пустые и нераспознанные
+    (None, None),
+    ('', None),
+    ('   ', None),
+    ('+-()', None),
+    ('8 999 123-45-67 доб. 12', None),
+    # цифры не ASCII: арабско-индийские и полноширинные
+    ('٨٩٩٩١٢٣٤٥٦٧', None),
+    ('８９９９１２３４５６７', None),
+]
+
+EMAILS = [
+    ('Ivan.Petrov@Example.COM', 'ivan.petrov@example.com'),
+    ('  MiXeD@Mail.Ru  ', 'mixed@mail.ru'),
+    ('user@example.com', 'user@example.com'),
+    # LOWER() в SQLite не меняет регистр не-ASCII букв
+    ('Иван.Petrov@Почта.РФ', 'Иван.petrov@Почта.РФ'),
+    (None, None),
+    ('', None),
+    ('   ', None),
+]
+
+
+@pytest.fixture(scope='module')
+def conn():
+    conn = sqlite3.connect(':memory:')
+    yield conn
+    conn.close()
+
+
+def _sql(conn, expression: str, value):
+    return conn.execute(f'SELECT {expression} FROM (SELECT ? AS v)', (value,)).fetchone()[0]
+
+
+@pytest.mark.parametrize('phone, expected', PHONES)
+def test_normalize_phone(conn, phone, expected):
+    assert normalize_phone(phone) == expected
+    assert _sql(conn, phone_e164_sql('v'), phone) == expected
+
+
+@pytest.mark.parametrize('email, expected', EMAILS)
+def test_normalize_email(conn, email, expected):
+    assert normalize_email(email) == expected
+    assert _sql(conn, email_lower_sql('v'), email) == expected
+
+
+def test_normalize_inn():
+    assert normalize_inn('77 07-083893') == '7707083893'
+    assert normalize_inn('нет') is None
+    assert normalize_inn(None) is None
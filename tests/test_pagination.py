@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""Курсорная пагинация (pagination.py): страницы по курсору дают тот же список, что и без него"""
+
+import sqlite3
+
+import pytest
+
+from pagination import (
+    DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT, InvalidCursor, decode_cursor, encode_cursor, fetch_page, page_limit
+)
+
+QUERY = 'SELECT id, created_at, status FROM items WHERE 1 = 1'
+
+
+@pytest.fixture
+def cursor():
+    conn = sqlite3.connect(':memory:')
+    conn.row_factory = sqlite3.Row
+    conn.execute('CREATE TABLE items (id INTEGER PRIMARY KEY, created_at TIMESTAMP, status TEXT)')
+    conn.executemany('INSERT INTO items (id, created_at, status) VALUES (?, ?, ?)', [
+        (1, '2024-01-01 10:00:00', 'new'),
+        (2, '2024-01-02 10:00:00', 'done'),
+        # одинаковое время - порядок по id
+        (3, '2024-01-03 10:00:00', 'new'),
+        (4, '2024-01-03 10:00:00', 'new'),
+        (5, None, 'new'),
+        (6, '2024-01-04 10:00:00', 'done'),
+        (7, None, 'done'),
+    ])
+    yield conn.cursor()
+    conn.close()
+
+
+def _all_pages(cursor, query, params, limit):
+    ids, page_cursor = [], None
+    while True:
+        rows, page_cursor = fetch_page(cursor, query, params, page_cursor, limit)
+        assert len(rows) <= limit
+        ids += [row['id'] for row in rows]
+        if page_cursor is None:
+            return ids
+
+
+def test_full_list_without_cursor_and_limit(cursor):
+    rows, next_cursor = fetch_page(cursor, QUERY, [])
+    assert [row['id'] for row in rows] == [6, 4, 3, 2, 1, 7, 5]
+    assert next_cursor is None
+
+
+@pytest.mark.parametrize('limit', [1, 2, 3, 7, 10])
+def test_pages_match_full_list(cursor, limit):
+    assert _all_pages(cursor, QUERY, [], limit) == [6, 4, 3, 2, 1, 7, 5]
+
+
+def test_pages_with_filter(cursor):
+    assert _all_pages(cursor, QUERY + ' AND status = ?', ['new'], 2) == [4, 3, 1, 5]
+
+
+def test_cursor_roundtrip():
+    assert decode_cursor(encode_cursor('2024-01-03 10:00:00', 4)) == ('2024-01-03 10:00:00', 4)
+    assert decode_cursor(encode_cursor(None, 5)) == (None, 5)
+
+
+@pytest.mark.parametrize('value', [
+    'not-a-cursor',
+    encode_cursor('2024-01-01', 1)[:-3],
+    # корректный base64 и JSON, но не (created_at, id)
+    encode_cursor(1, 'x'),
+])
+def test_invalid_cursor(value):
+    with pytest.raises(InvalidCursor):
+        decode_cursor(value)
+
+
+def test_page_limit():
+    assert page_limit(None, None) is None
+    assert page_limit('cursor', None) == DEFAULT_PAGE_LIMIT
+    assert page_limit(None, 0) == 1
+    assert page_limit(None, 10 ** 6) == MAX_PAGE_LIMIT
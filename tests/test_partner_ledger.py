@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+Журнал партнёра (partner_ledger): итоги и список лидов из журнала совпадают
+с прежним расчётом по quotes/contracts на каждый запрос, в том числе после
+изменений, которые журнал получает через триггеры.
+"""
+
+import pytest
+
+from database import PartnerDB
+
+PAID = ('signed', 'active', 'completed')
+
+
+def _old_stats(conn, partner_id):
+    """Прежний PartnerDB.get_stats: агрегаты по quotes и contracts на каждый запрос"""
+    rate = conn.execute('SELECT commission_rate FROM partners WHERE id = ?', (partner_id,)).fetchone()[0]
+    quotes = conn.execute('''
+        SELECT COUNT(*), COALESCE(SUM(total_amount), 0), SUM(CASE WHEN status = 'approved' THEN 1 ELSE 0 END)
+        FROM quotes WHERE partner_id = ?
+    ''', (partner_id,)).fetchone()
+    contracts = conn.execute('''
+        SELECT COUNT(*), COALESCE(SUM(total_amount), 0) FROM contracts
+        WHERE partner_id = ? AND status IN ('signed', 'active', 'completed')
+    ''', (partner_id,)).fetchone()
+    pending = conn.execute('''
+        SELECT COALESCE(SUM(q.total_amount), 0) FROM quotes q
+        LEFT JOIN contracts c ON c.quote_id = q.id
+        WHERE q.partner_id = ? AND q.status = 'approved'
+        AND (c.id IS NULL OR c.status NOT IN ('signed', 'active', 'completed'))
+    ''', (partner_id,)).fetchone()[0]
+    return {
+        'total_leads': quotes[0],
+        'quotes_amount': quotes[1],
+        'approved_quotes': quotes[2] or 0,
+        'total_contracts': contracts[0],
+        'paid_amount': contracts[1],
+        'commission_rate': rate,
+        'commission_earned': contracts[1] * rate / 100,
+        'commission_pending': pending * rate / 100,
+    }
+
+
+def _old_payment_statuses(conn, partner_id):
+    """Статус оплаты лидов по прежнему PartnerDB.get_leads"""
+    rows = conn.execute('''
+        SELECT q.id, q.status, c.status FROM quotes q
+        LEFT JOIN contracts c ON c.quote_id = q.id
+        WHERE q.partner_id = ?
+    ''', (partner_id,)).fetchall()
+    return {
+        quote_id: 'paid' if contract_status in PAID else 'pending' if quote_status == 'approved' else 'not_paid'
+        for quote_id, quote_status, contract_status in rows
+    }
+
+
+@pytest.fixture
+def ledger(db):
+    with db.get_db() as conn:
+        for partner_id, rate in ((1, 20), (2, 15)):
+            conn.execute('''
+                INSERT INTO partners (id, user_id, ref_code, partner_type, contact_name, contact_phone,
+                                      contact_email, commission_rate)
+                VALUES (?, ?, ?, 'agent', 'Партнёр', '+79990000000', 'p@example.com', ?)
+            ''', (partner_id, partner_id, f'REF{partner_id}', rate))
+        # (id, партнёр, статус КП, сумма КП, статус договора или None, сумма договора)
+        for quote_id, partner_id, status, amount, contract_status, contract_amount in (
+            (1, 1, 'approved', 1000, None, 0),  # одобрено, договора нет - ожидает
+            (2, 1, 'approved', 1000, 'draft', 2000),  # черновик договора - ожидает от суммы КП
+            (3, 1, 'approved', 500, 'signed', 700),  # оплачено от суммы договора
+            (4, 1, 'sent', 300, None, 0),
+            (5, 1, 'rejected', 400, None, 0),
+            (6, 1, 'approved', 900, 'completed', 900),
+            (7, 2, 'approved', 5000, 'active', 4000),
+        ):
+            conn.execute('''
+                INSERT INTO quotes (id, quote_number, company_id, partner_id, status, services_json,
+                                    total_amount, created_at)
+                VALUES (?, ?, 1, ?, ?, '[]', ?, ?)
+            ''', (quote_id, f'KP-{quote_id}', partner_id, status, amount, f'2024-01-0{quote_id} 10:00:00'))
+            if contract_status:
+                conn.execute('''
+                    INSERT INTO contracts (contract_number, company_id, quote_id, partner_id, status,
+                                           services_json, total_amount)
+                    VALUES (?, 1, ?, ?, ?, '[]', ?)
+                ''', (f'DOG-{quote_id}', quote_id, partner_id, contract_status, contract_amount))
+    return db
+
+
+def _assert_matches_old(db):
+    with db.get_db() as conn:
+        for partner_id in (1, 2):
+            stats = PartnerDB.get_stats(partner_id)
+            old = _old_stats(conn, partner_id)
+            assert {key: stats[key] for key in old} == pytest.approx(old)
+
+            leads = PartnerDB.get_leads(partner_id)
+            assert {lead['id']: lead['payment_status'] for lead in leads} == _old_payment_statuses(conn, partner_id)
+            # Итоги - суммы комиссий лидов
+            for status, total in (('paid', 'commission_earned'), ('pending', 'commission_pending')):
+                assert sum(lead['commission'] for lead in leads if lead['payment_status'] == status) == \
+                    pytest.approx(stats[total])
+
+
+def test_totals_match_per_request_computation(ledger):
+    _assert_matches_old(ledger)
+    stats = PartnerDB.get_stats(1)
+    # ожидает: (1000 + 1000) * 20%, заработано: (700 + 900) * 20%
+    assert (stats['commission_pending'], stats['commission_earned']) == (400, 320)
+
+
+def test_leads_order_and_fields(ledger):
+    leads = PartnerDB.get_leads(1)
+    assert [lead['id'] for lead in leads] == [6, 5, 4, 3, 2, 1]
+    paid = next(lead for lead in leads if lead['id'] == 3)
+    assert (paid['is_paid'], paid['contract_amount'], paid['commission'], paid['status_label']) == \
+        (True, 700, 140, 'Одобрено')
+    assert PartnerDB.get_stats(999) == {}
+
+
+def test_ledger_follows_changes(ledger):
+    with ledger.get_db() as conn:
+        # Договор подписан, КП отклонено, ставка изменена, КП удалено, новое КП
+        conn.execute("UPDATE contracts SET status = 'signed' WHERE quote_id = 2")
+        conn.execute("UPDATE quotes SET status = 'rejected' WHERE id = 1")
+        conn.execute('UPDATE partners SET commission_rate = 25 WHERE id = 1')
+        conn.execute('DELETE FROM quotes WHERE id = 4')
+        conn.execute('''
+            INSERT INTO quotes (id, quote_number, company_id, partner_id, status, services_json, total_amount)
+            VALUES (8, 'KP-8', 1, 2, 'approved', '[]', 100)
+        ''')
+    _assert_matches_old(ledger)
+    assert PartnerDB.get_stats(1)['commission_earned'] == (2000 + 700 + 900) * 25 / 100
+
+    with ledger.get_db() as conn:
+        conn.execute('DELETE FROM contracts WHERE quote_id = 3')
+        # Лид передан другому партнёру вместе с договором
+        conn.execute('UPDATE quotes SET partner_id = 2 WHERE id = 6')
+        conn.execute('UPDATE contracts SET partner_id = 2 WHERE quote_id = 6')
+    _assert_matches_old(ledger)
+    assert PartnerDB.get_stats(2)['total_contracts'] == 2
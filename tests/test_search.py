@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""Глобальный поиск по FTS5-индексу search_index (SearchDB, migrations/0006_search_index.py)"""
+
+import pytest
+
+from database import SearchDB
+
+
+@pytest.fixture
+def crm(db):
+    with db.get_db() as conn:
+        conn.execute('''
+            INSERT INTO clients (id, company_name, contact_name, contact_phone, inn)
+            VALUES (1, 'ООО Ромашка', 'Иван Петров', '+7 (999) 123-45-67', '7707083893')
+        ''')
+        conn.execute('''
+            INSERT INTO clients (id, company_name, contact_name, contact_phone, inn)
+            VALUES (2, 'ИП Васильков', 'Анна Смирнова', '8 912 000-11-22', '500100732259')
+        ''')
+        conn.execute('''
+            INSERT INTO callbacks (id, contact_name, contact_phone, company_name)
+            VALUES (1, 'Пётр Ромашкин', '+7 915 555-44-33', 'Лютик')
+        ''')
+        conn.execute('''
+            INSERT INTO contracts (id, contract_number, company_id, client_id, services_json, total_amount)
+            VALUES (1, 'DOG-010124-0001', 1, 1, '[]', 0)
+        ''')
+    return db
+
+
+def _found(q):
+    return [(item['type'], item['id']) for item in SearchDB.search(q)]
+
+
+def test_build_match_query():
+    assert SearchDB.build_match_query('ООО  Ромашка!') == '"ооо"* "ромашка"*'
+    assert SearchDB.build_match_query(' - ') == ''
+
+
+def test_search_by_name_prefix(crm):
+    found = _found('ромаш')
+    assert sorted(found) == [('callback', 1), ('client', 1), ('contract', 1)]
+    # Совпадение в названии выше совпадения в имени клиента договора
+    assert found[-1] == ('contract', 1)
+    assert _found('ромашка петров') == [('client', 1), ('contract', 1)]
+    assert _found('ромашкин') == [('callback', 1)]
+    assert _found('незабудка') == []
+    assert _found('') == []
+
+
+@pytest.mark.parametrize('q', ['79991234567', '+7 999', '4567', '1234', '999123'])
+def test_search_by_any_part_of_phone(crm, q):
+    assert ('client', 1) in _found(q)
+
+
+@pytest.mark.parametrize('q, expected', [
+    ('7707083893', ('client', 1)),
+    ('083893', ('client', 1)),
+    ('3893', ('client', 1)),
+    ('732259', ('client', 2)),
+])
+def test_search_by_any_part_of_inn(crm, q, expected):
+    assert _found(q) == [expected]
+
+
+def test_mixed_name_and_digits(crm):
+    assert _found('ромашка 4567') == [('client', 1)]
+    assert _found('лютик 4433') == [('callback', 1)]
+
+
+def test_index_follows_changes(crm):
+    with crm.get_db() as conn:
+        conn.execute("UPDATE clients SET company_name = 'ООО Незабудка', contact_phone = '+7 900 777-66-55' WHERE id = 1")
+    assert _found('незабудка') == [('client', 1), ('contract', 1)]
+    assert _found('4567') == []
+    assert _found('7766') == [('client', 1)]
+
+    with crm.get_db() as conn:
+        conn.execute('DELETE FROM contracts WHERE id = 1')
+        conn.execute('DELETE FROM callbacks WHERE id = 1')
+    assert _found('незабудка') == [('client', 1)]
+    assert _found('лютик') == []
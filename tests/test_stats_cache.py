@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""Кэш статистики (stats_cache): TTL, single-flight и сброс при записи через методы DB-классов"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+import stats_cache
+from database import CallbackDB
+from stats_cache import cached_stats, invalidate_stats
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    invalidate_stats()
+    yield
+    invalidate_stats()
+
+
+class Counter:
+    """compute для cached_stats: считает вызовы и возвращает их номер"""
+
+    def __init__(self, delay: float = 0):
+        self.calls = 0
+        self.delay = delay
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        time.sleep(self.delay)
+        with self._lock:
+            self.calls += 1
+            return self.calls
+
+
+def test_value_is_cached_per_key():
+    compute = Counter()
+
+    async def scenario():
+        return [await cached_stats(('a',), compute), await cached_stats(('a',), compute),
+                await cached_stats(('b',), compute)]
+
+    assert asyncio.run(scenario()) == [1, 1, 2]
+
+
+def test_ttl_expiry(monkeypatch):
+    monkeypatch.setattr(stats_cache, 'STATS_CACHE_TTL', 0)
+    compute = Counter()
+
+    async def scenario():
+        return [await cached_stats(('a',), compute) for _ in range(3)]
+
+    assert asyncio.run(scenario()) == [1, 2, 3]
+
+
+def test_concurrent_requests_share_one_computation():
+    compute = Counter(delay=0.05)
+
+    async def scenario():
+        return await asyncio.gather(*(cached_stats(('a',), compute) for _ in range(10)))
+
+    assert asyncio.run(scenario()) == [1] * 10
+    assert compute.calls == 1
+
+
+def test_errors_are_not_cached():
+    calls = []
+
+    def failing():
+        calls.append(1)
+        raise RuntimeError('db is down')
+
+    async def scenario():
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await cached_stats(('a',), failing)
+
+    asyncio.run(scenario())
+    assert len(calls) == 2
+
+
+def test_invalidation_during_computation_is_not_cached():
+    counter = Counter()
+
+    def compute():
+        value = counter()
+        if value == 1:
+            # Запись пришла, пока считалась статистика
+            invalidate_stats()
+        return value
+
+    async def scenario():
+        return [await cached_stats(('a',), compute), await cached_stats(('a',), compute),
+                await cached_stats(('a',), compute)]
+
+    assert asyncio.run(scenario()) == [1, 2, 2]
+
+
+def test_write_through_db_method_invalidates(db):
+    def count_callbacks():
+        with db.get_db() as conn:
+            return conn.execute('SELECT COUNT(*) FROM callbacks').fetchone()[0]
+
+    async def scenario():
+        before = await cached_stats(('admin_stats',), count_callbacks)
+        # Запись в обход DB-классов видна только после TTL
+        with db.get_db() as conn:
+            conn.execute("INSERT INTO callbacks (contact_name, contact_phone) VALUES ('Иван', '+79990000000')")
+        stale = await cached_stats(('admin_stats',), count_callbacks)
+        CallbackDB.create({'contact_name': 'Анна', 'contact_phone': '+79991112233'})
+        fresh = await cached_stats(('admin_stats',), count_callbacks)
+        return before, stale, fresh
+
+    assert asyncio.run(scenario()) == (0, 0, 2)
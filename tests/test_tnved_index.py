@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""Индексы справочника ТН ВЭД (tnved_index.py)"""
+
+from tnved_index import CategoryIndex, CodeTrie, NameIndex, normalize_tnved_code, stem_ru, tokenize_ru
+
+
+def test_normalize_tnved_code():
+    assert normalize_tnved_code('2203 00 31') == '22030031'
+    assert normalize_tnved_code('6403.99-930') == '640399930'
+    assert normalize_tnved_code('') == ''
+
+
+def test_code_trie():
+    trie = CodeTrie([('6403', 'обувь'), ('6403 99 930', 'сапоги'), ('2203', 'пиво'), ('6401', 'галоши')])
+    assert len(trie) == 4
+    assert trie.get('6403') == 'обувь'
+    assert trie.get('640') is None
+    assert '6403.99.930' in trie
+    assert '6402' not in trie
+    assert trie.prefix('640') == ['галоши', 'обувь', 'сапоги']
+    assert trie.prefix('640', limit=1) == ['галоши']
+    assert trie.prefix('9') == []
+    assert trie.count_prefix('64') == 3
+    assert trie.longest_prefix('6403999300') == ('640399930', 'сапоги')
+    assert trie.longest_prefix('6403100000') == ('6403', 'обувь')
+    assert trie.longest_prefix('6403100000', min_length=5) is None
+
+
+def test_stem_and_tokenize():
+    assert stem_ru('обуви') == stem_ru('обувь') == 'обув'
+    assert stem_ru('шин') == 'шин'
+    assert tokenize_ru('Пиво, ЁЛКИ!') == ['пив', 'елк']
+    assert tokenize_ru('') == []
+
+
+def test_name_index_search():
+    index = NameIndex([
+        ('Обувь кожаная мужская', 1),
+        ('Обувь детская', 2),
+        ('Шины для легковых автомобилей', 3),
+        ('Кожаные перчатки', 4),
+    ])
+    assert index.search('обуви') == [2, 1]
+    assert index.search('обув кожан') == [1]
+    # префикс слова находит полные основы
+    assert index.search('легк') == [3]
+    assert index.search('обувь шины') == []
+    assert index.search('') == []
+    assert index.search('обувь', limit=1) == [2]
+
+
+def test_category_index():
+    index = CategoryIndex([
+        ('Обувь', 'shoes', ['footwear']),
+        ('Молочная продукция', 'milk', ['молоко']),
+        ('Шины', 'tires', []),
+    ])
+    assert index.get('ОБУВЬ') == ('Обувь', 'shoes')
+    assert index.get('молоко') == ('Молочная продукция', 'milk')
+    assert index.get('пиво') is None
+    # вхождение подстроки и похожее название
+    assert index.find('молочная') == ('Молочная продукция', 'milk')
+    assert index.find('шинны') == ('Шины', 'tires')
+    assert index.find('вода') is None
+    assert index.find('') is None